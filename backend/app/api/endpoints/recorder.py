@@ -5,20 +5,29 @@ Exposes recorder document search, download, and extraction functionality
 to the frontend via FastAPI endpoints.
 """
 from fastapi import APIRouter, HTTPException, BackgroundTasks
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
 from pathlib import Path
 import asyncio
+import json
 import os
 import sys
 
+from app.services.pipeline.owner_names import owner_search_key
+from app.services.recorder_catalog import get_recorder_catalog
+from app.services import recorder_harvest_service
+from app.services.recorder_lookup_service import get_recorder_lookup_service
+
 # Add mcp_servers path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "mcp_servers" / "recorder"))
-from session import RecorderSession
+from session import RecorderSession, RELEVANT_DOC_KEYWORDS
 
 router = APIRouter()
 
+DOWNLOADS_DIR = Path(__file__).parent.parent.parent.parent / "mcp_servers" / "recorder" / "downloads"
+_downloads_registered = False  # Files downloaded before the catalog existed are cataloged once per process
+
 # Singleton session manager
 _session: Optional[RecorderSession] = None
 _session_lock = asyncio.Lock()
@@ -56,6 +65,7 @@ class DownloadResponse(BaseModel):
 class BulkLookupRequest(BaseModel):
     """Request for bulk recorder lookup."""
     leads: List[dict]  # List of {owner_name, address} objects
+    concurrency: Optional[int] = None  # Tabs to search with (default RECORDER_BULK_CONCURRENCY)
 
 
 class LeadRecorderResult(BaseModel):
@@ -122,6 +132,31 @@ async def get_status():
     )
 
 
+@router.get("/timings")
+async def get_timings(limit: int = 20):
+    """Per-step timings of the most recent recorder searches and downloads (newest first)."""
+    session = await get_session()
+    timings = list(session.timings)[-limit:]
+    return {"timings": timings[::-1], "total": len(timings)}
+
+
+@router.post("/harvest")
+async def run_harvest(window_days: Optional[int] = None):
+    """Run a distress-document harvest pass now (normally scheduled; see recorder_harvest_service)."""
+    session = await get_session()
+    _require_session(session)
+    return await recorder_harvest_service.harvest_distress_documents(session, window_days)
+
+
+@router.get("/harvest/status")
+async def get_harvest_status():
+    """Summary of the last harvest pass and the filters it feeds."""
+    return {
+        "last_harvest": recorder_harvest_service.last_harvest or None,
+        "filters": recorder_harvest_service.FILTER_DOC_TYPES,
+    }
+
+
 @router.get("/cookies/status")
 async def get_cookies_status():
     """Get status of saved cookies."""
@@ -222,6 +257,8 @@ async def search_documents(doc_type: str, limit: int = 100):
             raise HTTPException(status_code=503, detail=error_msg)
         raise HTTPException(status_code=500, detail=error_msg)
     
+    await get_recorder_catalog().upsert_documents(results)
+    
     return SearchResponse(
         results=[
             DocumentResult(
@@ -241,24 +278,26 @@ async def search_documents(doc_type: str, limit: int = 100):
 async def search_by_sequence(seq_num: str):
     """
     Search for a document by its sequence number.
-    Will auto-initialize browser session if not already initialized.
+    Answered from the recorder catalog when the document has been seen before;
+    otherwise searches the portal (auto-initializing the browser session).
     """
-    session = await get_session()
+    catalog = get_recorder_catalog()
+    results = await catalog.find_by_number(seq_num)
     
-    # Auto-initialize if needed
-    if not session.initialized:
-        success = await session.initialize()
-        if not success:
-            raise HTTPException(status_code=500, detail="Failed to initialize browser session. Please try again.")
-    
-    results = await session.search_by_sequence(seq_num)
-    
-    # Check for error in results
-    if results and "error" in results[0]:
-        error_msg = results[0]["error"]
-        if "Session not initialized" in error_msg or "browser closed" in error_msg:
-            raise HTTPException(status_code=503, detail=error_msg)
-        raise HTTPException(status_code=500, detail=error_msg)
+    if not results:
+        session = await get_session()
+        
+        # Auto-initialize if needed
+        if not session.initialized:
+            success = await session.initialize()
+            if not success:
+                raise HTTPException(status_code=500, detail="Failed to initialize browser session. Please try again.")
+        
+        results, error_msg = await catalog.lookup_sequence(session, seq_num)
+        if error_msg:
+            if "Session not initialized" in error_msg or "browser closed" in error_msg:
+                raise HTTPException(status_code=503, detail=error_msg)
+            raise HTTPException(status_code=500, detail=error_msg)
     
     return SearchResponse(
         results=[
@@ -294,6 +333,9 @@ async def search_by_name(
     1. If anchor_seq provided: Search by sequence first to get exact deed and its date
     2. Then search by name + date to find all related docs for that owner on that date
     3. Return combined, deduplicated results
+    
+    Every step reads the recorder catalog first and only searches the portal
+    for what it has not covered yet.
     """
     session = await get_session()
     
@@ -303,15 +345,16 @@ async def search_by_name(
             detail="Recorder session not active. Please open the Recorder page first to solve the CAPTCHA."
         )
     
+    catalog = get_recorder_catalog()
     all_results = []
     anchor_date_from_seq = None
     
     # Step 1/2: If we have a sequence number, search for it first
     if anchor_seq:
         print(f"[Recorder API] Step 1/2: Searching by sequence {anchor_seq}", flush=True)
-        seq_results = await session.search_by_sequence(anchor_seq)
+        seq_results, seq_error = await catalog.lookup_sequence(session, anchor_seq)
         
-        if seq_results and "error" not in seq_results[0]:
+        if not seq_error:
             for doc in seq_results:
                 all_results.append(doc)
                 # Extract the recording date from the anchor document
@@ -325,27 +368,26 @@ async def search_by_name(
     
     if target_date:
         print(f"[Recorder API] Step 3: Searching by name '{name}' on date {target_date}", flush=True)
-        name_date_results = await session.search_by_name_and_date(
-            name=name,
-            record_date=target_date,
+        name_date_results, _ = await catalog.lookup_name(
+            session,
+            name,
             search_type=search_type,
+            start_date=target_date,
+            end_date=target_date,
             limit=limit
         )
-        
-        if name_date_results and "error" not in name_date_results[0]:
-            for doc in name_date_results:
-                all_results.append(doc)
+        all_results.extend(name_date_results)
     else:
         # No date available - fall back to regular name search with limit
         print(f"[Recorder API] No date available, falling back to name search for '{name}'", flush=True)
-        fallback_results = await session.search_by_name(
-            name=name, 
-            search_type=search_type, 
-            deed_types_only=deed_only, 
+        fallback_results, _ = await catalog.lookup_name(
+            session,
+            name,
+            search_type=search_type,
+            doc_keywords=RELEVANT_DOC_KEYWORDS if deed_only else None,
             limit=20  # Limit fallback to avoid too many unrelated results
         )
-        if fallback_results and "error" not in fallback_results[0]:
-            all_results = fallback_results
+        all_results = fallback_results
     
     # Deduplicate by doc_number
     seen_doc_numbers = set()
@@ -375,131 +417,134 @@ async def search_by_name(
     )
 
 
-@router.post("/bulk-lookup", response_model=BulkLookupResponse)
-async def bulk_lookup(request: BulkLookupRequest):
+def _lead_result(address: str, owner_name: str, docs: List[Dict], error: Optional[str] = None) -> LeadRecorderResult:
+    """Recorder result for one lead: its owner's documents plus document type flags."""
+    if error:
+        return LeadRecorderResult(address=address, owner_name=owner_name, documents=[], doc_count=0, error=error)
+    
+    doc_results = []
+    has_deed_of_trust = False
+    has_lis_pendens = False
+    has_notice_sale = False
+    has_lien = False
+    has_judgment = False
+    has_reconveyance = False
+    last_deed_date = None
+    
+    for doc in docs:
+        doc_type = doc.get("doc_type", "").upper()
+        
+        doc_results.append(DocumentResult(
+            doc_id=doc.get("doc_id", ""),
+            doc_number=doc.get("doc_number", ""),
+            doc_type=doc.get("doc_type", ""),
+            record_date=doc.get("record_date", "")
+        ))
+        
+        # Detect document type flags
+        if "DEED OF TRUST" in doc_type or "TRUST DEED" in doc_type:
+            has_deed_of_trust = True
+        if "LIS PENDENS" in doc_type:
+            has_lis_pendens = True
+        if "NOTICE" in doc_type and "SALE" in doc_type:
+            has_notice_sale = True
+        if "LIEN" in doc_type:
+            has_lien = True
+        if "JUDGMENT" in doc_type:
+            has_judgment = True
+        if "RECONVEYANCE" in doc_type:
+            has_reconveyance = True
+        
+        # Track last deed date (WARRANTY DEED, QUIT CLAIM DEED, etc.)
+        if "DEED" in doc_type and "TRUST" not in doc_type:
+            if not last_deed_date:
+                last_deed_date = doc.get("record_date")
+    
+    return LeadRecorderResult(
+        address=address,
+        owner_name=owner_name,
+        documents=doc_results,
+        doc_count=len(doc_results),
+        has_deed_of_trust=has_deed_of_trust,
+        has_lis_pendens=has_lis_pendens,
+        has_notice_sale=has_notice_sale,
+        has_lien=has_lien,
+        has_judgment=has_judgment,
+        has_reconveyance=has_reconveyance,
+        last_deed_date=last_deed_date
+    )
+
+
+async def _bulk_results(session: RecorderSession, request: BulkLookupRequest):
     """
-    Bulk recorder lookup for multiple leads.
-    Searches by owner name (grantee) for each lead.
-    Rate limited to avoid overloading the recorder site.
+    Yields (index, LeadRecorderResult) per lead as its owner's search
+    completes. Leads sharing an owner (spouses, an LLC with many parcels)
+    share one search.
     """
-    session = await get_session()
+    by_key: Dict[str, List[int]] = {}
+    for i, lead in enumerate(request.leads):
+        key = owner_search_key(lead.get("owner_name", ""))
+        if not key:
+            yield i, _lead_result(lead.get("address", ""), lead.get("owner_name", ""), [], "No owner name provided")
+            continue
+        by_key.setdefault(key, []).append(i)
     
+    service = get_recorder_lookup_service()
+    owner_names = [request.leads[indices[0]].get("owner_name", "") for indices in by_key.values()]
+    async for key, docs, error in service.lookup_owners(session, owner_names, request.concurrency, RELEVANT_DOC_KEYWORDS):
+        for i in by_key.get(key, []):
+            lead = request.leads[i]
+            yield i, _lead_result(lead.get("address", ""), lead.get("owner_name", ""), docs, error)
+
+
+def _require_session(session: RecorderSession):
     if not session.initialized:
         raise HTTPException(
             status_code=503, 
             detail="Recorder session not active. Please open the Recorder page first."
         )
+
+
+@router.post("/bulk-lookup", response_model=BulkLookupResponse)
+async def bulk_lookup(request: BulkLookupRequest):
+    """
+    Bulk recorder lookup for multiple leads.
+    Searches by owner name (grantee) once per distinct owner, over a pool of
+    tabs with a global rate limit between searches. Results keep request order.
+    """
+    session = await get_session()
+    _require_session(session)
     
-    results = []
-    total_success = 0
-    total_errors = 0
-    
-    for i, lead in enumerate(request.leads):
-        owner_name = lead.get("owner_name", "")
-        address = lead.get("address", "")
-        
-        if not owner_name:
-            results.append(LeadRecorderResult(
-                address=address,
-                owner_name=owner_name,
-                documents=[],
-                doc_count=0,
-                error="No owner name provided"
-            ))
-            total_errors += 1
-            continue
-        
-        try:
-            # Search by owner name (grantee)
-            docs = await session.search_by_name(owner_name, search_type="grantee", limit=20)
-            
-            if docs and "error" in docs[0]:
-                results.append(LeadRecorderResult(
-                    address=address,
-                    owner_name=owner_name,
-                    documents=[],
-                    doc_count=0,
-                    error=docs[0]["error"]
-                ))
-                total_errors += 1
-                continue
-            
-            # Process document types and extract flags
-            doc_results = []
-            has_deed_of_trust = False
-            has_lis_pendens = False
-            has_notice_sale = False
-            has_lien = False
-            has_judgment = False
-            has_reconveyance = False
-            last_deed_date = None
-            
-            for doc in docs:
-                doc_type = doc.get("doc_type", "").upper()
-                
-                doc_results.append(DocumentResult(
-                    doc_id=doc.get("doc_id", ""),
-                    doc_number=doc.get("doc_number", ""),
-                    doc_type=doc.get("doc_type", ""),
-                    record_date=doc.get("record_date", "")
-                ))
-                
-                # Detect document type flags
-                if "DEED OF TRUST" in doc_type or "TRUST DEED" in doc_type:
-                    has_deed_of_trust = True
-                if "LIS PENDENS" in doc_type:
-                    has_lis_pendens = True
-                if "NOTICE" in doc_type and "SALE" in doc_type:
-                    has_notice_sale = True
-                if "LIEN" in doc_type:
-                    has_lien = True
-                if "JUDGMENT" in doc_type:
-                    has_judgment = True
-                if "RECONVEYANCE" in doc_type:
-                    has_reconveyance = True
-                
-                # Track last deed date (WARRANTY DEED, QUIT CLAIM DEED, etc.)
-                if "DEED" in doc_type and "TRUST" not in doc_type:
-                    if not last_deed_date:
-                        last_deed_date = doc.get("record_date")
-            
-            results.append(LeadRecorderResult(
-                address=address,
-                owner_name=owner_name,
-                documents=doc_results,
-                doc_count=len(doc_results),
-                has_deed_of_trust=has_deed_of_trust,
-                has_lis_pendens=has_lis_pendens,
-                has_notice_sale=has_notice_sale,
-                has_lien=has_lien,
-                has_judgment=has_judgment,
-                has_reconveyance=has_reconveyance,
-                last_deed_date=last_deed_date
-            ))
-            total_success += 1
-            
-            # Rate limit between searches (2 seconds)
-            if i < len(request.leads) - 1:
-                await asyncio.sleep(2)
-                
-        except Exception as e:
-            results.append(LeadRecorderResult(
-                address=address,
-                owner_name=owner_name,
-                documents=[],
-                doc_count=0,
-                error=str(e)
-            ))
-            total_errors += 1
+    results: List[Optional[LeadRecorderResult]] = [None] * len(request.leads)
+    async for i, result in _bulk_results(session, request):
+        results[i] = result
     
+    total_errors = sum(1 for r in results if r.error)
     return BulkLookupResponse(
         results=results,
         total_processed=len(request.leads),
-        total_success=total_success,
+        total_success=len(results) - total_errors,
         total_errors=total_errors
     )
 
 
+@router.post("/bulk-lookup/stream")
+async def bulk_lookup_stream(request: BulkLookupRequest):
+    """
+    Same lookup as /bulk-lookup, streamed as NDJSON: one LeadRecorderResult
+    line (with the lead's `index` in the request) as soon as its owner's
+    search completes.
+    """
+    session = await get_session()
+    _require_session(session)
+    
+    async def lines():
+        async for i, result in _bulk_results(session, request):
+            yield json.dumps({"index": i, **result.dict()}) + "\n"
+    
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
 @router.post("/download/{doc_id}", response_model=DownloadResponse)
 async def download_document(doc_id: str):
     """Download a document PDF by its doc_id."""
@@ -511,6 +556,7 @@ async def download_document(doc_id: str):
     file_path = await session.download_document(doc_id.upper())
     
     if file_path:
+        await get_recorder_catalog().mark_downloaded(doc_id.upper(), file_path)
         return DownloadResponse(success=True, doc_id=doc_id, file_path=file_path)
     else:
         return DownloadResponse(success=False, doc_id=doc_id, error="Download failed")
@@ -519,8 +565,7 @@ async def download_document(doc_id: str):
 @router.get("/file/{doc_id}")
 async def get_downloaded_file(doc_id: str):
     """Serve a previously downloaded PDF file."""
-    downloads_dir = Path(__file__).parent.parent.parent.parent / "mcp_servers" / "recorder" / "downloads"
-    pdf_path = downloads_dir / f"{doc_id.upper()}.pdf"
+    pdf_path = DOWNLOADS_DIR / f"{doc_id.upper()}.pdf"
     
     if not pdf_path.exists():
         raise HTTPException(status_code=404, detail=f"File not found: {doc_id}.pdf")
@@ -533,17 +578,22 @@ async def get_downloaded_file(doc_id: str):
 
 
 @router.post("/extract/{doc_id}", response_model=ExtractResponse)
-async def extract_document(doc_id: str):
+async def extract_document(doc_id: str, refresh: bool = False):
     """
     Extract structured data from a downloaded PDF using Vertex AI.
-    The PDF must already be downloaded.
+    The PDF must already be downloaded. Extractions are kept in the recorder
+    catalog and returned from there unless refresh is set.
     """
-    downloads_dir = Path(__file__).parent.parent.parent.parent / "mcp_servers" / "recorder" / "downloads"
-    pdf_path = downloads_dir / f"{doc_id.upper()}.pdf"
+    catalog = get_recorder_catalog()
+    doc = await catalog.get_document(doc_id.upper())
+    if doc is not None and doc.extraction and not refresh:
+        return ExtractResponse(success=True, doc_id=doc_id, data=doc.extraction)
+    
+    pdf_path = DOWNLOADS_DIR / f"{doc_id.upper()}.pdf"
     
     if not pdf_path.exists():
         # Try images folder
-        images_path = downloads_dir / f"{doc_id.upper()}_images"
+        images_path = DOWNLOADS_DIR / f"{doc_id.upper()}_images"
         if images_path.exists():
             pdf_path = images_path
         else:
@@ -555,30 +605,37 @@ async def extract_document(doc_id: str):
     if "error" in data:
         return ExtractResponse(success=False, doc_id=doc_id, error=data["error"])
     
+    await catalog.save_extraction(doc_id.upper(), data)
     return ExtractResponse(success=True, doc_id=doc_id, data=data)
 
 
 @router.get("/downloads")
-async def list_downloads():
-    """List all downloaded documents."""
-    downloads_dir = Path(__file__).parent.parent.parent.parent / "mcp_servers" / "recorder" / "downloads"
-    
-    if not downloads_dir.exists():
-        return {"files": []}
+async def list_downloads(rescan: bool = False):
+    """
+    List all downloaded documents (from the recorder catalog).
+    rescan=true catalogs files placed in the downloads directory by other
+    means (e.g. the interactive session CLI); the first call always does.
+    """
+    global _downloads_registered
+    catalog = get_recorder_catalog()
+    if rescan or not _downloads_registered:
+        await catalog.register_downloads(str(DOWNLOADS_DIR))
+        _downloads_registered = True
     
     files = []
-    for f in downloads_dir.iterdir():
-        if f.is_file() and f.suffix == ".pdf":
-            files.append({
-                "doc_id": f.stem,
-                "filename": f.name,
-                "size_bytes": f.stat().st_size
-            })
-        elif f.is_dir() and f.name.endswith("_images"):
-            files.append({
-                "doc_id": f.name.replace("_images", ""),
-                "filename": f.name,
-                "type": "images"
-            })
+    for doc in await catalog.list_downloaded():
+        path = Path(doc.downloaded_path)
+        entry = {
+            "doc_id": doc.doc_id,
+            "filename": path.name,
+            "doc_type": doc.doc_type,
+            "record_date": doc.record_date.isoformat() if doc.record_date else None,
+            "extracted": doc.extraction is not None,
+        }
+        if path.suffix == ".pdf":
+            entry["size_bytes"] = path.stat().st_size if path.exists() else None
+        else:
+            entry["type"] = "images"
+        files.append(entry)
     
     return {"files": files, "total": len(files)}
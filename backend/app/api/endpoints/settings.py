@@ -4,8 +4,10 @@ from fastapi import APIRouter, Depends, HTTPException, Header
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Optional, List, Dict
 from datetime import datetime
+import threading
+import time
 import httpx
 import os
 
@@ -175,6 +177,7 @@ async def create_setting(create: SettingCreate, db: AsyncSession = Depends(get_d
     db.add(setting)
     await db.commit()
     await db.refresh(setting)
+    invalidate_settings_cache()
     
     return SettingResponse(
         key=setting.key,
@@ -210,6 +213,7 @@ async def update_setting(key: str, update: SettingUpdate, db: AsyncSession = Dep
     
     await db.commit()
     await db.refresh(setting)
+    invalidate_settings_cache()
     
     return SettingResponse(
         key=setting.key,
@@ -258,52 +262,114 @@ async def test_setting(key: str, db: AsyncSession = Depends(get_db)):
         return TestResult(key=key, success=False, message=f"Test failed: {str(e)}")
 
 
+# --- Process-wide settings cache ---
+# All app_settings rows are read once (per SETTINGS_CACHE_TTL_S, so other
+# worker processes pick up changes) and served from memory afterwards.
+# create_setting / update_setting invalidate it in this process immediately;
+# a load that started before an invalidation is not stored (generation check).
+SETTINGS_CACHE_TTL_S = 300
+
+_settings_cache: Optional[Dict[str, str]] = None
+_settings_cache_loaded_at = 0.0
+_settings_cache_generation = 0  # Bumped by every invalidation
+_settings_cache_lock = threading.Lock()
+_sync_engine = None
+
+
+def _get_sync_engine():
+    """One sync engine for the process (the async app engine can't be used from sync code)."""
+    global _sync_engine
+    if _sync_engine is None:
+        from sqlalchemy import create_engine
+
+        database_url = app_config.DATABASE_URL
+        # Remove async driver prefix if present
+        database_url = database_url.replace("+aiosqlite", "").replace("+asyncpg", "")
+        _sync_engine = create_engine(
+            database_url,
+            connect_args={"check_same_thread": False} if "sqlite" in database_url else {},
+            pool_pre_ping=True,
+        )
+    return _sync_engine
+
+
+def _cache_fresh() -> bool:
+    return _settings_cache is not None and time.time() - _settings_cache_loaded_at < SETTINGS_CACHE_TTL_S
+
+
+def _store_cache(values: Dict[str, str], generation: int) -> Dict[str, str]:
+    """Caches values read at `generation` unless the cache was invalidated since (call under the lock)."""
+    global _settings_cache, _settings_cache_loaded_at
+    if generation == _settings_cache_generation:
+        _settings_cache = values
+        _settings_cache_loaded_at = time.time()
+    return values
+
+
+def invalidate_settings_cache():
+    """Drop cached values; the next lookup reloads them from the database."""
+    global _settings_cache, _settings_cache_generation
+    with _settings_cache_lock:
+        _settings_cache = None
+        _settings_cache_generation += 1
+
+
+def get_cached_settings() -> Dict[str, str]:
+    """All DB settings as {key: value}, loaded with one query when the cache is cold."""
+    if _cache_fresh():
+        return _settings_cache
+    with _settings_cache_lock:
+        if _cache_fresh():
+            return _settings_cache
+        try:
+            from sqlalchemy import text
+            with _get_sync_engine().connect() as conn:
+                rows = conn.execute(text("SELECT key, value FROM app_settings")).fetchall()
+            return _store_cache({row[0]: row[1] for row in rows}, _settings_cache_generation)
+        except Exception as e:
+            # DB unavailable (or table not created yet) - don't cache, env vars still apply
+            print(f"[Settings] Could not load settings from database: {e}")
+            return _settings_cache or {}
+
+
+def _env_fallback(key: str) -> str:
+    return getattr(app_config, key, "") or os.getenv(key, "")
+
+
 async def get_setting_value(key: str, db: AsyncSession) -> Optional[str]:
     """Helper to get a setting value (DB first, then env var fallback)."""
-    result = await db.execute(select(AppSetting).where(AppSetting.key == key))
-    db_setting = result.scalar_one_or_none()
-    
-    if db_setting:
-        return db_setting.value
-    
+    values = _settings_cache
+    if not _cache_fresh():
+        # Read outside the lock (it is a thread lock); an invalidation meanwhile keeps the result out of the cache
+        generation = _settings_cache_generation
+        try:
+            result = await db.execute(select(AppSetting.key, AppSetting.value))
+            with _settings_cache_lock:
+                values = _store_cache({k: v for k, v in result.all()}, generation)
+        except Exception as e:
+            print(f"[Settings] Could not load settings from database: {e}")
+    value = (values or {}).get(key)
+    if value is not None:
+        return value
+
     # Fallback to env var
-    return getattr(app_config, key, "") or os.getenv(key, "")
+    return _env_fallback(key)
 
 
 def get_setting_sync(key: str) -> Optional[str]:
     """
     Synchronous helper to get a setting value.
-    Uses a separate sync connection to check database.
+    Served from the process-wide cache (one shared sync engine loads it).
     Falls back to env var if not in database.
-    
+
     This is safe to call from synchronous service code.
     """
-    from sqlalchemy import create_engine
-    from sqlalchemy.orm import Session
-    
-    # Get database URL
-    database_url = app_config.DATABASE_URL
-    # Remove async driver prefix if present
-    if "+aiosqlite" in database_url:
-        database_url = database_url.replace("+aiosqlite", "")
-    
-    try:
-        engine = create_engine(database_url, connect_args={"check_same_thread": False} if "sqlite" in database_url else {})
-        with Session(engine) as session:
-            from sqlalchemy import text
-            result = session.execute(
-                text("SELECT value FROM app_settings WHERE key = :key"),
-                {"key": key}
-            )
-            row = result.fetchone()
-            if row:
-                return row[0]
-    except Exception:
-        # If DB access fails, fall back to env var
-        pass
-    
+    value = get_cached_settings().get(key)
+    if value is not None:
+        return value
+
     # Fallback to env var
-    return getattr(app_config, key, "") or os.getenv(key, "")
+    return _env_fallback(key)
 
 
 class PublicConfig(BaseModel):
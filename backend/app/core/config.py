@@ -11,6 +11,15 @@ class Settings(BaseSettings):
     
     # Database - default to SQLite for Cloud Run (use env var for PostgreSQL in production)
     DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./data/arela.db")
+
+    # Database profile - SQLite pragmas (app/core/database.py) / asyncpg pool for PostgreSQL
+    DB_SQLITE_WAL: bool = os.getenv("DB_SQLITE_WAL", "true").lower() in ("1", "true", "yes")
+    DB_SQLITE_BUSY_TIMEOUT_MS: int = int(os.getenv("DB_SQLITE_BUSY_TIMEOUT_MS", "5000"))
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "10"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_TIMEOUT: int = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # Cloud SQL drops idle connections
+    DB_COMMAND_TIMEOUT: int = int(os.getenv("DB_COMMAND_TIMEOUT", "60"))
     
     # APIs
     GOOGLE_MAPS_API_KEY: str = os.getenv("GOOGLE_MAPS_API_KEY", "")
@@ -27,6 +36,28 @@ class Settings(BaseSettings):
     
     # Security
     ARELA_ADMIN_KEY: str = os.getenv("ARELA_ADMIN_KEY", "")
+    
+    # Upstream GIS / Assessor roots (override to point Scout at benchmarks/gis_standin.py)
+    PIMA_GIS_BASE_URL: str = os.getenv("PIMA_GIS_BASE_URL", "https://gisdata.pima.gov/arcgis1/rest/services")
+    TUCSON_GIS_BASE_URL: str = os.getenv("TUCSON_GIS_BASE_URL", "https://gis.tucsonaz.gov/arcgis/rest/services")
+    PIMA_ASSESSOR_API_URL: str = os.getenv("PIMA_ASSESSOR_API_URL", "https://www.asr.pima.gov/AssessorSiteData/api/get/parceldetails/")
+
+    # Per-zip record counts (cache/zip_counts.json) used for weighted city-wide sampling
+    ZIP_COUNTS_TTL_HOURS: int = int(os.getenv("ZIP_COUNTS_TTL_HOURS", "168"))
+    ZIP_COUNTS_REFRESH_CITY: str = os.getenv("ZIP_COUNTS_REFRESH_CITY", "Tucson")  # "" disables the background schedule
+
+    # Materialized propensity scores: how often dirty leads are rescored (0 disables the worker)
+    RESCORE_INTERVAL_S: int = int(os.getenv("RESCORE_INTERVAL_S", "60"))
+
+    # Recorder bulk lookup: tabs searched in parallel
+    RECORDER_BULK_CONCURRENCY: int = int(os.getenv("RECORDER_BULK_CONCURRENCY", "3"))
+
+    # Recorder distress harvest: how often it runs (0 disables) and how many days back it keeps covered
+    RECORDER_HARVEST_INTERVAL_S: int = int(os.getenv("RECORDER_HARVEST_INTERVAL_S", "3600"))
+    RECORDER_HARVEST_WINDOW_DAYS: int = int(os.getenv("RECORDER_HARVEST_WINDOW_DAYS", "30"))
+
+    # Parcel owner index (recorder party -> parcel matching): rebuilt from Layer 12 when older than this (0 disables)
+    PARCEL_OWNER_INDEX_TTL_HOURS: int = int(os.getenv("PARCEL_OWNER_INDEX_TTL_HOURS", "168"))
 
     class Config:
         env_file = ".env"
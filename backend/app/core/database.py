@@ -1,22 +1,65 @@
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy import event, inspect, text
+from sqlalchemy.schema import CreateColumn
 import os
 from app.core.config import settings
 
-# Ensure Async Driver for SQLite
+# Ensure Async Driver for SQLite / PostgreSQL
 database_url = settings.DATABASE_URL
 if database_url.startswith("sqlite://") and "aiosqlite" not in database_url:
     database_url = database_url.replace("sqlite://", "sqlite+aiosqlite://")
+elif database_url.startswith("postgres://"):
+    database_url = database_url.replace("postgres://", "postgresql+asyncpg://", 1)
+elif database_url.startswith("postgresql://"):
+    database_url = database_url.replace("postgresql://", "postgresql+asyncpg://", 1)
 
-engine = create_async_engine(
-    database_url, 
-    connect_args={"check_same_thread": False} if "sqlite" in database_url else {},
-    echo=False
-)
+IS_SQLITE = "sqlite" in database_url
+
+# SQLite profile: WAL lets the CRM read while an import/harvest is writing;
+# NORMAL sync is durable under WAL and much cheaper than FULL per commit.
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": str(settings.DB_SQLITE_BUSY_TIMEOUT_MS),
+    "cache_size": "-65536",       # 64 MB page cache (negative = KiB)
+    "temp_store": "MEMORY",
+    "mmap_size": "268435456",     # 256 MB
+}
+
+
+def _engine_kwargs() -> dict:
+    if IS_SQLITE:
+        return {"connect_args": {"check_same_thread": False}}
+    # PostgreSQL (asyncpg) pool profile
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": True,
+        "connect_args": {
+            "command_timeout": settings.DB_COMMAND_TIMEOUT,
+            "server_settings": {"application_name": "arela-backend"},
+        },
+    }
+
+
+engine = create_async_engine(database_url, echo=False, **_engine_kwargs())
+
+if IS_SQLITE and settings.DB_SQLITE_WAL:
+    @event.listens_for(engine.sync_engine, "connect")
+    def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma, value in SQLITE_PRAGMAS.items():
+                cursor.execute(f"PRAGMA {pragma}={value}")
+        finally:
+            cursor.close()
 
 AsyncSessionLocal = sessionmaker(
-    bind=engine, 
-    class_=AsyncSession, 
+    bind=engine,
+    class_=AsyncSession,
     expire_on_commit=False,
     autoflush=False
 )
@@ -29,3 +72,61 @@ async def get_db():
             yield session
         finally:
             await session.close()
+
+
+def _ensure_columns(sync_conn) -> list:
+    """
+    create_all never alters existing tables, so columns added to a model later
+    are missing from older databases. Adds them (nullable / server defaults
+    only) and returns "table.column" for each one added.
+    """
+    inspector = inspect(sync_conn)
+    existing_tables = set(inspector.get_table_names())
+    added = []
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        existing = {col["name"] for col in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            ddl = CreateColumn(column).compile(dialect=sync_conn.dialect)
+            sync_conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {ddl}"))
+            added.append(f"{table.name}.{column.name}")
+    return added
+
+
+def _ensure_indexes(sync_conn) -> list:
+    """
+    create_all only builds indexes for tables it creates, so databases created
+    before an index was declared never get it. Creates any declared index that
+    is missing and returns the names it created.
+    """
+    inspector = inspect(sync_conn)
+    existing_tables = set(inspector.get_table_names())
+    created = []
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        existing = {ix["name"] for ix in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in existing:
+                index.create(sync_conn, checkfirst=True)
+                created.append(index.name)
+    return created
+
+
+async def verify_schema():
+    """Startup check that every column and index declared on the models exists."""
+    try:
+        async with engine.begin() as conn:
+            added = await conn.run_sync(_ensure_columns)
+            created = await conn.run_sync(_ensure_indexes)
+        if added:
+            print(f"[DB] Added missing columns: {', '.join(added)}")
+        if created:
+            print(f"[DB] Created missing indexes: {', '.join(created)}")
+        else:
+            print("[DB] All declared indexes present")
+    except Exception as e:
+        print(f"[DB] Schema verification failed: {e}")
@@ -9,17 +9,21 @@ if sys.platform == "win32":
     asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
 
 from typing import List, Optional, Union, Dict, Any
-from fastapi import FastAPI, Depends, HTTPException, Security
+from fastapi import FastAPI, Depends, HTTPException, Security, Response, Query
 from fastapi.security.api_key import APIKeyHeader
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from app.core.database import Base, engine, get_db
+from sqlalchemy import select, update, func, or_, and_, bindparam
+from app.core.database import Base, engine, get_db, verify_schema
+from app.core.config import settings
 
 # New Models & Schemas
 from app.models.orm import LeadModel
 from app.models.user import UserModel
 from app.models.offer import OfferModel
+from app.models.recorder import RecorderDocumentModel
+from app.models.parcel import ParcelOwnerModel
 from app.schemas import Lead, LeadCreate, User, UserCreate, Offer, OfferCreate
 
 # Agents
@@ -31,6 +35,14 @@ from app.agents.underwriting_agent import UnderwritingAgent
 from app.services.real_market_scout_service import RealMarketScoutService
 from app.services.pipeline.scout import ScoutService
 from app.services.pipeline.cleaner import CleanerService
+from app.services.pipeline.search_cursor import get_search_cursor_store
+from app.services.pipeline.lead_import import backfill_address_keys, bulk_upsert_leads
+from app.services.pipeline.owner_index import get_parcel_owner_index, run_owner_index_refresh
+from app.services.rescoring_service import run_rescore_worker
+from app.services.recorder_harvest_service import run_recorder_harvest_worker
+from app.services.export_service import (
+    EXPORT_MEDIA_TYPES, PARQUET_AVAILABLE, arrow_type, export_stream, stream_query_rows
+)
 from app.services.vision_service import VisionService, PropertyConditionReport
 from app.services.lex_service import LexService, LegalReviewResponse
 from app.services.scribe_service import ScribeService
@@ -73,6 +85,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 # Root health check - single definition
@@ -85,6 +98,42 @@ async def root_health_check():
 async def startup():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    await verify_schema()
+    await backfill_address_keys()  # Leads stored before the import dedupe key existed
+    # Keep materialized propensity scores current (only leads whose inputs changed)
+    if settings.RESCORE_INTERVAL_S:
+        global _rescore_task
+        _rescore_task = asyncio.create_task(run_rescore_worker(settings.RESCORE_INTERVAL_S))
+    # Keep zip record counts (weighted city-wide sampling) fresh in the background
+    if settings.ZIP_COUNTS_REFRESH_CITY:
+        global _zip_count_refresh_task
+        _zip_count_refresh_task = asyncio.create_task(
+            _get_scout_service().run_zip_count_refresh(settings.ZIP_COUNTS_REFRESH_CITY)
+        )
+    # Keep the parcel owner index (recorder party -> parcel matching) fresh
+    if settings.PARCEL_OWNER_INDEX_TTL_HOURS:
+        global _owner_index_task
+        _owner_index_task = asyncio.create_task(run_owner_index_refresh())
+    # Harvest recent distress documents into the recorder catalog (Scout's recorder filters)
+    if RECORDER_AVAILABLE and settings.RECORDER_HARVEST_INTERVAL_S:
+        global _recorder_harvest_task
+        _recorder_harvest_task = asyncio.create_task(
+            run_recorder_harvest_worker(recorder.get_session, settings.RECORDER_HARVEST_INTERVAL_S)
+        )
+
+@app.on_event("shutdown")
+async def shutdown():
+    if _zip_count_refresh_task:
+        _zip_count_refresh_task.cancel()
+    if _rescore_task:
+        _rescore_task.cancel()
+    if _recorder_harvest_task:
+        _recorder_harvest_task.cancel()
+    if _owner_index_task:
+        _owner_index_task.cancel()
+    from app.services import skip_trace_service
+    if skip_trace_service._skip_trace_service:
+        await skip_trace_service._skip_trace_service.close()
 
 @app.get("/health")
 async def health_status():
@@ -99,6 +148,10 @@ if RECORDER_AVAILABLE:
 
 # --- SINGLETON SERVICES (for caching) ---
 _scout_service_instance: Optional[ScoutService] = None
+_zip_count_refresh_task: Optional[asyncio.Task] = None
+_rescore_task: Optional[asyncio.Task] = None
+_recorder_harvest_task: Optional[asyncio.Task] = None
+_owner_index_task: Optional[asyncio.Task] = None
 
 def _get_scout_service() -> ScoutService:
     """Singleton factory for ScoutService to persist HomeHarvest cache across requests."""
@@ -129,11 +182,165 @@ async def sync_user(user_in: UserCreate, db: AsyncSession = Depends(get_db)):
     return user
 
 # --- LEADS ---
-@app.get("/api/v1/leads", response_model=List[Lead])
-async def get_leads(skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_db)):
-    stmt = select(LeadModel).offset(skip).limit(limit)
+LEAD_LIST_COLUMNS = {c.name: c for c in LeadModel.__table__.columns}
+# Default projection = the flat columns of the Lead schema (nested groups are detail-view only)
+LEAD_LIST_DEFAULT_FIELDS = [
+    "id", "user_id", "address_street", "address_zip", "status", "distress_score",
+    "equity_percent", "owner_name", "latitude", "longitude", "tags", "created_at", "updated_at",
+    "propensity_score", "propensity_label"
+]
+LEAD_LIST_SORTS = {
+    "created_at": LeadModel.created_at,
+    "propensity_score": LeadModel.propensity_score,  # sort=propensity_score&order=desc -> hottest first
+    "distress_score": func.coalesce(LeadModel.distress_score, 0),
+    "address_street": func.coalesce(LeadModel.address_street, ""),  # Keyset comparisons skip NULLs otherwise
+}
+LEAD_LIST_MAX_LIMIT = 1000
+
+
+def _csv_param(value: str) -> List[str]:
+    return [v.strip() for v in value.split(",") if v.strip()]
+
+
+def _filter_leads(stmt, status: Optional[str], zip_code: Optional[str], source: Optional[str],
+                  min_score: Optional[int], max_score: Optional[int]):
+    """Shared lead list/export filters (status/zip/source accept comma-separated values)."""
+    if status:
+        stmt = stmt.where(LeadModel.status.in_(_csv_param(status)))
+    if zip_code:
+        stmt = stmt.where(LeadModel.address_zip.in_(_csv_param(zip_code)))
+    if source:
+        stmt = stmt.where(LeadModel.source.in_(_csv_param(source)))
+    if min_score is not None:
+        stmt = stmt.where(LeadModel.distress_score >= min_score)
+    if max_score is not None:
+        stmt = stmt.where(LeadModel.distress_score <= max_score)
+    return stmt
+
+
+def _parse_fields(fields: Optional[str], default: List[str], allowed) -> List[str]:
+    if not fields:
+        return default
+    names = _csv_param(fields)
+    unknown = [f for f in names if f not in allowed]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+    return names
+
+
+def _check_export_format(format: str):
+    if format not in EXPORT_MEDIA_TYPES:
+        raise HTTPException(status_code=400, detail=f"format must be one of {sorted(EXPORT_MEDIA_TYPES)}")
+    if format == "parquet" and not PARQUET_AVAILABLE:
+        raise HTTPException(status_code=501, detail="Parquet export requires pyarrow")
+
+
+def _export_response(format: str, body, filename: str) -> StreamingResponse:
+    return StreamingResponse(
+        body,
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{format}"'},
+    )
+
+
+@app.get("/api/v1/leads")
+async def get_leads(
+    response: Response,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    status: Optional[str] = None,
+    zip_code: Optional[str] = Query(None, alias="zip"),
+    source: Optional[str] = None,
+    min_score: Optional[int] = None,
+    max_score: Optional[int] = None,
+    sort: str = "created_at",
+    order: str = "desc",
+    fields: Optional[str] = None,
+    skip: int = 0,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Lead list with keyset pagination on (sort column, id).
+
+    Pass the X-Next-Cursor response header back as `cursor` for the next page
+    (absent on the last page). `skip` is still honoured when no cursor is
+    given, for old clients. status/zip/source accept comma-separated values;
+    `fields=` (comma-separated columns) returns only those columns. Rows are
+    selected as plain column tuples - no ORM objects are built.
+    """
+    if sort not in LEAD_LIST_SORTS:
+        raise HTTPException(status_code=400, detail=f"sort must be one of {sorted(LEAD_LIST_SORTS)}")
+    if order not in ("asc", "desc"):
+        raise HTTPException(status_code=400, detail="order must be asc or desc")
+
+    field_names = _parse_fields(fields, LEAD_LIST_DEFAULT_FIELDS, LEAD_LIST_COLUMNS)
+    if "id" not in field_names:
+        field_names = ["id"] + field_names
+    limit = max(1, min(limit, LEAD_LIST_MAX_LIMIT))
+
+    stmt = select(*[LEAD_LIST_COLUMNS[f] for f in field_names])
+
+    stmt = _filter_leads(stmt, status, zip_code, source, min_score, max_score)
+
+    sort_col = LEAD_LIST_SORTS[sort]
+    if cursor:
+        # Resolve the cursor row's sort value in SQL so comparisons stay in the DB's own types
+        anchor = await db.execute(select(sort_col).where(LeadModel.id == cursor))
+        anchor_row = anchor.first()
+        if anchor_row is None:
+            raise HTTPException(status_code=400, detail="Invalid or expired cursor")
+        anchor_value = select(sort_col).where(LeadModel.id == cursor).scalar_subquery()
+        if order == "desc":
+            stmt = stmt.where(or_(sort_col < anchor_value, and_(sort_col == anchor_value, LeadModel.id < cursor)))
+        else:
+            stmt = stmt.where(or_(sort_col > anchor_value, and_(sort_col == anchor_value, LeadModel.id > cursor)))
+    elif skip:
+        stmt = stmt.offset(skip)
+
+    if order == "desc":
+        stmt = stmt.order_by(sort_col.desc(), LeadModel.id.desc())
+    else:
+        stmt = stmt.order_by(sort_col.asc(), LeadModel.id.asc())
+    stmt = stmt.limit(limit + 1)
+
     result = await db.execute(stmt)
-    return result.scalars().all()
+    rows = [dict(r) for r in result.mappings().all()]
+
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers["X-Next-Cursor"] = rows[-1]["id"]
+
+    if not fields:
+        for row in rows:
+            row["tags"] = row["tags"] or []
+            row.update(contact_info=None, property_details=None, flags=None, financials=None)
+    return rows
+
+@app.get("/api/v1/leads/export")
+async def export_leads(
+    format: str = "csv",
+    status: Optional[str] = None,
+    zip_code: Optional[str] = Query(None, alias="zip"),
+    source: Optional[str] = None,
+    min_score: Optional[int] = None,
+    max_score: Optional[int] = None,
+    fields: Optional[str] = None,
+):
+    """
+    Streams leads as CSV or Parquet (same filters/fields as GET /api/v1/leads,
+    all columns by default). Rows come off a server-side cursor in batches,
+    so memory use does not grow with the export size.
+    """
+    _check_export_format(format)
+    field_names = _parse_fields(fields, list(LEAD_LIST_COLUMNS), LEAD_LIST_COLUMNS)
+
+    stmt = select(*[LEAD_LIST_COLUMNS[f] for f in field_names])
+    stmt = _filter_leads(stmt, status, zip_code, source, min_score, max_score)
+    stmt = stmt.order_by(LeadModel.created_at.desc(), LeadModel.id.desc())
+
+    types = {f: arrow_type(LEAD_LIST_COLUMNS[f].type) for f in field_names} if format == "parquet" else None
+    return _export_response(format, export_stream(format, stream_query_rows(stmt), field_names, types), "leads")
+
 
 @app.get("/api/v1/leads/{lead_id}", response_model=Lead)
 async def get_lead(lead_id: str, db: AsyncSession = Depends(get_db)):
@@ -174,6 +381,17 @@ class LeadImportItem(BaseModel):
     has_garage: bool = False
     has_guesthouse: bool = False
     distress_score: int = 0
+    distress_signals: List[str] = []
+    violation_count: Optional[int] = None
+    record_date: Optional[str] = None
+    recorder_flags: Optional[Dict[str, Any]] = None
+
+
+class LeadImportResult(BaseModel):
+    index: int
+    address: str
+    status: str  # imported, updated, skipped, duplicate, invalid
+    id: Optional[str] = None
 
 
 class LeadImportResponse(BaseModel):
@@ -181,64 +399,38 @@ class LeadImportResponse(BaseModel):
     skipped: int
     total: int
     message: str
+    updated: int = 0
+    invalid: int = 0  # Rows without an address (counted in skipped, not as duplicates)
+    results: List[LeadImportResult] = []
 
 
 @app.post("/api/v1/leads/import", response_model=LeadImportResponse)
 async def import_leads(leads: List[LeadImportItem], db: AsyncSession = Depends(get_db)):
     """
     Bulk import leads from LeadScout into the database.
-    Dedupes by address (skips if already exists).
+    Dedupes by canonical address (skips if already exists) in one set-based
+    transaction; `results` has the outcome of every input row.
     """
-    imported_count = 0
-    skipped_count = 0
-    
+    rows = []
     for lead_data in leads:
-        # Normalize address for deduplication
-        address_normalized = lead_data.address.strip().upper()
-        
-        # Check if lead already exists
-        stmt = select(LeadModel).where(
-            LeadModel.address_street == address_normalized
-        )
-        result = await db.execute(stmt)
-        existing = result.scalars().first()
-        
-        if existing:
-            skipped_count += 1
-            continue
-        
-        # Create new lead
-        db_lead = LeadModel(
-            address_street=lead_data.address,
-            address_zip=lead_data.address_zip,
-            owner_name=lead_data.owner_name,
-            mailing_address=lead_data.mailing_address,
-            latitude=lead_data.latitude,
-            longitude=lead_data.longitude,
-            bedrooms=lead_data.bedrooms,
-            bathrooms=lead_data.bathrooms,
-            sqft=lead_data.sqft,
-            year_built=lead_data.year_built,
-            property_type=lead_data.property_type,
-            parcel_id=lead_data.parcel_id,
-            zoning=lead_data.zoning,
-            has_pool=lead_data.has_pool,
-            has_garage=lead_data.has_garage,
-            has_guesthouse=lead_data.has_guesthouse,
-            distress_score=lead_data.distress_score,
-            status="New",
-            source="LeadScout"
-        )
-        db.add(db_lead)
-        imported_count += 1
-    
-    await db.commit()
-    
+        row = lead_data.dict(exclude={"address"})
+        row.update(address_street=lead_data.address, status="New", source="LeadScout")
+        rows.append(row)
+
+    outcome = await bulk_upsert_leads(db, rows)
+    skipped_count = len(leads) - outcome["imported"]
+    invalid_count = sum(1 for r in outcome["results"] if r["status"] == "invalid")
+    message = f"Imported {outcome['imported']} leads, skipped {skipped_count - invalid_count} duplicates"
+    if invalid_count:
+        message += f" and {invalid_count} invalid rows (no address)"
+
     return LeadImportResponse(
-        imported=imported_count,
+        imported=outcome["imported"],
         skipped=skipped_count,
         total=len(leads),
-        message=f"Imported {imported_count} leads, skipped {skipped_count} duplicates"
+        message=message,
+        invalid=invalid_count,
+        results=outcome["results"],
     )
 
 
@@ -292,23 +484,47 @@ async def analyze_lead(lead_data: LeadAnalyzeRequest):
     # Score the lead
     result = scorer.score_lead(lead_dict)
     
-    # Determine recommended action
-    if result.score >= 80:
-        action = "Skip trace + call immediately"
-    elif result.score >= 51:
-        action = "Add to automated drip campaign"
-    else:
-        action = "Archive or low-priority drip"
-    
+    return _analyze_response(result)
+
+
+def _score_action(score: int) -> str:
+    """Recommended action for a propensity score."""
+    if score >= 80:
+        return "Skip trace + call immediately"
+    elif score >= 51:
+        return "Add to automated drip campaign"
+    return "Archive or low-priority drip"
+
+
+def _analyze_response(result) -> LeadAnalyzeResponse:
     return LeadAnalyzeResponse(
         score=result.score,
         label=result.label,
         emoji=result.emoji,
         signals=result.signals,
         breakdown=result.breakdown,
-        action=action
+        action=_score_action(result.score)
     )
 
+
+class LeadAnalyzeBatchItem(LeadAnalyzeRequest):
+    """Lead to score in a batch, optionally with recorder lookup results"""
+    recorder_data: Optional[Dict[str, Any]] = None
+
+
+@app.post("/api/v1/scout/analyze/batch", response_model=List[LeadAnalyzeResponse])
+async def analyze_leads_batch(leads: List[LeadAnalyzeBatchItem]):
+    """
+    Score many leads in one call (same scoring as /api/v1/scout/analyze).
+    Results are returned in request order.
+    """
+    from app.services.scoring_service import get_scoring_service
+    
+    scorer = get_scoring_service()
+    lead_dicts = [lead.dict(exclude={"recorder_data"}) for lead in leads]
+    results = scorer.score_many(lead_dicts, [lead.recorder_data for lead in leads])
+    return [_analyze_response(result) for result in results]
+
 # --- OFFERS ---
 @app.post("/api/v1/offers", response_model=Offer)
 async def create_offer(offer_in: OfferCreate, db: AsyncSession = Depends(get_db)):
@@ -469,6 +685,86 @@ async def skip_trace_endpoint(lead_id: str, db: AsyncSession = Depends(get_db)):
         "skip_trace_message": result.message
     }
 
+class BulkSkipTraceRequest(BaseModel):
+    lead_ids: List[str]
+    force: bool = False  # Re-trace leads that are already Skiptraced
+
+
+SKIP_TRACE_IN_CHUNK = 500
+
+
+@app.post("/leads/skiptrace/bulk")
+async def bulk_skip_trace(request: BulkSkipTraceRequest, db: AsyncSession = Depends(get_db)):
+    """
+    Skip traces many leads in one call: lookups are deduped by canonical
+    address + owner, cached, and batched to the provider under a bounded
+    pool; found contacts are written back with one bulk UPDATE.
+    """
+    from app.services.skip_trace_service import get_skip_trace_service
+
+    lead_ids = list(dict.fromkeys(request.lead_ids))
+    columns = [LeadModel.id, LeadModel.address_street, LeadModel.address_zip,
+               LeadModel.owner_name, LeadModel.mailing_address, LeadModel.status]
+    leads = {}
+    for i in range(0, len(lead_ids), SKIP_TRACE_IN_CHUNK):
+        chunk = lead_ids[i:i + SKIP_TRACE_IN_CHUNK]
+        result = await db.execute(select(*columns).where(LeadModel.id.in_(chunk)))
+        leads.update({row["id"]: row for row in result.mappings().all()})
+
+    outcomes = {}
+    to_trace = []
+    for lead_id in lead_ids:
+        lead = leads.get(lead_id)
+        if not lead:
+            outcomes[lead_id] = {"lead_id": lead_id, "status": "not_found_in_db"}
+        elif lead["status"] == "Skiptraced" and not request.force:
+            outcomes[lead_id] = {"lead_id": lead_id, "status": "already_skiptraced"}
+        else:
+            to_trace.append(lead)
+
+    skip_trace = get_skip_trace_service()
+    results = await skip_trace.lookup_many([
+        {"address": lead["address_street"], "owner_name": lead["owner_name"], "zip_code": lead["address_zip"]}
+        for lead in to_trace
+    ])
+
+    updates = []
+    for lead, result in zip(to_trace, results):
+        outcomes[lead["id"]] = {
+            "lead_id": lead["id"],
+            "status": result.status,
+            "phone": result.phone,
+            "email": result.email,
+            "message": result.message,
+        }
+        if result.status == "found":
+            updates.append({
+                "lead_id": lead["id"],
+                "phone": result.phone,
+                "email": result.email,
+                "owner_name": result.owner_name or lead["owner_name"],  # Don't overwrite if empty
+                "mailing_address": result.mailing_address or lead["mailing_address"],
+                "social_ids": result.social_ids or {},
+                "status": "Skiptraced",
+                "score_dirty": True,  # mailing_address feeds the out-of-state signal
+            })
+
+    if updates:
+        leads = LeadModel.__table__
+        await db.execute(
+            update(leads).where(leads.c.id == bindparam("lead_id"))
+            .values(score_version=leads.c.score_version + 1),
+            updates,
+        )
+        await db.commit()
+
+    return {
+        "requested": len(lead_ids),
+        "traced": len(to_trace),
+        "updated": len(updates),
+        "results": [outcomes[lead_id] for lead_id in lead_ids],
+    }
+
 @app.post("/leads/{lead_id}/offer")
 async def generate_offer_endpoint(lead_id: str, db: AsyncSession = Depends(get_db)):
     stmt = select(LeadModel).where(LeadModel.id == lead_id)
@@ -534,6 +830,18 @@ async def autocomplete_address(query: str):
     suggestions = await service.autocomplete_address(query)
     return {"suggestions": suggestions}
 
+class OwnerMatchRequest(BaseModel):
+    names: List[str]  # Recorder grantor / grantee names
+    limit: int = 5    # Candidate parcels per name
+
+@app.post("/scout/owner-match")
+async def match_owners_to_parcels(request: OwnerMatchRequest):
+    """Candidate parcels (owner, situs address, match score) for each name, from the parcel owner index."""
+    index = get_parcel_owner_index()
+    matches = await index.resolve(request.names, limit=request.limit)
+    last = await index.last_refreshed()
+    return {"matches": matches, "index_refreshed_at": last.isoformat() if last else None}
+
 @app.post("/scout/market")
 async def analyze_market_endpoint(request: MarketAnalysisRequest):
     service = RealMarketScoutService()
@@ -581,7 +889,10 @@ async def search_leads(filters: SearchFilters):
     scout = _get_scout_service()
     cleaner = CleanerService()
     
-    raw_leads = await scout.fetch_leads(filters.dict())
+    # page_state collects the surplus candidates so "load more" can page through them
+    search_filters = filters.dict()
+    page_state: Dict[str, Any] = {}
+    raw_leads = await scout.fetch_leads(search_filters, page_state=page_state)
     
     with open("debug_cleaner.log", "a") as f:
         f.write(f"API FOUND {len(raw_leads)} RAW LEADS\n")
@@ -622,63 +933,132 @@ async def search_leads(filters: SearchFilters):
             elif len(cleaned_leads) == 0:
                  warning = "No Code Violations found matching your criteria."
 
+    page = cleaned_leads[:filters.limit]
+    cursor = get_search_cursor_store().create(
+        search_filters,
+        page_state.get("pending") or [],
+        page_state.get("primary"),
+        page,
+        ready=page_state.get("ready"),
+    )
+
     return {
-        "leads": cleaned_leads[:filters.limit],
-        "warning": warning
+        "leads": page,
+        "warning": warning,
+        "cursor": cursor.id if cursor.has_more else None,
+        "has_more": cursor.has_more,
+        "search_id": cursor.id,  # For /scout/search/{id}/export
     }
 
+@app.get("/scout/search/{cursor_id}")
+async def search_leads_page(cursor_id: str, limit: Optional[int] = None):
+    """
+    Next page of a stored search. Only this page's candidates are enriched;
+    the cursor expires after 30 minutes of inactivity (re-run the search then).
+    An exhausted cursor stays exportable until it expires.
+    """
+    store = get_search_cursor_store()
+    cursor = store.get(cursor_id)
+    if not cursor:
+        raise HTTPException(status_code=404, detail="Search cursor expired or not found. Run the search again.")
+
+    scout = _get_scout_service()
+    cleaner = CleanerService()
+    page_limit = limit or cursor.filters.get("limit") or 100
+
+    async with cursor.lock:
+        leads = []
+        while len(leads) < page_limit and cursor.has_more:
+            raw_leads = await scout.fetch_next_page(cursor.filters, cursor.pending, cursor.primary,
+                                                    page_limit - len(leads), ready=cursor.ready)
+            leads.extend(cursor.add_served(cleaner.clean_leads(raw_leads)))
+        cursor.pages_served += 1
+        has_more = cursor.has_more
+
+    return {
+        "leads": leads,
+        "warning": None,
+        "cursor": cursor_id if has_more else None,
+        "has_more": has_more,
+    }
+
+SEARCH_EXPORT_FIELDS = [
+    "address", "address_zip", "owner_name", "mailing_address", "property_type",
+    "beds", "baths", "sqft", "lot_size", "year_built", "zoning", "parcel_id",
+    "assessed_value", "last_sale_date", "last_sale_price", "distress_signals",
+    "violation_description", "latitude", "longitude", "source",
+]
+SEARCH_EXPORT_PAGE = 100
+
+
+@app.get("/scout/search/{cursor_id}/export")
+async def export_search(cursor_id: str, format: str = "csv", fields: Optional[str] = None):
+    """
+    Streams every result of a stored search as CSV or Parquet: the pages
+    already served, then the remaining candidates enriched one page at a
+    time (which also exhausts the cursor for paging).
+    """
+    _check_export_format(format)
+    cursor = get_search_cursor_store().get(cursor_id)
+    if not cursor:
+        raise HTTPException(status_code=404, detail="Search cursor expired or not found. Run the search again.")
+    field_names = _csv_param(fields) if fields else SEARCH_EXPORT_FIELDS  # Scout leads are free-form dicts
+
+    async def batches():
+        scout = _get_scout_service()
+        cleaner = CleanerService()
+        async with cursor.lock:
+            for i in range(0, len(cursor.served), SEARCH_EXPORT_PAGE):
+                yield cursor.served[i:i + SEARCH_EXPORT_PAGE]
+            while cursor.has_more:
+                raw_leads = await scout.fetch_next_page(cursor.filters, cursor.pending, cursor.primary,
+                                                        SEARCH_EXPORT_PAGE, ready=cursor.ready)
+                yield cursor.add_served(cleaner.clean_leads(raw_leads))
+
+    return _export_response(format, export_stream(format, batches(), field_names), f"search_{cursor_id[:8]}")
+
+
+SCOUT_IMPORT_FILL_FIELDS = [
+    "owner_name", "sqft", "parcel_id", "zoning", "property_type",
+    "lot_size", "last_sale_date", "last_sale_price", "mailing_address",
+    "latitude", "longitude", "distress_signals", "violation_count", "record_date",
+    "recorder_flags", "bedrooms", "bathrooms"
+]
+
+
 @app.post("/scout/import")
 async def import_leads(leads: List[Dict[str, Any]], db: AsyncSession = Depends(get_db)):
-    imported_count = 0
-    updated_count = 0
-    
+    rows = []
     for lead_data in leads:
-        address = lead_data.get("address")
-        if not address:
-            continue
-            
-        stmt = select(LeadModel).where(LeadModel.address_street == address)
-        result = await db.execute(stmt)
-        existing_lead = result.scalars().first()
-        
-        if existing_lead:
-            updated = False
-            fields_to_update = [
-                "owner_name", "sqft", "parcel_id", "zoning", "property_type", 
-                "lot_size", "last_sale_date", "last_sale_price", "mailing_address",
-                "latitude", "longitude"
-            ]
-            
-            for field in fields_to_update:
-                if not getattr(existing_lead, field) and lead_data.get(field):
-                    setattr(existing_lead, field, lead_data.get(field))
-                    updated = True
-            
-            if updated:
-                updated_count += 1
-        else:
-            new_lead = LeadModel(
-                address_street=address,
-                owner_name=lead_data.get("owner_name"),
-                status="New",
-                strategy=lead_data.get("strategy", "Wholesale"),
-                distress_score=50 if lead_data.get("distress_signals") else 0,
-                sqft=lead_data.get("sqft"),
-                year_built=lead_data.get("year_built"),
-                mailing_address=lead_data.get("mailing_address"),
-                parcel_id=lead_data.get("parcel_id"),
-                zoning=lead_data.get("zoning"),
-                property_type=lead_data.get("property_type"),
-                lot_size=lead_data.get("lot_size"),
-                last_sale_date=lead_data.get("last_sale_date"),
-                last_sale_price=lead_data.get("last_sale_price"),
-                latitude=lead_data.get("latitude"),
-                longitude=lead_data.get("longitude")
-            )
-            db.add(new_lead)
-            imported_count += 1
-            
-    await db.commit()
-    return {"imported": imported_count, "updated": updated_count}
-
+        rows.append({
+            "address_street": lead_data.get("address"),
+            "address_zip": lead_data.get("address_zip"),
+            "owner_name": lead_data.get("owner_name"),
+            "status": "New",
+            "strategy": lead_data.get("strategy", "Wholesale"),
+            "distress_signals": lead_data.get("distress_signals") or [],
+            "violation_count": lead_data.get("violation_count"),
+            "record_date": lead_data.get("record_date"),
+            "recorder_flags": lead_data.get("recorder_flags") or {},
+            "bedrooms": lead_data.get("beds") or lead_data.get("bedrooms"),
+            "bathrooms": lead_data.get("baths") or lead_data.get("bathrooms"),
+            "sqft": lead_data.get("sqft"),
+            "year_built": lead_data.get("year_built"),
+            "mailing_address": lead_data.get("mailing_address"),
+            "parcel_id": lead_data.get("parcel_id"),
+            "zoning": lead_data.get("zoning"),
+            "property_type": lead_data.get("property_type"),
+            "lot_size": lead_data.get("lot_size"),
+            "last_sale_date": lead_data.get("last_sale_date"),
+            "last_sale_price": lead_data.get("last_sale_price"),
+            "latitude": lead_data.get("latitude"),
+            "longitude": lead_data.get("longitude"),
+        })
 
+    outcome = await bulk_upsert_leads(db, rows, fill_fields=SCOUT_IMPORT_FILL_FIELDS)
+    return {
+        "imported": outcome["imported"],
+        "updated": outcome["updated"],
+        "skipped": outcome["skipped"],
+        "results": outcome["results"],
+    }
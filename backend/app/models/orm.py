@@ -1,6 +1,7 @@
-from sqlalchemy import Column, Integer, String, Float, JSON, Boolean, DateTime, ForeignKey, Date, func
+from sqlalchemy import Index, Column, Integer, String, Float, JSON, Boolean, DateTime, ForeignKey, Date, func, event, text, true, inspect
 import uuid
 from app.core.database import Base
+from app.services.pipeline.address import canonical_key
 
 class LeadModel(Base):
     __tablename__ = "leads"
@@ -11,10 +12,11 @@ class LeadModel(Base):
     
     # Address (Aligned with Properties spec)
     address_street = Column(String, index=True, nullable=False) # Was 'address'
+    address_key = Column(String, index=True, nullable=True)  # canonical_key(address_street), the import dedupe key
     address_zip = Column(String(10), index=True, nullable=True)
     
     owner_name = Column(String, nullable=True)
-    status = Column(String, default="New") # New, Skiptraced, Contacted
+    status = Column(String, default="New", index=True) # New, Skiptraced, Contacted
     distress_score = Column(Integer, default=0)
     equity_percent = Column(Float, default=0.0)
     
@@ -36,7 +38,7 @@ class LeadModel(Base):
     year_built = Column(Integer, nullable=True)
     zoning = Column(String, nullable=True)
     property_type = Column(String, nullable=True)
-    parcel_id = Column(String, nullable=True)
+    parcel_id = Column(String, nullable=True, index=True)
     
     # Flags (Boolean)
     has_pool = Column(Boolean, default=False)
@@ -49,10 +51,55 @@ class LeadModel(Base):
     offer_amount = Column(Integer, nullable=True)
     mortgage_amount = Column(Integer, nullable=True)
     
+    # Propensity scoring inputs (scoring_service) - changing any of these marks the score dirty
+    distress_signals = Column(JSON, default=[])
+    violation_count = Column(Integer, nullable=True)
+    record_date = Column(String, nullable=True)     # As received (YYYY-MM-DD, MM/DD/YYYY or epoch ms)
+    recorder_flags = Column(JSON, default={})       # has_notice_sale, has_lien, deed_type ... from recorder lookups
+    
+    # Materialized propensity score (rescoring_service keeps it current)
+    propensity_score = Column(Integer, default=0, server_default=text("0"))
+    propensity_label = Column(String, nullable=True)
+    propensity_signals = Column(JSON, nullable=True)
+    propensity_breakdown = Column(JSON, nullable=True)
+    scored_at = Column(DateTime(timezone=True), nullable=True)
+    score_dirty = Column(Boolean, default=True, server_default=true(), index=True)
+    score_version = Column(Integer, default=0, server_default=text("0"), nullable=False)  # Bumped with every input change
+    
     # Meta
     tags = Column(JSON, default=[])
     strategy = Column(String, nullable=True)
-    source = Column(String, nullable=True)
+    source = Column(String, nullable=True, index=True)
     
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    __table_args__ = (
+        Index("ix_leads_created_at_id", "created_at", "id"),  # Keyset pagination of GET /api/v1/leads
+        Index("ix_leads_propensity_score_id", "propensity_score", "id"),  # Top-N hottest leads
+    )
+
+
+# Columns the propensity score depends on (bedrooms/bathrooms feed the asset score,
+# mailing_address the out-of-state signal)
+SCORE_INPUT_COLUMNS = (
+    "distress_signals", "violation_count", "record_date", "recorder_flags",
+    "mailing_address", "bedrooms", "bathrooms",
+)
+
+
+def _mark_score_dirty(target, value, oldvalue, initiator):
+    if value != oldvalue:
+        target.score_dirty = True
+        if inspect(target).persistent:
+            # Incremented in SQL so a rescore that read the old version cannot clear the flag
+            target.score_version = LeadModel.score_version + 1
+
+
+for _column in SCORE_INPUT_COLUMNS:
+    event.listen(getattr(LeadModel, _column), "set", _mark_score_dirty)
+
+
+@event.listens_for(LeadModel.address_street, "set")
+def _set_address_key(target, value, oldvalue, initiator):
+    target.address_key = canonical_key(value) or None
@@ -0,0 +1,28 @@
+from sqlalchemy import Index, Column, Integer, String, DateTime, func
+from app.core.database import Base
+
+
+class ParcelOwnerModel(Base):
+    """Owner and situs address of a Pima County parcel (GIS Layer 12), for owner-name matching."""
+    __tablename__ = "parcel_owners"
+
+    parcel_id = Column(String, primary_key=True)
+    owner_name = Column(String, nullable=True)       # MAIL1
+    address_street = Column(String, nullable=True)   # ADDRESS_OL
+    address_city = Column(String, nullable=True)     # JURIS_OL
+    address_zip = Column(String(10), nullable=True)
+    mailing_address = Column(String, nullable=True)  # MAIL2-MAIL5
+    refreshed_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+
+
+class ParcelOwnerKeyModel(Base):
+    """Blocking keys of a parcel's owner name (owner_names.blocking_keys)."""
+    __tablename__ = "parcel_owner_keys"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    parcel_id = Column(String, index=True, nullable=False)
+    key = Column(String, nullable=False)
+
+    __table_args__ = (
+        Index("ix_parcel_owner_keys_key", "key"),
+    )
@@ -0,0 +1,56 @@
+from sqlalchemy import Index, Column, Integer, String, JSON, Date, DateTime, func
+from app.core.database import Base
+
+
+class RecorderDocumentModel(Base):
+    """Every Pima County Recorder document seen in a search (app.services.recorder_catalog)."""
+    __tablename__ = "recorder_documents"
+
+    doc_id = Column(String, primary_key=True)            # Portal data-documentid
+    doc_number = Column(String, index=True, nullable=True)  # Sequence number
+    doc_type = Column(String, index=True, nullable=True)
+    record_date = Column(Date, index=True, nullable=True)
+    grantor = Column(String, nullable=True)
+    grantee = Column(String, nullable=True)
+    book_page = Column(String, nullable=True)
+    related_docs = Column(JSON, default=[])
+
+    downloaded_path = Column(String, nullable=True)     # PDF or <doc_id>_images directory
+    extraction = Column(JSON, nullable=True)            # extract_with_vertex_ai result
+
+    first_seen = Column(DateTime(timezone=True), server_default=func.now())
+    last_seen = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class RecorderPartyModel(Base):
+    """Grantor / grantee names of a catalog document, normalized for prefix lookups."""
+    __tablename__ = "recorder_document_parties"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    doc_id = Column(String, index=True, nullable=False)
+    role = Column(String, nullable=False)       # grantor / grantee
+    name = Column(String, nullable=False)
+    name_norm = Column(String, nullable=False)  # owner_names.normalize_owner_name
+
+    __table_args__ = (
+        Index("ix_recorder_parties_name_role", "name_norm", "role"),
+    )
+
+
+class RecorderCoverageModel(Base):
+    """
+    Recording-date ranges already searched on the portal, per search scope
+    (e.g. "grantee" + normalized name), so repeat lookups only search the gaps.
+    """
+    __tablename__ = "recorder_coverage"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    scope = Column(String, nullable=False)
+    key = Column(String, nullable=False)
+    start_date = Column(Date, nullable=False)
+    end_date = Column(Date, nullable=False)
+    searched_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_recorder_coverage_scope_key", "scope", "key"),
+    )
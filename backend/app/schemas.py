@@ -73,6 +73,12 @@ class Lead(LeadBase):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
+    # Materialized propensity score
+    propensity_score: Optional[int] = None
+    propensity_label: Optional[str] = None
+    propensity_signals: Optional[List[str]] = None
+    propensity_breakdown: Optional[Dict[str, int]] = None
+
     class Config:
         from_attributes = True
 
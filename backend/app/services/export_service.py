@@ -0,0 +1,170 @@
+"""
+Export Service
+Streams rows (from the leads table or a stored Scout search) as CSV or
+Parquet without materializing the full result: rows arrive in batches from
+an async iterator and each batch is encoded and yielded before the next is
+fetched, so memory stays at one batch regardless of export size.
+"""
+import csv
+import io
+import json
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from sqlalchemy import Boolean, Date, DateTime, Float, Integer, JSON
+
+from app.core.database import AsyncSessionLocal
+
+# Parquet needs pyarrow (optional - CSV export works without it)
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+EXPORT_BATCH_SIZE = 2000
+
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+def _cell(value: Any) -> Any:
+    """Flattens lists/dicts (tags, distress_signals, social_ids) for tabular output."""
+    if isinstance(value, list):
+        return "; ".join(str(v) for v in value)
+    if isinstance(value, dict):
+        return json.dumps(value)
+    return value
+
+
+async def stream_query_rows(stmt, batch_size: int = EXPORT_BATCH_SIZE) -> AsyncIterator[List[Dict]]:
+    """
+    Runs a column select with a server-side cursor (yield_per) in its own
+    session - the request session is closed before a streaming body is sent.
+    """
+    async with AsyncSessionLocal() as session:
+        result = await session.stream(stmt.execution_options(yield_per=batch_size))
+        async for partition in result.mappings().partitions(batch_size):
+            yield [dict(row) for row in partition]
+
+
+async def csv_stream(batches: AsyncIterator[List[Dict]], columns: List[str]) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    async for batch in batches:
+        for row in batch:
+            writer.writerow([_cell(row.get(c)) for c in columns])
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def arrow_type(column_type) -> "pa.DataType":
+    """Arrow type for a SQLAlchemy column type (anything unknown is exported as text)."""
+    if isinstance(column_type, Boolean):
+        return pa.bool_()
+    if isinstance(column_type, Integer):
+        return pa.int64()
+    if isinstance(column_type, Float):
+        return pa.float64()
+    if isinstance(column_type, DateTime):
+        return pa.timestamp("us")
+    if isinstance(column_type, Date):
+        return pa.date32()
+    if isinstance(column_type, JSON):
+        return pa.string()
+    return pa.string()
+
+
+class _ChunkSink:
+    """
+    Write-only file object for ParquetWriter that hands written bytes back
+    to the generator. tell() reports the total written so column chunk
+    offsets in the footer stay correct.
+    """
+
+    def __init__(self):
+        self.chunks: List[bytes] = []
+        self.position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self.chunks.append(data)
+        self.position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def writable(self) -> bool:
+        return True
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def _arrow_value(value: Any, arrow_t) -> Any:
+    if value is None:
+        return None
+    if pa.types.is_string(arrow_t):
+        value = _cell(value)
+        return value if isinstance(value, str) else str(value)
+    if pa.types.is_date32(arrow_t) and isinstance(value, str):
+        try:
+            return date.fromisoformat(value[:10])
+        except ValueError:
+            return None
+    if pa.types.is_timestamp(arrow_t) and isinstance(value, datetime) and value.tzinfo:
+        return value.replace(tzinfo=None)
+    return value
+
+
+async def parquet_stream(
+    batches: AsyncIterator[List[Dict]],
+    columns: List[str],
+    types: Optional[Dict[str, "pa.DataType"]] = None,
+) -> AsyncIterator[bytes]:
+    """One Parquet row group per batch; bytes are yielded as each group is written."""
+    types = types or {}
+    schema = pa.schema([(c, types.get(c, pa.string())) for c in columns])
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(pa.PythonFile(sink, mode="w"), schema, compression="snappy")
+    try:
+        async for batch in batches:
+            if not batch:
+                continue
+            arrays = {
+                c: [_arrow_value(row.get(c), schema.field(c).type) for row in batch]
+                for c in columns
+            }
+            writer.write_table(pa.Table.from_pydict(arrays, schema=schema))
+            data = sink.drain()
+            if data:
+                yield data
+    finally:
+        writer.close()
+    data = sink.drain()
+    if data:
+        yield data
+
+
+def export_stream(fmt: str, batches: AsyncIterator[List[Dict]], columns: List[str],
+                  types: Optional[Dict[str, "pa.DataType"]] = None) -> AsyncIterator[bytes]:
+    if fmt == "parquet":
+        return parquet_stream(batches, columns, types)
+    return csv_stream(batches, columns)
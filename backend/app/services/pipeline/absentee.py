@@ -0,0 +1,119 @@
+"""
+Absentee Owner Detection
+One rule for every place that asks "does the owner live somewhere else?"
+(_map_pima_parcel, parcel enrichment of violations, _fetch_absentee_owners,
+_verify_filter / _is_absentee), evaluated over arrays of (situs, mailing) pairs.
+
+Rule, on canonical tokens from app.services.pipeline.address:
+    1. Missing situs street or mailing address -> not absentee (unknown)
+    2. Situs zip and mailing zip both known and different -> absentee
+    3. Situs street (unit dropped) appears as a whole-token run in the mailing
+       address -> owner-occupied
+    4. Same check without the street suffix ("4842 N MARYVALE" in the mailing)
+       -> owner-occupied
+    5. Otherwise -> absentee
+
+Tokens and per-address derived values are memoized, so a pool of N parcels
+costs N dict lookups plus one substring test per pair.
+"""
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from app.services.pipeline.address import canonical_tokens, SUFFIX_CANONICAL
+
+ABSENTEE_SIGNAL = "Absentee Owner"
+
+_SUFFIXES = frozenset(SUFFIX_CANONICAL.values())
+_ZIP_RE = re.compile(r"^(\d{5})(?:-?\d{4})?$")
+
+
+@lru_cache(maxsize=65536)
+def _situs_patterns(situs: str) -> Tuple[str, str]:
+    """(' STREET LINE ', ' STREET LINE WITHOUT SUFFIX ') padded for whole-token matching."""
+    tokens = canonical_tokens(situs.split(",", 1)[0])
+    if "#" in tokens:
+        tokens = tokens[:tokens.index("#")]
+    if not tokens:
+        return "", ""
+    full = " " + " ".join(tokens) + " "
+    # Number + Name + Suffix: mailing addresses sometimes omit the suffix
+    if len(tokens) > 2 and tokens[-1] in _SUFFIXES:
+        return full, " " + " ".join(tokens[:-1]) + " "
+    return full, ""
+
+
+@lru_cache(maxsize=65536)
+def _mailing_parts(mailing: str) -> Tuple[str, Optional[str]]:
+    """(' PADDED CANONICAL MAILING ', trailing 5-digit zip or None)."""
+    tokens = canonical_tokens(mailing)
+    if not tokens:
+        return "", None
+    zip_match = _ZIP_RE.match(tokens[-1]) if len(tokens) > 1 else None
+    return " " + " ".join(tokens) + " ", (zip_match.group(1) if zip_match else None)
+
+
+def _zip5(value) -> Optional[str]:
+    if not value:
+        return None
+    z = str(value).strip().split("-")[0][:5]
+    return z if len(z) == 5 and z.isdigit() else None
+
+
+def is_absentee_owner(situs: str, mailing: str, situs_zip: Optional[str] = None) -> bool:
+    """Single-pair form of classify_absentee."""
+    if not situs or not mailing:
+        return False
+    full, no_suffix = _situs_patterns(str(situs))
+    mail, mail_zip = _mailing_parts(str(mailing))
+    if not full or not mail:
+        return False
+
+    prop_zip = _zip5(situs_zip)
+    if prop_zip and mail_zip and prop_zip != mail_zip:
+        return True
+    if full in mail:
+        return False
+    if no_suffix and no_suffix in mail:
+        return False
+    return True
+
+
+def classify_absentee(
+    situs: Sequence[str],
+    mailing: Sequence[str],
+    situs_zips: Optional[Sequence[Optional[str]]] = None,
+) -> List[bool]:
+    """
+    Batch absentee classification over parallel arrays.
+    situs_zips is optional; without it only the street rule applies.
+    """
+    if situs_zips is None:
+        situs_zips = [None] * len(situs)
+    return [is_absentee_owner(s, m, z) for s, m, z in zip(situs, mailing, situs_zips)]
+
+
+def _lead_fields(lead: Dict) -> Tuple[str, str, Optional[str]]:
+    return (
+        lead.get("address_street") or lead.get("address") or "",
+        lead.get("mailing_address") or "",
+        lead.get("address_zip"),
+    )
+
+
+def mark_absentee(leads: Iterable[Dict]) -> List[bool]:
+    """
+    Classifies lead dicts in one pass and appends the "Absentee Owner"
+    distress signal to the ones that are. Returns the per-lead flags.
+    """
+    leads = list(leads)
+    if not leads:
+        return []
+    situs, mailing, zips = zip(*(_lead_fields(lead) for lead in leads))
+    flags = classify_absentee(situs, mailing, zips)
+    for lead, flag in zip(leads, flags):
+        if flag:
+            signals = lead.get("distress_signals") or []
+            if ABSENTEE_SIGNAL not in signals:
+                lead["distress_signals"] = signals + [ABSENTEE_SIGNAL]
+    return flags
@@ -0,0 +1,160 @@
+"""
+Address Normalization
+One place for every address comparison in the pipeline. Patterns and token
+tables are compiled once; canonical keys are memoized because the same
+streets come back on every search (violations, parcels, HomeHarvest, cache).
+
+    normalize_address("123 North Main Street, Tucson")  -> "123 N MAIN ST, TUCSON"   (display / Cleaner)
+    canonical_key("123 n. main st., Tucson, AZ")        -> "123 N MAIN ST"           (cache + dedupe key)
+    location_key("123 Main St, Tucson, AZ 85705")      -> "123 MAIN ST|85705"       (same, across cities)
+    canonical_address("PO Box 5, Tucson, AZ 85705")     -> "PO BOX 5 TUCSON AZ 85705"
+    pima_query_address("123 N Main Avenue Apt 4")       -> "123 N MAIN AV"           (ADDRESS_OL LIKE)
+"""
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Street suffix spellings -> one canonical abbreviation.
+# Pima GIS uses short forms (AV, BL, WY, CI, TE ...), user input and
+# HomeHarvest use USPS forms or full words; all collapse to the same token.
+SUFFIX_CANONICAL: Dict[str, str] = {
+    "AV": "AVE", "AVE": "AVE", "AVENUE": "AVE",
+    "BL": "BLVD", "BLVD": "BLVD", "BOULEVARD": "BLVD",
+    "WY": "WAY", "WAY": "WAY",
+    "PL": "PL", "PLACE": "PL",
+    "TR": "TRL", "TRL": "TRL", "TRAIL": "TRL",
+    "PK": "PKWY", "PKWY": "PKWY", "PARKWAY": "PKWY",
+    "RD": "RD", "ROAD": "RD",
+    "ST": "ST", "STR": "ST", "STREET": "ST",
+    "DR": "DR", "DRIVE": "DR",
+    "LN": "LN", "LANE": "LN",
+    "CT": "CT", "COURT": "CT",
+    "CI": "CIR", "CIR": "CIR", "CIRCLE": "CIR",
+    "TE": "TER", "TER": "TER", "TERRACE": "TER",
+    "LP": "LOOP", "LOOP": "LOOP",
+    "HWY": "HWY", "HIGHWAY": "HWY",
+}
+
+DIRECTIONAL_CANONICAL: Dict[str, str] = {
+    "NORTH": "N", "SOUTH": "S", "EAST": "E", "WEST": "W",
+    "NORTHEAST": "NE", "NORTHWEST": "NW", "SOUTHEAST": "SE", "SOUTHWEST": "SW",
+}
+
+UNIT_DESIGNATORS = frozenset({"#", "APT", "APARTMENT", "UNIT", "STE", "SUITE", "SPC", "SPACE"})
+
+# Canonical suffix -> the abbreviation Pima stores in ADDRESS_OL
+PIMA_SUFFIX: Dict[str, str] = {
+    "AVE": "AV", "BLVD": "BL", "WAY": "WY", "TRL": "TR", "PKWY": "PK",
+    "CIR": "CI", "TER": "TE", "LOOP": "LP",
+}
+
+_TOKEN_CANONICAL: Dict[str, str] = {**SUFFIX_CANONICAL, **DIRECTIONAL_CANONICAL}
+
+_WS_RE = re.compile(r"\s+")
+_PUNCT_RE = re.compile(r"[.,;:'\"]")
+_HASH_RE = re.compile(r"#")
+_WORD_RE = re.compile(r"\b(" + "|".join(sorted(_TOKEN_CANONICAL, key=len, reverse=True)) + r")\b")
+
+
+def normalize_address(address: str) -> str:
+    """
+    Display form: uppercase, single spaces, standardized suffixes/directionals.
+    Commas are kept so "street, city, state zip" still reads naturally.
+    """
+    if not address:
+        return ""
+    addr = _WS_RE.sub(" ", str(address).upper()).strip()
+    return _WORD_RE.sub(lambda m: _TOKEN_CANONICAL[m.group(1)], addr)
+
+
+@lru_cache(maxsize=65536)
+def _tokens(address: str) -> Tuple[str, ...]:
+    addr = _HASH_RE.sub(" # ", _PUNCT_RE.sub(" ", address.upper()))
+    out = []
+    for tok in addr.split():
+        if tok in UNIT_DESIGNATORS:
+            tok = "#"
+        else:
+            tok = _TOKEN_CANONICAL.get(tok, tok)
+        # "APT #4" / "UNIT # 4" -> one designator
+        if tok == "#" and out and out[-1] == "#":
+            continue
+        out.append(tok)
+    return tuple(out)
+
+
+def canonical_tokens(address: str) -> Tuple[str, ...]:
+    """Canonical tokens of the whole address (punctuation dropped, unit designators -> '#')."""
+    if not address:
+        return ()
+    return _tokens(str(address))
+
+
+def canonical_address(address: str) -> str:
+    """Canonical form of the whole address, for comparing full strings (e.g. mailing addresses)."""
+    return " ".join(canonical_tokens(address))
+
+
+@lru_cache(maxsize=65536)
+def _key(address: str) -> str:
+    return " ".join(_tokens(address.split(",", 1)[0]))
+
+
+def canonical_key(address: str) -> str:
+    """
+    Cache / dedupe key: canonical street line only (text before the first comma),
+    so "123 N Main Av" and "123 NORTH MAIN AVE, Tucson, AZ 85705" share a key.
+    """
+    if not address:
+        return ""
+    return _key(str(address))
+
+
+def canonical_keys(addresses: Iterable[str]) -> List[str]:
+    """Batch form of canonical_key."""
+    return [canonical_key(a) for a in addresses]
+
+
+_ZIP_RE = re.compile(r"\b(\d{5})(?:-\d{4})?\b")
+_STATE_RE = re.compile(r"\s+[A-Z]{2}$")
+
+
+def locality(address: str, city: Optional[str] = None, zip_code: Optional[str] = None) -> str:
+    """
+    Where a street line is: the 5-digit zip (given, or from the text after the
+    street line), else the city (given, or the part after the first comma);
+    "" if neither is known.
+    """
+    zip_match = _ZIP_RE.search(str(zip_code or ""))
+    tail = str(address).split(",", 1)[1] if address and "," in str(address) else ""
+    if not zip_match:
+        zip_match = _ZIP_RE.search(tail)
+    if zip_match:
+        return zip_match.group(1)
+    if not city:
+        city = _STATE_RE.sub("", _ZIP_RE.sub("", tail.split(",", 1)[0]).strip().upper())
+        if city in ("AZ", "ARIZONA"):
+            city = ""
+    return " ".join(str(city or "").upper().split())
+
+
+def location_key(address: str, city: Optional[str] = None, zip_code: Optional[str] = None) -> str:
+    """
+    canonical_key plus locality, for keys that must not merge the same street
+    line in two cities / zips ("" if there is no street line).
+    """
+    key = canonical_key(address)
+    if not key:
+        return ""
+    return f"{key}|{locality(address, city, zip_code)}"
+
+
+def pima_query_address(address: str) -> str:
+    """
+    Street line in the form used for ADDRESS_OL / ADDRESS LIKE queries:
+    Pima suffix abbreviations (AVENUE -> AV, BOULEVARD -> BL), no unit/apt part.
+    """
+    tokens = canonical_tokens(str(address).split(",", 1)[0]) if address else ()
+    if "#" in tokens:
+        tokens = tokens[:tokens.index("#")]
+    return " ".join(PIMA_SUFFIX.get(t, t) for t in tokens)
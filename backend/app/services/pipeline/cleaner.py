@@ -1,5 +1,5 @@
-import re
 import uuid
+from app.services.pipeline.address import normalize_address, canonical_address
 
 class CleanerService:
     def __init__(self):
@@ -30,10 +30,11 @@ class CleanerService:
             norm_addr = self._normalize_address(raw_addr)
             lead["address"] = norm_addr
             
-            # 2. Deduplicate in batch
-            if norm_addr in seen_addresses:
+            # 2. Deduplicate in batch (canonical form: "Ave"/"AV", "#4"/"Apt 4" etc. collapse)
+            dedupe_key = canonical_address(norm_addr)
+            if dedupe_key in seen_addresses:
                 continue
-            seen_addresses.add(norm_addr)
+            seen_addresses.add(dedupe_key)
             
             # 3. Basic Validation
             if "TUCSON" not in norm_addr and "AZ" not in norm_addr:
@@ -56,31 +57,4 @@ class CleanerService:
         """
         Converts to uppercase, removes extra spaces, standardizes suffixes.
         """
-        if not address:
-            return ""
-            
-        addr = address.upper().strip()
-        
-        # Remove multiple spaces
-        addr = re.sub(r'\s+', ' ', addr)
-        
-        # Standardize common suffixes (very basic list)
-        replacements = {
-            " AVENUE": " AVE",
-            " STREET": " ST",
-            " ROAD": " RD",
-            " DRIVE": " DR",
-            " LANE": " LN",
-            " BOULEVARD": " BLVD",
-            " PLACE": " PL",
-            " COURT": " CT",
-            " NORTH ": " N ",
-            " SOUTH ": " S ",
-            " EAST ": " E ",
-            " WEST ": " W "
-        }
-        
-        for old, new in replacements.items():
-            addr = addr.replace(old, new)
-            
-        return addr
+        return normalize_address(address)
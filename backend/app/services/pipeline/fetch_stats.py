@@ -0,0 +1,113 @@
+"""
+Fetch Stats - Learned Pass Rates
+Records how many primary-source candidates survive the AND-logic filters per
+(primary source, secondary filters, property types, location) so fetch_leads
+can size its first fetch from observed hit rates instead of hardcoded rarity
+guesses. The secondary filters are part of the key because the recorded rate
+includes their pass rates - "Code Violations" alone passes far more than
+"Code Violations" AND "Absentee Owner".
+
+Persisted next to zip_counts.json as cache/fetch_stats.json:
+    {"Code Violations|Absentee Owner|Vacant Land|85705": {"fetched": 1200, "passed": 31, "_updated": "..."},
+     "Code Violations|-|all|85705": {...}, ...}
+
+Every observation is also folded into the location-wide "*" row, which is the
+fallback when a specific zip has too few samples.
+"""
+import os
+import json
+import math
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence
+
+MIN_SAMPLES = 50          # fetched candidates needed before a row is trusted
+DECAY_AT = 20000          # halve a row once it has seen this many candidates (keeps it adaptive)
+SAFETY = 1.25             # fetch 25% more than the expected need
+MIN_MULTIPLIER = 3        # same floor as the hardcoded estimate
+MAX_MULTIPLIER = 50
+
+
+def _types_key(property_types: Optional[List[str]], property_subtypes: Optional[List[str]] = None) -> str:
+    types = sorted(set((property_types or []) + (property_subtypes or [])))
+    if not types or "all" in [t.lower() for t in types]:
+        return "all"
+    return "+".join(types)
+
+
+def _secondary_key(secondary: Sequence[str]) -> str:
+    return "+".join(sorted(set(secondary))) or "-"
+
+
+def _location_key(filters: Dict) -> str:
+    if filters.get("zip_code"):
+        return str(filters["zip_code"])[:5]
+    if filters.get("city"):
+        return f"city:{str(filters['city']).upper().strip()}"
+    return "*"
+
+
+class FetchStats:
+    """Small persistent pass-rate table (one JSON file, loaded once per ScoutService)."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.rows: Dict[str, Dict] = self._load()
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            if os.path.exists(self.path):
+                with open(self.path, "r") as f:
+                    return json.load(f)
+        except Exception as e:
+            print(f"[Scout] Error loading fetch stats: {e}")
+        return {}
+
+    def _save(self):
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, "w") as f:
+                json.dump(self.rows, f, indent=2, sort_keys=True)
+        except Exception as e:
+            print(f"[Scout] Error saving fetch stats: {e}")
+
+    @staticmethod
+    def key(primary: str, filters: Dict, location: Optional[str] = None, secondary: Sequence[str] = ()) -> str:
+        types = _types_key(filters.get("property_types"), filters.get("property_subtypes"))
+        location = location if location is not None else _location_key(filters)
+        return f"{primary}|{_secondary_key(secondary)}|{types}|{location}"
+
+    def record(self, primary: str, filters: Dict, fetched: int, passed: float, secondary: Sequence[str] = ()):
+        """
+        Adds one observation (fetched primary candidates, of which `passed`
+        survived the property-type filter and every secondary filter).
+        """
+        if fetched <= 0:
+            return
+        now = datetime.now().isoformat()
+        keys = {self.key(primary, filters, secondary=secondary), self.key(primary, filters, "*", secondary)}
+        for k in keys:
+            row = self.rows.setdefault(k, {"fetched": 0, "passed": 0.0})
+            row["fetched"] += fetched
+            row["passed"] += passed
+            if row["fetched"] > DECAY_AT:
+                row["fetched"] = row["fetched"] // 2
+                row["passed"] = row["passed"] / 2
+            row["_updated"] = now
+        self._save()
+
+    def pass_rate(self, primary: str, filters: Dict, secondary: Sequence[str] = ()) -> Optional[float]:
+        """Observed pass rate for this search shape, falling back to the location-wide row."""
+        for k in (self.key(primary, filters, secondary=secondary), self.key(primary, filters, "*", secondary)):
+            row = self.rows.get(k)
+            if row and row.get("fetched", 0) >= MIN_SAMPLES:
+                return row["passed"] / row["fetched"]
+        return None
+
+    def multiplier(self, primary: str, filters: Dict, secondary: Sequence[str] = ()) -> Optional[int]:
+        """Fetch multiplier from the learned pass rate, or None if there is not enough data yet."""
+        rate = self.pass_rate(primary, filters, secondary)
+        if rate is None:
+            return None
+        if rate <= 0:
+            return MAX_MULTIPLIER
+        return max(MIN_MULTIPLIER, min(MAX_MULTIPLIER, math.ceil(SAFETY / rate)))
@@ -0,0 +1,191 @@
+"""
+Lead Import - Set-Based Upsert
+Shared by POST /api/v1/leads/import and POST /scout/import. Replaces one
+SELECT per incoming lead with:
+
+    1. canonical keys for the whole batch (app.services.pipeline.address)
+    2. chunked `address_key IN (...)` lookups on the stored canonical key, so
+       "123 Main Street" finds "123 MAIN ST"; a match must also be in the same
+       zip / city (address.locality) when both sides know it
+    3. one executemany INSERT for new leads (propensity score computed for the
+       batch), field-fill UPDATEs for existing ones (flushed together by the
+       session; changed scoring inputs mark the score dirty)
+    4. a single commit; any error rolls the whole batch back
+
+Every input row gets an outcome: imported / updated / skipped / duplicate / invalid.
+Repeats within a batch are detected on address.location_key (street + zip /
+city), so the same street line in two cities imports twice.
+
+Leads stored before address_key existed are keyed by backfill_address_keys
+(run at startup).
+"""
+import uuid
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import AsyncSessionLocal
+from app.models.orm import LeadModel
+from app.services.pipeline.address import canonical_keys, locality, location_key
+from app.services.rescoring_service import score_columns
+
+IN_CHUNK = 500  # Stays under SQLite's 999 bound-parameter limit
+
+LEAD_COLUMNS = frozenset(c.name for c in LeadModel.__table__.columns) - {"id", "created_at", "updated_at"}
+
+
+def _coerce_date(value) -> Optional[date]:
+    """Scout sends sale dates as 'YYYY-MM-DD' strings; the column is a DATE."""
+    if value is None or isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return None
+
+
+def _coerce_row(values: Dict[str, Any]) -> Dict[str, Any]:
+    row = {k: v for k, v in values.items() if k in LEAD_COLUMNS}
+    if "last_sale_date" in row:
+        row["last_sale_date"] = _coerce_date(row["last_sale_date"])
+    return row
+
+
+async def _fetch_existing(db: AsyncSession, keys: Iterable[str]) -> Dict[str, List[LeadModel]]:
+    """Existing leads per canonical key, looked up on address_key with chunked IN queries."""
+    keys = sorted(set(keys))
+    existing: Dict[str, List[LeadModel]] = {}
+    for i in range(0, len(keys), IN_CHUNK):
+        result = await db.execute(select(LeadModel).where(LeadModel.address_key.in_(keys[i:i + IN_CHUNK])))
+        for lead in result.scalars().all():
+            existing.setdefault(lead.address_key, []).append(lead)
+    return existing
+
+
+def _match_existing(leads: List[LeadModel], where: str) -> Optional[LeadModel]:
+    """
+    The stored lead an incoming row (located at `where`) is: same zip / city
+    first, else one whose location is unknown - or any, if the row's is.
+    """
+    located = [(lead, locality(lead.address_street, zip_code=lead.address_zip)) for lead in leads]
+    for lead, lead_where in located:
+        if lead_where == where:
+            return lead
+    for lead, lead_where in located:
+        if not where or not lead_where:
+            return lead
+    return None
+
+
+async def backfill_address_keys(batch_size: int = 1000) -> int:
+    """Sets address_key on leads stored before the column existed. Returns the number keyed."""
+    total = 0
+    try:
+        while True:
+            async with AsyncSessionLocal() as db:
+                result = await db.execute(
+                    select(LeadModel.id, LeadModel.address_street)
+                    .where(LeadModel.address_key.is_(None), LeadModel.address_street.isnot(None))
+                    .limit(batch_size)
+                )
+                rows = result.all()
+                updates = [{"id": lead_id, "address_key": key}
+                           for (lead_id, _), key in zip(rows, canonical_keys(r.address_street for r in rows)) if key]
+                if updates:
+                    await db.execute(update(LeadModel), updates)
+                    await db.commit()
+            total += len(updates)
+            # Streets with no canonical key stay NULL; stop once a batch keys nothing new
+            if len(rows) < batch_size or not updates:
+                break
+    except Exception as e:
+        print(f"[Import] Address key backfill failed after {total} leads: {e}")
+    if total:
+        print(f"[Import] Keyed {total} existing leads for dedupe")
+    return total
+
+
+async def bulk_upsert_leads(
+    db: AsyncSession,
+    rows: List[Dict[str, Any]],
+    fill_fields: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Upserts lead rows (dicts of LeadModel column values, address_street required).
+
+    Existing leads (same canonical address, in the same zip / city when
+    known) get their empty `fill_fields` filled from the incoming row - or
+    are skipped if fill_fields is None. Repeats of an address within the
+    batch are reported as "duplicate".
+
+    Returns {"imported", "updated", "skipped", "results": [{index, address, status, id}]}.
+    """
+    results: List[Dict[str, Any]] = []
+    addresses = [(r.get("address_street") or "").strip() for r in rows]
+    keys = canonical_keys(addresses)
+
+    existing = await _fetch_existing(db, [k for k in keys if k])
+
+    to_insert: List[Dict[str, Any]] = []
+    seen: Dict[str, str] = {}  # location key -> lead id handled earlier in this batch
+    counts = {"imported": 0, "updated": 0, "skipped": 0}
+
+    for index, (row, address, key) in enumerate(zip(rows, addresses, keys)):
+        if not key:
+            results.append({"index": index, "address": address, "status": "invalid", "id": None})
+            continue
+        where = locality(address, zip_code=row.get("address_zip"))
+        batch_key = location_key(address, zip_code=row.get("address_zip"))
+        if batch_key in seen:
+            results.append({"index": index, "address": address, "status": "duplicate", "id": seen[batch_key]})
+            continue
+
+        lead = _match_existing(existing.get(key, []), where)
+        if lead is not None:
+            seen[batch_key] = lead.id
+            status = "skipped"
+            if fill_fields:
+                values = _coerce_row(row)
+                for field in fill_fields:
+                    if not getattr(lead, field) and values.get(field):
+                        setattr(lead, field, values[field])
+                        status = "updated"
+            counts[status] += 1
+            results.append({"index": index, "address": address, "status": status, "id": lead.id})
+            continue
+
+        values = _coerce_row(row)
+        values["address_street"] = address
+        values["address_key"] = key
+        values["id"] = str(uuid.uuid4())
+        to_insert.append(values)
+        seen[batch_key] = values["id"]
+        counts["imported"] += 1
+        results.append({"index": index, "address": address, "status": "imported", "id": values["id"]})
+
+    # Materialized propensity score for new leads (instead of a placeholder
+    # distress_score); rows that carry their own distress_score keep it
+    for values, score_cols in zip(to_insert, score_columns(to_insert)):
+        values.update(score_cols)
+        if values.get("distress_score") is None:
+            values["distress_score"] = score_cols["propensity_score"]
+
+    try:
+        if to_insert:
+            # executemany wants one column set; fill the gaps with column defaults
+            columns = set().union(*to_insert)
+            defaults = {c.name: c.default.arg for c in LeadModel.__table__.columns
+                        if c.name in columns and c.default is not None and not callable(c.default.arg)}
+            batch = [{c: r.get(c, defaults.get(c)) for c in columns} for r in to_insert]
+            await db.execute(insert(LeadModel), batch)
+        await db.commit()
+    except Exception as e:
+        await db.rollback()
+        print(f"[Import] Bulk upsert failed, rolled back {len(rows)} rows: {e}")
+        raise
+
+    print(f"[Import] {len(rows)} rows: {counts['imported']} imported, {counts['updated']} updated, "
+          f"{counts['skipped']} skipped")
+    return {**counts, "results": results}
@@ -0,0 +1,239 @@
+"""
+Parcel Owner Index - Matches recorder grantor / grantee names to parcels.
+
+Recorder documents carry party names but no address. The index keeps every
+Pima County parcel's owner (MAIL1 from GIS Layer 12) and situs address in
+parcel_owners, with the owner's blocking keys (owner_names.blocking_keys:
+last name + first initial per person, legal-form-stripped name per entity)
+in parcel_owner_keys. Resolving a batch of names is then chunked IN queries
+on the key index plus in-memory scoring - no per-name GIS LIKE queries.
+
+    index = get_parcel_owner_index()
+    await index.refresh()                                # full Layer 12 pass
+    matches = await index.resolve(["SMITH JOHN A", "ACME HOLDINGS INC"])
+    # {"SMITH JOHN A": [{"parcel_id", "owner_name", "address", ..., "score"}], ...}
+
+A refresh pages through the layer by OBJECTID and rewrites the index page by
+page, so lookups keep working during it; parcels not seen by a completed
+refresh are dropped. run_owner_index_refresh keeps it within
+PARCEL_OWNER_INDEX_TTL_HOURS (started from app startup).
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import delete, func, insert, select
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.parcel import ParcelOwnerKeyModel, ParcelOwnerModel
+from app.services.pipeline.owner_names import blocking_keys, match_score
+
+LAYER_FIELDS = "OBJECTID,PARCEL,MAIL1,MAIL2,MAIL3,MAIL4,MAIL5,ZIP,ADDRESS_OL,JURIS_OL"
+PAGE_SIZE = 2000        # Layer 12 maxRecordCount
+IN_CHUNK = 500          # Stays under SQLite's 999 bound-parameter limit
+MIN_MATCH_SCORE = 0.6   # Share of the party's name tokens the owner name must contain
+MAX_CANDIDATES = 5
+
+
+def _mailing_address(attrs: Dict) -> str:
+    parts = [str(attrs.get(f"MAIL{i}") or "").strip() for i in range(2, 6)]
+    return ", ".join(p for p in parts if p and p != ".")
+
+
+def _parcel_row(attrs: Dict, refreshed_at: datetime) -> Optional[Dict]:
+    parcel_id = str(attrs.get("PARCEL") or "").strip()
+    if not parcel_id:
+        return None
+    street = (attrs.get("ADDRESS_OL") or "").strip() or None
+    mailing = _mailing_address(attrs)
+    zip_code = str(attrs.get("ZIP") or "").split("-")[0][:5] or None
+    # Layer 12 ZIP is the owner's mailing zip - it is the property's only when the owner lives there
+    owner_occupied = bool(street) and mailing.upper().startswith(street.upper())
+    return {
+        "parcel_id": parcel_id,
+        "owner_name": (attrs.get("MAIL1") or "").strip() or None,
+        "address_street": street,
+        "address_city": (attrs.get("JURIS_OL") or "").strip().title() or None,
+        "address_zip": zip_code if owner_occupied else None,
+        "mailing_address": mailing or None,
+        "refreshed_at": refreshed_at,
+    }
+
+
+def _candidate(parcel: ParcelOwnerModel, score: float) -> Dict:
+    city = parcel.address_city or "Tucson"
+    address = None
+    if parcel.address_street:
+        address = f"{parcel.address_street}, {city}, AZ"
+        if parcel.address_zip:
+            address += f" {parcel.address_zip}"
+    return {
+        "parcel_id": parcel.parcel_id,
+        "owner_name": parcel.owner_name,
+        "address": address,
+        "address_street": parcel.address_street,
+        "address_city": city,
+        "address_zip": parcel.address_zip,
+        "mailing_address": parcel.mailing_address,
+        "score": round(score, 2),
+    }
+
+
+class ParcelOwnerIndex:
+    def __init__(self):
+        self.layer_url = f"{settings.PIMA_GIS_BASE_URL}/GISOpenData/LandRecords/MapServer/12/query"
+        self._refresh_lock = asyncio.Lock()
+
+    # --- Build ---
+
+    async def _store_page(self, rows: List[Dict]):
+        """Replaces the page's parcels and their keys."""
+        ids = [r["parcel_id"] for r in rows]
+        keys = [{"parcel_id": r["parcel_id"], "key": k} for r in rows for k in blocking_keys(r["owner_name"])]
+        async with AsyncSessionLocal() as db:
+            try:
+                for i in range(0, len(ids), IN_CHUNK):
+                    chunk = ids[i:i + IN_CHUNK]
+                    await db.execute(delete(ParcelOwnerKeyModel).where(ParcelOwnerKeyModel.parcel_id.in_(chunk)))
+                    await db.execute(delete(ParcelOwnerModel).where(ParcelOwnerModel.parcel_id.in_(chunk)))
+                await db.execute(insert(ParcelOwnerModel), rows)
+                if keys:
+                    await db.execute(insert(ParcelOwnerKeyModel), keys)
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
+
+    async def _drop_unseen(self, started: datetime) -> int:
+        """Removes parcels a completed refresh did not see (split / retired parcels)."""
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(ParcelOwnerModel.parcel_id).where(ParcelOwnerModel.refreshed_at < started)
+            )
+            stale = list(result.scalars().all())
+            for i in range(0, len(stale), IN_CHUNK):
+                chunk = stale[i:i + IN_CHUNK]
+                await db.execute(delete(ParcelOwnerKeyModel).where(ParcelOwnerKeyModel.parcel_id.in_(chunk)))
+                await db.execute(delete(ParcelOwnerModel).where(ParcelOwnerModel.parcel_id.in_(chunk)))
+            await db.commit()
+        return len(stale)
+
+    async def refresh(self) -> int:
+        """Rebuilds the index from Layer 12. Returns the number of parcels indexed."""
+        import aiohttp
+        import time as time_module
+
+        if self._refresh_lock.locked():
+            print("[Scout] Owner index refresh already running")
+            return 0
+        async with self._refresh_lock:
+            t_start = time_module.time()
+            started = datetime.utcnow()
+            total = pages = 0
+            last_id = -1
+            timeout = aiohttp.ClientTimeout(total=60)
+            async with aiohttp.ClientSession() as session:
+                while True:
+                    params = {
+                        "where": f"OBJECTID > {last_id}",
+                        "outFields": LAYER_FIELDS,
+                        "orderByFields": "OBJECTID ASC",  # Critical for pagination
+                        "resultRecordCount": PAGE_SIZE,
+                        "returnGeometry": "false",
+                        "f": "json",
+                    }
+                    async with session.post(self.layer_url, data=params, timeout=timeout) as resp:
+                        if resp.status != 200:
+                            raise RuntimeError(f"Layer 12 query failed with status {resp.status}")
+                        data = await resp.json(content_type=None)
+                    if "error" in data:
+                        raise RuntimeError(f"Layer 12 query error: {data['error']}")
+                    features = [f.get("attributes", {}) for f in data.get("features", [])]
+                    if not features:
+                        break
+                    rows = list({r["parcel_id"]: r for r in (_parcel_row(a, started) for a in features) if r}.values())
+                    if rows:
+                        await self._store_page(rows)
+                    total += len(rows)
+                    pages += 1
+                    new_last = max(a.get("OBJECTID", -1) for a in features)
+                    if new_last <= last_id:
+                        break
+                    last_id = new_last
+                    if pages % 25 == 0:
+                        print(f"[Scout] Owner index: {total} parcels...")
+            dropped = await self._drop_unseen(started)
+            print(f"[PERF] Owner index refreshed: {total} parcels ({dropped} dropped) "
+                  f"in {time_module.time() - t_start:.1f}s")
+            return total
+
+    async def last_refreshed(self) -> Optional[datetime]:
+        """Start of the last complete refresh (the oldest row; an interrupted pass leaves older ones)."""
+        async with AsyncSessionLocal() as db:
+            return (await db.execute(select(func.min(ParcelOwnerModel.refreshed_at)))).scalar()
+
+    async def is_stale(self) -> bool:
+        last = await self.last_refreshed()
+        if last is None:
+            return True
+        return datetime.utcnow() - last.replace(tzinfo=None) > timedelta(hours=settings.PARCEL_OWNER_INDEX_TTL_HOURS)
+
+    # --- Resolve ---
+
+    async def resolve(self, names: Iterable[str], limit: int = MAX_CANDIDATES) -> Dict[str, List[Dict]]:
+        """
+        Candidate parcels per party name, best match first (score = share of
+        the name's tokens in the owner name, at least MIN_MATCH_SCORE).
+        Names with no candidate map to [].
+        """
+        names = list(dict.fromkeys(n for n in names if n))
+        by_key: Dict[str, List[str]] = {}
+        for name in names:
+            for key in blocking_keys(name):
+                by_key.setdefault(key, []).append(name)
+
+        found: Dict[str, Dict[str, ParcelOwnerModel]] = {n: {} for n in names}
+        keys = list(by_key)
+        async with AsyncSessionLocal() as db:
+            for i in range(0, len(keys), IN_CHUNK):
+                result = await db.execute(
+                    select(ParcelOwnerKeyModel.key, ParcelOwnerModel)
+                    .join(ParcelOwnerModel, ParcelOwnerModel.parcel_id == ParcelOwnerKeyModel.parcel_id)
+                    .where(ParcelOwnerKeyModel.key.in_(keys[i:i + IN_CHUNK]))
+                )
+                for key, parcel in result.all():
+                    for name in by_key[key]:
+                        found[name][parcel.parcel_id] = parcel
+
+        matches: Dict[str, List[Dict]] = {}
+        for name in names:
+            scored = [(match_score(name, p.owner_name), p) for p in found[name].values()]
+            scored = sorted((s for s in scored if s[0] >= MIN_MATCH_SCORE), key=lambda s: (-s[0], s[1].parcel_id))
+            matches[name] = [_candidate(p, score) for score, p in scored[:limit]]
+        return matches
+
+
+async def run_owner_index_refresh(check_interval_s: int = 3600):
+    """Background schedule: keeps the index within PARCEL_OWNER_INDEX_TTL_HOURS. Runs until cancelled."""
+    index = get_parcel_owner_index()
+    while True:
+        try:
+            if await index.is_stale():
+                await index.refresh()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"[Scout] Owner index refresh error: {e}")
+        await asyncio.sleep(check_interval_s)
+
+
+_index: Optional[ParcelOwnerIndex] = None
+
+
+def get_parcel_owner_index() -> ParcelOwnerIndex:
+    global _index
+    if _index is None:
+        _index = ParcelOwnerIndex()
+    return _index
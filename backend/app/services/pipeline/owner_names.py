@@ -0,0 +1,140 @@
+"""
+Owner Name Normalization
+Parcel owner names (MAIL1) and recorder parties spell the same owner many
+ways: "SMITH JOHN & JANE", "SMITH JOHN ET UX", "ACME HOLDINGS, L.L.C.".
+These helpers reduce them to one form so repeat owners are looked up once,
+and give the blocking keys the parcel owner index matches recorder parties on.
+
+    normalize_owner_name("Acme Holdings, L.L.C.")   -> "ACME HOLDINGS LLC"
+    owner_search_key("SMITH JOHN & JANE")            -> "SMITH JOHN"
+    owner_search_key("SMITH & SONS LLC")             -> "SMITH & SONS LLC"
+    entity_key("THE SMITH FAMILY TRUST")             -> "SMITH FAMILY"
+    blocking_keys("SMITH JOHN & JANE")               -> ["SMITH J"]
+    blocking_keys("ACME HOLDINGS LLC")               -> ["E:ACME HOLDINGS", "ACME H"]
+"""
+import re
+from functools import lru_cache
+from typing import FrozenSet, List, Optional, Tuple
+
+# Tokens that mark an owner as a business / trust / government entity
+ENTITY_TOKENS = frozenset({
+    "LLC", "INC", "CORP", "CORPORATION", "CO", "COMPANY", "LP", "LLP", "LLLP", "LTD", "PLLC",
+    "TRUST", "TR", "TRS", "TRUSTEE", "TRUSTEES", "ESTATE", "BANK", "ASSN", "ASSOCIATION",
+    "PARTNERS", "PARTNERSHIP", "HOLDINGS", "PROPERTIES", "INVESTMENTS", "FUND", "CHURCH",
+})
+
+# Legal-form words stripped from entity names before matching ("ACME LLC" ~ "ACME INC")
+ENTITY_SUFFIXES = frozenset({
+    "LLC", "INC", "CORP", "CORPORATION", "CO", "COMPANY", "LP", "LLP", "LLLP", "LTD", "PLLC",
+    "TRUST", "TR", "TRS", "TRUSTEE", "TRUSTEES", "THE", "OF", "DTD", "UTD", "UA", "REVOCABLE", "LIVING",
+})
+
+# Trailing spouse / co-owner markers on individual owners
+_CO_OWNER_MARKERS = ("ET AL", "ETAL", "ET UX", "ETUX", "ET VIR", "ETVIR", "JTRS", "JT TEN")
+_NAME_NOISE = frozenset({"ET", "AL", "ETAL", "UX", "ETUX", "VIR", "ETVIR", "JTRS", "JT", "TEN", "JR", "SR", "II", "III", "IV"})
+
+_DROP_RE = re.compile(r"[.']")
+_SPLIT_RE = re.compile(r"[^A-Z0-9&/]+")
+_PARTY_SEP_RE = re.compile(r"\s*(?:&|\bAND\b|/)\s*")
+
+
+@lru_cache(maxsize=65536)
+def normalize_owner_name(name: Optional[str]) -> str:
+    """Uppercase, punctuation-free, single-spaced owner name ("" if empty)."""
+    if not name:
+        return ""
+    cleaned = _DROP_RE.sub("", str(name).upper())  # "L.L.C." -> "LLC", "O'BRIEN" -> "OBRIEN"
+    return " ".join(_SPLIT_RE.sub(" ", cleaned).split())
+
+
+def is_entity(normalized: str) -> bool:
+    return any(token in ENTITY_TOKENS for token in normalized.split())
+
+
+def _strip_co_owner_markers(normalized: str) -> str:
+    for marker in _CO_OWNER_MARKERS:
+        if normalized.endswith(" " + marker):
+            normalized = normalized[:-len(marker) - 1]
+    return normalized
+
+
+@lru_cache(maxsize=65536)
+def owner_search_key(name: Optional[str]) -> str:
+    """
+    The name to search the recorder with. Individuals are reduced to the
+    first party ("SMITH JOHN & JANE" / "SMITH JOHN ET UX" -> "SMITH JOHN"),
+    so spouses and co-owner variants share one lookup; entities keep their
+    full normalized name (an "&" there is part of the name).
+    """
+    normalized = normalize_owner_name(name)
+    if not normalized or is_entity(normalized):
+        return normalized
+    normalized = _strip_co_owner_markers(normalized)
+    return _PARTY_SEP_RE.split(normalized, 1)[0].strip() or normalized
+
+
+@lru_cache(maxsize=65536)
+def entity_key(name: Optional[str]) -> str:
+    """Entity name without legal-form words and dates of trust agreements."""
+    tokens = [t for t in normalize_owner_name(name).split()
+              if t not in ENTITY_SUFFIXES and t != "&" and not t.isdigit()]
+    return " ".join(tokens)
+
+
+def _parties(normalized: str) -> List[List[str]]:
+    """Individual owners as token lists, "LAST FIRST [MIDDLE]" each; a bare first name inherits the last name."""
+    parties = []
+    for part in _PARTY_SEP_RE.split(_strip_co_owner_markers(normalized)):
+        tokens = [t for t in part.split() if t not in _NAME_NOISE]
+        if not tokens:
+            continue
+        if len(tokens) == 1 and parties:
+            tokens = [parties[0][0]] + tokens  # "SMITH JOHN & JANE" -> JANE SMITH
+        parties.append(tokens)
+    return parties
+
+
+@lru_cache(maxsize=65536)
+def blocking_keys(name: Optional[str]) -> Tuple[str, ...]:
+    """
+    Coarse keys two spellings of the same owner share: "LAST F" (last name +
+    first initial) per individual party, plus "E:<entity_key>" for entities.
+    Candidates sharing a key are then ranked with match_score.
+    """
+    normalized = normalize_owner_name(name)
+    if not normalized:
+        return ()
+    keys = []
+    if is_entity(normalized):
+        key = entity_key(normalized)
+        if not key:
+            return ()
+        # Also block as a person: "SMITH JOHN TR" on the parcel, "SMITH JOHN" on the deed
+        keys.append(f"E:{key}")
+        normalized = key
+    for tokens in _parties(normalized):
+        keys.append(f"{tokens[0]} {tokens[1][0]}" if len(tokens) > 1 else tokens[0])
+    return tuple(dict.fromkeys(keys))
+
+
+@lru_cache(maxsize=65536)
+def name_tokens(name: Optional[str]) -> FrozenSet[str]:
+    """Distinguishing tokens of an owner name (no legal forms, co-owner markers or separators)."""
+    normalized = normalize_owner_name(name)
+    if is_entity(normalized):
+        return frozenset(entity_key(normalized).split())
+    return frozenset(t for tokens in _parties(normalized) for t in tokens)
+
+
+def match_score(query: Optional[str], candidate: Optional[str]) -> float:
+    """
+    Share of the query's name tokens found in the candidate (0-1). A single
+    letter matches any token with that initial ("SMITH J" ~ "SMITH JOHN").
+    """
+    q, c = name_tokens(query), name_tokens(candidate)
+    if not q or not c:
+        return 0.0
+    initials = {t[0] for t in c}
+    hits = sum(1 for t in q if t in c or (len(t) == 1 and t in initials)
+               or (len(t) > 1 and any(len(x) == 1 and x == t[0] for x in c)))
+    return hits / len(q)
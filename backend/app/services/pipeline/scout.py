@@ -7,6 +7,12 @@ from typing import List, Dict, Optional, Any
 from shapely.geometry import Polygon, Point
 from shapely.prepared import prep
 from shapely.ops import unary_union
+from app.core.config import settings
+from app.services.pipeline.taxonomy import classify_use_code, prefixes_for_types
+from app.services.pipeline.address import canonical_key, canonical_keys, pima_query_address
+from app.services.pipeline.absentee import is_absentee_owner, mark_absentee
+from app.services.pipeline.fetch_stats import FetchStats
+from app.services.pipeline.owner_names import normalize_owner_name
 
 class ScoutService:
     # Priority order for AND-logic filtering (most restrictive first)
@@ -54,16 +60,20 @@ class ScoutService:
 
     def __init__(self):
         print("SCOUT SERVICE V4 - WITH COMPREHENSIVE LEAD CACHE")
+        # ArcGIS REST roots - configurable so load tests can target a local stand-in
+        self.pima_gis_base = settings.PIMA_GIS_BASE_URL.rstrip("/")
+        self.tucson_gis_base = settings.TUCSON_GIS_BASE_URL.rstrip("/")
+        
     # Pima County GIS - Parcels - Regional (Verified Public URL)
-        self.pima_parcels_url = "https://gisdata.pima.gov/arcgis1/rest/services/GISOpenData/LandRecords/MapServer/12/query"
+        self.pima_parcels_url = f"{self.pima_gis_base}/GISOpenData/LandRecords/MapServer/12/query"
         # Pima County Assessor API (Hidden API for Sales Data)
-        self.pima_assessor_api_url = "https://www.asr.pima.gov/AssessorSiteData/api/get/parceldetails/"
+        self.pima_assessor_api_url = settings.PIMA_ASSESSOR_API_URL
         
         # Pinal County GIS - Assessor Info
         self.pinal_parcels_url = "https://rogue.casagrandeaz.gov/arcgis/rest/services/Pinal_County/Pinal_County_Assessor_Info/MapServer/0/query"
         
         # Tucson Open Data - Code Violations (Verified Layer 94)
-        self.tucson_violations_url = "https://gis.tucsonaz.gov/arcgis/rest/services/PDSD/pdsdMain_General5/MapServer/94/query"
+        self.tucson_violations_url = f"{self.tucson_gis_base}/PDSD/pdsdMain_General5/MapServer/94/query"
         
         # HomeHarvest cache - keyed by normalized address (for HomeHarvest API)
         self._homeharvest_cache: Dict[str, Optional[Dict]] = {}
@@ -111,6 +121,10 @@ class ScoutService:
         self._cache_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), "cache")
         self._zip_counts_file = os.path.join(self._cache_dir, "zip_counts.json")
         self._zip_counts_cache: Dict[str, Dict[str, int]] = self._load_zip_counts()
+        self._zip_count_refresh_tasks: Dict[str, asyncio.Task] = {}
+        
+        # Learned primary-source pass rates (sizes the first AND-logic fetch)
+        self._fetch_stats = FetchStats(os.path.join(self._cache_dir, "fetch_stats.json"))
 
     def _load_zip_counts(self) -> Dict[str, Dict[str, int]]:
         """Load zip record counts from persistent JSON file."""
@@ -136,81 +150,184 @@ class ScoutService:
         except Exception as e:
             print(f"[Scout] Error saving zip counts cache: {e}")
     
-    async def _get_zip_record_counts(self, city: str, data_type: str = "code_violations") -> Dict[str, int]:
+    def _stale_zips(self, zips: List[str], data_type: str) -> List[str]:
+        """
+        The zips whose data_type count is older than ZIP_COUNTS_TTL_HOURS (or
+        was never counted). Each zip keeps its own timestamp under "_zips_updated";
+        counts from before that fall back to the table-wide "_updated".
+        """
+        from datetime import datetime, timedelta
+        cached = self._zip_counts_cache.get(data_type, {})
+        stamps = cached.get("_zips_updated", {})
+        cutoff = datetime.now() - timedelta(hours=settings.ZIP_COUNTS_TTL_HOURS)
+        stale = []
+        for zip_code in zips:
+            updated = stamps.get(zip_code) or cached.get("_updated")
+            try:
+                if updated and datetime.fromisoformat(updated) >= cutoff:
+                    continue
+            except ValueError:
+                pass
+            stale.append(zip_code)
+        return stale
+
+    async def _count_zip_records(self, session, zip_code: str, data_type: str) -> Optional[int]:
+        """returnCountOnly query for one zip. None on failure (keeps the previous count)."""
+        import aiohttp
+        timeout = aiohttp.ClientTimeout(total=10)
+        try:
+            if data_type == "code_violations":
+                zip_metadata = await self._get_zip_metadata(zip_code)
+                if not zip_metadata or "envelope" not in zip_metadata:
+                    return None
+                params = {
+                    "where": "STATUS_1 NOT IN ('COMPLIAN', 'CLOSED', 'VOID')",
+                    "geometry": json.dumps(zip_metadata["envelope"]),
+                    "geometryType": "esriGeometryEnvelope",
+                    "spatialRel": "esriSpatialRelIntersects",
+                    "inSR": "2868",
+                    "returnCountOnly": "true",
+                    "f": "json"
+                }
+                async with session.post(self.tucson_violations_url, data=params, timeout=timeout) as resp:
+                    if resp.status != 200:
+                        return None
+                    data = await resp.json(content_type=None)
+            else:
+                params = {
+                    "where": f"ZIP LIKE '{zip_code}%'",
+                    "returnCountOnly": "true",
+                    "f": "json"
+                }
+                async with session.get(self.pima_parcels_url, params=params, timeout=timeout) as resp:
+                    if resp.status != 200:
+                        return None
+                    data = await resp.json(content_type=None)
+            count = data.get("count")
+            return int(count) if count is not None else None
+        except Exception as e:
+            print(f"[Scout] Count query failed for {data_type} zip {zip_code}: {e}")
+            return None
+
+    async def _refresh_zip_record_counts(self, zips: List[str], data_type: str) -> Dict[str, int]:
+        """
+        Issues the per-zip count queries concurrently and merges them into the
+        persistent cache. Zips whose query failed keep their previous count
+        and timestamp, so they stay stale and are retried.
+        """
+        import aiohttp
+        import time as time_module
+        from datetime import datetime
+
+        if not zips:
+            return {}
+        t_start = time_module.time()
+        # Same ceiling as the city-wide violations fetch (Tucson GIS sensitive to overload)
+        sem = asyncio.Semaphore(5)
+
+        async with aiohttp.ClientSession() as session:
+            async def count_with_limit(zip_code: str):
+                async with sem:
+                    return await self._count_zip_records(session, zip_code, data_type)
+            results = await asyncio.gather(*(count_with_limit(z) for z in zips))
+
+        fresh = {z: c for z, c in zip(zips, results) if c is not None}
+        cached = self._zip_counts_cache.setdefault(data_type, {})
+        cached.update(fresh)
+        if fresh:
+            now = datetime.now().isoformat()
+            cached.setdefault("_zips_updated", {}).update({z: now for z in fresh})
+            self._save_zip_counts()
+
+        print(f"[PERF] Refreshed {data_type} counts: {len(fresh)}/{len(zips)} zips in {time_module.time() - t_start:.1f}s")
+        return {z: cached[z] for z in zips if z in cached}
+
+    def _schedule_zip_count_refresh(self, zips: List[str], data_type: str):
+        """Refresh stale zips in the background (at most one refresh per data type in flight)."""
+        task = self._zip_count_refresh_tasks.get(data_type)
+        if task and not task.done():
+            return
+        self._zip_count_refresh_tasks[data_type] = asyncio.create_task(
+            self._refresh_zip_record_counts(list(zips), data_type)
+        )
+
+    async def _get_zip_record_counts(self, city: str, data_type: str = "code_violations",
+                                     city_zips: Optional[List[str]] = None) -> Dict[str, int]:
         """
         Get record counts per zip for weighted sampling.
-        Uses persistent file cache - only fetches from GIS if not cached.
+        Served from the persistent file cache; zips never counted are fetched
+        inline (concurrently), stale counts are returned as-is and those zips
+        refreshed in the background.
         
         Args:
             city: City name (e.g., "tucson")
             data_type: "code_violations" or "parcels"
+            city_zips: Zips of the city, if the caller already resolved them
         
         Returns:
             Dict mapping zip code to record count
         """
-        cache_key = data_type
-        
-        # Check if we have cached counts with actual data (more than just metadata)
-        cached = self._zip_counts_cache.get(cache_key, {})
-        real_counts = {k: v for k, v in cached.items() if not k.startswith("_")}
-        if real_counts:
-            print(f"[Scout] Using cached {data_type} counts: {len(real_counts)} zips")
-            return real_counts
-        
-        # Need to fetch counts from GIS
-        print(f"[Scout] Fetching {data_type} record counts for {city}...")
-        city_zips = await self._fetch_zips_by_city(city)
+        if city_zips is None:
+            city_zips = await self._fetch_zips_by_city(city)
         if not city_zips:
             return {}
-        
-        counts = {}
-        
-        if data_type == "code_violations":
-            # Query code violations layer for counts per zip
-            for zip_code in city_zips:
-                try:
-                    # Get just the count, not full records
-                    zip_metadata = await self._get_zip_metadata(zip_code)
-                    if zip_metadata and "envelope" in zip_metadata:
-                        params = {
-                            "where": "STATUS_1 NOT IN ('COMPLIAN', 'CLOSED', 'VOID')",
-                            "geometry": json.dumps(zip_metadata["envelope"]),
-                            "geometryType": "esriGeometryEnvelope",
-                            "spatialRel": "esriSpatialRelIntersects",
-                            "inSR": "2868",
-                            "returnCountOnly": "true",
-                            "f": "json"
-                        }
-                        resp = requests.post(self.tucson_violations_url, data=params, timeout=10)
-                        if resp.status_code == 200:
-                            data = resp.json()
-                            counts[zip_code] = data.get("count", 0)
-                except Exception as e:
-                    counts[zip_code] = 0
-            
-        elif data_type == "parcels":
-            # Query parcel layer for counts per zip
-            for zip_code in city_zips:
-                try:
-                    params = {
-                        "where": f"ZIP LIKE '{zip_code}%'",
-                        "returnCountOnly": "true",
-                        "f": "json"
-                    }
-                    resp = requests.get(self.pima_parcels_url, params=params, timeout=10)
-                    if resp.status_code == 200:
-                        data = resp.json()
-                        counts[zip_code] = data.get("count", 0)
-                except Exception as e:
-                    counts[zip_code] = 0
-        
-        # Save to cache
-        from datetime import datetime
-        self._zip_counts_cache[cache_key] = {**counts, "_updated": datetime.now().isoformat()}
-        self._save_zip_counts()
-        
-        print(f"[Scout] Cached {data_type} counts: {len(counts)} zips, total={sum(counts.values())}")
-        return counts
+
+        cached = self._zip_counts_cache.get(data_type, {})
+        missing = [z for z in city_zips if z not in cached]
+        if missing:
+            print(f"[Scout] Fetching {data_type} record counts for {len(missing)} zips in {city}...")
+            await self._refresh_zip_record_counts(missing, data_type)
+            cached = self._zip_counts_cache.get(data_type, {})
+        stale = [z for z in self._stale_zips(city_zips, data_type) if z not in missing]
+        if stale:
+            print(f"[Scout] {data_type} counts are stale for {len(stale)} zips - refreshing in background")
+            self._schedule_zip_count_refresh(stale, data_type)
+
+        return {z: cached[z] for z in city_zips if z in cached}
+
+    async def run_zip_count_refresh(self, city: str, check_interval_s: int = 3600):
+        """
+        Background schedule: keeps both count tables for `city` within
+        ZIP_COUNTS_TTL_HOURS. Started from app startup; runs until cancelled.
+        """
+        while True:
+            try:
+                city_zips = await self._fetch_zips_by_city(city)
+                for data_type in ("code_violations", "parcels"):
+                    stale = self._stale_zips(city_zips or [], data_type)
+                    if stale:
+                        await self._refresh_zip_record_counts(stale, data_type)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"[Scout] Zip count refresh error: {e}")
+            await asyncio.sleep(check_interval_s)
+
+    @staticmethod
+    def _allocate_zip_limits(zips: List[str], counts: Dict[str, int], total: int, floor: int) -> Dict[str, int]:
+        """
+        Splits a fetch budget across zips in proportion to their record counts
+        (largest remainder). Zips with a known count of 0 get nothing; zips
+        without a count are weighted at the median. Each zip gets at least
+        `floor` (capped at its count) so sparse zips still appear.
+        """
+        known = [counts[z] for z in zips if counts.get(z) is not None]
+        if not known or sum(known) == 0:
+            even = max(floor, total // max(1, len(zips)) + 1)
+            return {z: even for z in zips}
+
+        median = sorted(known)[len(known) // 2]
+        weights = {z: (counts[z] if counts.get(z) is not None else median) for z in zips}
+        weights = {z: w for z, w in weights.items() if w > 0}
+        weight_sum = sum(weights.values())
+
+        raw = {z: total * w / weight_sum for z, w in weights.items()}
+        alloc = {z: int(r) for z, r in raw.items()}
+        leftover = total - sum(alloc.values())
+        for z in sorted(raw, key=lambda z: raw[z] - alloc[z], reverse=True)[:max(0, leftover)]:
+            alloc[z] += 1
+
+        return {z: min(max(floor, n), weights[z]) for z, n in alloc.items()}
 
     async def _fetch_code_violations(self, filters: Dict, limit: int) -> List[Dict]:
         import time as time_module  # For TTL timestamp
@@ -346,15 +463,15 @@ class ScoutService:
                 print(f"Warning: No zips found for city '{city}'")
                 return []
             
-            print(f"[PERF] Querying {len(city_zips)} zips in parallel...")
-            
-            # Query each zip in parallel (limit per zip to avoid huge responses)
-            per_zip_limit = max(20, limit // len(city_zips) + 5)  # At least 20 per zip
+            # Per-zip limits proportional to open violation counts (dense zips get more)
+            zip_counts = await self._get_zip_record_counts(city, "code_violations", city_zips=city_zips)
+            zip_limits = self._allocate_zip_limits(city_zips, zip_counts, total=limit + limit // 4, floor=3)
+            print(f"[PERF] Querying {len(zip_limits)} zips in parallel (limits: {zip_limits})...")
             
             async def fetch_single_zip(zip_code: str) -> List[Dict]:
                 try:
                     zip_filters = {**filters, "zip_code": zip_code, "city": None}
-                    return await self._fetch_code_violations(zip_filters, per_zip_limit)
+                    return await self._fetch_code_violations(zip_filters, zip_limits[zip_code])
                 except Exception as e:
                     print(f"    Error fetching zip {zip_code}: {e}")
                     return []
@@ -365,7 +482,7 @@ class ScoutService:
                 async with sem:
                     return await fetch_single_zip(zip_code)
             
-            tasks = [fetch_with_limit(z) for z in city_zips]
+            tasks = [fetch_with_limit(z) for z in zip_limits]
             results_list = await asyncio.gather(*tasks)
             
             # Combine all results
@@ -586,7 +703,7 @@ class ScoutService:
         start_time = time_module.time()
         print(f"[PERF] Enriching {len(leads)} violations with parcel data (ASYNC PARALLEL)...")
         
-        base_url = "https://gisdata.pima.gov/arcgis1/rest/services/GISOpenData/LandRecords/MapServer/12/query"
+        base_url = f"{self.pima_gis_base}/GISOpenData/LandRecords/MapServer/12/query"
         
         # Process in batches of 50
         batch_size = 50
@@ -760,14 +877,7 @@ class ScoutService:
 
                                         
                                         # Check absentee
-                                        prop_street = (lead.get("address_street") or "").upper().strip()
-                                        mailing_address = lead.get("mailing_address", "")
-                                        if prop_street and mailing_address:
-                                            if prop_street not in mailing_address.upper():
-                                                if "distress_signals" not in lead:
-                                                    lead["distress_signals"] = []
-                                                if "Absentee Owner" not in lead["distress_signals"]:
-                                                    lead["distress_signals"].append("Absentee Owner")
+                                        mark_absentee([lead])
                                         
                                         lead["_parcel_enriched"] = True
                                         batch_enriched += 1
@@ -799,7 +909,7 @@ class ScoutService:
         if not leads:
             return
             
-        zip_layer_url = "https://gisdata.pima.gov/arcgis1/rest/services/GISOpenData/Addresses/MapServer/6/query"
+        zip_layer_url = f"{self.pima_gis_base}/GISOpenData/Addresses/MapServer/6/query"
         loop = asyncio.get_event_loop()
         
         # Calculate bounding box of all leads
@@ -984,7 +1094,7 @@ class ScoutService:
         # Helper to normalize address for cache key
         def cache_key(lead):
             addr = lead.get("address_street") or lead.get("address", "")
-            return " ".join(str(addr).upper().split()) if addr else None
+            return canonical_key(addr) or None
         
         # Helper to check if PARCEL_USE code matches our property types
         def matches_type(use_code):
@@ -1022,7 +1132,7 @@ class ScoutService:
         
         # Phase 2: Query API for uncached leads using PARALLEL BATCHES
         import aiohttp
-        base_url = "https://gisdata.pima.gov/arcgis1/rest/services/GISOpenData/LandRecords/MapServer/12/query"
+        base_url = f"{self.pima_gis_base}/GISOpenData/LandRecords/MapServer/12/query"
         
         # Split into batches of 50 (optimal for GIS multipoint queries)
         batch_size = 50
@@ -1148,49 +1258,49 @@ class ScoutService:
         layers = [
             (
                 "Zoning",
-                "https://gisdata.pima.gov/arcgis1/rest/services/GISOpenData/OverlayZoningBase/MapServer/1/query",
+                f"{self.pima_gis_base}/GISOpenData/OverlayZoningBase/MapServer/1/query",
                 "ZONE_CLASS,MUNICIPALITY",
                 {"zoning": "ZONE_CLASS", "municipality": "MUNICIPALITY"},
                 False  # Use multipoint intersection
             ),
             (
                 "Floodplain",
-                "https://gisdata.pima.gov/arcgis1/rest/services/GISOpenData/FloodControl2/MapServer/8/query",
+                f"{self.pima_gis_base}/GISOpenData/FloodControl2/MapServer/8/query",
                 "ZONE",
                 {"flood_zone": "ZONE"},
                 False  # Use multipoint intersection
             ),
             (
                 "School District",
-                "https://gisdata.pima.gov/arcgis1/rest/services/GISOpenData/Community2/MapServer/14/query",
+                f"{self.pima_gis_base}/GISOpenData/Community2/MapServer/14/query",
                 "SDISTNAME",
                 {"school_district": "SDISTNAME"},
                 True  # Fetch ALL (only 18 districts, multipoint fragments polygons)
             ),
             (
                 "Path of Progress",
-                "https://gisdata.pima.gov/arcgis1/rest/services/GISOpenData/OverlayDevelopment/MapServer/13/query",
+                f"{self.pima_gis_base}/GISOpenData/OverlayDevelopment/MapServer/13/query",
                 "PROJ_NAME,AA_STATUS",
                 {"nearby_development": "PROJ_NAME", "development_status": "AA_STATUS"},
                 False  # Use multipoint intersection (spatial query works with correct fields)
             ),
             (
                 "Parcels",
-                "https://gisdata.pima.gov/arcgis1/rest/services/GISOpenData/LandRecords/MapServer/12/query",
+                f"{self.pima_gis_base}/GISOpenData/LandRecords/MapServer/12/query",
                 "PARCEL,MAIL1,FCV,CURZONE_OL,PARCEL_USE,SEQ_NUM_S,DOCKET,PAGE,RECORDDATE",
                 {"parcel_id": "PARCEL", "owner_name": "MAIL1", "assessed_value": "FCV", "zoning": "CURZONE_OL", "parcel_use_code": "PARCEL_USE", "seq_num": "SEQ_NUM_S", "docket": "DOCKET", "page": "PAGE", "record_date": "RECORDDATE"},
                 False  # Use multipoint intersection to get real APN from coordinates
             ),
             (
                 "Neighborhood Associations",
-                "https://gisdata.pima.gov/arcgis1/rest/services/GISOpenData/Community2/MapServer/9/query",
+                f"{self.pima_gis_base}/GISOpenData/Community2/MapServer/9/query",
                 "NAME",
                 {"neighborhoods": "NAME"},
                 False
             ),
             (
                 "Subdivisions",
-                "https://gisdata.pima.gov/arcgis1/rest/services/GISOpenData/LandRecords/MapServer/15/query",
+                f"{self.pima_gis_base}/GISOpenData/LandRecords/MapServer/15/query",
                 "SUB_NAME",
                 {"subdivision": "SUB_NAME"},
                 False
@@ -1436,16 +1546,12 @@ class ScoutService:
 
             loop = asyncio.get_event_loop()
             
-            # Helper to normalize address for cache key
-            def normalize_addr(addr):
-                return addr.upper().split(",")[0].strip()
-            
             # Check cache first and separate cached/uncached
             uncached_leads = []
             cache_hits = 0
             
             for idx, addr, lead_obj in address_leads:
-                cache_key = normalize_addr(addr)
+                cache_key = canonical_key(addr)
                 if cache_key in self._homeharvest_cache:
                     cached_data = self._homeharvest_cache[cache_key]
                     if cached_data:
@@ -1930,9 +2036,6 @@ class ScoutService:
         
         applied_count = 0
         
-        def normalize_addr(addr):
-            return addr.upper().split(",")[0].strip() if addr else ""
-        
         for lead in leads:
             # Skip leads already enriched (e.g., from previous full enrichment this session)
             if lead.get("beds") or lead.get("sqft") or lead.get("primary_photo"):
@@ -1942,7 +2045,7 @@ class ScoutService:
             if not address:
                 continue
             
-            cache_key = normalize_addr(address)
+            cache_key = canonical_key(address)
             if cache_key in self._homeharvest_cache:
                 cached_data = self._homeharvest_cache[cache_key]
                 if cached_data:
@@ -1968,8 +2071,7 @@ class ScoutService:
                 continue
             
             leads_with_addr += 1
-            # Normalize: uppercase, remove extra spaces
-            cache_key = " ".join(str(addr).upper().split())
+            cache_key = canonical_key(addr)
             if cache_key in self._lead_cache:
                 cached = self._lead_cache[cache_key]
                 # Apply all cached enrichment fields
@@ -1986,7 +2088,7 @@ class ScoutService:
             sample_addr = sample.get("address_street") or sample.get("address", "")
             print(f"  Cache debug: {leads_with_addr}/{len(leads)} have addresses, cache has {len(self._lead_cache)} entries, matched {applied_count}")
             if sample_addr and applied_count == 0 and len(self._lead_cache) > 0:
-                sample_key = " ".join(str(sample_addr).upper().split())
+                sample_key = canonical_key(sample_addr)
                 print(f"  Sample addr: '{sample_key}', in cache: {sample_key in self._lead_cache}")
         
         return applied_count
@@ -2006,8 +2108,7 @@ class ScoutService:
             if not addr:
                 continue
             
-            # Normalize: uppercase, remove extra spaces
-            cache_key = " ".join(str(addr).upper().split())
+            cache_key = canonical_key(addr)
             
             # Check if lead has any enrichment data worth caching
             has_enrichment = any(lead.get(field) for field in self._enrichment_fields)
@@ -2113,35 +2214,16 @@ class ScoutService:
             print(f"Tax check pipeline error: {e}")
 
     def _is_absentee(self, lead: Dict) -> bool:
-        """Quick in-memory check if property is absentee-owned."""
-        prop_street = (lead.get("address_street") or "").upper().strip()
-        mail_addr = (lead.get("mailing_address") or "").upper().strip()
-        
-        if not prop_street or not mail_addr:
-            return False
-        
-        return prop_street not in mail_addr
+        """Quick in-memory check if property is absentee-owned (see pipeline/absentee.py)."""
+        return is_absentee_owner(
+            lead.get("address_street") or lead.get("address") or "",
+            lead.get("mailing_address") or "",
+            lead.get("address_zip"),
+        )
 
     def _normalize_address(self, address: str) -> str:
-        """Normalize address for matching (Ave->AV, Street->ST, etc.)"""
-        if not address:
-            return ""
-        addr = address.upper().strip()
-        # Common abbreviations
-        replacements = [
-            (" AVENUE", " AV"), (" AVE", " AV"), (" STREET", " ST"), (" STR", " ST"),
-            (" DRIVE", " DR"), (" BOULEVARD", " BLVD"), (" ROAD", " RD"),
-            (" LANE", " LN"), (" COURT", " CT"), (" CIRCLE", " CIR"),
-            (" PLACE", " PL"), (" NORTH", " N"), (" SOUTH", " S"),
-            (" EAST", " E"), (" WEST", " W"), ("  ", " ")
-        ]
-        for old, new in replacements:
-            addr = addr.replace(old, new)
-        # Remove unit/apt info
-        for sep in [" #", " APT", " UNIT", " STE"]:
-            if sep in addr:
-                addr = addr.split(sep)[0].strip()
-        return addr.strip()
+        """Normalize address for GIS matching (Avenue->AV, Street->ST, unit dropped)."""
+        return pima_query_address(address)
 
     async def _fetch_by_address(self, address: str, filters: Dict) -> List[Dict]:
         """
@@ -2158,7 +2240,7 @@ class ScoutService:
         
         print(f"  Normalized search term: '{search_term}'")
         
-        base_url = "https://gisdata.pima.gov/arcgis1/rest/services/GISOpenData/LandRecords/MapServer/12/query"
+        base_url = f"{self.pima_gis_base}/GISOpenData/LandRecords/MapServer/12/query"
         
         # Try multiple search strategies
         search_strategies = [
@@ -2283,12 +2365,8 @@ class ScoutService:
         
         if filter_type == "Absentee Owner":
             # In-memory check: mailing address != property address
-            verified = []
-            for c in candidates:
-                if self._is_absentee(c):
-                    if "Absentee Owner" not in c.get("distress_signals", []):
-                        c["distress_signals"].append("Absentee Owner")
-                    verified.append(c)
+            flags = mark_absentee(candidates)
+            verified = [c for c, flag in zip(candidates, flags) if flag]
             print(f"AND filter '{filter_type}': {len(verified)}/{len(candidates)} passed")
             return verified
         
@@ -2321,7 +2399,15 @@ class ScoutService:
         # For now, pass through
         return candidates
 
-    async def fetch_leads(self, filters: Dict) -> List[Dict]:
+    async def fetch_leads(self, filters: Dict, page_state: Optional[Dict] = None) -> List[Dict]:
+        """
+        Runs a search and returns up to filters["limit"] enriched leads.
+        
+        page_state: optional dict filled with the surplus leads - already enriched
+        ("ready") and unenriched candidates ("pending") - and the primary source
+        ("primary") so callers can page through them later with fetch_next_page()
+        instead of re-running the search.
+        """
         try:
 
             limit = filters.get("limit", 100)
@@ -2497,14 +2583,7 @@ class ScoutService:
                             """Check if lead matches any selected distress type."""
                             # Absentee Owner Check: mailing address != property address
                             if check_absentee:
-                                mailing = lead.get("mailing_address", "").upper().strip()
-                                property_addr = lead.get("address", "").upper().strip()
-                                # Extract just street portion (before city/state)
-                                mailing_street = mailing.split(",")[0].strip() if mailing else ""
-                                property_street = property_addr.split(",")[0].strip() if property_addr else ""
-                                
-                                if mailing_street and property_street and mailing_street != property_street:
-                                    lead["distress_signals"] = lead.get("distress_signals", []) + ["Absentee Owner"]
+                                if mark_absentee([lead])[0]:
                                     return True
                             
                             # Code Violation Check: coordinates match violation locations
@@ -2640,12 +2719,7 @@ class ScoutService:
                             print("  No candidates matched the Code Violation filter")
                     
                     # Check for absentee owner status on each
-                    for lead in candidates:
-                        if self._is_absentee(lead):
-                            if "distress_signals" not in lead:
-                                lead["distress_signals"] = []
-                            if "Absentee Owner" not in lead["distress_signals"]:
-                                lead["distress_signals"].append("Absentee Owner")
+                    mark_absentee(candidates)
                     
                     # Run enrichment on found properties
                     # Respect skip_homeharvest flag
@@ -2715,15 +2789,19 @@ class ScoutService:
                 # Step 1: Fetch from PRIMARY (most restrictive) source
                 primary = selected[0]
                 
-                # HYBRID FETCH STRATEGY: Dynamic multiplier + Progressive fetch
+                # HYBRID FETCH STRATEGY: Learned (or estimated) multiplier + Progressive fetch
                 property_types = filters.get("property_types") or []
-                base_multiplier = self._estimate_fetch_multiplier(property_types)
+                learned_multiplier = self._fetch_stats.multiplier(primary, filters, selected[1:])
+                base_multiplier = learned_multiplier or self._estimate_fetch_multiplier(property_types)
                 fetch_limit = limit * base_multiplier
                 max_fetch_limit = 2000  # Safety cap
                 
-                print(f"AND-Logic: Fetching from primary source '{primary}' with initial limit {fetch_limit} (multiplier: {base_multiplier}x)")
+                print(f"AND-Logic: Fetching from primary source '{primary}' with initial limit {fetch_limit} "
+                      f"(multiplier: {base_multiplier}x, {'learned' if learned_multiplier else 'estimated'})")
                 
                 candidates = await self._fetch_primary(primary, filters, min(fetch_limit, max_fetch_limit))
+                primary_fetched = len(candidates)
+                observed_pass_rate = 1.0
                 print(f"AND-Logic: Got {len(candidates)} candidates from primary source")
                 
                 # Step 1.5: Apply Property Type Filter (for Code Violations)
@@ -2734,8 +2812,10 @@ class ScoutService:
                     print(f"AND-Logic: After property type filter: {len(filtered_candidates)} candidates")
                     
                     # PROGRESSIVE FETCH: If not enough results, fetch more and try again
+                    # (skipped when the primary already returned less than asked - nothing more to fetch)
                     fetch_attempts = 0
-                    while len(filtered_candidates) < limit and fetch_attempts < 3:
+                    source_exhausted = primary_fetched < min(fetch_limit, max_fetch_limit)
+                    while len(filtered_candidates) < limit and fetch_attempts < 3 and not source_exhausted:
                         current_count = len(candidates)
                         additional_needed = (limit - len(filtered_candidates)) * base_multiplier
                         new_fetch_limit = min(current_count + int(additional_needed), max_fetch_limit)
@@ -2749,10 +2829,13 @@ class ScoutService:
                         
                         # Fetch more candidates
                         candidates = await self._fetch_primary(primary, filters, new_fetch_limit)
+                        primary_fetched = len(candidates)
+                        source_exhausted = primary_fetched < new_fetch_limit
                         filtered_candidates = await self._filter_violations_by_property_type(candidates, property_types, property_subtypes)
                         print(f"AND-Logic: After progressive fetch: {len(filtered_candidates)} candidates")
                     
                     candidates = filtered_candidates
+                    observed_pass_rate = len(candidates) / primary_fetched if primary_fetched else 0.0
                 
                 # Step 1.75: Early parcel enrichment if Absentee Owner is a secondary filter
                 # (Absentee check needs mailing_address which comes from parcel data)
@@ -2785,12 +2868,19 @@ class ScoutService:
                 # Step 2: Verify against SECONDARY filters (AND logic)
                 for secondary in selected[1:]:
                     print(f"AND-Logic: Verifying against secondary filter '{secondary}'")
+                    checked = len(candidates)
                     candidates = await self._verify_filter(candidates, secondary, filters)
+                    if checked:
+                        observed_pass_rate *= len(candidates) / checked
                     
                     # Early exit if no candidates left
                     if not candidates:
                         print(f"AND-Logic: No candidates passed '{secondary}' filter")
                         break
+                
+                # Learn the pass rate for this (primary, secondary filters, property types, location)
+                self._fetch_stats.record(primary, filters, primary_fetched, primary_fetched * observed_pass_rate,
+                                         selected[1:])
             
             # SAFETY NET: Enforce Map Bounds (Client-Side)
             # This catches any results that slipped through due to strategy fallbacks or missing spatial filters
@@ -2848,9 +2938,9 @@ class ScoutService:
                         smart_enrichment_needed = False  # Skip the GIS loop below
                     else:
                         # Cache gave partial results - dedupe candidates to avoid re-processing
-                        cached_addrs = {(c.get("address") or "").upper() for c in cache_hits}
+                        cached_addrs = set(canonical_keys(c.get("address") for c in cache_hits))
                         original_count = len(candidates)
-                        candidates = [c for c in candidates if (c.get("address") or "").upper() not in cached_addrs]
+                        candidates = [c for c in candidates if canonical_key(c.get("address")) not in cached_addrs]
                         print(f"[Cache-First] Deduped candidates: {original_count} -> {len(candidates)} (removed {original_count - len(candidates)} already cached)")
                         # Update limit for remaining fetch
                         limit = limit - len(cache_hits)
@@ -2932,43 +3022,21 @@ class ScoutService:
                     final_results.extend(valid_leads)
                     
                     print(f"[Scout] Batch result: {len(valid_leads)} valid matches. Total: {len(final_results)}")
+                
+                if page_state is not None:
+                    # Overshoot from the last batch is already enriched and filtered (and cached below)
+                    page_state["ready"] = final_results[limit:]
+                    page_state["pending"] = candidates[processed_count:]
                     
             else:
                 # Standard Logic (Truncate -> Enrich -> Filter)
                 # This is faster for common searches where we don't expect high drop-off
                 print(f"AND-Logic: Final result count: {len(candidates[:limit])}")
                 final_results = candidates[:limit]
+                if page_state is not None:
+                    page_state["pending"] = candidates[limit:]
                 
-                # Enrich
-                skip_enrichment = filters.get("skip_enrichment", False)
-                if not skip_enrichment:
-                    self._apply_cached_enrichment(final_results)
-                    
-                    # Code Violations / Zip enrichment (legacy support)
-                    if primary == "Code Violations":
-                        unenriched = [l for l in final_results if not l.get("_parcel_enriched") and not l.get("_cache_enriched")]
-                        if unenriched: await self._enrich_violations_with_parcel_data(unenriched)
-                    
-                    leads_needing_zip = [l for l in final_results if not l.get("address_zip")]
-                    if leads_needing_zip: await self._enrich_violations_with_zip_codes(leads_needing_zip)
-
-                    # HomeHarvest + GIS
-                    skip_hh = filters.get("skip_homeharvest", False)
-                    gis_task = asyncio.create_task(self._enrich_with_gis_layers(final_results))
-                    
-                    if skip_hh:
-                        self._apply_homeharvest_from_cache(final_results)
-                        try:
-                            await asyncio.wait_for(gis_task, timeout=30.0)
-                        except asyncio.TimeoutError:
-                            gis_task.cancel()
-                    else:
-                        hh_task = asyncio.create_task(self._enrich_with_homeharvest(final_results))
-                        try:
-                            await asyncio.wait_for(asyncio.gather(hh_task, gis_task, return_exceptions=True), timeout=90.0)
-                        except asyncio.TimeoutError:
-                            hh_task.cancel()
-                            gis_task.cancel()
+                await self._enrich_page(final_results, filters, primary)
 
             # Tax delinquency check (rarely used)
             if len(final_results) <= 10 and not filters.get("skip_tax_check", True):
@@ -2982,53 +3050,12 @@ class ScoutService:
             
             # Apply filters one last time for Standard Logic path (Smart path already did it)
             if not smart_enrichment_needed:
-                # Re-apply filters for standard path just in case
-                # (Logic copied from original code for safety)
-                min_beds = filters.get("min_beds")
-                max_beds = filters.get("max_beds")
-                min_baths = filters.get("min_baths")
-                max_baths = filters.get("max_baths")
-                min_sqft = filters.get("min_sqft")
-                max_sqft = filters.get("max_sqft")
-                min_year_built = filters.get("min_year_built")
-                max_year_built = filters.get("max_year_built")
-                has_pool = filters.get("has_pool")
-                has_garage = filters.get("has_garage")
-                has_guest_house = filters.get("has_guest_house")
-                
-                if any([min_beds, max_beds, min_baths, max_baths, min_sqft, max_sqft, 
-                        min_year_built, max_year_built, has_pool, has_garage, has_guest_house]):
-                    
-                    def matches_property_details_final(lead: Dict) -> bool:
-                        if min_beds and (lead.get("beds") or 0) < min_beds: return False
-                        if max_beds and (lead.get("beds") or 0) > max_beds: return False
-                        if min_baths and (lead.get("baths") or 0) < min_baths: return False
-                        if max_baths and (lead.get("baths") or 0) > max_baths: return False
-                        if min_sqft and (lead.get("sqft") or 0) < min_sqft: return False
-                        if max_sqft and (lead.get("sqft") or 0) > max_sqft: return False
-                        if min_year_built and (lead.get("year_built") or 0) < min_year_built: return False
-                        if max_year_built and (lead.get("year_built") or 0) > max_year_built: return False
-                        if has_pool is True and not lead.get("has_pool"): return False
-                        if has_garage is True and not lead.get("has_garage"): return False
-                        # Guest House handled at GIS level, but double check here
-                        if has_guest_house is True and not lead.get("has_guest_house"): return False
-                        return True
-                        
-                    final_results = [l for l in final_results if matches_property_details_final(l)]
+                final_results = self._filter_by_property_details(final_results, filters)
 
             # Sanitize results to replace NaN with None (JSON compliance)
-            # Recursive function to handle nested dicts/lists
-            def sanitize(obj):
-                if isinstance(obj, float) and math.isnan(obj):
-                    return None
-                if isinstance(obj, dict):
-                    return {k: sanitize(v) for k, v in obj.items()}
-                if isinstance(obj, list):
-                    return [sanitize(x) for x in obj]
-                return obj
-
-            import math
-            final_results = sanitize(final_results)
+            final_results = self._sanitize_results(final_results)
+            if page_state is not None:
+                page_state["primary"] = primary
 
             return final_results
             
@@ -3037,6 +3064,111 @@ class ScoutService:
             print(f"ERROR IN FETCH_LEADS: {str(e)}\n{traceback.format_exc()}")
             return []
 
+    async def _enrich_page(self, leads: List[Dict], filters: Dict, primary: Optional[str]):
+        """Standard enrichment for one page of leads: cache, parcel/zip (violations), HomeHarvest + GIS."""
+        if not leads or filters.get("skip_enrichment", False):
+            return
+        self._apply_cached_enrichment(leads)
+        
+        # Code Violations / Zip enrichment (legacy support)
+        if primary == "Code Violations":
+            unenriched = [l for l in leads if not l.get("_parcel_enriched") and not l.get("_cache_enriched")]
+            if unenriched: await self._enrich_violations_with_parcel_data(unenriched)
+        
+        leads_needing_zip = [l for l in leads if not l.get("address_zip")]
+        if leads_needing_zip: await self._enrich_violations_with_zip_codes(leads_needing_zip)
+
+        # HomeHarvest + GIS
+        skip_hh = filters.get("skip_homeharvest", False)
+        gis_task = asyncio.create_task(self._enrich_with_gis_layers(leads))
+        
+        if skip_hh:
+            self._apply_homeharvest_from_cache(leads)
+            try:
+                await asyncio.wait_for(gis_task, timeout=30.0)
+            except asyncio.TimeoutError:
+                gis_task.cancel()
+        else:
+            hh_task = asyncio.create_task(self._enrich_with_homeharvest(leads))
+            try:
+                await asyncio.wait_for(asyncio.gather(hh_task, gis_task, return_exceptions=True), timeout=90.0)
+            except asyncio.TimeoutError:
+                hh_task.cancel()
+                gis_task.cancel()
+
+    def _filter_by_property_details(self, leads: List[Dict], filters: Dict) -> List[Dict]:
+        """Post-enrichment detail filters (beds/baths/sqft/year built/pool/garage/guest house)."""
+        min_beds = filters.get("min_beds")
+        max_beds = filters.get("max_beds")
+        min_baths = filters.get("min_baths")
+        max_baths = filters.get("max_baths")
+        min_sqft = filters.get("min_sqft")
+        max_sqft = filters.get("max_sqft")
+        min_year_built = filters.get("min_year_built")
+        max_year_built = filters.get("max_year_built")
+        has_pool = filters.get("has_pool")
+        has_garage = filters.get("has_garage")
+        has_guest_house = filters.get("has_guest_house")
+        
+        if not any([min_beds, max_beds, min_baths, max_baths, min_sqft, max_sqft,
+                    min_year_built, max_year_built, has_pool, has_garage, has_guest_house]):
+            return leads
+        
+        def matches_property_details_final(lead: Dict) -> bool:
+            if min_beds and (lead.get("beds") or 0) < min_beds: return False
+            if max_beds and (lead.get("beds") or 0) > max_beds: return False
+            if min_baths and (lead.get("baths") or 0) < min_baths: return False
+            if max_baths and (lead.get("baths") or 0) > max_baths: return False
+            if min_sqft and (lead.get("sqft") or 0) < min_sqft: return False
+            if max_sqft and (lead.get("sqft") or 0) > max_sqft: return False
+            if min_year_built and (lead.get("year_built") or 0) < min_year_built: return False
+            if max_year_built and (lead.get("year_built") or 0) > max_year_built: return False
+            if has_pool is True and not lead.get("has_pool"): return False
+            if has_garage is True and not lead.get("has_garage"): return False
+            # Guest House handled at GIS level, but double check here
+            if has_guest_house is True and not lead.get("has_guest_house"): return False
+            return True
+            
+        return [l for l in leads if matches_property_details_final(l)]
+
+    @staticmethod
+    def _sanitize_results(results: List[Dict]) -> List[Dict]:
+        """Replace NaN with None (JSON compliance), recursing into nested dicts/lists."""
+        def sanitize(obj):
+            if isinstance(obj, float) and math.isnan(obj):
+                return None
+            if isinstance(obj, dict):
+                return {k: sanitize(v) for k, v in obj.items()}
+            if isinstance(obj, list):
+                return [sanitize(x) for x in obj]
+            return obj
+        return sanitize(results)
+
+    async def fetch_next_page(self, filters: Dict, pending: List[Dict], primary: Optional[str], limit: int,
+                              ready: Optional[List[Dict]] = None) -> List[Dict]:
+        """
+        Next page of a stored search: serves the already-enriched surplus
+        (`ready`) first, then enriches surplus candidates from an earlier
+        fetch_leads() call only as far as needed to fill `limit` leads after
+        the detail filters. Consumes `ready` and `pending` in place.
+        """
+        results = []
+        if ready:
+            results = ready[:limit]
+            del ready[:len(results)]
+        enriched = []
+        while len(results) < limit and pending:
+            batch = pending[:limit - len(results)]
+            del pending[:len(batch)]
+            await self._enrich_page(batch, filters, primary)
+            batch = self._filter_by_property_details(batch, filters)
+            enriched.extend(batch)
+            results.extend(batch)
+        
+        self._save_to_lead_cache(enriched)
+        print(f"[Scout] Page enriched: {len(results)} leads, {len(pending)} candidates left")
+        return self._sanitize_results(results)
+
     def _log(self, msg: str):
         """Legacy logging wrapper."""
         print(f"[Scout] {msg}")
@@ -3055,7 +3187,7 @@ class ScoutService:
             self._log(f"Using cached metadata for zip {zip_code}")
             return cached
         
-        url = "https://gisdata.pima.gov/arcgis1/rest/services/GISOpenData/Addresses/MapServer/6/query"
+        url = f"{self.pima_gis_base}/GISOpenData/Addresses/MapServer/6/query"
         metadata = {}
         
         try:
@@ -3067,8 +3199,23 @@ class ScoutService:
                 "f": "json"
             }
             
+            # 2. Fetch WGS84 for Polygon
+            params_wgs = {
+                "where": f"ZIPCODE = '{zip_code}'",
+                "outFields": "ZIPCODE",
+                "returnGeometry": "true",
+                "outSR": "4326",
+                "f": "json"
+            }
+            
+            # Both requests in the thread pool, concurrently - this is awaited from async search paths
+            loop = asyncio.get_event_loop()
+            resp_native, resp_wgs = await asyncio.gather(
+                loop.run_in_executor(None, lambda: requests.get(url, params=params_native, timeout=10)),
+                loop.run_in_executor(None, lambda: requests.get(url, params=params_wgs, timeout=10)),
+            )
+            
             # Request 1: Native
-            resp_native = requests.get(url, params=params_native, timeout=10)
             if resp_native.status_code == 200:
                 data = resp_native.json()
                 if data.get("features"):
@@ -3092,17 +3239,7 @@ class ScoutService:
                         }
                         self._log(f"Got envelope: {metadata['envelope']}")
 
-            # 2. Fetch WGS84 for Polygon
-            params_wgs = {
-                "where": f"ZIPCODE = '{zip_code}'",
-                "outFields": "ZIPCODE",
-                "returnGeometry": "true",
-                "outSR": "4326",
-                "f": "json"
-            }
-
             # Request 2: WGS84
-            resp_wgs = requests.get(url, params=params_wgs, timeout=10)
             if resp_wgs.status_code == 200:
                 data = resp_wgs.json()
                 if data.get("features"):
@@ -3165,7 +3302,7 @@ class ScoutService:
         }
 
         # 3. Query Layer 6 for Intersecting Zip Polygons
-        url = "https://gisdata.pima.gov/arcgis1/rest/services/GISOpenData/Addresses/MapServer/6/query"
+        url = f"{self.pima_gis_base}/GISOpenData/Addresses/MapServer/6/query"
         params = {
             "geometry": json.dumps(envelope),
             "geometryType": "esriGeometryEnvelope",
@@ -3266,9 +3403,9 @@ class ScoutService:
             self._city_zips_cache[cache_key] = unique_zips
             return unique_zips
         
-        url = "https://gisdata.pima.gov/arcgis1/rest/services/GISOpenData/Addresses/MapServer/3/query"
+        url = f"{self.pima_gis_base}/GISOpenData/Addresses/MapServer/3/query"
         
-        url = "https://gisdata.pima.gov/arcgis1/rest/services/GISOpenData/Addresses/MapServer/3/query"
+        url = f"{self.pima_gis_base}/GISOpenData/Addresses/MapServer/3/query"
         params = {
             "where": f"ZIPCITY = '{city.upper()}'",
             "outFields": "ZIPCODE",
@@ -3311,8 +3448,8 @@ class ScoutService:
         Fetches parcels from Pima County GIS (Layer 12).
         Uses a Two-Step Strategy + Client-Side Filtering.
         """
-        base_url = "https://gisdata.pima.gov/arcgis1/rest/services/GISOpenData/LandRecords/MapServer/12/query"
-        address_url = "https://gisdata.pima.gov/arcgis1/rest/services/GISOpenData/Addresses/MapServer/3/query"
+        base_url = f"{self.pima_gis_base}/GISOpenData/LandRecords/MapServer/12/query"
+        address_url = f"{self.pima_gis_base}/GISOpenData/Addresses/MapServer/3/query"
         
         where_parts = ["1=1"]
         
@@ -3963,22 +4100,7 @@ class ScoutService:
 
         # Dynamic Absentee Logic
         distress_signals = []
-        # Simple normalization for comparison
-        addr_norm = address.upper().replace(" ", "").replace(",", "")
-        mail_norm = mailing_address.upper().replace(" ", "").replace(",", "")
-        
-        # Check if property address is contained in mailing address (to handle formatting diffs)
-        # If the street address part isn't in the mailing address, it's likely absentee
-        # This is a heuristic.
-        is_absentee = False
-        if address.upper() not in mailing_address.upper():
-             # Double check strict equality of normalized strings if simple substring fails
-             # (e.g. 123 MAIN ST vs 123 MAIN STREET) - for now, simple substring is a good start
-             # But mailing address usually includes name, so we check if the address part is present.
-             # Actually, mailing address in Pima often starts with Name. 
-             # Let's check if the *street* part of the property address is in the mailing address.
-             if address.split(",")[0].strip().upper() not in mailing_address.upper():
-                 is_absentee = True
+        is_absentee = is_absentee_owner(address, mailing_address, zip_code)
 
         if is_absentee:
             distress_signals.append("Absentee Owner")
@@ -4098,236 +4220,9 @@ class ScoutService:
     def _map_parcel_use_to_type(self, parcel_use: str) -> str:
         """
         Maps a PARCEL_USE code to a detailed human-readable property type.
-        Format: XX-YZ where XX=Category, Y=Subtype, Z=Characteristic
-        Based on Pima County Property Use Code Manual.
+        See app.services.pipeline.taxonomy (compiled once at import).
         """
-        if not parcel_use:
-            return "Unknown"
-        
-        code = str(parcel_use).strip()
-        
-        full_code_map = {
-            # --- Vacant Land (00-XX) ---
-            "0010": "Vacant Land - Undetermined",
-            "0011": "Vacant Land - Residential, Urban Subdivided",
-            "0012": "Vacant Land - Residential, Urban Non-Subdivided",
-            "0013": "Vacant Land - Residential, Rural Subdivided",
-            "0014": "Vacant Land - Residential, Rural Non-Subdivided",
-            "0020": "Vacant Land - Commercial",
-            "0021": "Vacant Land - Commercial, Urban Subdivided",
-            "0022": "Vacant Land - Commercial, Urban Non-Subdivided",
-            "0026": "Vacant Land - Commercial, Multiple Use",
-            "0030": "Vacant Land - Industrial",
-            "0031": "Vacant Land - Industrial, Urban Subdivided",
-            "0032": "Vacant Land - Industrial, Urban Non-Subdivided",
-            "0040": "Vacant Land - Condo",
-            "0041": "Vacant Land - Condo, Urban Subdivided",
-            "0070": "Vacant Land - Incomplete Subdivision",
-            "0071": "Vacant Land - Incomplete Subdivision, Urban Subdivided",
-            "0080": "Vacant Land - Manufactured Home",
-            
-            # --- Single Family Residential (01-XX) ---
-            # Site <= 5 Acres
-            "0100": "Single Family Residential - Site ≤5 Acres",
-            "0101": "Single Family Residential - Site ≤5 Acres, Urban Subdivided",
-            "0102": "Single Family Residential - Site ≤5 Acres, Urban Non-Subdivided",
-            "0103": "Single Family Residential - Site ≤5 Acres, Rural Subdivided",
-            "0104": "Single Family Residential - Site ≤5 Acres, Rural Non-Subdivided",
-            
-            # Grades (Standard)
-            "0110": "Single Family Residential - Grade 1",
-            "0111": "Single Family Residential - Grade 1 (Urban Subdivided)",
-            "0112": "Single Family Residential - Grade 1 (Urban Non-Subdivided)",
-            "0113": "Single Family Residential - Grade 1 (Rural Subdivided)",
-            "0114": "Single Family Residential - Grade 1 (Rural Non-Subdivided)",
-            
-            "0120": "Single Family Residential - Grade 2",
-            "0121": "Single Family Residential - Grade 2 (Urban Subdivided)",
-            "0122": "Single Family Residential - Grade 2 (Urban Non-Subdivided)",
-            "0123": "Single Family Residential - Grade 2 (Rural Subdivided)",
-            "0124": "Single Family Residential - Grade 2 (Rural Non-Subdivided)",
-            
-            "0130": "Single Family Residential - Grade 3",
-            "0131": "Single Family Residential - Grade 3 (Urban Subdivided)",
-            "0132": "Single Family Residential - Grade 3 (Urban Non-Subdivided)",
-            "0133": "Single Family Residential - Grade 3 (Rural Subdivided)",
-            "0134": "Single Family Residential - Grade 3 (Rural Non-Subdivided)",
-            
-            "0140": "Single Family Residential - Grade 4",
-            "0141": "Single Family Residential - Grade 4 (Urban Subdivided)",
-            "0142": "Single Family Residential - Grade 4 (Urban Non-Subdivided)",
-            "0143": "Single Family Residential - Grade 4 (Rural Subdivided)",
-            "0144": "Single Family Residential - Grade 4 (Rural Non-Subdivided)",
-            
-            "0150": "Single Family Residential - Grade 5",
-            "0151": "Single Family Residential - Grade 5 (Urban Subdivided)",
-            "0152": "Single Family Residential - Grade 5 (Urban Non-Subdivided)",
-            "0153": "Single Family Residential - Grade 5 (Rural Subdivided)",
-            "0154": "Single Family Residential - Grade 5 (Rural Non-Subdivided)",
-            
-            # Guest Houses / Additional Units
-            "0180": "Single Family Residential - With Additional Unit",
-            "0181": "Single Family Residential - With Additional Unit (Urban Subdivided)",
-            "0182": "Single Family Residential - With Additional Unit (Urban Non-Subdivided)",
-            "0183": "Single Family Residential - With Additional Unit (Rural Subdivided)",
-            "0184": "Single Family Residential - With Additional Unit (Rural Non-Subdivided)",
-            
-            # Misc
-            "0190": "Single Family Residential - Miscellaneous Improvements",
-            "0191": "Single Family Residential - Misc Improvements (Urban Subdivided)",
-            "0192": "Single Family Residential - Misc Improvements (Urban Non-Subdivided)",
-            "0193": "Single Family Residential - Misc Improvements (Rural Subdivided)",
-            "0194": "Single Family Residential - Misc Improvements (Rural Non-Subdivided)",
-            
-            # --- PUD (02-XX) ---
-            "0200": "PUD - Common Area",
-            "0260": "PUD - Residential Common Area", # Explicitly map this to avoid Multi-Family confusion
-
-            # --- Multi-Family (03-XX) ---
-            "0300": "Multi-Family - Unspecified",
-            "0310": "Multi-Family - Mixed Complex (Duplex-Fourplex)",
-            "0311": "Multi-Family - Mixed Complex (Urban Subdivided)",
-            "0312": "Multi-Family - Mixed Complex (Urban Non-Subdivided)",
-            
-            "0320": "Multi-Family - Duplex",
-            "0321": "Multi-Family - Duplex (2-4 Buildings)",
-            "0330": "Multi-Family - Triplex",
-            "0340": "Multi-Family - Fourplex",
-            
-            "0350": "Multi-Family - Apartments (5-24 Units)",
-            "0360": "Multi-Family - Apartments (25-99 Units)",
-            "0370": "Multi-Family - Apartments (100+ Units)",
-            "0380": "Multi-Family - Boarding/Rooming House",
-            "0390": "Multi-Family - Apartment Cooperative",
-            
-            # --- Commercial (Typical) ---
-            "0410": "Hotel",
-            "0510": "Motel",
-            "1110": "Store (Retail)",
-            "1112": "Store (Retail) - Supermarket",
-            "1510": "Office Building",
-            "1520": "Medical Office",
-            "3710": "Warehouse",
-            "3750": "Mini-Warehouse (Self Storage)",
-            
-            # --- Condo/Townhouse (07-XX) ---
-            "0710": "Condo/Townhouse",
-            "0720": "Condo/Townhouse - Grade 2",
-            "0730": "Condo/Townhouse - Grade 3",
-            "0740": "Condo/Townhouse - Grade 4",
-            "0750": "Condo/Townhouse - Grade 5",
-            "0780": "Condo/Townhouse - Common Area w/ Improvements",
-            "0790": "Condo/Townhouse - Common Area w/o Improvements",
-            
-            # --- Mobile Homes (08-XX) ---
-            "0810": "Manufactured Home Subdivision",
-            "0820": "Manufactured Home - Subdivided Lot",
-            "0830": "Manufactured Home - Non-Subdivided",
-            "0840": "Manufactured Home Park",
-            "0850": "RV/Travel Trailer Park",
-            "0860": "Manufactured Home Cooperative",
-            "0890": "Manufactured Home/RV Park - Mixed",
-            
-            # --- Rural Residential > 5 Acres (87-XX) ---
-            "8710": "Single Family Residential - Site >5 Acres",
-            "8711": "Single Family Residential - Site >5 Acres, Urban Subdivided",
-            "8712": "Single Family Residential - Site >5 Acres, Urban Non-Subdivided",
-            "8713": "Single Family Residential - Site >5 Acres, Rural Subdivided",
-            "8714": "Single Family Residential - Site >5 Acres, Rural Non-Subdivided",
-            "8720": "Single Family Residential - Site >5 Acres, Multiple Residences",
-            "8730": "Rural Residential - Unsecured Manufactured Home",
-            "8740": "Rural Residential - Secured Manufactured Home",
-            "8750": "Rural Residential - Affixed Manufactured Home",
-        }
-        
-        # Check for exact 4-digit match first
-        if code in full_code_map:
-            return full_code_map[code]
-            
-        # Smart Range Mapping for Multi-Family Subtypes (03xx)
-        # Catch-all for specific unit counts even if exact code is missing (e.g. 0366 -> 0360)
-        if code.startswith("035"): return "Multi-Family - Apartments (5-24 Units)"
-        if code.startswith("036"): return "Multi-Family - Apartments (25-99 Units)"
-        if code.startswith("037"): return "Multi-Family - Apartments (100+ Units)"
-        if code.startswith("038"): return "Multi-Family - Boarding/Rooming House"
-        
-        # 2-digit prefix mapping with general descriptions
-        prefix_map = [
-            # Vacant Land
-            ("00", "Vacant Land"),
-            # Single Family
-            ("01", "Single Family Residential - Site ≤5 Acres"),
-            ("87", "Single Family Residential - Site >5 Acres"),
-            # PUD
-            ("02", "PUD Common Area"),
-            # Multi-Family
-            ("03", "Multi-Family"),
-            # Commercial
-            ("04", "Commercial - Hotel"),
-            ("05", "Commercial - Motel"),
-            ("06", "Commercial - Resort"),
-            ("07", "Condo/Townhouse"),
-            ("081", "Manufactured Home"),
-            ("082", "Manufactured Home"),
-            ("083", "Manufactured Home"),
-            ("084", "Manufactured Home Park"),
-            ("085", "RV/Travel Trailer Park"),
-            ("08", "Manufactured Home"),
-            ("09", "Salvage/Teardown"),
-            ("10", "Commercial - Miscellaneous"),
-            ("11", "Commercial - Retail"),
-            ("12", "Mixed Use - Store/Residential"),
-            ("13", "Commercial - Department Store"),
-            ("14", "Commercial - Shopping Center"),
-            ("15", "Commercial - Office"),
-            ("16", "Commercial - Bank"),
-            ("17", "Commercial - Gas/Auto Services"),
-            ("18", "Commercial - Vehicle Sales"),
-            ("19", "Care Facility"),
-            ("20", "Commercial - Restaurant/Bar"),
-            ("21", "Commercial - Medical"),
-            ("22", "Commercial - Track/Airfield"),
-            ("23", "Commercial - Cemetery"),
-            ("24", "Commercial - Golf Course"),
-            ("25", "Commercial - Entertainment"),
-            ("26", "Parking Facility"),
-            ("27", "Commercial - Club/Lodge"),
-            ("28", "Partially Complete Structure"),
-            ("29", "Private School"),
-            ("30", "Industrial"),
-            ("37", "Industrial - Warehouse"),
-            ("40", "Agricultural - Plant Nursery"),
-            ("41", "Agricultural - Field Crops"),
-            ("42", "Agricultural - Vineyard"),
-            ("43", "Agricultural - Orchard"),
-            ("44", "Agricultural - Citrus"),
-            ("45", "Agricultural - High Density"),
-            ("46", "Agricultural - Jojoba"),
-            ("47", "Ranch"),
-            ("48", "Pasture Land"),
-            ("49", "Agricultural - Waste/Fallow"),
-            ("88", "Limited Use"),
-            ("89", "Converted Use"),
-            ("90", "Tax Exempt - Private"),
-            ("91", "Tax Exempt - Private"),
-            ("92", "Religious Property"),
-        ]
-        
-        for prefix, prop_type in prefix_map:
-            if code.startswith(prefix):
-                return prop_type
-        
-        # Fallback
-        if code.startswith("0") or code.startswith("8"):
-            return "Residential"
-        elif code.startswith("1") or code.startswith("2"):
-            return "Commercial"
-        elif code.startswith("3"):
-            return "Industrial"
-        elif code.startswith("4"):
-            return "Agricultural"
-        
-        return "Unknown"
+        return classify_use_code(parcel_use)
 
     def _estimate_fetch_multiplier(self, property_types: List[str]) -> int:
         """
@@ -4379,132 +4274,8 @@ class ScoutService:
         """
         Maps friendly property types to Pima County Use Code PREFIXES (2-4 digits).
         The query logic will use LIKE 'prefix%' to match all subtypes.
-        Reference: Pima County Property Use Code Manual
         """
-        prefixes = []
-        
-        # Helper to decide if we've handled a type to avoid double matching
-        handled_types = set()
-        
-        # 1. Single Family
-        sfr_subtypes_selected = any(t in types for t in [
-            "Urban Subdivided", "Urban Non-Subdivided", 
-            "Rural Subdivided", "Rural Non-Subdivided", 
-            "With Guest House / Affixed MH"
-        ])
-        
-        if "Single Family" in types and not sfr_subtypes_selected:
-            prefixes.extend(["01", "87"])
-            handled_types.add("Single Family")
-            
-        # Specific SFR Filters
-        if "Urban Subdivided" in types:
-            base_sfr = ["010", "011", "012", "013", "014", "015", "018", "019", "871"]
-            prefixes.extend([f"{b}1" for b in base_sfr]) 
-            handled_types.add("Urban Subdivided")
-
-        if "Urban Non-Subdivided" in types:
-            base_sfr = ["010", "011", "012", "013", "014", "015", "018", "019", "871"]
-            prefixes.extend([f"{b}2" for b in base_sfr])
-            handled_types.add("Urban Non-Subdivided")
-
-        if "Rural Subdivided" in types:
-            base_sfr = ["010", "011", "012", "013", "014", "015", "018", "019", "871"]
-            prefixes.extend([f"{b}3" for b in base_sfr])
-            handled_types.add("Rural Subdivided")
-            
-        if "Rural Non-Subdivided" in types:
-            base_sfr = ["010", "011", "012", "013", "014", "015", "018", "019", "871"]
-            prefixes.extend([f"{b}4" for b in base_sfr])
-            handled_types.add("Rural Non-Subdivided")
-            
-        if "With Guest House / Affixed MH" in types:
-            prefixes.append("018")
-            handled_types.add("With Guest House / Affixed MH")
-
-        # 2. Multi-Family
-        mf_subtypes_selected = any(t in types for t in [
-            "Duplex/Triplex/Fourplex", "Apartments 5-24", 
-            "Apartments 25-99", "Apartments 100+"
-        ])
-        
-        if "Multi-Family" in types and not mf_subtypes_selected:
-            prefixes.append("03")
-            handled_types.add("Multi-Family")
-        
-        if "Duplex/Triplex/Fourplex" in types:
-            prefixes.extend(["031", "032", "033", "034"])
-            handled_types.add("Duplex/Triplex/Fourplex")
-            
-        if "Apartments 5-24" in types:
-            prefixes.append("035")
-            handled_types.add("Apartments 5-24")
-            
-        if "Apartments 25-99" in types:
-            prefixes.append("036")
-            handled_types.add("Apartments 25-99")
-            
-        if "Apartments 100+" in types:
-            prefixes.append("037")
-            handled_types.add("Apartments 100+")
-
-        # 3. Mobile Homes
-        mh_subtypes_selected = any(t in types for t in [
-            "Individual Mobile Home", "Mobile Home Park"
-        ])
-
-        if "Mobile Homes" in types and not mh_subtypes_selected:
-            prefixes.append("08")
-            handled_types.add("Mobile Homes")
-            
-        if "Individual Mobile Home" in types:
-            prefixes.extend(["081", "082", "083"])
-            handled_types.add("Individual Mobile Home")
-            
-        if "Mobile Home Park" in types:
-            prefixes.extend(["084", "085", "086", "089"])
-            handled_types.add("Mobile Home Park")
-
-        # 4. Standard Categories (Legacy/Unchanged)
-        type_map = {
-            "Condo": ["07"],
-            "Townhouse": ["07"],
-            "Commercial": ["04", "05", "06", "10", "11", "13", "14", "15", 
-                           "16", "17", "18", "19", "20", "21", "22", "23", "24", 
-                           "25", "27", "29", "30"],
-            "Retail": ["11", "13", "14"],
-            "Office": ["15"],
-            "Industrial": ["30", "37"],
-            "Mixed Use": ["12"],
-            "Parking": ["26"],
-            "Partially Complete": ["28"],
-            "Industrial / Storage": ["37"],
-            "Salvage / Teardown": ["09"],
-            "Vacant Land": ["00", "40", "41", "42", "43", "44", "45", "46", "47", "48", "49"],
-        }
-        
-        for t in types:
-            if t in handled_types:
-                continue
-                
-            if t in type_map:
-                prefixes.extend(type_map[t])
-            else:
-                # Fuzzy match fallback
-                found = False
-                for key, val in type_map.items():
-                    if t.lower() in key.lower() or key.lower() in t.lower():
-                        prefixes.extend(val)
-                        found = True
-                if not found:
-                    # If specific subtypes passed that we didn't handle explicitly above
-                    # e.g. "Residential" (Vacant Land subtype)
-                    if t == "Residential": prefixes.append("001")
-                    elif t == "Commercial" and "Vacant Land" in types: prefixes.append("002") # Ambiguous if just "Commercial"
-                    elif t == "Office/Bank": prefixes.extend(["15", "16"])
-                    elif t == "Retail/Store": prefixes.extend(["11", "13", "14"])
-                    
-        return list(set(prefixes))
+        return prefixes_for_types(types)
 
     async def _enrich_with_tucson_data(self, leads: List[Dict]):
         """
@@ -4519,7 +4290,7 @@ class ScoutService:
         # Query Layer 4 using PARCEL
         where_clause = f"PARCEL IN ({','.join([repr(pid) for pid in parcel_ids])})"
         
-        url = "https://gisdata.pima.gov/arcgis1/rest/services/GISOpenData/LandRecords/MapServer/4/query"
+        url = f"{self.pima_gis_base}/GISOpenData/LandRecords/MapServer/4/query"
         params = {
             "where": where_clause,
             "outFields": "PARCEL,USE_,SQ_FT,CODE,SALE_DATE,SALE_PRICE,MAIL1,MAIL2,MAIL3,MAIL4,MAIL5,ZIP9,STREETCITY,STREETDIR,STREETNAME,STREETNO",
@@ -4594,106 +4365,9 @@ class ScoutService:
         import random
         import asyncio
         
-        # Helper function to check if a lead is absentee owner
-        def is_absentee(lead: Dict) -> bool:
-            prop_addr = lead.get("address", "").upper().strip()
-            mail_addr = lead.get("mailing_address", "").upper().strip()
-            
-            if not prop_addr or not mail_addr:
-                return False
-            
-            # 1. Check Zip Code Difference (Strongest Signal)
-            prop_zip = lead.get("address_zip", "").split("-")[0]
-            
-            # Extract zip from mailing address (look for 5 digits)
-            import re
-            # Look for zip at the end or near end of string
-            mail_zip_match = re.search(r'\b(\d{5})\b', mail_addr)
-            if mail_zip_match:
-                mail_zip = mail_zip_match.group(1)
-                # If zips are valid and different, it's absentee
-                if prop_zip and mail_zip and prop_zip != mail_zip:
-                    if "Absentee Owner" not in lead.get("distress_signals", []):
-                        lead["distress_signals"] = lead.get("distress_signals", []) + ["Absentee Owner"]
-                    return True
-
-            # 2. Fallback to Street Match (if Zips match or Mail Zip missing)
-            # This handles cases where owner lives on same street but different number (rare)
-            # or if mailing address is just "PO BOX 123" (no street match)
-            prop_street = prop_addr.split(",")[0].strip()
-            
-            # NORMALIZE ADDRESSES (Handle AV vs AVE, BL vs BLVD, etc.)
-            def normalize_suffix(addr_str):
-                replacements = {
-                    r'\bAV\b': 'AVE',
-                    r'\bAVE\b': 'AVE',
-                    r'\bBL\b': 'BLVD',
-                    r'\bBLVD\b': 'BLVD',
-                    r'\bWY\b': 'WAY',
-                    r'\bWAY\b': 'WAY',
-                    r'\bPL\b': 'PLACE',
-                    r'\bPLACE\b': 'PLACE',
-                    r'\bTR\b': 'TRAIL',
-                    r'\bTRAIL\b': 'TRAIL',
-                    r'\bPK\b': 'PKWY',
-                    r'\bPKWY\b': 'PKWY',
-                    r'\bRD\b': 'ROAD',
-                    r'\bROAD\b': 'ROAD',
-                    r'\bST\b': 'STREET',
-                    r'\bSTREET\b': 'STREET',
-                    r'\bDR\b': 'DRIVE',
-                    r'\bDRIVE\b': 'DRIVE',
-                    r'\bLN\b': 'LANE',
-                    r'\bLANE\b': 'LANE',
-                    r'\bCT\b': 'COURT',
-                    r'\bCOURT\b': 'COURT',
-                    r'\bCI\b': 'CIRCLE',
-                    r'\bCIR\b': 'CIRCLE',
-                    r'\bCIRCLE\b': 'CIRCLE',
-                    r'\bTE\b': 'TERRACE',
-                    r'\bTER\b': 'TERRACE',
-                    r'\bTERRACE\b': 'TERRACE',
-                    r'\bLP\b': 'LOOP',
-                    r'\bLOOP\b': 'LOOP',
-                    r'\bHWY\b': 'HIGHWAY',
-                    r'\bHIGHWAY\b': 'HIGHWAY'
-                }
-                for pattern, repl in replacements.items():
-                    addr_str = re.sub(pattern, repl, addr_str)
-                return addr_str
-
-            norm_prop = normalize_suffix(prop_street)
-            norm_mail = normalize_suffix(mail_addr)
-            
-            # Heuristic: If property street is NOT in mailing address, it's likely absentee
-            # Use Regex Word Boundaries to avoid partial matches (e.g. "123 MAIN" matching "1123 MAIN")
-            try:
-                # Escape special chars in address just in case
-                pattern = r'\b' + re.escape(norm_prop) + r'\b'
-                if not re.search(pattern, norm_mail):
-                    # Fallback: Try matching WITHOUT suffix (if mailing address omits it)
-                    # e.g. Prop: "4842 N MARYVALE AVE", Mail: "4842 N MARYVALE"
-                    # Remove the last word if it's a known suffix?
-                    # Or just try to match the "Number + Street Name" part?
-                    # Simple heuristic: Remove the last token from prop address and check again
-                    prop_parts = norm_prop.split()
-                    if len(prop_parts) > 2: # Ensure we have Number + Name + Suffix
-                        prop_no_suffix = " ".join(prop_parts[:-1])
-                        pattern_no_suffix = r'\b' + re.escape(prop_no_suffix) + r'\b'
-                        if re.search(pattern_no_suffix, norm_mail):
-                             return False # It MATCHED without suffix, so Owner Occupied
-                    
-                    if "Absentee Owner" not in lead.get("distress_signals", []):
-                        lead["distress_signals"] = lead.get("distress_signals", []) + ["Absentee Owner"]
-                    return True
-            except:
-                # Fallback to simple substring if regex fails
-                if norm_prop not in norm_mail:
-                    if "Absentee Owner" not in lead.get("distress_signals", []):
-                        lead["distress_signals"] = lead.get("distress_signals", []) + ["Absentee Owner"]
-                    return True
-                
-            return False
+        # Batch absentee filter (also tags the "Absentee Owner" signal)
+        def absentee_only(leads: List[Dict]) -> List[Dict]:
+            return [lead for lead, flag in zip(leads, mark_absentee(leads)) if flag]
         
         # ===== WEIGHTED PROPORTIONAL ZIP SAMPLING for city searches =====
         if filters.get("city") and not filters.get("zip_code"):
@@ -4712,10 +4386,11 @@ class ScoutService:
                 print(f"Warning: No zips found for city '{city}'")
                 return []
             
-            print(f"[PERF] Querying {len(city_zips)} zips in parallel...")
-            
-            # Query each zip in parallel (need ~10x limit since only ~30-50% are absentee)
-            per_zip_limit = max(30, (limit * 10) // len(city_zips) + 5)
+            # Query each zip in parallel (need ~10x limit since only ~30-50% are absentee),
+            # budget split in proportion to parcel counts
+            zip_counts = await self._get_zip_record_counts(city, "parcels", city_zips=city_zips)
+            zip_limits = self._allocate_zip_limits(city_zips, zip_counts, total=limit * 10, floor=10)
+            print(f"[PERF] Querying {len(zip_limits)} zips in parallel (limits: {zip_limits})...")
             
             async def fetch_absentee_single_zip(zip_code: str) -> List[Dict]:
                 try:
@@ -4730,16 +4405,16 @@ class ScoutService:
                     if not keep_city:
                         zip_filters["city"] = None
                         
-                    candidates = await self._fetch_pima_parcels(zip_filters, limit=per_zip_limit, offset=0)
+                    candidates = await self._fetch_pima_parcels(zip_filters, limit=zip_limits[zip_code], offset=0)
                     if not candidates:
                         return []
-                    return [c for c in candidates if is_absentee(c)]
+                    return absentee_only(candidates)
                 except Exception as e:
                     print(f"    Error fetching absentee for zip {zip_code}: {e}")
                     return []
             
             # No concurrent limit for Pima County API (handles load well)
-            tasks = [fetch_absentee_single_zip(z) for z in city_zips]
+            tasks = [fetch_absentee_single_zip(z) for z in zip_limits]
             results_list = await asyncio.gather(*tasks)
             
             # Combine results
@@ -4763,7 +4438,7 @@ class ScoutService:
         self._log(f"Absentee Search: Found {len(candidates)} candidates.")
         
         # Filter to absentee owners
-        all_absentee_leads = [c for c in candidates if is_absentee(c)]
+        all_absentee_leads = absentee_only(candidates)
         
         # Random sample for geographic distribution
         if len(all_absentee_leads) > limit:
@@ -4944,7 +4619,7 @@ class ScoutService:
             return None
 
         # 1. Try Neighborhood Associations (Layer 9)
-        assoc_url = "https://gisdata.pima.gov/arcgis1/rest/services/GISOpenData/Community2/MapServer/9/query"
+        assoc_url = f"{self.pima_gis_base}/GISOpenData/Community2/MapServer/9/query"
         bounds = await query_layer_bounds(assoc_url, "NAME", neighborhood)
         
         if bounds:
@@ -4953,7 +4628,7 @@ class ScoutService:
             
         # 2. Fallback to Subdivisions (Layer 15)
         print(f"Neighborhood Association not found, trying Subdivisions...")
-        subdiv_url = "https://gisdata.pima.gov/arcgis1/rest/services/GISOpenData/LandRecords/MapServer/15/query"
+        subdiv_url = f"{self.pima_gis_base}/GISOpenData/LandRecords/MapServer/15/query"
         bounds = await query_layer_bounds(subdiv_url, "SUB_NAME", neighborhood)
         
         if bounds:
@@ -4982,7 +4657,7 @@ class ScoutService:
         }
         
         # 2. Search Subdivisions (Neighborhoods) - USE LAYER 15
-        sub_url = "https://gisdata.pima.gov/arcgis1/rest/services/GISOpenData/LandRecords/MapServer/15/query"
+        sub_url = f"{self.pima_gis_base}/GISOpenData/LandRecords/MapServer/15/query"
         sub_where = f"SUB_NAME LIKE '%{query.upper()}%'"
         sub_params = {
             "where": sub_where,
@@ -5025,78 +4700,80 @@ class ScoutService:
             return []
     async def _fetch_recorder_data(self, distress_type: str, limit: int) -> List[Dict]:
         """
-        Fetches data from Pima County Recorder via MCP Server.
+        Recent Pima County Recorder documents for a distress filter, read from
+        the local recorder catalog (kept current by recorder_harvest_service)
+        instead of searching the portal per request. Each grantor party (a
+        cell can list several) is matched to parcels in one pass over the
+        parcel owner index; a document takes the best match across its parties.
         """
-        print(f"Fetching Recorder data for: {distress_type}")
-        
-        # Map distress type to MCP doc_type
-        type_map = {
-            "Liens (HOA, Mechanics)": "LIEN",
-            "Pre-Foreclosure": "FORECLOSURE",
-            "Divorce": "DIVORCE",
-            "Judgements": "JUDGMENT",
-            "Tax Liens": "TAX LIEN"
-        }
+        from datetime import date, timedelta
+        from app.services.recorder_catalog import get_recorder_catalog, parse_record_date, party_names
+        from app.services.recorder_harvest_service import FILTER_DOC_TYPES
+        from app.services.pipeline.owner_index import get_parcel_owner_index
         
-        doc_type = type_map.get(distress_type)
-        if not doc_type:
+        doc_types = FILTER_DOC_TYPES.get(distress_type)
+        if not doc_types:
             return []
-
-        # Path to MCP server script
-        # Assuming relative path from backend/app/services/pipeline/scout.py to backend/mcp_servers/recorder/server.py
-        print("MCP Recorder integration temporarily disabled due to import errors.")
-        return []
         
-        # server_script = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../mcp_servers/recorder/server.py"))
-        # backend/app/services/pipeline/../../../mcp_servers/recorder/server.py
-        server_script = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../mcp_servers/recorder/server.py"))
-        
-        if not os.path.exists(server_script):
-            print(f"MCP Server script not found at: {server_script}")
+        since = date.today() - timedelta(days=settings.RECORDER_HARVEST_WINDOW_DAYS)
+        try:
+            docs = await get_recorder_catalog().find_by_doc_types(doc_types, start_date=since, limit=limit)
+        except Exception as e:
+            print(f"[Scout] Error reading recorder catalog for {distress_type}: {e}")
             return []
-
-        server_params = StdioServerParameters(
-            command=sys.executable,
-            args=[server_script],
-            env=os.environ.copy()
-        )
-
-        leads = []
+        print(f"[Scout] Recorder catalog: {len(docs)} {distress_type} documents since {since}")
+        
         try:
-            async with stdio_client(server_params) as (read, write):
-                async with ClientSession(read, write) as session:
-                    await session.initialize()
-                    
-                    # Call tool
-                    print(f"Calling tool search_documents with doc_type={doc_type}")
-                    results = await session.call_tool("search_documents", arguments={"query": "", "doc_type": doc_type})
-                    print(f"Raw MCP Results: {results}")
-                    
-                    # Map results to Lead format
-                    if results and hasattr(results, 'content') and isinstance(results.content, list):
-                        for content in results.content:
-                            print(f"Content Type: {content.type}")
-                            if content.type == "text":
-                                print(f"Content Text: {content.text}")
-                                try:
-                                    data = json.loads(content.text)
-                                    # data should be the List[Dict] I returned
-                                    if isinstance(data, list):
-                                        for item in data:
-                                            leads.append({
-                                                "source": "pima_recorder_mcp",
-                                                "owner_name": item.get("grantor", "Unknown"),
-                                                "address": "Unknown Address (Recorder Match)", # Recorder often lacks address, need cross-ref
-                                                "distress_signals": [f"{distress_type}: {item.get('doc_type')}"],
-                                                "status": "New",
-                                                "strategy": "Creative Finance",
-                                                "parcel_id": f"REC-{item.get('doc_id')}",
-                                                "distress_score": 80
-                                            })
-                                except json.JSONDecodeError:
-                                    print("Failed to decode JSON from content text")
-
+            matches = await get_parcel_owner_index().resolve(
+                name for d in docs for name in party_names(d.get("grantor")))
         except Exception as e:
-            print(f"Error calling MCP server: {e}")
-            
-        return leads[:limit]
+            print(f"[Scout] Owner index lookup failed: {e}")
+            matches = {}
+        
+        leads = []
+        for item in docs:
+            record_date = parse_record_date(item.get("record_date"))
+            lead = {
+                "id": item.get("doc_id"),
+                "source": "pima_recorder",
+                "owner_name": item.get("grantor") or "Unknown",
+                "address": "Unknown Address (Recorder Match)", # Recorder often lacks address, need cross-ref
+                "distress_signals": [f"{distress_type}: {item.get('doc_type')}"],
+                "record_date": record_date.isoformat() if record_date else None,
+                "status": "New",
+                "strategy": "Creative Finance",
+                "parcel_id": f"REC-{item.get('doc_id')}",
+                "distress_score": 80
+            }
+            # Best score per parcel across the grantor's parties ("SMITH JOHN A; WELLS FARGO BANK NA")
+            by_parcel: Dict[str, Dict] = {}
+            for name in party_names(item.get("grantor")):
+                for c in matches.get(name, []):
+                    if c["address"] and c["score"] > by_parcel.get(c["parcel_id"], {}).get("score", -1):
+                        by_parcel[c["parcel_id"]] = c
+            candidates = sorted(by_parcel.values(), key=lambda c: (-c["score"], c["parcel_id"]))
+            # Only assign when one owner holds the best score - a tie between owners is a guess
+            top_owners = {normalize_owner_name(c["owner_name"]) for c in candidates
+                          if c["score"] == candidates[0]["score"]}
+            if len(top_owners) > 1:
+                lead["parcel_candidates"] = [c["parcel_id"] for c in candidates]
+            elif candidates:
+                best = candidates[0]
+                lead.update({
+                    "address": best["address"],
+                    "address_street": best["address_street"],
+                    "address_city": best["address_city"],
+                    "address_state": "AZ",
+                    "address_zip": best["address_zip"],
+                    "parcel_id": best["parcel_id"],
+                    "mailing_address": best["mailing_address"],
+                    "owner_match_score": best["score"],
+                    # Other parcels the same owner name matched (an owner can hold several)
+                    "parcel_candidates": [c["parcel_id"] for c in candidates[1:]],
+                })
+            leads.append(lead)
+        
+        matched = sum(1 for lead in leads if not lead["parcel_id"].startswith("REC-"))
+        ambiguous = sum(1 for lead in leads if lead["parcel_id"].startswith("REC-") and lead.get("parcel_candidates"))
+        print(f"[Scout] Matched {matched}/{len(leads)} recorder grantors to parcels ({ambiguous} ambiguous)")
+        return leads
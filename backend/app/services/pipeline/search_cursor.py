@@ -0,0 +1,117 @@
+"""
+Search Cursors
+Server-side storage for /scout/search results so "load more" pages through
+the surplus candidates a search already fetched instead of re-running the
+whole pipeline with a bigger limit. Leads the search already enriched past
+its limit are kept ready to serve; the rest of the candidates are stored
+unenriched and enriched one page at a time (ScoutService.fetch_next_page).
+Leads already served are kept so the whole search can be exported
+(/scout/search/{id}/export). Pages are deduped on location_key (street line
+plus zip / city), falling back to parcel_id / id for leads without a real
+street line - those are never merged on their (blank or placeholder) address.
+
+In-memory, per process, with a TTL and an LRU cap - a cursor is a
+convenience, clients fall back to a fresh search if it has expired.
+"""
+import time
+import uuid
+import asyncio
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set
+
+from app.services.pipeline.address import location_key
+
+PLACEHOLDER_ADDRESS_PREFIX = "UNKNOWN ADDRESS"  # e.g. "Unknown Address (Recorder Match)"
+
+
+def dedupe_key(lead: Dict) -> Optional[str]:
+    """
+    Cross-page identity of a lead: location_key when it has a real street line,
+    else its parcel_id / id; None if there is nothing safe to key on.
+    """
+    address = str(lead.get("address") or "").strip()
+    if address and not address.upper().startswith(PLACEHOLDER_ADDRESS_PREFIX):
+        key = location_key(address, lead.get("address_city") or lead.get("city"),
+                           lead.get("address_zip") or lead.get("zip_code"))
+        if key:
+            return f"addr:{key}"
+    if lead.get("parcel_id"):
+        return f"parcel:{lead['parcel_id']}"
+    if lead.get("id"):
+        return f"id:{lead['id']}"
+    return None
+
+
+class SearchCursor:
+    def __init__(self, filters: Dict, pending: List[Dict], primary: Optional[str], served: List[Dict],
+                 ready: Optional[List[Dict]] = None):
+        self.id = uuid.uuid4().hex
+        self.filters = filters
+        self.ready = ready or []        # Enriched surplus leads, served before any pending candidate
+        self.pending = pending          # Unenriched surplus candidates, consumed page by page
+        self.primary = primary          # Primary AND-logic source (drives violations parcel enrichment)
+        self.served = served            # Enriched leads returned so far, in page order
+        self.seen: Set[str] = {key for key in map(dedupe_key, served) if key}  # Cross-page dedupe
+        self.pages_served = 1
+        self.touched = time.time()
+        self.lock = asyncio.Lock()      # One page at a time per cursor
+
+    @property
+    def has_more(self) -> bool:
+        return bool(self.ready or self.pending)
+
+    def add_served(self, leads: List[Dict]) -> List[Dict]:
+        """Records a page's leads as served, dropping leads an earlier page already had."""
+        fresh = []
+        for lead in leads:
+            key = dedupe_key(lead)
+            if key:
+                if key in self.seen:
+                    continue
+                self.seen.add(key)
+            fresh.append(lead)
+        self.served.extend(fresh)
+        return fresh
+
+
+class SearchCursorStore:
+    def __init__(self, ttl_seconds: int = 1800, max_cursors: int = 50):
+        self.ttl_seconds = ttl_seconds  # Same 30 min window as the violations cache
+        self.max_cursors = max_cursors  # Each cursor can hold up to ~2000 candidates
+        self._cursors: "OrderedDict[str, SearchCursor]" = OrderedDict()
+
+    def _evict(self):
+        now = time.time()
+        for cursor_id in [k for k, c in self._cursors.items() if now - c.touched > self.ttl_seconds]:
+            del self._cursors[cursor_id]
+        while len(self._cursors) > self.max_cursors:
+            self._cursors.popitem(last=False)
+
+    def create(self, filters: Dict, pending: List[Dict], primary: Optional[str], served: List[Dict],
+               ready: Optional[List[Dict]] = None) -> SearchCursor:
+        """Stores a search: its first page and the surplus (enriched and not) left to page through."""
+        cursor = SearchCursor(filters, pending, primary, list(served), ready)
+        self._cursors[cursor.id] = cursor
+        self._evict()
+        return cursor
+
+    def get(self, cursor_id: str) -> Optional[SearchCursor]:
+        self._evict()
+        cursor = self._cursors.get(cursor_id)
+        if cursor:
+            cursor.touched = time.time()
+            self._cursors.move_to_end(cursor_id)
+        return cursor
+
+    def discard(self, cursor_id: str):
+        self._cursors.pop(cursor_id, None)
+
+
+_store: Optional[SearchCursorStore] = None
+
+
+def get_search_cursor_store() -> SearchCursorStore:
+    global _store
+    if _store is None:
+        _store = SearchCursorStore()
+    return _store
@@ -0,0 +1,402 @@
+"""
+Pima County PARCEL_USE Taxonomy
+Compiled once at import time so per-parcel classification is a dict walk
+instead of rebuilding the code tables on every call.
+
+    classify_use_code("0131")            -> "Single Family Residential - Grade 3 (Urban Subdivided)"
+    classify_use_codes(["0131", "0366"]) -> [..., "Multi-Family - Apartments (25-99 Units)"]
+    prefixes_for_types(["Multi-Family"]) -> ["03"]
+
+Reference: Pima County Property Use Code Manual.
+Format: XX-YZ where XX=Category, Y=Subtype, Z=Characteristic
+"""
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+# ----------------------------------------------------------------------
+# Forward tables: PARCEL_USE code -> human-readable property type
+# ----------------------------------------------------------------------
+
+# Exact 4-digit codes
+USE_CODE_DESCRIPTIONS: Dict[str, str] = {
+    # --- Vacant Land (00-XX) ---
+    "0010": "Vacant Land - Undetermined",
+    "0011": "Vacant Land - Residential, Urban Subdivided",
+    "0012": "Vacant Land - Residential, Urban Non-Subdivided",
+    "0013": "Vacant Land - Residential, Rural Subdivided",
+    "0014": "Vacant Land - Residential, Rural Non-Subdivided",
+    "0020": "Vacant Land - Commercial",
+    "0021": "Vacant Land - Commercial, Urban Subdivided",
+    "0022": "Vacant Land - Commercial, Urban Non-Subdivided",
+    "0026": "Vacant Land - Commercial, Multiple Use",
+    "0030": "Vacant Land - Industrial",
+    "0031": "Vacant Land - Industrial, Urban Subdivided",
+    "0032": "Vacant Land - Industrial, Urban Non-Subdivided",
+    "0040": "Vacant Land - Condo",
+    "0041": "Vacant Land - Condo, Urban Subdivided",
+    "0070": "Vacant Land - Incomplete Subdivision",
+    "0071": "Vacant Land - Incomplete Subdivision, Urban Subdivided",
+    "0080": "Vacant Land - Manufactured Home",
+
+    # --- Single Family Residential (01-XX) ---
+    # Site <= 5 Acres
+    "0100": "Single Family Residential - Site ≤5 Acres",
+    "0101": "Single Family Residential - Site ≤5 Acres, Urban Subdivided",
+    "0102": "Single Family Residential - Site ≤5 Acres, Urban Non-Subdivided",
+    "0103": "Single Family Residential - Site ≤5 Acres, Rural Subdivided",
+    "0104": "Single Family Residential - Site ≤5 Acres, Rural Non-Subdivided",
+
+    # Grades (Standard)
+    "0110": "Single Family Residential - Grade 1",
+    "0111": "Single Family Residential - Grade 1 (Urban Subdivided)",
+    "0112": "Single Family Residential - Grade 1 (Urban Non-Subdivided)",
+    "0113": "Single Family Residential - Grade 1 (Rural Subdivided)",
+    "0114": "Single Family Residential - Grade 1 (Rural Non-Subdivided)",
+
+    "0120": "Single Family Residential - Grade 2",
+    "0121": "Single Family Residential - Grade 2 (Urban Subdivided)",
+    "0122": "Single Family Residential - Grade 2 (Urban Non-Subdivided)",
+    "0123": "Single Family Residential - Grade 2 (Rural Subdivided)",
+    "0124": "Single Family Residential - Grade 2 (Rural Non-Subdivided)",
+
+    "0130": "Single Family Residential - Grade 3",
+    "0131": "Single Family Residential - Grade 3 (Urban Subdivided)",
+    "0132": "Single Family Residential - Grade 3 (Urban Non-Subdivided)",
+    "0133": "Single Family Residential - Grade 3 (Rural Subdivided)",
+    "0134": "Single Family Residential - Grade 3 (Rural Non-Subdivided)",
+
+    "0140": "Single Family Residential - Grade 4",
+    "0141": "Single Family Residential - Grade 4 (Urban Subdivided)",
+    "0142": "Single Family Residential - Grade 4 (Urban Non-Subdivided)",
+    "0143": "Single Family Residential - Grade 4 (Rural Subdivided)",
+    "0144": "Single Family Residential - Grade 4 (Rural Non-Subdivided)",
+
+    "0150": "Single Family Residential - Grade 5",
+    "0151": "Single Family Residential - Grade 5 (Urban Subdivided)",
+    "0152": "Single Family Residential - Grade 5 (Urban Non-Subdivided)",
+    "0153": "Single Family Residential - Grade 5 (Rural Subdivided)",
+    "0154": "Single Family Residential - Grade 5 (Rural Non-Subdivided)",
+
+    # Guest Houses / Additional Units
+    "0180": "Single Family Residential - With Additional Unit",
+    "0181": "Single Family Residential - With Additional Unit (Urban Subdivided)",
+    "0182": "Single Family Residential - With Additional Unit (Urban Non-Subdivided)",
+    "0183": "Single Family Residential - With Additional Unit (Rural Subdivided)",
+    "0184": "Single Family Residential - With Additional Unit (Rural Non-Subdivided)",
+
+    # Misc
+    "0190": "Single Family Residential - Miscellaneous Improvements",
+    "0191": "Single Family Residential - Misc Improvements (Urban Subdivided)",
+    "0192": "Single Family Residential - Misc Improvements (Urban Non-Subdivided)",
+    "0193": "Single Family Residential - Misc Improvements (Rural Subdivided)",
+    "0194": "Single Family Residential - Misc Improvements (Rural Non-Subdivided)",
+
+    # --- PUD (02-XX) ---
+    "0200": "PUD - Common Area",
+    "0260": "PUD - Residential Common Area", # Explicitly map this to avoid Multi-Family confusion
+
+    # --- Multi-Family (03-XX) ---
+    "0300": "Multi-Family - Unspecified",
+    "0310": "Multi-Family - Mixed Complex (Duplex-Fourplex)",
+    "0311": "Multi-Family - Mixed Complex (Urban Subdivided)",
+    "0312": "Multi-Family - Mixed Complex (Urban Non-Subdivided)",
+
+    "0320": "Multi-Family - Duplex",
+    "0321": "Multi-Family - Duplex (2-4 Buildings)",
+    "0330": "Multi-Family - Triplex",
+    "0340": "Multi-Family - Fourplex",
+
+    "0350": "Multi-Family - Apartments (5-24 Units)",
+    "0360": "Multi-Family - Apartments (25-99 Units)",
+    "0370": "Multi-Family - Apartments (100+ Units)",
+    "0380": "Multi-Family - Boarding/Rooming House",
+    "0390": "Multi-Family - Apartment Cooperative",
+
+    # --- Commercial (Typical) ---
+    "0410": "Hotel",
+    "0510": "Motel",
+    "1110": "Store (Retail)",
+    "1112": "Store (Retail) - Supermarket",
+    "1510": "Office Building",
+    "1520": "Medical Office",
+    "3710": "Warehouse",
+    "3750": "Mini-Warehouse (Self Storage)",
+
+    # --- Condo/Townhouse (07-XX) ---
+    "0710": "Condo/Townhouse",
+    "0720": "Condo/Townhouse - Grade 2",
+    "0730": "Condo/Townhouse - Grade 3",
+    "0740": "Condo/Townhouse - Grade 4",
+    "0750": "Condo/Townhouse - Grade 5",
+    "0780": "Condo/Townhouse - Common Area w/ Improvements",
+    "0790": "Condo/Townhouse - Common Area w/o Improvements",
+
+    # --- Mobile Homes (08-XX) ---
+    "0810": "Manufactured Home Subdivision",
+    "0820": "Manufactured Home - Subdivided Lot",
+    "0830": "Manufactured Home - Non-Subdivided",
+    "0840": "Manufactured Home Park",
+    "0850": "RV/Travel Trailer Park",
+    "0860": "Manufactured Home Cooperative",
+    "0890": "Manufactured Home/RV Park - Mixed",
+
+    # --- Rural Residential > 5 Acres (87-XX) ---
+    "8710": "Single Family Residential - Site >5 Acres",
+    "8711": "Single Family Residential - Site >5 Acres, Urban Subdivided",
+    "8712": "Single Family Residential - Site >5 Acres, Urban Non-Subdivided",
+    "8713": "Single Family Residential - Site >5 Acres, Rural Subdivided",
+    "8714": "Single Family Residential - Site >5 Acres, Rural Non-Subdivided",
+    "8720": "Single Family Residential - Site >5 Acres, Multiple Residences",
+    "8730": "Rural Residential - Unsecured Manufactured Home",
+    "8740": "Rural Residential - Secured Manufactured Home",
+    "8750": "Rural Residential - Affixed Manufactured Home",
+}
+
+# Smart Range Mapping for Multi-Family Subtypes (03xx)
+# Catch-all for specific unit counts even if exact code is missing (e.g. 0366 -> 0360)
+USE_RANGE_TYPES: Dict[str, str] = {
+    "035": "Multi-Family - Apartments (5-24 Units)",
+    "036": "Multi-Family - Apartments (25-99 Units)",
+    "037": "Multi-Family - Apartments (100+ Units)",
+    "038": "Multi-Family - Boarding/Rooming House",
+}
+
+# 2-digit prefix mapping with general descriptions (first match wins)
+USE_PREFIX_TYPES: List[Tuple[str, str]] = [
+    # Vacant Land
+    ("00", "Vacant Land"),
+    # Single Family
+    ("01", "Single Family Residential - Site ≤5 Acres"),
+    ("87", "Single Family Residential - Site >5 Acres"),
+    # PUD
+    ("02", "PUD Common Area"),
+    # Multi-Family
+    ("03", "Multi-Family"),
+    # Commercial
+    ("04", "Commercial - Hotel"),
+    ("05", "Commercial - Motel"),
+    ("06", "Commercial - Resort"),
+    ("07", "Condo/Townhouse"),
+    ("081", "Manufactured Home"),
+    ("082", "Manufactured Home"),
+    ("083", "Manufactured Home"),
+    ("084", "Manufactured Home Park"),
+    ("085", "RV/Travel Trailer Park"),
+    ("08", "Manufactured Home"),
+    ("09", "Salvage/Teardown"),
+    ("10", "Commercial - Miscellaneous"),
+    ("11", "Commercial - Retail"),
+    ("12", "Mixed Use - Store/Residential"),
+    ("13", "Commercial - Department Store"),
+    ("14", "Commercial - Shopping Center"),
+    ("15", "Commercial - Office"),
+    ("16", "Commercial - Bank"),
+    ("17", "Commercial - Gas/Auto Services"),
+    ("18", "Commercial - Vehicle Sales"),
+    ("19", "Care Facility"),
+    ("20", "Commercial - Restaurant/Bar"),
+    ("21", "Commercial - Medical"),
+    ("22", "Commercial - Track/Airfield"),
+    ("23", "Commercial - Cemetery"),
+    ("24", "Commercial - Golf Course"),
+    ("25", "Commercial - Entertainment"),
+    ("26", "Parking Facility"),
+    ("27", "Commercial - Club/Lodge"),
+    ("28", "Partially Complete Structure"),
+    ("29", "Private School"),
+    ("30", "Industrial"),
+    ("37", "Industrial - Warehouse"),
+    ("40", "Agricultural - Plant Nursery"),
+    ("41", "Agricultural - Field Crops"),
+    ("42", "Agricultural - Vineyard"),
+    ("43", "Agricultural - Orchard"),
+    ("44", "Agricultural - Citrus"),
+    ("45", "Agricultural - High Density"),
+    ("46", "Agricultural - Jojoba"),
+    ("47", "Ranch"),
+    ("48", "Pasture Land"),
+    ("49", "Agricultural - Waste/Fallow"),
+    ("88", "Limited Use"),
+    ("89", "Converted Use"),
+    ("90", "Tax Exempt - Private"),
+    ("91", "Tax Exempt - Private"),
+    ("92", "Religious Property"),
+]
+
+# Fallback on the first digit
+USE_CATEGORY_FALLBACK: Dict[str, str] = {
+    "0": "Residential",
+    "8": "Residential",
+    "1": "Commercial",
+    "2": "Commercial",
+    "3": "Industrial",
+    "4": "Agricultural",
+}
+
+
+class _TrieNode:
+    __slots__ = ("children", "exact", "range", "prefix", "fallback")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.exact: Optional[str] = None     # Whole code ends here (USE_CODE_DESCRIPTIONS)
+        self.range: Optional[str] = None     # USE_RANGE_TYPES
+        self.prefix: Optional[str] = None    # USE_PREFIX_TYPES
+        self.fallback: Optional[str] = None  # USE_CATEGORY_FALLBACK
+
+
+def _build_use_code_trie() -> _TrieNode:
+    root = _TrieNode()
+
+    def node_for(key: str) -> _TrieNode:
+        node = root
+        for ch in key:
+            node = node.children.setdefault(ch, _TrieNode())
+        return node
+
+    for code, label in USE_CODE_DESCRIPTIONS.items():
+        node_for(code).exact = label
+    for prefix, label in USE_RANGE_TYPES.items():
+        node_for(prefix).range = label
+
+    # USE_PREFIX_TYPES is first-match-wins. An entry is unreachable if an earlier
+    # entry is a prefix of it, so dropping those lets "deepest hit" equal "first hit".
+    kept: List[str] = []
+    for prefix, label in USE_PREFIX_TYPES:
+        if any(prefix.startswith(k) for k in kept):
+            continue
+        kept.append(prefix)
+        node_for(prefix).prefix = label
+
+    for digit, label in USE_CATEGORY_FALLBACK.items():
+        node_for(digit).fallback = label
+    return root
+
+
+_USE_CODE_TRIE = _build_use_code_trie()
+
+
+@lru_cache(maxsize=4096)
+def _classify(code: str) -> str:
+    node = _USE_CODE_TRIE
+    best_range = best_prefix = best_fallback = None
+    for ch in code:
+        node = node.children.get(ch)
+        if node is None:
+            break
+        best_range = node.range or best_range
+        best_prefix = node.prefix or best_prefix
+        best_fallback = node.fallback or best_fallback
+    else:
+        if node.exact:
+            return node.exact
+    return best_range or best_prefix or best_fallback or "Unknown"
+
+
+def classify_use_code(parcel_use) -> str:
+    """Maps a PARCEL_USE code to a detailed human-readable property type."""
+    if not parcel_use:
+        return "Unknown"
+    return _classify(str(parcel_use).strip())
+
+
+def classify_use_codes(codes: Iterable) -> List[str]:
+    """
+    Batch form of classify_use_code for a whole feature page / column of codes.
+    Distinct codes are classified once (a Pima page rarely has more than a few dozen).
+    """
+    codes = list(codes)
+    labels = {c: classify_use_code(c) for c in set(str(c) if c is not None else "" for c in codes)}
+    return [labels[str(c) if c is not None else ""] for c in codes]
+
+
+# ----------------------------------------------------------------------
+# Reverse tables: friendly property type -> PARCEL_USE prefixes
+# The query logic uses LIKE 'prefix%' to match all subtypes.
+# ----------------------------------------------------------------------
+
+_SFR_BASE = ["010", "011", "012", "013", "014", "015", "018", "019", "871"]
+
+# (parent type, parent prefixes, {subtype: prefixes}). The parent only applies
+# when none of its subtypes were selected.
+TYPE_GROUPS: List[Tuple[str, List[str], Dict[str, List[str]]]] = [
+    ("Single Family", ["01", "87"], {
+        "Urban Subdivided": [f"{b}1" for b in _SFR_BASE],
+        "Urban Non-Subdivided": [f"{b}2" for b in _SFR_BASE],
+        "Rural Subdivided": [f"{b}3" for b in _SFR_BASE],
+        "Rural Non-Subdivided": [f"{b}4" for b in _SFR_BASE],
+        "With Guest House / Affixed MH": ["018"],
+    }),
+    ("Multi-Family", ["03"], {
+        "Duplex/Triplex/Fourplex": ["031", "032", "033", "034"],
+        "Apartments 5-24": ["035"],
+        "Apartments 25-99": ["036"],
+        "Apartments 100+": ["037"],
+    }),
+    ("Mobile Homes", ["08"], {
+        "Individual Mobile Home": ["081", "082", "083"],
+        "Mobile Home Park": ["084", "085", "086", "089"],
+    }),
+]
+
+# Standard Categories (Legacy/Unchanged)
+TYPE_PREFIXES: Dict[str, List[str]] = {
+    "Condo": ["07"],
+    "Townhouse": ["07"],
+    "Commercial": ["04", "05", "06", "10", "11", "13", "14", "15",
+                   "16", "17", "18", "19", "20", "21", "22", "23", "24",
+                   "25", "27", "29", "30"],
+    "Retail": ["11", "13", "14"],
+    "Office": ["15"],
+    "Industrial": ["30", "37"],
+    "Mixed Use": ["12"],
+    "Parking": ["26"],
+    "Partially Complete": ["28"],
+    "Industrial / Storage": ["37"],
+    "Salvage / Teardown": ["09"],
+    "Vacant Land": ["00", "40", "41", "42", "43", "44", "45", "46", "47", "48", "49"],
+}
+
+# Names that neither match TYPE_PREFIXES exactly nor fuzzily
+# e.g. "Residential" (Vacant Land subtype)
+_UNMATCHED_TYPE_PREFIXES: Dict[str, List[str]] = {
+    "Residential": ["001"],
+}
+
+
+@lru_cache(maxsize=256)
+def _prefixes_for_type(t: str) -> FrozenSet[str]:
+    if t in TYPE_PREFIXES:
+        return frozenset(TYPE_PREFIXES[t])
+    # Fuzzy match fallback
+    lowered = t.lower()
+    found = set()
+    for key, val in TYPE_PREFIXES.items():
+        if lowered in key.lower() or key.lower() in lowered:
+            found.update(val)
+    if found:
+        return frozenset(found)
+    return frozenset(_UNMATCHED_TYPE_PREFIXES.get(t, []))
+
+
+def prefixes_for_types(types: List[str]) -> List[str]:
+    """
+    Maps friendly property types (and subtypes) to Pima County Use Code PREFIXES (2-4 digits).
+    """
+    selected = set(types)
+    prefixes = set()
+    handled = set()
+
+    for parent, parent_prefixes, subtypes in TYPE_GROUPS:
+        picked = selected.intersection(subtypes)
+        if parent in selected and not picked:
+            prefixes.update(parent_prefixes)
+            handled.add(parent)
+        for sub in picked:
+            prefixes.update(subtypes[sub])
+        handled.update(picked)
+
+    for t in types:
+        if t not in handled:
+            prefixes.update(_prefixes_for_type(t))
+    return list(prefixes)
@@ -0,0 +1,426 @@
+"""
+Recorder Catalog - Local table of every Pima County Recorder document seen.
+
+Search results used to be thrown away after each response. Every search now
+writes its rows to recorder_documents (app.models.recorder), with grantor /
+grantee names normalized into recorder_document_parties, and records the
+recording-date range it covered in recorder_coverage. Lookups answer from
+the catalog and only search the portal for the date ranges no earlier search
+has covered:
+
+    catalog = get_recorder_catalog()
+    docs, error = await catalog.lookup_name(session, "SMITH JOHN", "grantee")
+    docs, error = await catalog.lookup_sequence(session, "20240010123")
+
+Name searches with no date range cover all time (from ALL_TIME_START). Today
+is never marked covered - the portal is still indexing it - so a name looked
+up again tomorrow costs one search of the days in between. Downloads and
+extraction results are kept on the same rows (list_downloaded replaces the
+downloads directory scan).
+"""
+
+import os
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import insert, select, update
+
+from app.core.database import AsyncSessionLocal
+from app.models.recorder import RecorderCoverageModel, RecorderDocumentModel, RecorderPartyModel
+from app.services.pipeline.owner_names import normalize_owner_name
+
+IN_CHUNK = 500                     # Stays under SQLite's 999 bound-parameter limit
+ALL_TIME_START = date(1900, 1, 1)  # Coverage start of a name search without dates
+FIRST_WINDOW_DAYS = 365            # Newest window of a limited name search; each older one doubles
+PARTY_ROLES = ("grantor", "grantee")
+PORTAL_DATE_FORMAT = "%m/%d/%Y"
+
+
+def parse_record_date(value) -> Optional[date]:
+    """Portal dates are MM/DD/YYYY; ISO strings and date objects pass through."""
+    if value is None or isinstance(value, date):
+        return value
+    for fmt in (PORTAL_DATE_FORMAT, "%Y-%m-%d"):
+        try:
+            return datetime.strptime(str(value).strip()[:10], fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+def _portal_date(d: Optional[date]) -> str:
+    return d.strftime(PORTAL_DATE_FORMAT) if d else ""
+
+
+def _roles(search_type: str) -> List[str]:
+    """Party roles a search type covers ("both" = either role)."""
+    return list(PARTY_ROLES) if search_type == "both" else [search_type]
+
+
+def _doc_dict(doc: RecorderDocumentModel) -> Dict:
+    """Catalog row in the shape RecorderSession searches return."""
+    return {
+        "doc_id": doc.doc_id,
+        "doc_number": doc.doc_number or "",
+        "doc_type": doc.doc_type or "",
+        "record_date": _portal_date(doc.record_date),
+        "grantor": doc.grantor or "",
+        "grantee": doc.grantee or "",
+        "book_page": doc.book_page or "",
+        "related_docs": doc.related_docs or [],
+    }
+
+
+def party_names(value: Optional[str]) -> List[str]:
+    """A grantor / grantee cell can list several parties, one per line or ';'-separated."""
+    if not value:
+        return []
+    return [p.strip() for p in value.replace(";", "\n").split("\n") if p.strip()]
+
+
+def _newest_first(docs: List[Dict]) -> List[Dict]:
+    return sorted(docs, key=lambda d: parse_record_date(d.get("record_date")) or date.min, reverse=True)
+
+
+def _with_keywords(docs: List[Dict], keywords: List[str]) -> List[Dict]:
+    """Documents whose type contains one of the (upper-case) keywords; all of them if there are none."""
+    if not keywords:
+        return docs
+    return [d for d in docs if any(k in (d.get("doc_type") or "").upper() for k in keywords)]
+
+
+def _search_windows(start: date, end: date, limit: Optional[int]) -> Iterator[Tuple[date, date]]:
+    """
+    The date windows a name search walks over [start, end]: the whole range
+    at once, or with a limit newest first - a year, then doubling - so a
+    lookup that only needs the newest documents stops early.
+    """
+    if not limit:
+        yield start, end
+        return
+    span = FIRST_WINDOW_DAYS
+    window_end = end
+    while window_end >= start:
+        window_start = max(start, window_end - timedelta(days=span - 1))
+        yield window_start, window_end
+        window_end = window_start - timedelta(days=1)
+        span *= 2
+
+
+class RecorderCatalog:
+
+    # --- Documents ---
+
+    async def upsert_documents(self, records: Iterable[Dict]) -> int:
+        """
+        Stores search result rows. New documents are inserted with their
+        parties; known ones get last_seen bumped and empty fields filled.
+        Returns the number of new documents.
+        """
+        by_id: Dict[str, Dict] = {}
+        for r in records:
+            if r.get("doc_id") and "error" not in r:
+                by_id[r["doc_id"]] = r
+        if not by_id:
+            return 0
+
+        now = datetime.utcnow()
+        async with AsyncSessionLocal() as db:
+            ids = list(by_id)
+            existing: Dict[str, RecorderDocumentModel] = {}
+            for i in range(0, len(ids), IN_CHUNK):
+                result = await db.execute(
+                    select(RecorderDocumentModel).where(RecorderDocumentModel.doc_id.in_(ids[i:i + IN_CHUNK]))
+                )
+                existing.update({d.doc_id: d for d in result.scalars().all()})
+
+            new_docs, new_parties, updates = [], [], []
+            for doc_id, r in by_id.items():
+                values = {
+                    "doc_number": r.get("doc_number") or None,
+                    "doc_type": r.get("doc_type") or None,
+                    "record_date": parse_record_date(r.get("record_date")),
+                    "grantor": r.get("grantor") or None,
+                    "grantee": r.get("grantee") or None,
+                    "book_page": r.get("book_page") or None,
+                    "related_docs": r.get("related_docs") or [],
+                }
+                doc = existing.get(doc_id)
+                if doc is None:
+                    new_docs.append({"doc_id": doc_id, **values, "first_seen": now, "last_seen": now})
+                    for role in PARTY_ROLES:
+                        for name in party_names(values[role]):
+                            new_parties.append({"doc_id": doc_id, "role": role, "name": name,
+                                                "name_norm": normalize_owner_name(name)})
+                    continue
+                fill = {k: v for k, v in values.items() if v and not getattr(doc, k)}
+                updates.append({"doc_id": doc_id, "last_seen": now, **fill})
+
+            try:
+                if new_docs:
+                    await db.execute(insert(RecorderDocumentModel), new_docs)
+                if new_parties:
+                    await db.execute(insert(RecorderPartyModel), new_parties)
+                # Bulk UPDATE by primary key wants one column set per statement
+                for columns in {frozenset(u) for u in updates}:
+                    await db.execute(update(RecorderDocumentModel), [u for u in updates if frozenset(u) == columns])
+                await db.commit()
+            except Exception as e:
+                await db.rollback()
+                print(f"[Recorder] Catalog upsert failed for {len(by_id)} documents: {e}")
+                raise
+        return len(new_docs)
+
+    async def find_by_number(self, doc_number: str) -> List[Dict]:
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(RecorderDocumentModel).where(RecorderDocumentModel.doc_number == doc_number.strip())
+            )
+            return [_doc_dict(d) for d in result.scalars().all()]
+
+    async def find_by_party(
+        self,
+        name: str,
+        search_type: str = "grantee",
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> List[Dict]:
+        """
+        Documents with a party whose normalized name starts with `name` (the
+        portal's name search is a prefix match too), newest first.
+        """
+        key = normalize_owner_name(name)
+        if not key:
+            return []
+        query = (
+            select(RecorderDocumentModel)
+            .join(RecorderPartyModel, RecorderPartyModel.doc_id == RecorderDocumentModel.doc_id)
+            .where(
+                RecorderPartyModel.name_norm >= key,
+                RecorderPartyModel.name_norm < key + "~",  # "~" sorts after every normalized character
+                RecorderPartyModel.role.in_(_roles(search_type)),
+            )
+            .distinct()
+        )
+        if start_date:
+            query = query.where(RecorderDocumentModel.record_date >= start_date)
+        if end_date:
+            query = query.where(RecorderDocumentModel.record_date <= end_date)
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(query)
+            return _newest_first([_doc_dict(d) for d in result.scalars().all()])
+
+    async def find_by_doc_types(
+        self,
+        doc_types: Iterable[str],
+        start_date: Optional[date] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict]:
+        """Documents of the given types recorded since start_date, newest first."""
+        query = (
+            select(RecorderDocumentModel)
+            .where(RecorderDocumentModel.doc_type.in_(list(doc_types)))
+            .order_by(RecorderDocumentModel.record_date.desc())
+        )
+        if start_date:
+            query = query.where(RecorderDocumentModel.record_date >= start_date)
+        if limit:
+            query = query.limit(limit)
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(query)
+            return [_doc_dict(d) for d in result.scalars().all()]
+
+    # --- Coverage ---
+
+    async def record_coverage(self, scope: str, key: str, start_date: date, end_date: date):
+        end_date = min(end_date, date.today() - timedelta(days=1))
+        if end_date < start_date:
+            return
+        async with AsyncSessionLocal() as db:
+            db.add(RecorderCoverageModel(scope=scope, key=key, start_date=start_date, end_date=end_date))
+            await db.commit()
+
+    async def uncovered_ranges(self, scope: str, key: str, start_date: date, end_date: date) -> List[Tuple[date, date]]:
+        """The parts of [start_date, end_date] no recorded search has covered."""
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(RecorderCoverageModel.start_date, RecorderCoverageModel.end_date)
+                .where(
+                    RecorderCoverageModel.scope == scope,
+                    RecorderCoverageModel.key == key,
+                    RecorderCoverageModel.end_date >= start_date,
+                    RecorderCoverageModel.start_date <= end_date,
+                )
+                .order_by(RecorderCoverageModel.start_date)
+            )
+            covered = result.all()
+
+        gaps = []
+        cursor = start_date
+        for cov_start, cov_end in covered:
+            if cov_start > cursor:
+                gaps.append((cursor, min(cov_start - timedelta(days=1), end_date)))
+            cursor = max(cursor, cov_end + timedelta(days=1))
+            if cursor > end_date:
+                return gaps
+        gaps.append((cursor, end_date))
+        return gaps
+
+    # --- Downloads / extraction ---
+
+    async def _set_fields(self, doc_id: str, **fields):
+        async with AsyncSessionLocal() as db:
+            doc = await db.get(RecorderDocumentModel, doc_id)
+            if doc is None:
+                # Downloaded by id without a search (or before the catalog existed)
+                db.add(RecorderDocumentModel(doc_id=doc_id, **fields))
+            else:
+                for k, v in fields.items():
+                    setattr(doc, k, v)
+            await db.commit()
+
+    async def mark_downloaded(self, doc_id: str, path: str):
+        await self._set_fields(doc_id, downloaded_path=path)
+
+    async def save_extraction(self, doc_id: str, data: Dict):
+        await self._set_fields(doc_id, extraction=data)
+
+    async def get_document(self, doc_id: str) -> Optional[RecorderDocumentModel]:
+        async with AsyncSessionLocal() as db:
+            return await db.get(RecorderDocumentModel, doc_id)
+
+    async def list_downloaded(self) -> List[RecorderDocumentModel]:
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(RecorderDocumentModel)
+                .where(RecorderDocumentModel.downloaded_path.isnot(None))
+                .order_by(RecorderDocumentModel.record_date.desc())
+            )
+            return list(result.scalars().all())
+
+    async def register_downloads(self, downloads_dir: str) -> int:
+        """Catalogs files already in the downloads directory. Returns the number added."""
+        if not os.path.isdir(downloads_dir):
+            return 0
+        found = {}
+        for entry in os.scandir(downloads_dir):
+            if entry.is_file() and entry.name.endswith(".pdf"):
+                found[entry.name[:-4]] = entry.path
+            elif entry.is_dir() and entry.name.endswith("_images"):
+                found.setdefault(entry.name[:-len("_images")], entry.path)
+        known = {d.doc_id for d in await self.list_downloaded()}
+        added = 0
+        for doc_id, path in found.items():
+            if doc_id not in known:
+                await self.mark_downloaded(doc_id, path)
+                added += 1
+        if added:
+            print(f"[Recorder] Cataloged {added} existing downloads")
+        return added
+
+    # --- Lookups (catalog first, portal for the gaps) ---
+
+    async def lookup_sequence(self, session, seq_num: str) -> Tuple[List[Dict], Optional[str]]:
+        docs = await self.find_by_number(seq_num)
+        if docs:
+            return docs, None
+        results = await session.search_by_sequence(seq_num)
+        if results and "error" in results[0]:
+            return [], results[0]["error"]
+        await self.upsert_documents(results)
+        return results, None
+
+    async def _has_newest(self, key: str, role: str, since: date, end_date, keywords: List[str], limit: int) -> bool:
+        """Whether the catalog already has `limit` matching documents recorded since `since`."""
+        docs = await self.find_by_party(key, role, since, parse_record_date(end_date))
+        return len(_with_keywords(docs, keywords)) >= limit
+
+    async def lookup_name(
+        self,
+        session,
+        name: str,
+        search_type: str = "grantee",
+        start_date=None,
+        end_date=None,
+        doc_keywords: Optional[Iterable[str]] = None,
+        limit: Optional[int] = None,
+        page=None,
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """
+        Documents for a party name, newest first - optionally within a
+        recording date range and to types containing one of doc_keywords.
+        Only the uncovered part of the range is searched on the portal
+        (all result pages, so the covered range is complete). With a limit,
+        gaps are searched newest first in growing windows and the walk stops
+        once the newest `limit` documents are known; each window read in full
+        is covered on its own, so a later lookup does not start over from
+        ALL_TIME_START. Returns (documents, error); the error is set only
+        when a portal search failed and nothing could be answered.
+        """
+        key = normalize_owner_name(name)
+        if not key:
+            return [], "No name provided"
+        start = parse_record_date(start_date) or ALL_TIME_START
+        end = parse_record_date(end_date) or date.today()
+
+        # Coverage stops at yesterday; a range that reaches today still searches it
+        # along with any older gap, but not on its own
+        covered_end = min(end, date.today() - timedelta(days=1))
+        keywords = [k.upper() for k in doc_keywords or []]
+        error = None
+        for role in _roles(search_type):
+            if start > covered_end:
+                gaps = [(start, end)]
+            else:
+                gaps = await self.uncovered_ranges(role, key, start, covered_end)
+                if gaps and gaps[-1][1] == covered_end:
+                    gaps[-1] = (gaps[-1][0], end)
+            if limit:
+                gaps.reverse()
+            for gap_start, gap_end in gaps:
+                if limit and gap_end < end and await self._has_newest(key, role, gap_end + timedelta(days=1),
+                                                                      end_date, keywords, limit):
+                    break
+                for window_start, window_end in _search_windows(gap_start, gap_end, limit):
+                    records = []
+                    try:
+                        async for record in session.iter_name_documents(
+                            key, search_type=role,
+                            start_date=_portal_date(window_start) if window_start > ALL_TIME_START else None,
+                            end_date=_portal_date(window_end) if window_end < date.today() else None,
+                            page=page,
+                        ):
+                            records.append(record)
+                    except Exception as e:
+                        # Keep what was found; the window stays uncovered and is searched again next time
+                        print(f"[Recorder] {role} search for {key} ({window_start} - {window_end}) incomplete: {e}")
+                        error = str(e)
+                        await self.upsert_documents(records)
+                        break
+                    await self.upsert_documents(records)
+                    await self.record_coverage(role, key, window_start, window_end)
+                    if limit and await self._has_newest(key, role, window_start, end_date, keywords, limit):
+                        break
+                else:
+                    continue
+                if limit:
+                    # Either the newest `limit` are known, or a window failed and older
+                    # ones could not tell which documents are the newest
+                    break
+
+        docs = await self.find_by_party(key, search_type,
+                                        start if start > ALL_TIME_START else None, parse_record_date(end_date))
+        docs = _with_keywords(docs, keywords)
+        if limit:
+            docs = docs[:limit]
+        return docs, (error if not docs else None)
+
+
+_catalog: Optional[RecorderCatalog] = None
+
+
+def get_recorder_catalog() -> RecorderCatalog:
+    global _catalog
+    if _catalog is None:
+        _catalog = RecorderCatalog()
+    return _catalog
@@ -0,0 +1,149 @@
+"""
+Recorder Harvest Service - Keeps the recorder catalog stocked with recent
+distress documents so Scout's recorder filters answer from the local table.
+
+Each pass looks at a sliding window of recording dates (the last
+RECORDER_HARVEST_WINDOW_DAYS) for every document type behind a Scout
+filter, asks the catalog which days of that window are not covered yet, and
+searches only those on the portal - types missing the same days share one
+multi-type search, in slices of at most SLICE_DAYS. Results are stored as
+they stream in, and a slice is marked covered once its search completes, so
+an interrupted pass resumes where it stopped. After the initial backfill a
+daily pass costs one short search.
+
+Usage:
+    await harvest_distress_documents(session)              # one pass
+    await run_recorder_harvest_worker(get_session, 3600)   # background loop (started in main.py)
+
+The worker reuses the recorder router's browser session and skips passes
+while it is not initialized (the CAPTCHA needs a person). It searches on its
+own tab (RecorderSession.dedicated_page), never the main page user searches
+and bulk lookups run on.
+"""
+
+import asyncio
+from datetime import date, datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.services.recorder_catalog import get_recorder_catalog
+
+# Scout distress filter -> recorder document types harvested for it
+FILTER_DOC_TYPES: Dict[str, List[str]] = {
+    "Pre-Foreclosure": ["LIS PENDENS", "NOTICE SALE", "SUBSTITUTION TRUSTEE"],
+    "Divorce": ["DISSOLUTION MARRIAGE"],
+    "Judgements": ["JUDGMENT", "ABSTRACT JUDGMENT"],
+    "Tax Liens": ["FEDERAL LIEN"],
+    "Liens (HOA, Mechanics)": ["MECHANICS LIEN", "LIEN", "NOTICE LIEN", "CITY LIEN"],
+    "Probate": ["AFFIDAVIT SUCCESSION"],
+}
+
+STORE_EVERY = 100    # Rows buffered before writing to the catalog
+SLICE_DAYS = 7       # Longest date range per search (keeps a backfill under the result-page cap)
+
+_harvest_lock = asyncio.Lock()
+last_harvest: Dict = {}
+
+
+def harvest_doc_types() -> List[str]:
+    return list(dict.fromkeys(t for types in FILTER_DOC_TYPES.values() for t in types))
+
+
+async def _harvest_range(session, page, doc_types: List[str], start: date, end: date,
+                         selected: List[str]) -> Tuple[int, int]:
+    """
+    Searches one date range for doc_types, storing as it goes. Returns
+    (seen, new); `selected` receives the types the portal search included.
+    """
+    catalog = get_recorder_catalog()
+    seen = new = 0
+    buffer = []
+    documents = session.iter_documents(
+        doc_types, start_date=start.strftime("%m/%d/%Y"), end_date=end.strftime("%m/%d/%Y"),
+        page=page, selected_types=selected,
+    )
+    try:
+        async for record in documents:
+            buffer.append(record)
+            if len(buffer) >= STORE_EVERY:
+                new += await catalog.upsert_documents(buffer)
+                seen += len(buffer)
+                buffer = []
+    finally:
+        await documents.aclose()
+        if buffer:
+            new += await catalog.upsert_documents(buffer)
+            seen += len(buffer)
+    return seen, new
+
+
+async def harvest_distress_documents(session, window_days: Optional[int] = None) -> Dict:
+    """
+    One harvest pass over the sliding window. Returns a summary
+    {"searches", "documents", "new", "errors"}.
+    """
+    async with _harvest_lock:
+        catalog = get_recorder_catalog()
+        window_days = window_days or settings.RECORDER_HARVEST_WINDOW_DAYS
+        today = date.today()
+        start = today - timedelta(days=window_days)
+        covered_end = today - timedelta(days=1)
+
+        # Group types by the gaps they share so each gap is one multi-type search
+        by_gap: Dict[Tuple[date, date], List[str]] = {}
+        for doc_type in harvest_doc_types():
+            gaps = await catalog.uncovered_ranges("doc_type", doc_type, start, covered_end)
+            if gaps and gaps[-1][1] == covered_end:
+                gaps[-1] = (gaps[-1][0], today)  # Pick up what is already indexed for today
+            for gap_start, gap_end in gaps:
+                while gap_start <= gap_end:
+                    slice_end = min(gap_start + timedelta(days=SLICE_DAYS - 1), gap_end)
+                    by_gap.setdefault((gap_start, slice_end), []).append(doc_type)
+                    gap_start = slice_end + timedelta(days=1)
+
+        summary = {"searches": 0, "documents": 0, "new": 0, "errors": []}
+        page = await session.dedicated_page("harvest") if by_gap else None
+        if by_gap and page is None:
+            summary["errors"].append("Could not open the harvest tab")
+            by_gap = {}
+        for (gap_start, gap_end), doc_types in sorted(by_gap.items()):
+            print(f"[Recorder] Harvest {', '.join(doc_types)}: {gap_start} - {gap_end}")
+            summary["searches"] += 1
+            selected: List[str] = []
+            try:
+                seen, new = await _harvest_range(session, page, doc_types, gap_start, gap_end, selected)
+            except Exception as e:
+                print(f"[Recorder] Harvest of {', '.join(doc_types)} ({gap_start} - {gap_end}) failed: {e}")
+                summary["errors"].append(f"{', '.join(doc_types)} {gap_start} - {gap_end}: {e}")
+                continue
+            summary["documents"] += seen
+            summary["new"] += new
+            # Only types the search included are covered; the rest are retried next pass
+            missed = [t for t in doc_types if t not in selected]
+            if missed:
+                summary["errors"].append(f"{', '.join(missed)} {gap_start} - {gap_end}: doc type not selected")
+            for doc_type in selected:
+                await catalog.record_coverage("doc_type", doc_type, gap_start, gap_end)
+
+        if summary["searches"]:
+            print(f"[Recorder] Harvest done: {summary['searches']} searches, {summary['documents']} documents "
+                  f"({summary['new']} new), {len(summary['errors'])} errors")
+        last_harvest.clear()
+        last_harvest.update(summary, finished_at=datetime.utcnow().isoformat(), window_days=window_days)
+        return summary
+
+
+async def run_recorder_harvest_worker(get_session: Callable[[], Awaitable], interval_s: int = 3600):
+    """Background loop: harvest every interval_s seconds while the recorder session is up."""
+    while True:
+        try:
+            session = await get_session()
+            if session.initialized:
+                await harvest_distress_documents(session)
+            else:
+                print("[Recorder] Harvest skipped: recorder session not initialized")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"[Recorder] Error harvesting distress documents: {e}")
+        await asyncio.sleep(interval_s)
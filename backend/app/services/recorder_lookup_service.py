@@ -0,0 +1,109 @@
+"""
+Recorder Lookup Service - Bulk owner-name searches against the Pima County
+Recorder portal (RecorderSession from mcp_servers/recorder).
+
+Usage:
+    service = get_recorder_lookup_service()
+    async for key, docs, error in service.lookup_owners(session, owner_names):
+        ...
+
+Owner names are reduced to one search key each (owner_search_key: spouses
+and co-owner variants collapse, entities keep their full name), so a bulk
+run looks up every distinct owner once. Owners whose history the recorder
+catalog (app.services.recorder_catalog) already covers are answered from it
+without touching the portal. The rest are spread over a pool of tabs in the
+authenticated browser context, each searching only the date range its owner
+is missing; the session's own throttle keeps search submissions a polite
+interval apart across all tabs, and results are yielded as each owner
+completes.
+"""
+
+import asyncio
+from datetime import date, timedelta
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Tuple
+
+from app.core.config import settings
+from app.services.pipeline.owner_names import owner_search_key
+from app.services.recorder_catalog import ALL_TIME_START, get_recorder_catalog
+
+NAME_SEARCH_LIMIT = 20  # Documents kept per owner (what bulk lookup always asked for)
+MAX_SEARCH_TABS = 6     # Upper bound on a caller-supplied concurrency
+
+
+class RecorderLookupService:
+    def __init__(self):
+        self.catalog = get_recorder_catalog()
+
+    # --- Bulk lookup ---
+
+    async def lookup_owners(
+        self,
+        session,
+        owner_names: Iterable[str],
+        concurrency: Optional[int] = None,
+        doc_keywords: Optional[Iterable[str]] = None,
+    ) -> AsyncIterator[Tuple[str, List[Dict], Optional[str]]]:
+        """
+        Yields (search_key, documents, error) once per distinct search key,
+        catalog-covered keys first, then in completion order. Documents are
+        the owner's grantee history, newest first (types containing one of
+        doc_keywords, if given). Map owner names back with owner_search_key().
+        """
+        keys = list(dict.fromkeys(k for k in (owner_search_key(n) for n in owner_names) if k))
+        covered_end = date.today() - timedelta(days=1)
+        pending = []
+        for key in keys:
+            if await self.catalog.uncovered_ranges("grantee", key, ALL_TIME_START, covered_end):
+                pending.append(key)
+            else:
+                docs, _ = await self.catalog.lookup_name(session, key, "grantee", doc_keywords=doc_keywords,
+                                                         limit=NAME_SEARCH_LIMIT)
+                yield key, docs, None
+        if not pending:
+            return
+
+        concurrency = max(1, min(concurrency or settings.RECORDER_BULK_CONCURRENCY, MAX_SEARCH_TABS, len(pending)))
+        pages = await session.open_search_pages(concurrency)
+        if not pages:
+            for key in pending:
+                yield key, [], "Session not initialized or browser closed. Please re-initialize."
+            return
+        print(f"[Recorder] Bulk lookup: {len(keys)} owners ({len(keys) - len(pending)} from catalog), "
+              f"{len(pending)} searches over {len(pages)} tabs")
+
+        queue: asyncio.Queue = asyncio.Queue()
+        for key in pending:
+            queue.put_nowait(key)
+        done: asyncio.Queue = asyncio.Queue()
+
+        async def worker(page):
+            while True:
+                try:
+                    key = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    docs, error = await self.catalog.lookup_name(session, key, "grantee", doc_keywords=doc_keywords,
+                                                                 limit=NAME_SEARCH_LIMIT, page=page)
+                    await done.put((key, docs, error))
+                except Exception as e:
+                    await done.put((key, [], str(e)))
+
+        workers = [asyncio.create_task(worker(page)) for page in pages]
+        try:
+            for _ in range(len(pending)):
+                yield await done.get()
+        finally:
+            # Client went away mid-stream: stop searching, keep what finished
+            for w in workers:
+                w.cancel()
+
+
+_service: Optional[RecorderLookupService] = None
+
+
+def get_recorder_lookup_service() -> RecorderLookupService:
+    global _service
+    if _service is None:
+        _service = RecorderLookupService()
+    return _service
@@ -0,0 +1,109 @@
+"""
+Rescoring Service - Keeps the materialized propensity score on LeadModel current.
+
+Leads carry their scoring inputs (distress_signals, violation_count,
+record_date, recorder_flags, mailing_address, bedrooms/bathrooms). Setting any
+of them through the ORM flips score_dirty and bumps score_version (see
+app.models.orm); bulk writers do both explicitly. The worker picks up only
+dirty leads, scores them in batches with PropensityScoringService.score_many
+and writes the results back with one bulk UPDATE per batch - guarded by the
+score_version it read, so a lead changed mid-rescore stays dirty.
+
+Usage:
+    columns = score_columns(rows)          # materialized score columns for new rows
+    await rescore_dirty_leads()            # one pass
+    await run_rescore_worker(60)           # background loop (started in main.py)
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from typing import Dict, List
+
+from sqlalchemy import bindparam, select, true, update
+
+from app.core.database import AsyncSessionLocal
+from app.models.orm import LeadModel
+from app.services.scoring_service import get_scoring_service
+
+RESCORE_BATCH_SIZE = 1000
+
+_INPUT_COLUMNS = [
+    LeadModel.id, LeadModel.distress_signals, LeadModel.violation_count, LeadModel.record_date,
+    LeadModel.recorder_flags, LeadModel.mailing_address, LeadModel.bedrooms, LeadModel.bathrooms,
+    LeadModel.score_version,
+]
+
+_leads = LeadModel.__table__
+# Writes a batch's scores only where the lead still has the input version that was scored
+_SCORE_UPDATE = (
+    update(_leads)
+    .where(_leads.c.id == bindparam("lead_id"))
+    .where(_leads.c.score_version == bindparam("read_version"))
+)
+
+
+def score_columns(rows: List[Dict]) -> List[Dict]:
+    """
+    Materialized score columns for LeadModel-shaped dicts (same order), with
+    score_dirty cleared.
+    """
+    if not rows:
+        return []
+    scorer = get_scoring_service()
+    results = scorer.score_many(
+        [{
+            "distress_signals": row.get("distress_signals") or [],
+            "violation_count": row.get("violation_count"),
+            "record_date": row.get("record_date"),
+            "mailing_address": row.get("mailing_address"),
+            "bedrooms": row.get("bedrooms"),
+            "bathrooms": row.get("bathrooms"),
+        } for row in rows],
+        [row.get("recorder_flags") for row in rows],
+    )
+    now = datetime.now(timezone.utc)
+    return [{
+        "propensity_score": result.score,
+        "propensity_label": result.label,
+        "propensity_signals": result.signals,
+        "propensity_breakdown": result.breakdown,
+        "scored_at": now,
+        "score_dirty": False,
+    } for result in results]
+
+
+async def rescore_dirty_leads(batch_size: int = RESCORE_BATCH_SIZE) -> int:
+    """Rescores every dirty lead, one batch at a time. Returns the number rescored."""
+    total = 0
+    while True:
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                select(*_INPUT_COLUMNS).where(LeadModel.score_dirty == true()).limit(batch_size)
+            )
+            rows = [dict(r) for r in result.mappings().all()]
+            if not rows:
+                break
+            updates = [
+                {"lead_id": row["id"], "read_version": row["score_version"], **cols}
+                for row, cols in zip(rows, score_columns(rows))
+            ]
+            await session.execute(_SCORE_UPDATE, updates)
+            await session.commit()
+        total += len(rows)
+        if len(rows) < batch_size:
+            break
+    if total:
+        print(f"[Rescore] Rescored {total} leads")
+    return total
+
+
+async def run_rescore_worker(interval_s: int = 60):
+    """Background loop: rescore dirty leads every interval_s seconds."""
+    while True:
+        try:
+            await rescore_dirty_leads()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"[Rescore] Error rescoring leads: {e}")
+        await asyncio.sleep(interval_s)
@@ -7,10 +7,17 @@ Scoring Formula: Motivation + Equity + Asset = Score (0-100)
 - 80-100: Hot 🔥 (Skip trace + call)
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, date
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
 from pydantic import BaseModel
 
+# (label, emoji) by tier: Hot >= 80, Warm >= 51, else Cold
+SCORE_TIERS = [("Hot", "🔥"), ("Warm", "🌤️"), ("Cold", "❄️")]
+
 
 class ScoreResult(BaseModel):
     """Result from propensity scoring"""
@@ -77,6 +84,93 @@ class PropensityScoringService:
         "In Target Zip": 10,
     }
     
+    # Out-of-state mailing address: state abbreviations that count
+    OUT_OF_STATE_ABBREVS = ["CA", "TX", "FL", "NY", "NV", "CO", "WA", "OR", "IL", "PA", "OH"]
+    
+    # record_date string formats, tried in order
+    DATE_FORMATS = ["%Y-%m-%d", "%m/%d/%Y", "%Y/%m/%d"]
+    
+    # Recorder flags that add motivation, in signal order (flag, label)
+    RECORDER_MOTIVATION_FLAGS = [
+        ("has_notice_sale", "Notice of Sale"),
+        ("has_lis_pendens", "Lis Pendens"),
+        ("has_lien", "Liens Found"),
+        ("has_judgment", "Judgment"),
+    ]
+    
+    def __init__(self):
+        # Matchers compiled once: lowercase keys in priority order, and
+        # per-distinct-value caches (the same few signals/mailing addresses
+        # repeat across thousands of leads)
+        self._motivation_keys = [(key.lower(), weight) for key, weight in self.MOTIVATION_WEIGHTS.items()]
+        self._recorder_motivation_weights = np.array(
+            [self.RECORDER_DOCUMENT_WEIGHTS[flag] for flag, _ in self.RECORDER_MOTIVATION_FLAGS], dtype=np.int64
+        )
+        self._match_signal = lru_cache(maxsize=4096)(self._match_signal_uncached)
+        self._out_of_state = lru_cache(maxsize=65536)(self._out_of_state_uncached)
+    
+    def _match_signal_uncached(self, signal: str) -> Optional[Tuple[int, str]]:
+        """(weight, label) of the first MOTIVATION_WEIGHTS key contained in the signal."""
+        signal_lower = signal.lower()
+        for key, weight in self._motivation_keys:
+            if key in signal_lower:
+                return weight, f"{signal} (+{weight})"
+        return None
+    
+    def _out_of_state_uncached(self, mailing_address: str) -> Optional[str]:
+        upper = mailing_address.upper()
+        if ", AZ" in upper or ", ARIZONA" in upper:
+            return None
+        # Check if it's a real out-of-state address (not just empty)
+        if len(mailing_address) <= 10 or not any(c.isalpha() for c in mailing_address):
+            return None
+        for state in self.OUT_OF_STATE_ABBREVS:
+            if f", {state}" in upper:
+                return state
+        return None
+    
+    @staticmethod
+    def _numeric(values: List) -> np.ndarray:
+        out = np.zeros(len(values), dtype=np.float64)
+        for i, v in enumerate(values):
+            try:
+                out[i] = float(v) if v else 0.0
+            except (TypeError, ValueError):
+                pass
+        return out
+    
+    def _years_owned(self, record_dates: List) -> np.ndarray:
+        """Years since each record_date (NaN where missing/unparseable), parsed per column."""
+        n = len(record_dates)
+        now = pd.Timestamp(datetime.now())
+        parsed = pd.Series(pd.NaT, index=range(n), dtype="datetime64[ns]")
+        
+        str_idx = [i for i, d in enumerate(record_dates) if isinstance(d, str)]
+        if str_idx:
+            values = pd.Series([record_dates[i] for i in str_idx], index=str_idx)
+            dates = pd.Series(pd.NaT, index=str_idx, dtype="datetime64[ns]")
+            for fmt in self.DATE_FORMATS:
+                missing = dates.isna()
+                if not missing.any():
+                    break
+                dates[missing] = pd.to_datetime(values[missing], format=fmt, errors="coerce")
+            parsed[str_idx] = dates
+        
+        # Epoch timestamps in milliseconds (local time, like datetime.fromtimestamp); 0 means missing
+        num_idx = [i for i, d in enumerate(record_dates)
+                   if isinstance(d, (int, float)) and not isinstance(d, bool) and d]
+        if num_idx:
+            ms = pd.to_datetime([record_dates[i] for i in num_idx], unit="ms", utc=True, errors="coerce")
+            parsed[num_idx] = ms.tz_convert(datetime.now().astimezone().tzinfo).tz_localize(None)
+        
+        obj_idx = [i for i, d in enumerate(record_dates) if isinstance(d, date)]
+        if obj_idx:
+            parsed[obj_idx] = pd.to_datetime([record_dates[i] for i in obj_idx], errors="coerce")
+        
+        # Whole days elapsed (timedelta.days floors), as in (now - dt).days / 365
+        days = np.floor((now - parsed).dt.total_seconds().to_numpy() / 86400)
+        return days / 365
+    
     def score_lead(self, lead: Dict, recorder_data: Optional[Dict] = None) -> ScoreResult:
         """
         Calculate propensity score for a lead.
@@ -88,154 +182,127 @@ class PropensityScoringService:
         Returns:
             ScoreResult with score, label, and breakdown
         """
-        signals_found = []
-        motivation_score = 0
-        equity_score = 0
-        asset_score = 0
+        return self.score_many([lead], [recorder_data])[0]
+    
+    def score_many(self, leads: List[Dict], recorder_data: Optional[List[Optional[Dict]]] = None) -> List[ScoreResult]:
+        """
+        Score many leads at once (same rules as score_lead).
+        Signal text is matched through the cached matchers; dates, equity,
+        asset and totals are computed as NumPy arrays over the whole batch.
         
-        # --- MOTIVATION SCORING ---
-        distress_signals = lead.get("distress_signals", [])
+        Args:
+            leads: Lead dicts
+            recorder_data: Optional recorder lookup results, parallel to leads
+        """
+        n = len(leads)
+        if n == 0:
+            return []
+        recorder_data = recorder_data or [None] * n
+        with_recorder = [(i, r) for i, r in enumerate(recorder_data) if r]
         
-        for signal in distress_signals:
-            for key, weight in self.MOTIVATION_WEIGHTS.items():
-                if key.lower() in signal.lower():
-                    motivation_score += weight
-                    signals_found.append(f"{signal} (+{weight})")
-                    break
+        motivation = np.zeros(n, dtype=np.int64)
+        equity = np.zeros(n, dtype=np.int64)
+        asset = np.zeros(n, dtype=np.int64)
+        signals_found: List[List[str]] = [[] for _ in range(n)]
+        
+        # --- MOTIVATION SCORING ---
+        has_code_violations = np.zeros(n, dtype=bool)
+        for i, lead in enumerate(leads):
+            for signal in lead.get("distress_signals") or []:
+                if not isinstance(signal, str):
+                    continue
+                match = self._match_signal(signal)
+                if match:
+                    motivation[i] += match[0]
+                    signals_found[i].append(match[1])
+                    if signal == "Code Violations":
+                        has_code_violations[i] = True
         
         # Check for code violations
-        violation_count = lead.get("violation_count", 0)
-        if violation_count and violation_count > 0:
-            if "Code Violations" not in [s.split(" (+")[0] for s in signals_found]:
-                motivation_score += 20
-                signals_found.append(f"Code Violations ({violation_count}) (+20)")
+        violation_count = self._numeric([lead.get("violation_count", 0) for lead in leads])
+        for i in np.nonzero((violation_count > 0) & ~has_code_violations)[0]:
+            motivation[i] += 20
+            signals_found[i].append(f"Code Violations ({leads[i].get('violation_count')}) (+20)")
         
         # Check for Out of State (from mailing address)
-        mailing_address = lead.get("mailing_address", "")
-        if mailing_address and ", AZ" not in mailing_address.upper() and ", ARIZONA" not in mailing_address.upper():
-            # Check if it's a real out-of-state address (not just empty)
-            if len(mailing_address) > 10 and any(c.isalpha() for c in mailing_address):
-                # Look for state abbreviations that aren't AZ
-                state_abbrevs = ["CA", "TX", "FL", "NY", "NV", "CO", "WA", "OR", "IL", "PA", "OH"]
-                for state in state_abbrevs:
-                    if f", {state}" in mailing_address.upper():
-                        motivation_score += 10
-                        signals_found.append(f"Out of State ({state}) (+10)")
-                        break
+        for i, lead in enumerate(leads):
+            mailing_address = lead.get("mailing_address", "")
+            if mailing_address:
+                state = self._out_of_state(mailing_address)
+                if state:
+                    motivation[i] += 10
+                    signals_found[i].append(f"Out of State ({state}) (+10)")
         
         # Recorder data signals (from bulk enhance)
-        if recorder_data:
-            # Notice of Sale - urgent foreclosure
-            if recorder_data.get("has_notice_sale"):
-                points = self.RECORDER_DOCUMENT_WEIGHTS.get("has_notice_sale", 40)
-                motivation_score += points
-                signals_found.append(f"Notice of Sale (+{points})")
-            
-            # Lis Pendens - litigation
-            if recorder_data.get("has_lis_pendens"):
-                points = self.RECORDER_DOCUMENT_WEIGHTS.get("has_lis_pendens", 35)
-                motivation_score += points
-                signals_found.append(f"Lis Pendens (+{points})")
-            
-            # Liens
-            if recorder_data.get("has_lien"):
-                points = self.RECORDER_DOCUMENT_WEIGHTS.get("has_lien", 15)
-                motivation_score += points
-                signals_found.append(f"Liens Found (+{points})")
-            
-            # Judgment
-            if recorder_data.get("has_judgment"):
-                points = self.RECORDER_DOCUMENT_WEIGHTS.get("has_judgment", 15)
-                motivation_score += points
-                signals_found.append(f"Judgment (+{points})")
-            
-            # Reconveyance = loan paid off = equity!
-            if recorder_data.get("has_reconveyance"):
-                points = self.RECORDER_DOCUMENT_WEIGHTS.get("has_reconveyance", 25)
-                equity_score += points
-                signals_found.append(f"Loan Paid Off (RECON) (+{points})")
+        flags = np.zeros((n, len(self.RECORDER_MOTIVATION_FLAGS)), dtype=bool)
+        has_recon = np.zeros(n, dtype=bool)
+        warranty_no_loan = np.zeros(n, dtype=bool)
+        for i, r in with_recorder:
+            for j, (flag, _) in enumerate(self.RECORDER_MOTIVATION_FLAGS):
+                flags[i, j] = bool(r.get(flag))
+            has_recon[i] = bool(r.get("has_reconveyance"))
+            warranty_no_loan[i] = r.get("deed_type") == "WTDEED" and not r.get("has_dot")
+        motivation += flags.astype(np.int64) @ self._recorder_motivation_weights
+        recon_points = self.RECORDER_DOCUMENT_WEIGHTS["has_reconveyance"]
+        equity += np.where(has_recon, recon_points, 0)
+        for i in np.nonzero(flags.any(axis=1) | has_recon)[0]:
+            for j, (flag, label) in enumerate(self.RECORDER_MOTIVATION_FLAGS):
+                if flags[i, j]:
+                    signals_found[i].append(f"{label} (+{self._recorder_motivation_weights[j]})")
+            if has_recon[i]:
+                signals_found[i].append(f"Loan Paid Off (RECON) (+{recon_points})")
         
         # --- EQUITY SCORING ---
-        record_date = lead.get("record_date")
-        
-        if record_date:
-            # Calculate years since last recording
-            try:
-                if isinstance(record_date, str):
-                    # Try parsing common date formats
-                    for fmt in ["%Y-%m-%d", "%m/%d/%Y", "%Y/%m/%d"]:
-                        try:
-                            dt = datetime.strptime(record_date, fmt)
-                            break
-                        except:
-                            dt = None
-                elif isinstance(record_date, (int, float)):
-                    # Epoch timestamp in milliseconds
-                    dt = datetime.fromtimestamp(record_date / 1000)
-                else:
-                    dt = None
-                
-                if dt:
-                    years_owned = (datetime.now() - dt).days / 365
-                    
-                    if years_owned > 15:
-                        # Likely free & clear
-                        equity_score += 30
-                        signals_found.append(f"Free & Clear (est. {int(years_owned)}yr) (+30)")
-                    elif years_owned > 10:
-                        equity_score += 10
-                        signals_found.append(f"Long Ownership ({int(years_owned)}yr) (+10)")
-                    elif years_owned < 2:
-                        equity_score -= 20
-                        signals_found.append(f"Recent Purchase ({int(years_owned)}yr) (-20)")
-            except Exception as e:
-                pass  # Skip if date parsing fails
+        years = self._years_owned([lead.get("record_date") for lead in leads])
+        known = ~np.isnan(years)
+        free_clear = known & (years > 15)
+        long_owned = known & (years > 10) & ~free_clear
+        recent = known & (years < 2)
+        equity += np.select([free_clear, long_owned, recent], [30, 10, -20], 0)
+        for i in np.nonzero(free_clear | long_owned | recent)[0]:
+            y = int(years[i])
+            if free_clear[i]:
+                signals_found[i].append(f"Free & Clear (est. {y}yr) (+30)")
+            elif long_owned[i]:
+                signals_found[i].append(f"Long Ownership ({y}yr) (+10)")
+            else:
+                signals_found[i].append(f"Recent Purchase ({y}yr) (-20)")
         
         # Check recorder data for deed type
-        if recorder_data:
-            if recorder_data.get("deed_type") == "WTDEED" and not recorder_data.get("has_dot"):
-                equity_score += 30
-                signals_found.append("Warranty Deed (no loan) (+30)")
-            elif recorder_data.get("has_reconveyance"):
-                equity_score += 25
-                signals_found.append("Loan Paid Off (RECON) (+25)")
+        recon_deed = has_recon & ~warranty_no_loan
+        equity += np.select([warranty_no_loan, recon_deed], [30, 25], 0)
+        for i in np.nonzero(warranty_no_loan | recon_deed)[0]:
+            signals_found[i].append(
+                "Warranty Deed (no loan) (+30)" if warranty_no_loan[i] else "Loan Paid Off (RECON) (+25)"
+            )
         
         # --- ASSET SCORING ---
-        beds = lead.get("beds") or lead.get("bedrooms") or 0
-        baths = lead.get("baths") or lead.get("bathrooms") or 0
-        
-        if beds >= 3 and baths >= 2:
-            asset_score += 5
-            signals_found.append("3+ Bed / 2+ Bath (+5)")
+        beds = self._numeric([lead.get("beds") or lead.get("bedrooms") or 0 for lead in leads])
+        baths = self._numeric([lead.get("baths") or lead.get("bathrooms") or 0 for lead in leads])
+        buy_box = (beds >= 3) & (baths >= 2)
+        asset += np.where(buy_box, 5, 0)
+        for i in np.nonzero(buy_box)[0]:
+            signals_found[i].append("3+ Bed / 2+ Bath (+5)")
         
         # --- CALCULATE TOTAL SCORE ---
-        raw_score = motivation_score + equity_score + asset_score
-        
         # Cap score to 0-100 range
-        score = max(0, min(100, raw_score))
-        
-        # Determine label
-        if score >= 80:
-            label = "Hot"
-            emoji = "🔥"
-        elif score >= 51:
-            label = "Warm"
-            emoji = "🌤️"
-        else:
-            label = "Cold"
-            emoji = "❄️"
-        
-        return ScoreResult(
-            score=score,
-            label=label,
-            emoji=emoji,
-            signals=signals_found,
-            breakdown={
-                "motivation": motivation_score,
-                "equity": equity_score,
-                "asset": asset_score
-            }
-        )
+        scores = np.clip(motivation + equity + asset, 0, 100)
+        tiers = np.select([scores >= 80, scores >= 51], [0, 1], 2)
+        
+        return [
+            ScoreResult(
+                score=int(scores[i]),
+                label=SCORE_TIERS[tiers[i]][0],
+                emoji=SCORE_TIERS[tiers[i]][1],
+                signals=signals_found[i],
+                breakdown={
+                    "motivation": int(motivation[i]),
+                    "equity": int(equity[i]),
+                    "asset": int(asset[i])
+                }
+            )
+            for i in range(n)
+        ]
 
 
 # Singleton instance
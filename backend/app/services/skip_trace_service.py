@@ -8,13 +8,29 @@ This is a modular design:
 Usage:
     service = SkipTraceService()
     result = await service.lookup("123 Main St, Tucson, AZ 85711", "John Doe")
+    results = await service.lookup_many([{"address": ..., "owner_name": ...}, ...])
+
+Lookups share one aiohttp session, are deduped by canonical address (street
+line + zip/city) + owner, sent to BatchData in batches under a bounded pool,
+and cached (with a TTL) in cache/skip_trace_cache.json so repeat traces
+don't hit the paid API. Mock results are never cached.
 """
 
 import os
+import json
+import time
+import asyncio
 import aiohttp
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 from pydantic import BaseModel
 
+from app.services.pipeline.address import location_key
+
+CACHE_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "cache", "skip_trace_cache.json")
+CACHE_TTL_S = int(os.getenv("SKIP_TRACE_CACHE_TTL_DAYS", "30")) * 86400
+BATCH_SIZE = 50        # Property skip-trace requests per BatchData call
+MAX_CONCURRENT = 4     # BatchData calls in flight
+
 
 class SkipTraceResult(BaseModel):
     """Result from a skip trace lookup"""
@@ -47,6 +63,60 @@ class SkipTraceService:
             print("[SkipTrace] Running in MOCK mode (no BATCHDATA_API_KEY found)")
         else:
             print("[SkipTrace] BatchData API configured")
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._cache: Dict[str, Dict] = self._load_cache()
+
+    # --- Shared session ---
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=MAX_CONCURRENT * 2),
+                timeout=aiohttp.ClientTimeout(total=60),
+            )
+        return self._session
+
+    async def close(self):
+        if self._session and not self._session.closed:
+            await self._session.close()
+
+    # --- Result cache ---
+
+    @staticmethod
+    def cache_key(address: str, owner_name: Optional[str] = None,
+                  city: Optional[str] = None, zip_code: Optional[str] = None) -> str:
+        """Canonical street line + zip (or city) + normalized owner name."""
+        owner = " ".join((owner_name or "").upper().replace(",", " ").split())
+        return f"{location_key(address, city, zip_code)}|{owner}"
+
+    def _load_cache(self) -> Dict[str, Dict]:
+        try:
+            if os.path.exists(CACHE_FILE):
+                with open(CACHE_FILE, "r") as f:
+                    data = json.load(f)
+                now = time.time()
+                return {k: v for k, v in data.items() if now - v.get("_cached_at", 0) < CACHE_TTL_S}
+        except Exception as e:
+            print(f"[SkipTrace] Error loading cache: {e}")
+        return {}
+
+    def _save_cache(self):
+        try:
+            os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+            with open(CACHE_FILE, "w") as f:
+                json.dump(self._cache, f)
+        except Exception as e:
+            print(f"[SkipTrace] Error saving cache: {e}")
+
+    def _cached(self, key: str) -> Optional[SkipTraceResult]:
+        entry = self._cache.get(key)
+        if not entry:
+            return None
+        if time.time() - entry.get("_cached_at", 0) >= CACHE_TTL_S:
+            del self._cache[key]
+            return None
+        return SkipTraceResult(**{k: v for k, v in entry.items() if k != "_cached_at"})
     
     async def lookup(
         self,
@@ -69,88 +139,122 @@ class SkipTraceService:
         Returns:
             SkipTraceResult with contact information
         """
-        if self.mock_mode:
-            return await self._mock_lookup(address, owner_name)
-        else:
-            return await self._batchdata_lookup(address, owner_name, city, state, zip_code)
-    
-    async def _batchdata_lookup(
-        self,
-        address: str,
-        owner_name: Optional[str],
-        city: Optional[str],
-        state: str,
-        zip_code: Optional[str]
-    ) -> SkipTraceResult:
+        results = await self.lookup_many([{
+            "address": address,
+            "owner_name": owner_name,
+            "city": city,
+            "state": state,
+            "zip_code": zip_code,
+        }])
+        return results[0]
+
+    async def lookup_many(self, requests: List[Dict]) -> List[SkipTraceResult]:
+        """
+        Skip traces many properties at once. Each request is a dict with
+        address (required), owner_name, city, state, zip_code. Returns one
+        result per request, in order; duplicates (same canonical address,
+        zip/city and owner) and cached results cost no provider calls.
+        """
+        keys = [self.cache_key(r.get("address") or "", r.get("owner_name"), r.get("city"), r.get("zip_code"))
+                for r in requests]
+        resolved: Dict[str, SkipTraceResult] = {}
+        to_fetch: Dict[str, Dict] = {}
+        for key, req in zip(keys, requests):
+            if key in resolved or key in to_fetch:
+                continue
+            cached = self._cached(key)
+            if cached:
+                resolved[key] = cached
+            else:
+                to_fetch[key] = req
+
+        if to_fetch:
+            items = list(to_fetch.items())
+            batches = [items[i:i + BATCH_SIZE] for i in range(0, len(items), BATCH_SIZE)]
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT)
+
+            async def run_batch(batch: List[Tuple[str, Dict]]) -> List[SkipTraceResult]:
+                async with semaphore:
+                    reqs = [req for _, req in batch]
+                    if self.mock_mode:
+                        return [await self._mock_lookup(r["address"], r.get("owner_name")) for r in reqs]
+                    return await self._batchdata_lookup_batch(reqs)
+
+            batch_results = await asyncio.gather(*(run_batch(b) for b in batches))
+            now = time.time()
+            for batch, results in zip(batches, batch_results):
+                for (key, _), result in zip(batch, results):
+                    resolved[key] = result
+                    # Retry errors next time; fake mock contacts must never outlive mock mode
+                    if result.status != "error" and not self.mock_mode:
+                        self._cache[key] = {**result.dict(), "_cached_at": now}
+            if not self.mock_mode:
+                self._save_cache()
+
+        print(f"[SkipTrace] {len(requests)} lookups: {len(to_fetch)} sent to provider, "
+              f"{len(requests) - len(to_fetch)} deduped/cached")
+        return [resolved[k] for k in keys]
+
+    async def _batchdata_lookup_batch(self, requests: List[Dict]) -> List[SkipTraceResult]:
         """
-        Real skip trace using BatchData API.
+        Real skip trace using BatchData API (property skip trace, one call per batch).
         
         BatchData offers:
         - Property Skip Trace (address-based)
         - Person Skip Trace (name + location)
         
-        We use property-based first, then name-based if needed.
+        Results come back in request order.
         """
+        def error(message: str) -> List[SkipTraceResult]:
+            return [SkipTraceResult(status="error", message=message) for _ in requests]
+
         try:
-            async with aiohttp.ClientSession() as session:
-                # Try property-based skip trace first
-                payload = {
-                    "requests": [{
-                        "streetAddress": address,
-                        "city": city,
-                        "state": state,
-                        "zip": zip_code
-                    }]
-                }
-                
-                headers = {
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json"
-                }
-                
-                async with session.post(
-                    f"{self.base_url}/property/skip-trace",
-                    json=payload,
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return self._parse_batchdata_response(data)
-                    elif response.status == 401:
-                        return SkipTraceResult(
-                            status="error",
-                            message="Invalid BatchData API key"
-                        )
-                    else:
-                        error_text = await response.text()
-                        print(f"[SkipTrace] BatchData error: {response.status} - {error_text}")
-                        return SkipTraceResult(
-                            status="error",
-                            message=f"API error: {response.status}"
-                        )
+            session = await self._get_session()
+            payload = {
+                "requests": [{
+                    "streetAddress": r["address"],
+                    "city": r.get("city"),
+                    "state": r.get("state") or "AZ",
+                    "zip": r.get("zip_code")
+                } for r in requests]
+            }
+            
+            headers = {
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json"
+            }
+            
+            async with session.post(
+                f"{self.base_url}/property/skip-trace",
+                json=payload,
+                headers=headers,
+            ) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    results = data.get("results", [])
+                    parsed = [self._parse_batchdata_result(r) for r in results[:len(requests)]]
+                    missing = len(requests) - len(parsed)
+                    return parsed + [SkipTraceResult(status="not_found", message="No data found")] * missing
+                elif response.status == 401:
+                    return error("Invalid BatchData API key")
+                else:
+                    error_text = await response.text()
+                    print(f"[SkipTrace] BatchData error: {response.status} - {error_text}")
+                    return error(f"API error: {response.status}")
                         
         except aiohttp.ClientError as e:
             print(f"[SkipTrace] Network error: {e}")
-            return SkipTraceResult(
-                status="error",
-                message=f"Network error: {str(e)}"
-            )
+            return error(f"Network error: {str(e)}")
         except Exception as e:
             print(f"[SkipTrace] Unexpected error: {e}")
-            return SkipTraceResult(
-                status="error",
-                message=f"Unexpected error: {str(e)}"
-            )
+            return error(f"Unexpected error: {str(e)}")
     
-    def _parse_batchdata_response(self, data: Dict) -> SkipTraceResult:
-        """Parse BatchData API response into SkipTraceResult."""
+    def _parse_batchdata_result(self, result: Dict) -> SkipTraceResult:
+        """Parse one entry of a BatchData response's results into SkipTraceResult."""
         try:
-            results = data.get("results", [])
-            if not results:
+            if not result:
                 return SkipTraceResult(status="not_found", message="No data found")
             
-            result = results[0]
             persons = result.get("persons", [])
             
             if not persons:
@@ -0,0 +1,343 @@
+"""
+Offline Benchmark Suite for ScoutService.fetch_leads
+Replays recorded ArcGIS / Assessor / HomeHarvest fixtures so performance
+changes in scout.py can be measured without hitting county servers.
+
+Usage (run from backend/):
+    # 1. Record fixtures once against the live services
+    python -m benchmarks.bench_scout --record
+
+    # 2. Run offline and store the result as the baseline
+    python -m benchmarks.bench_scout --save-baseline
+
+    # 3. After a change, compare against the baseline
+    python -m benchmarks.bench_scout
+    python -m benchmarks.bench_scout --scenario city_absentee --verbose
+
+Reported per scenario:
+    wall_s            - wall time of fetch_leads (last run when repeat > 1)
+    upstream_calls    - number of upstream requests issued (served from fixtures)
+    peak_rss_mb       - process peak RSS (each scenario runs in a fresh process)
+    stages            - inclusive time + call count per ScoutService stage
+"""
+import os
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+import functools
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Optional
+
+BENCH_DIR = Path(__file__).parent.resolve()
+BACKEND_DIR = BENCH_DIR.parent
+BASELINE_FILE = BENCH_DIR / "baseline.json"
+
+# Make `app.*` importable when run as a script or module from anywhere
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from benchmarks.fixtures import FixtureTransport, FIXTURES_DIR
+from benchmarks.scenarios import SCENARIOS, get_scenario
+
+RESULT_MARKER = "BENCH_RESULT "
+BENCH_SEED = 1337
+
+# ScoutService stages timed individually (times are inclusive of nested stages)
+STAGES = [
+    "_fetch_primary",
+    "_fetch_code_violations",
+    "_fetch_absentee_owners",
+    "_fetch_pima_parcels",
+    "_verify_filter",
+    "_enrich_violations_with_parcel_data",
+    "_enrich_violations_with_zip_codes",
+    "_filter_violations_by_property_type",
+    "_enrich_with_zip_codes",
+    "_enrich_with_gis_layers",
+    "_enrich_with_tucson_data",
+    "_enrich_with_homeharvest",
+    "fetch_hot_leads",
+    "_apply_cached_enrichment",
+    "_save_to_lead_cache",
+]
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """Process high-water RSS in MB (ru_maxrss is KB on Linux, bytes on macOS)."""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform == "darwin":
+            return round(peak / (1024 * 1024), 1)
+        return round(peak / 1024, 1)
+    except ImportError:
+        # Windows: no resource module
+        return None
+
+
+class StageTimer:
+    """Wraps ScoutService instance methods to collect per-stage timings."""
+
+    def __init__(self, service, stages: List[str]):
+        self.timings: Dict[str, Dict] = {}
+        for name in stages:
+            method = getattr(service, name, None)
+            if method is None:
+                continue
+            setattr(service, name, self._wrap(name, method))
+
+    def _record(self, name: str, elapsed: float):
+        entry = self.timings.setdefault(name, {"seconds": 0.0, "calls": 0})
+        entry["seconds"] += elapsed
+        entry["calls"] += 1
+
+    def _wrap(self, name, method):
+        if asyncio.iscoroutinefunction(method):
+            @functools.wraps(method)
+            async def async_wrapper(*args, **kwargs):
+                t0 = time.perf_counter()
+                try:
+                    return await method(*args, **kwargs)
+                finally:
+                    self._record(name, time.perf_counter() - t0)
+            return async_wrapper
+
+        @functools.wraps(method)
+        def sync_wrapper(*args, **kwargs):
+            t0 = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self._record(name, time.perf_counter() - t0)
+        return sync_wrapper
+
+    def reset(self):
+        self.timings = {}
+
+    def report(self) -> Dict:
+        return {k: {"seconds": round(v["seconds"], 4), "calls": v["calls"]} for k, v in sorted(self.timings.items())}
+
+
+# ----------------------------------------------------------------------
+# Worker: runs ONE scenario in the current process
+# ----------------------------------------------------------------------
+async def _run_scenario(scenario: Dict, transport: FixtureTransport) -> Dict:
+    from app.services.pipeline.scout import ScoutService
+
+    service = ScoutService()
+    timer = StageTimer(service, STAGES)
+    runs = []
+
+    for i in range(max(1, scenario.get("repeat", 1))):
+        random.seed(BENCH_SEED)
+        transport.reset_counters()
+        timer.reset()
+
+        t0 = time.perf_counter()
+        # fetch_leads mutates filters (neighborhood/address redirects) - pass a copy
+        leads = await service.fetch_leads(json.loads(json.dumps(scenario["filters"])))
+        wall = time.perf_counter() - t0
+
+        runs.append({
+            "run": i + 1,
+            "wall_s": round(wall, 4),
+            "leads": len(leads or []),
+            **transport.snapshot(),
+            "stages": timer.report(),
+        })
+
+    final = runs[-1]
+    return {
+        "scenario": scenario["name"],
+        "description": scenario.get("description", ""),
+        "wall_s": final["wall_s"],
+        "cold_wall_s": runs[0]["wall_s"],
+        "leads": final["leads"],
+        "upstream_calls": final["upstream_calls"],
+        "upstream_calls_by_host": final["upstream_calls_by_host"],
+        "fixture_misses": sum(r["fixture_misses"] for r in runs),
+        "peak_rss_mb": _peak_rss_mb(),
+        "stages": final["stages"],
+        "runs": runs,
+    }
+
+
+def run_worker(name: str, mode: str, strict: bool, verbose: bool):
+    scenario = get_scenario(name)
+    transport = FixtureTransport(mode=mode, strict=strict)
+
+    # ScoutService is very chatty - silence it unless asked
+    real_stdout = sys.stdout
+    devnull = None
+    if not verbose:
+        devnull = open(os.devnull, "w")
+        sys.stdout = devnull
+
+    try:
+        with transport:
+            result = asyncio.run(_run_scenario(scenario, transport))
+    except Exception as e:
+        result = {"scenario": name, "error": f"{type(e).__name__}: {e}"}
+    finally:
+        sys.stdout = real_stdout
+        if devnull:
+            devnull.close()
+
+    print(RESULT_MARKER + json.dumps(result), flush=True)
+
+
+# ----------------------------------------------------------------------
+# Driver: one subprocess per scenario (clean caches + honest peak RSS)
+# ----------------------------------------------------------------------
+def _spawn(name: str, args) -> Dict:
+    cmd = [sys.executable, "-m", "benchmarks.bench_scout", "--worker", name]
+    if args.record:
+        cmd.append("--record")
+    if args.strict:
+        cmd.append("--strict")
+    if args.verbose:
+        cmd.append("--verbose")
+
+    env = {**os.environ, "PYTHONHASHSEED": "0"}  # stable set() ordering -> stable fixture keys
+    proc = subprocess.run(cmd, cwd=str(BACKEND_DIR), env=env, capture_output=True, text=True)
+
+    if args.verbose and proc.stdout:
+        print(proc.stdout)
+    for line in proc.stdout.splitlines():
+        if line.startswith(RESULT_MARKER):
+            return json.loads(line[len(RESULT_MARKER):])
+    return {"scenario": name, "error": (proc.stderr or "no result").strip()[-500:]}
+
+
+def _load_baseline() -> Dict:
+    if not BASELINE_FILE.exists():
+        return {}
+    try:
+        with open(BASELINE_FILE, "r") as f:
+            return json.load(f).get("scenarios", {})
+    except Exception as e:
+        print(f"[Bench] Could not read baseline: {e}")
+        return {}
+
+
+def _save_baseline(results: List[Dict]):
+    data = {
+        "_updated": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "scenarios": {
+            r["scenario"]: {k: r.get(k) for k in ("wall_s", "cold_wall_s", "upstream_calls", "peak_rss_mb", "leads", "stages")}
+            for r in results if "error" not in r
+        },
+    }
+    with open(BASELINE_FILE, "w") as f:
+        json.dump(data, f, indent=2)
+    print(f"[Bench] Baseline saved to {BASELINE_FILE}")
+
+
+def _delta(current, base) -> str:
+    if current is None or not base:
+        return "   n/a"
+    pct = (current - base) / base * 100
+    return f"{pct:+6.1f}%"
+
+
+def _print_report(results: List[Dict], baseline: Dict, tolerance: float) -> bool:
+    """Print the comparison table. Returns True if any scenario regressed."""
+    regressed = False
+    print()
+    print("=" * 100)
+    print(f"{'scenario':<24}{'wall_s':>10}{'vs base':>10}{'calls':>8}{'vs base':>10}{'rss_mb':>9}{'vs base':>10}{'leads':>7}  status")
+    print("-" * 100)
+
+    for r in results:
+        name = r["scenario"]
+        if "error" in r:
+            print(f"{name:<24}  ERROR: {r['error']}")
+            regressed = True
+            continue
+
+        base = baseline.get(name, {})
+        status = "ok"
+        if base:
+            if base.get("wall_s") and r["wall_s"] > base["wall_s"] * (1 + tolerance):
+                status = "SLOWER"
+            if base.get("upstream_calls") is not None and r["upstream_calls"] > base["upstream_calls"]:
+                status = "MORE CALLS" if status == "ok" else status + "+CALLS"
+            if status != "ok":
+                regressed = True
+        else:
+            status = "no baseline"
+        if r.get("fixture_misses"):
+            status += f" ({r['fixture_misses']} fixture misses)"
+
+        rss = r.get("peak_rss_mb")
+        print(
+            f"{name:<24}{r['wall_s']:>10.3f}{_delta(r['wall_s'], base.get('wall_s')):>10}"
+            f"{r['upstream_calls']:>8}{_delta(r['upstream_calls'], base.get('upstream_calls')):>10}"
+            f"{(rss if rss is not None else 0):>9.1f}{_delta(rss, base.get('peak_rss_mb')):>10}"
+            f"{r['leads']:>7}  {status}"
+        )
+
+    print("=" * 100)
+    for r in results:
+        if "error" in r or not r.get("stages"):
+            continue
+        print(f"\n[{r['scenario']}] stage timings (inclusive)")
+        base_stages = baseline.get(r["scenario"], {}).get("stages") or {}
+        for stage, t in sorted(r["stages"].items(), key=lambda kv: -kv[1]["seconds"]):
+            base_s = (base_stages.get(stage) or {}).get("seconds")
+            print(f"    {stage:<40}{t['seconds']:>9.3f}s  x{t['calls']:<4}{_delta(t['seconds'], base_s)}")
+    print()
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline benchmark suite for ScoutService.fetch_leads")
+    parser.add_argument("--scenario", action="append", help="Scenario name (repeatable). Default: all")
+    parser.add_argument("--list", action="store_true", help="List scenarios and exit")
+    parser.add_argument("--record", action="store_true", help="Hit live services and (re)record fixtures")
+    parser.add_argument("--strict", action="store_true", help="Fail on any request without a fixture")
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.20, help="Allowed wall time regression (default 0.20 = 20%%)")
+    parser.add_argument("--json", dest="json_out", help="Write full results to this JSON file")
+    parser.add_argument("--verbose", action="store_true", help="Show ScoutService logs")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.worker, "record" if args.record else "replay", args.strict, args.verbose)
+        return
+
+    if args.list:
+        for s in SCENARIOS:
+            print(f"  {s['name']:<26} {s.get('description', '')}")
+        return
+
+    names = args.scenario or [s["name"] for s in SCENARIOS]
+    mode = "RECORD (live)" if args.record else "REPLAY (offline)"
+    print(f"[Bench] {len(names)} scenario(s), mode={mode}, fixtures={FIXTURES_DIR}")
+
+    results = []
+    for name in names:
+        print(f"[Bench] Running {name}...", flush=True)
+        results.append(_spawn(name, args))
+
+    baseline = _load_baseline()
+    regressed = _print_report(results, baseline, args.tolerance)
+
+    if args.json_out:
+        with open(args.json_out, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"[Bench] Full results written to {args.json_out}")
+
+    if args.save_baseline:
+        _save_baseline(results)
+    elif regressed and baseline:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
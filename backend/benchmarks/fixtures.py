@@ -0,0 +1,338 @@
+"""
+Fixture Transport for Offline Benchmarks
+Patches the upstream transports used by ScoutService so that every
+ArcGIS / Assessor / HomeHarvest call is either recorded to disk or
+replayed from disk.
+
+Patched call sites:
+  - requests.get / requests.post          (Pima + Tucson GIS, run_in_executor calls)
+  - aiohttp.ClientSession                 (parallel violation / parcel / assessor batches)
+  - homeharvest.scrape_property           (sold / listing data)
+
+Fixtures are stored one file per request under benchmarks/fixtures/,
+named by a hash of (method, url, params) so that recordings are stable
+across runs as long as the benchmark seeds `random` and PYTHONHASHSEED.
+"""
+import json
+import time
+import hashlib
+import threading
+from pathlib import Path
+from urllib.parse import urlparse
+from typing import Dict, Optional, Any
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+# Params that change every call but do not affect the response
+VOLATILE_PARAMS = {"timeout", "headers", "_", "token"}
+
+EMPTY_ARCGIS_RESPONSE = {"features": []}
+
+
+def _canonical(value: Any) -> Any:
+    """Convert params/data into a JSON-stable structure for hashing."""
+    if value is None:
+        return None
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in sorted(value.items(), key=lambda kv: str(kv[0])) if k not in VOLATILE_PARAMS}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, bytes):
+        return value.decode("utf-8", errors="replace")
+    if isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def fixture_key(method: str, url: str, params: Any = None) -> str:
+    """Stable hash for a single upstream request."""
+    payload = json.dumps([method.upper(), url, _canonical(params)], sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+class _FakeRequestsResponse:
+    """Minimal stand-in for requests.Response (only what scout.py reads)."""
+
+    def __init__(self, status_code: int, body: Any):
+        self.status_code = status_code
+        self._body = body
+        self.ok = 200 <= status_code < 400
+        self.text = body if isinstance(body, str) else json.dumps(body)
+
+    def json(self):
+        if isinstance(self._body, str):
+            return json.loads(self._body)
+        return self._body
+
+    def raise_for_status(self):
+        if not self.ok:
+            import requests
+            raise requests.HTTPError(f"{self.status_code} (fixture)")
+
+
+class _FakeAiohttpResponse:
+    """Minimal stand-in for aiohttp.ClientResponse (status/json/text)."""
+
+    def __init__(self, status: int, body: Any):
+        self.status = status
+        self._body = body
+
+    async def json(self, content_type=None, **kwargs):
+        if isinstance(self._body, str):
+            return json.loads(self._body)
+        return self._body
+
+    async def text(self, **kwargs):
+        return self._body if isinstance(self._body, str) else json.dumps(self._body)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FixtureTransport:
+    """
+    Record or replay upstream HTTP traffic for ScoutService.
+
+    mode="replay": serve responses from FIXTURES_DIR. Missing fixtures return an
+                   empty ArcGIS response and are counted as misses (or raise when strict).
+    mode="record": perform the live call and save the response to FIXTURES_DIR.
+    """
+
+    def __init__(self, mode: str = "replay", fixtures_dir: Optional[Path] = None, strict: bool = False):
+        if mode not in ("replay", "record"):
+            raise ValueError(f"Unknown fixture mode: {mode}")
+        self.mode = mode
+        self.strict = strict
+        self.fixtures_dir = Path(fixtures_dir) if fixtures_dir else FIXTURES_DIR
+        self.fixtures_dir.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._originals: Dict[str, Any] = {}
+        self.reset_counters()
+
+    # ------------------------------------------------------------------
+    # Counters
+    # ------------------------------------------------------------------
+    def reset_counters(self):
+        with self._lock:
+            self.calls_by_host: Dict[str, int] = {}
+            self.total_calls = 0
+            self.misses = 0
+
+    def _count(self, url: str, hit: bool):
+        host = urlparse(url).netloc or url
+        with self._lock:
+            self.calls_by_host[host] = self.calls_by_host.get(host, 0) + 1
+            self.total_calls += 1
+            if not hit:
+                self.misses += 1
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {
+                "upstream_calls": self.total_calls,
+                "upstream_calls_by_host": dict(sorted(self.calls_by_host.items())),
+                "fixture_misses": self.misses,
+            }
+
+    # ------------------------------------------------------------------
+    # Fixture storage
+    # ------------------------------------------------------------------
+    def _path(self, key: str) -> Path:
+        return self.fixtures_dir / f"{key}.json"
+
+    def _load(self, key: str) -> Optional[Dict]:
+        path = self._path(key)
+        if not path.exists():
+            return None
+        try:
+            with open(path, "r") as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"[Bench] Corrupt fixture {path.name}: {e}")
+            return None
+
+    def _save(self, key: str, method: str, url: str, params: Any, status: int, body: Any):
+        record = {
+            "request": {"method": method, "url": url, "params": _canonical(params)},
+            "response": {"status": status, "body": body},
+            "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        try:
+            with open(self._path(key), "w") as f:
+                json.dump(record, f)
+        except Exception as e:
+            print(f"[Bench] Failed to save fixture {key}: {e}")
+
+    def _replay(self, method: str, url: str, params: Any) -> tuple:
+        key = fixture_key(method, url, params)
+        record = self._load(key)
+        self._count(url, hit=record is not None)
+        if record is None:
+            if self.strict:
+                raise RuntimeError(f"No fixture for {method} {url} (key {key})")
+            return 200, EMPTY_ARCGIS_RESPONSE
+        resp = record.get("response", {})
+        return resp.get("status", 200), resp.get("body")
+
+    # ------------------------------------------------------------------
+    # requests
+    # ------------------------------------------------------------------
+    def _requests_call(self, method: str, url: str, params: Any, **kwargs):
+        if self.mode == "replay":
+            status, body = self._replay(method, url, params)
+            return _FakeRequestsResponse(status, body)
+
+        original = self._originals[f"requests.{method.lower()}"]
+        resp = original(url, **({"params": params} if method == "GET" else {"data": params}), **kwargs)
+        try:
+            body = resp.json()
+        except ValueError:
+            body = resp.text
+        self._count(url, hit=True)
+        self._save(fixture_key(method, url, params), method, url, params, resp.status_code, body)
+        return resp
+
+    def _patched_get(self, url, params=None, **kwargs):
+        return self._requests_call("GET", url, params, **kwargs)
+
+    def _patched_post(self, url, data=None, **kwargs):
+        return self._requests_call("POST", url, data, **kwargs)
+
+    # ------------------------------------------------------------------
+    # aiohttp
+    # ------------------------------------------------------------------
+    def _make_client_session(self):
+        transport = self
+        original_cls = self._originals["aiohttp.ClientSession"]
+
+        class _RecordingResponse:
+            """Wraps a live aiohttp response so the body can be saved on read."""
+
+            def __init__(self, ctx, method, url, params):
+                self._ctx = ctx
+                self._method = method
+                self._url = url
+                self._params = params
+                self._resp = None
+
+            async def __aenter__(self):
+                self._resp = await self._ctx.__aenter__()
+                self.status = self._resp.status
+                return self
+
+            async def __aexit__(self, *exc):
+                return await self._ctx.__aexit__(*exc)
+
+            async def json(self, content_type=None, **kwargs):
+                body = await self._resp.json(content_type=None)
+                transport._save(fixture_key(self._method, self._url, self._params), self._method, self._url, self._params, self.status, body)
+                return body
+
+            async def text(self, **kwargs):
+                body = await self._resp.text()
+                transport._save(fixture_key(self._method, self._url, self._params), self._method, self._url, self._params, self.status, body)
+                return body
+
+        class FixtureClientSession:
+            def __init__(self, *args, **kwargs):
+                self._live = original_cls(*args, **kwargs) if transport.mode == "record" else None
+
+            async def __aenter__(self):
+                if self._live is not None:
+                    await self._live.__aenter__()
+                return self
+
+            async def __aexit__(self, *exc):
+                if self._live is not None:
+                    return await self._live.__aexit__(*exc)
+                return False
+
+            async def close(self):
+                if self._live is not None:
+                    await self._live.close()
+
+            def _request(self, method, url, params, **kwargs):
+                if transport.mode == "replay":
+                    status, body = transport._replay(method, url, params)
+                    return _FakeAiohttpResponse(status, body)
+                transport._count(url, hit=True)
+                live_kwargs = {"params": params} if method == "GET" else {"data": params}
+                ctx = getattr(self._live, method.lower())(url, **live_kwargs, **kwargs)
+                return _RecordingResponse(ctx, method, url, params)
+
+            def get(self, url, params=None, **kwargs):
+                return self._request("GET", url, params, **kwargs)
+
+            def post(self, url, data=None, **kwargs):
+                return self._request("POST", url, data, **kwargs)
+
+        return FixtureClientSession
+
+    # ------------------------------------------------------------------
+    # HomeHarvest
+    # ------------------------------------------------------------------
+    def _patched_scrape_property(self, **kwargs):
+        import pandas as pd
+
+        url = "homeharvest://scrape_property"
+        if self.mode == "replay":
+            status, body = self._replay("CALL", url, kwargs)
+            if not isinstance(body, dict) or "columns" not in body:
+                return pd.DataFrame()
+            return pd.DataFrame(data=body.get("data", []), columns=body.get("columns", []))
+
+        df = self._originals["homeharvest.scrape_property"](**kwargs)
+        self._count(url, hit=True)
+        body = json.loads(df.to_json(orient="split", date_format="iso", index=False)) if df is not None else {}
+        self._save(fixture_key("CALL", url, kwargs), "CALL", url, kwargs, 200, body)
+        return df
+
+    # ------------------------------------------------------------------
+    # Install / uninstall
+    # ------------------------------------------------------------------
+    def install(self):
+        """Patch requests, aiohttp and homeharvest module attributes."""
+        import requests
+        import aiohttp
+
+        self._originals["requests.get"] = requests.get
+        self._originals["requests.post"] = requests.post
+        self._originals["aiohttp.ClientSession"] = aiohttp.ClientSession
+        requests.get = self._patched_get
+        requests.post = self._patched_post
+        aiohttp.ClientSession = self._make_client_session()
+
+        try:
+            import homeharvest
+            self._originals["homeharvest.scrape_property"] = homeharvest.scrape_property
+            homeharvest.scrape_property = self._patched_scrape_property
+        except ImportError:
+            print("[Bench] homeharvest not installed - HomeHarvest stages will be skipped by ScoutService")
+
+        print(f"[Bench] Fixture transport installed (mode={self.mode}, dir={self.fixtures_dir})")
+        return self
+
+    def uninstall(self):
+        import requests
+        import aiohttp
+
+        if "requests.get" in self._originals:
+            requests.get = self._originals["requests.get"]
+            requests.post = self._originals["requests.post"]
+        if "aiohttp.ClientSession" in self._originals:
+            aiohttp.ClientSession = self._originals["aiohttp.ClientSession"]
+        if "homeharvest.scrape_property" in self._originals:
+            import homeharvest
+            homeharvest.scrape_property = self._originals["homeharvest.scrape_property"]
+        self._originals.clear()
+
+    def __enter__(self):
+        return self.install()
+
+    def __exit__(self, *exc):
+        self.uninstall()
+        return False
@@ -0,0 +1,877 @@
+"""
+Local ArcGIS REST Stand-in
+Implements the subset of the ArcGIS MapServer `query` endpoint that
+ScoutService actually uses, so /scout/search can be load- and chaos-tested
+without hitting gisdata.pima.gov / gis.tucsonaz.gov.
+
+Supported query parameters:
+    where               = <>, <, <=, >, >=, LIKE, NOT LIKE, IN, NOT IN, IS [NOT] NULL,
+                          AND / OR / NOT, parentheses, UPPER()/LOWER(), 1=1
+    geometry            envelope (JSON or "xmin,ymin,xmax,ymax"), point, multipoint, polygon
+    inSR / outSR        4326, 2868 (AZ Central ft, the layers' native SR), 3857/102100
+    returnCountOnly     {"count": n}
+    returnIdsOnly       {"objectIdFieldName": "OBJECTID", "objectIds": [...]}
+    returnDistinctValues, outFields, returnGeometry, orderByFields,
+    resultRecordCount / resultOffset (capped at the layer maxRecordCount)
+
+Layers served (synthetic by default, or from --fixtures):
+    pima   GISOpenData/LandRecords/12    parcels
+    pima   GISOpenData/Addresses/6       zip code polygons
+    pima   GISOpenData/Addresses/3       address points (ZIPCITY/ZIPCODE)
+    tucson PDSD/pdsdMain_General5/94     code violations
+    Any other layer answers with an empty feature set.
+    POST /assessor/parceldetails/ mimics the Pima Assessor sales API.
+
+Usage (from backend/):
+    python -m benchmarks.gis_standin --port 8090 --latency-ms 80 --jitter-ms 40 --error-rate 0.02
+
+    # Point ScoutService at it
+    PIMA_GIS_BASE_URL=http://127.0.0.1:8090/pima/rest/services \\
+    TUCSON_GIS_BASE_URL=http://127.0.0.1:8090/tucson/rest/services \\
+    PIMA_ASSESSOR_API_URL=http://127.0.0.1:8090/assessor/parceldetails/ \\
+    python run.py
+
+Runtime knobs can be changed without a restart:
+    GET  /_standin/stats
+    POST /_standin/config   {"latency_ms": 200, "error_rate": 0.1, "error_mode": "arcgis"}
+"""
+import re
+import json
+import math
+import time
+import random
+import asyncio
+import argparse
+from pathlib import Path
+from functools import lru_cache
+from urllib.parse import parse_qs
+from typing import Dict, List, Optional, Any, Callable, Tuple
+
+import numpy as np
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+try:
+    from shapely.geometry import Polygon, Point
+    from shapely.prepared import prep
+    SHAPELY_AVAILABLE = True
+except ImportError:
+    SHAPELY_AVAILABLE = False
+
+
+# ======================================================================
+# Projection helpers: EPSG:2868 (NAD83 / Arizona Central, intl ft) <-> 4326
+# Transverse Mercator on GRS80 (Snyder, USGS PP 1395). Accurate to well
+# under a foot across Pima County, which is plenty for a stand-in.
+# ======================================================================
+_A = 6378137.0
+_F = 1 / 298.257222101
+_E2 = _F * (2 - _F)
+_EP2 = _E2 / (1 - _E2)
+_K0 = 0.9999
+_LAT0 = math.radians(31.0)
+_LON0 = math.radians(-111.0 - 55.0 / 60.0)
+_X0_M = 213360.0
+_FT = 0.3048
+
+
+def _meridian_arc(phi: float) -> float:
+    e2, e4, e6 = _E2, _E2 ** 2, _E2 ** 3
+    return _A * (
+        (1 - e2 / 4 - 3 * e4 / 64 - 5 * e6 / 256) * phi
+        - (3 * e2 / 8 + 3 * e4 / 32 + 45 * e6 / 1024) * math.sin(2 * phi)
+        + (15 * e4 / 256 + 45 * e6 / 1024) * math.sin(4 * phi)
+        - (35 * e6 / 3072) * math.sin(6 * phi)
+    )
+
+
+_M0 = _meridian_arc(_LAT0)
+
+
+def wgs84_to_2868(lon: float, lat: float) -> Tuple[float, float]:
+    phi, lam = math.radians(lat), math.radians(lon)
+    n = _A / math.sqrt(1 - _E2 * math.sin(phi) ** 2)
+    t = math.tan(phi) ** 2
+    c = _EP2 * math.cos(phi) ** 2
+    a = (lam - _LON0) * math.cos(phi)
+    m = _meridian_arc(phi)
+    x = _K0 * n * (a + (1 - t + c) * a ** 3 / 6 + (5 - 18 * t + t ** 2 + 72 * c - 58 * _EP2) * a ** 5 / 120)
+    y = _K0 * (m - _M0 + n * math.tan(phi) * (
+        a ** 2 / 2 + (5 - t + 9 * c + 4 * c ** 2) * a ** 4 / 24
+        + (61 - 58 * t + t ** 2 + 600 * c - 330 * _EP2) * a ** 6 / 720))
+    return (x + _X0_M) / _FT, y / _FT
+
+
+def sr2868_to_wgs84(x_ft: float, y_ft: float) -> Tuple[float, float]:
+    x = x_ft * _FT - _X0_M
+    y = y_ft * _FT
+    m = _M0 + y / _K0
+    mu = m / (_A * (1 - _E2 / 4 - 3 * _E2 ** 2 / 64 - 5 * _E2 ** 3 / 256))
+    e1 = (1 - math.sqrt(1 - _E2)) / (1 + math.sqrt(1 - _E2))
+    phi1 = (mu + (3 * e1 / 2 - 27 * e1 ** 3 / 32) * math.sin(2 * mu)
+            + (21 * e1 ** 2 / 16 - 55 * e1 ** 4 / 32) * math.sin(4 * mu)
+            + (151 * e1 ** 3 / 96) * math.sin(6 * mu)
+            + (1097 * e1 ** 4 / 512) * math.sin(8 * mu))
+    n1 = _A / math.sqrt(1 - _E2 * math.sin(phi1) ** 2)
+    t1 = math.tan(phi1) ** 2
+    c1 = _EP2 * math.cos(phi1) ** 2
+    r1 = _A * (1 - _E2) / (1 - _E2 * math.sin(phi1) ** 2) ** 1.5
+    d = x / (n1 * _K0)
+    lat = phi1 - (n1 * math.tan(phi1) / r1) * (
+        d ** 2 / 2 - (5 + 3 * t1 + 10 * c1 - 4 * c1 ** 2 - 9 * _EP2) * d ** 4 / 24
+        + (61 + 90 * t1 + 298 * c1 + 45 * t1 ** 2 - 252 * _EP2 - 3 * c1 ** 2) * d ** 6 / 720)
+    lon = _LON0 + (d - (1 + 2 * t1 + c1) * d ** 3 / 6
+                   + (5 - 2 * c1 + 28 * t1 - 3 * c1 ** 2 + 8 * _EP2 + 24 * t1 ** 2) * d ** 5 / 120) / math.cos(phi1)
+    return math.degrees(lon), math.degrees(lat)
+
+
+def _webmerc_to_wgs84(x: float, y: float) -> Tuple[float, float]:
+    lon = math.degrees(x / 6378137.0)
+    lat = math.degrees(2 * math.atan(math.exp(y / 6378137.0)) - math.pi / 2)
+    return lon, lat
+
+
+def _wgs84_to_webmerc(lon: float, lat: float) -> Tuple[float, float]:
+    x = math.radians(lon) * 6378137.0
+    y = math.log(math.tan(math.pi / 4 + math.radians(lat) / 2)) * 6378137.0
+    return x, y
+
+
+def _to_wgs84(sr: Optional[int]) -> Callable[[float, float], Tuple[float, float]]:
+    if sr in (2868, 2223):
+        return sr2868_to_wgs84
+    if sr in (3857, 102100, 102113):
+        return _webmerc_to_wgs84
+    return lambda x, y: (x, y)
+
+
+def _from_wgs84(sr: Optional[int]) -> Callable[[float, float], Tuple[float, float]]:
+    if sr in (2868, 2223):
+        return wgs84_to_2868
+    if sr in (3857, 102100, 102113):
+        return _wgs84_to_webmerc
+    return lambda x, y: (x, y)
+
+
+# ======================================================================
+# WHERE clause compiler
+# ======================================================================
+_TOKEN_RE = re.compile(r"""
+    \s*(?:
+        (?P<str>'(?:[^']|'')*')
+      | (?P<num>-?\d+(?:\.\d+)?)
+      | (?P<op><>|!=|<=|>=|=|<|>)
+      | (?P<lp>\()
+      | (?P<rp>\))
+      | (?P<comma>,)
+      | (?P<word>[A-Za-z_][A-Za-z0-9_\.]*)
+    )""", re.VERBOSE)
+
+_KEYWORDS = {"AND", "OR", "NOT", "LIKE", "IN", "IS", "NULL"}
+
+
+class WhereSyntaxError(ValueError):
+    pass
+
+
+def _tokenize(where: str) -> List[Tuple[str, Any]]:
+    tokens, pos = [], 0
+    where = where.strip()
+    while pos < len(where):
+        m = _TOKEN_RE.match(where, pos)
+        if not m or m.end() == pos:
+            raise WhereSyntaxError(f"Unexpected input at {pos}: {where[pos:pos + 20]!r}")
+        pos = m.end()
+        kind = m.lastgroup
+        text = m.group(kind)
+        if kind == "str":
+            tokens.append(("str", text[1:-1].replace("''", "'")))
+        elif kind == "num":
+            tokens.append(("num", float(text) if "." in text else int(text)))
+        elif kind == "word" and text.upper() in _KEYWORDS:
+            tokens.append(("kw", text.upper()))
+        else:
+            tokens.append((kind, text))
+    return tokens
+
+
+def _like_regex(pattern: str) -> re.Pattern:
+    out = []
+    for ch in pattern:
+        if ch == "%":
+            out.append(".*")
+        elif ch == "_":
+            out.append(".")
+        else:
+            out.append(re.escape(ch))
+    return re.compile("^" + "".join(out) + "$", re.DOTALL)
+
+
+def _coerce_pair(a, b):
+    """ArcGIS is lenient: compare numerically when both sides look numeric."""
+    if isinstance(a, (int, float)) and isinstance(b, str):
+        try:
+            return a, float(b)
+        except ValueError:
+            return str(a), b
+    if isinstance(a, str) and isinstance(b, (int, float)):
+        try:
+            return float(a), b
+        except ValueError:
+            return a, str(b)
+    return a, b
+
+
+class _WhereParser:
+    """Recursive-descent parser producing a predicate over an attributes dict."""
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.i = 0
+
+    def peek(self, offset=0):
+        j = self.i + offset
+        return self.tokens[j] if j < len(self.tokens) else (None, None)
+
+    def take(self, kind=None, value=None):
+        tok = self.peek()
+        if kind and tok[0] != kind:
+            raise WhereSyntaxError(f"Expected {kind}, got {tok}")
+        if value and tok[1] != value:
+            raise WhereSyntaxError(f"Expected {value}, got {tok}")
+        self.i += 1
+        return tok
+
+    def parse(self):
+        pred = self.or_expr()
+        if self.i != len(self.tokens):
+            raise WhereSyntaxError(f"Trailing tokens: {self.tokens[self.i:]}")
+        return pred
+
+    def or_expr(self):
+        parts = [self.and_expr()]
+        while self.peek() == ("kw", "OR"):
+            self.take()
+            parts.append(self.and_expr())
+        return parts[0] if len(parts) == 1 else (lambda r: any(p(r) for p in parts))
+
+    def and_expr(self):
+        parts = [self.not_expr()]
+        while self.peek() == ("kw", "AND"):
+            self.take()
+            parts.append(self.not_expr())
+        return parts[0] if len(parts) == 1 else (lambda r: all(p(r) for p in parts))
+
+    def not_expr(self):
+        if self.peek() == ("kw", "NOT"):
+            self.take()
+            inner = self.not_expr()
+            return lambda r: not inner(r)
+        return self.primary()
+
+    def primary(self):
+        if self.peek()[0] == "lp":
+            # Either a grouped boolean expression or a parenthesised value
+            self.take("lp")
+            inner = self.or_expr()
+            self.take("rp")
+            return inner
+        return self.comparison()
+
+    def value(self) -> Callable[[Dict], Any]:
+        kind, val = self.peek()
+        if kind in ("str", "num"):
+            self.take()
+            return lambda r, v=val: v
+        if kind == "word":
+            self.take()
+            fn = val.upper()
+            if fn in ("UPPER", "LOWER") and self.peek()[0] == "lp":
+                self.take("lp")
+                inner = self.value()
+                self.take("rp")
+                if fn == "UPPER":
+                    return lambda r: (inner(r) or "").upper() if isinstance(inner(r), str) else inner(r)
+                return lambda r: (inner(r) or "").lower() if isinstance(inner(r), str) else inner(r)
+            return lambda r, f=val: r.get(f)
+        raise WhereSyntaxError(f"Unexpected token {self.peek()}")
+
+    def comparison(self):
+        left = self.value()
+        kind, val = self.peek()
+
+        # 1=1 / field = value / field <> value ...
+        if kind == "op":
+            self.take()
+            right = self.value()
+            op = "<>" if val == "!=" else val
+
+            def cmp(r, op=op):
+                a, b = _coerce_pair(left(r), right(r))
+                if a is None or b is None:
+                    return False
+                try:
+                    return {
+                        "=": a == b, "<>": a != b, "<": a < b,
+                        "<=": a <= b, ">": a > b, ">=": a >= b,
+                    }[op]
+                except TypeError:
+                    return False
+            return cmp
+
+        negate = False
+        if (kind, val) == ("kw", "NOT"):
+            self.take()
+            negate = True
+            kind, val = self.peek()
+
+        if (kind, val) == ("kw", "LIKE"):
+            self.take()
+            pattern = _like_regex(str(self.take("str")[1]))
+
+            def like(r):
+                v = left(r)
+                hit = v is not None and bool(pattern.match(str(v)))
+                return hit != negate
+            return like
+
+        if (kind, val) == ("kw", "IN"):
+            self.take()
+            self.take("lp")
+            values = []
+            while True:
+                tk, tv = self.take()
+                if tk not in ("str", "num"):
+                    raise WhereSyntaxError(f"IN list expects literals, got {tk}")
+                values.append(tv)
+                if self.peek()[0] == "comma":
+                    self.take()
+                    continue
+                self.take("rp")
+                break
+            str_set = {str(v) for v in values}
+
+            def in_list(r):
+                v = left(r)
+                hit = v is not None and (v in values or str(v) in str_set)
+                return hit != negate
+            return in_list
+
+        if (kind, val) == ("kw", "IS"):
+            self.take()
+            is_not = False
+            if self.peek() == ("kw", "NOT"):
+                self.take()
+                is_not = True
+            self.take("kw", "NULL")
+            return lambda r: (left(r) is None) != is_not
+
+        raise WhereSyntaxError(f"Unsupported predicate near {self.peek()}")
+
+
+@lru_cache(maxsize=4096)
+def compile_where(where: str) -> Callable[[Dict], bool]:
+    """Compile an ArcGIS where clause into a predicate (memoized)."""
+    if not where or where.strip() in ("1=1", "1 = 1"):
+        return lambda r: True
+    return _WhereParser(_tokenize(where)).parse()
+
+
+# ======================================================================
+# Layers
+# ======================================================================
+class Layer:
+    """In-memory feature layer with a vectorized bounding-box index (WGS84)."""
+
+    def __init__(self, name: str, features: List[Dict], geometry_type: str, max_record_count: int = 2000):
+        self.name = name
+        self.geometry_type = geometry_type
+        self.max_record_count = max_record_count
+        self.features = features
+        self._shapes: Dict[int, Any] = {}
+
+        for i, f in enumerate(self.features):
+            f.setdefault("attributes", {}).setdefault("OBJECTID", i + 1)
+
+        bboxes = [self._bbox(f.get("geometry") or {}) for f in self.features]
+        arr = np.array(bboxes, dtype=float) if bboxes else np.zeros((0, 4))
+        self.xmin, self.ymin, self.xmax, self.ymax = (arr[:, k] for k in range(4)) if len(arr) else (np.zeros(0),) * 4
+
+    @staticmethod
+    def _bbox(geom: Dict) -> Tuple[float, float, float, float]:
+        if "x" in geom and "y" in geom:
+            return geom["x"], geom["y"], geom["x"], geom["y"]
+        pts = [p for ring in geom.get("rings", []) for p in ring] or geom.get("points", [])
+        if not pts:
+            return (math.nan,) * 4
+        xs = [p[0] for p in pts]
+        ys = [p[1] for p in pts]
+        return min(xs), min(ys), max(xs), max(ys)
+
+    def shape(self, idx: int):
+        if not SHAPELY_AVAILABLE:
+            return None
+        if idx not in self._shapes:
+            geom = self.features[idx].get("geometry") or {}
+            if "rings" in geom:
+                self._shapes[idx] = Polygon(geom["rings"][0])
+            elif "x" in geom:
+                self._shapes[idx] = Point(geom["x"], geom["y"])
+            else:
+                self._shapes[idx] = None
+        return self._shapes[idx]
+
+    def envelope_hits(self, xmin, ymin, xmax, ymax) -> np.ndarray:
+        mask = (self.xmax >= xmin) & (self.xmin <= xmax) & (self.ymax >= ymin) & (self.ymin <= ymax)
+        return np.nonzero(mask)[0]
+
+    def point_hits(self, points: List[Tuple[float, float]]) -> np.ndarray:
+        hits = set()
+        for x, y in points:
+            candidates = np.nonzero((self.xmin <= x) & (self.xmax >= x) & (self.ymin <= y) & (self.ymax >= y))[0]
+            for idx in candidates:
+                shp = self.shape(int(idx))
+                if shp is None or shp.geom_type == "Point" or shp.contains(Point(x, y)):
+                    hits.add(int(idx))
+        return np.array(sorted(hits), dtype=int)
+
+    def polygon_hits(self, ring: List[List[float]]) -> np.ndarray:
+        xs = [p[0] for p in ring]
+        ys = [p[1] for p in ring]
+        candidates = self.envelope_hits(min(xs), min(ys), max(xs), max(ys))
+        if not SHAPELY_AVAILABLE:
+            return candidates
+        area = prep(Polygon(ring))
+        return np.array([i for i in candidates if self.shape(int(i)) is None or area.intersects(self.shape(int(i)))], dtype=int)
+
+
+# Tucson zips laid out on a synthetic grid around downtown (WGS84)
+SYNTH_ORIGIN = (-111.10, 32.10)
+SYNTH_CELL = 0.05
+STREETS = ["SPEEDWAY", "GRANT", "BROADWAY", "22ND", "ORACLE", "STONE", "CAMPBELL", "SWAN",
+           "CRAYCROFT", "WILMOT", "KOLB", "PIMA", "FT LOWELL", "RIVER", "VALENCIA", "IRVINGTON",
+           "AJO", "MISSION", "PRINCE", "ROGER", "INA", "OCOTILLO", "ELM", "LEE"]
+SUFFIXES = ["ST", "RD", "AV", "DR", "BL", "PL", "WY", "LN", "CT"]
+DIRS = ["N", "S", "E", "W"]
+OUT_OF_STATE = [("LOS ANGELES", "CA", "90012"), ("PHOENIX", "AZ", "85004"), ("SEATTLE", "WA", "98101"),
+                ("DENVER", "CO", "80202"), ("CHICAGO", "IL", "60601"), ("SCOTTSDALE", "AZ", "85251")]
+# Weighted PARCEL_USE mix roughly matching Pima County (heavy SFR)
+USE_CODES = [("0131", 40), ("0111", 10), ("0141", 6), ("0181", 4), ("0132", 4), ("8710", 3),
+             ("0310", 5), ("0330", 2), ("0350", 1), ("0710", 6), ("0810", 3), ("0840", 1),
+             ("0011", 5), ("1100", 2), ("1510", 2), ("3000", 1), ("4000", 2), ("9000", 1)]
+VIOLATION_TYPES = ["JUNK/TRASH/DEBRIS", "INOPERABLE VEHICLE", "OVERGROWN VEGETATION",
+                   "SUBSTANDARD STRUCTURE", "ILLEGAL OCCUPANCY", "NO PERMIT", "GRAFFITI"]
+VIOLATION_STATUSES = [("OPEN", 6), ("ACTIVE", 3), ("NOTICE", 2), ("COMPLIAN", 2), ("CLOSED", 3), ("VOID", 1)]
+
+
+def _weighted(rng: random.Random, items):
+    values, weights = zip(*items)
+    return rng.choices(values, weights=weights, k=1)[0]
+
+
+def _square(cx, cy, half):
+    return [[[cx - half, cy - half], [cx + half, cy - half], [cx + half, cy + half], [cx - half, cy + half], [cx - half, cy - half]]]
+
+
+def build_synthetic_layers(parcels_per_zip: int = 1500, violations_per_zip: int = 120, seed: int = 42) -> Dict[str, Layer]:
+    """Deterministic Pima-like parcel / zip / violation layers in WGS84."""
+    rng = random.Random(seed)
+    tucson_zips = sorted({
+        "85701", "85704", "85705", "85706", "85707", "85708", "85710", "85711",
+        "85712", "85713", "85714", "85715", "85716", "85718", "85719", "85724",
+        "85726", "85730", "85743", "85745", "85746", "85747", "85748", "85749",
+        "85750", "85756", "85741",
+    })
+    other_zips = {"85614": "GREEN VALLEY", "85629": "SAHUARITA", "85641": "VAIL", "85653": "MARANA",
+                  "85737": "ORO VALLEY", "85755": "ORO VALLEY", "85739": "CATALINA", "85622": "GREEN VALLEY"}
+    all_zips = [(z, "TUCSON") for z in tucson_zips] + sorted(other_zips.items())
+
+    cols = 6
+    zip_features, address_features, parcel_features, violation_features = [], [], [], []
+    parcel_seq = 100000000
+
+    for zi, (zip_code, city) in enumerate(all_zips):
+        x0 = SYNTH_ORIGIN[0] + (zi % cols) * SYNTH_CELL
+        y0 = SYNTH_ORIGIN[1] + (zi // cols) * SYNTH_CELL
+        ring = [[x0, y0], [x0 + SYNTH_CELL, y0], [x0 + SYNTH_CELL, y0 + SYNTH_CELL], [x0, y0 + SYNTH_CELL], [x0, y0]]
+        zip_features.append({"attributes": {"ZIPCODE": zip_code, "ZIPCITY": city}, "geometry": {"rings": [ring]}})
+
+        # Parcels on a jittered grid inside the zip cell
+        side = max(1, int(math.ceil(math.sqrt(parcels_per_zip))))
+        step = SYNTH_CELL / (side + 1)
+        zip_parcels = []
+        for pi in range(parcels_per_zip):
+            cx = x0 + step * (1 + pi % side)
+            cy = y0 + step * (1 + pi // side)
+            number = rng.randint(100, 9999)
+            street = f"{number} {rng.choice(DIRS)} {rng.choice(STREETS)} {rng.choice(SUFFIXES)}"
+            owner = f"{rng.choice(['SMITH', 'GARCIA', 'JOHNSON', 'LOPEZ', 'NGUYEN', 'BROWN', 'MARTINEZ'])} " \
+                    f"{rng.choice(['JOHN', 'MARIA', 'DAVID', 'LINDA', 'JOSE', 'SUSAN'])}"
+            if rng.random() < 0.08:
+                owner = f"{rng.choice(STREETS)} HOLDINGS LLC"
+            absentee = rng.random() < 0.3
+            if absentee:
+                m_city, m_state, m_zip = rng.choice(OUT_OF_STATE)
+                mail2 = f"{rng.randint(100, 9999)} {rng.choice(STREETS)} {rng.choice(SUFFIXES)}"
+                mail3 = f"{m_city} {m_state}"
+            else:
+                m_zip = zip_code
+                mail2 = street
+                mail3 = f"{city} AZ"
+            parcel_seq += rng.randint(1, 40)
+            use_code = _weighted(rng, USE_CODES)
+            record_year = rng.randint(1975, 2025)
+            attrs = {
+                "PARCEL": str(parcel_seq),
+                "ADDRESS_OL": street,
+                "JURIS_OL": city,
+                "ZIP": zip_code,
+                "ZIP9": f"{m_zip}0000",
+                "MAIL1": owner,
+                "MAIL2": mail2,
+                "MAIL3": mail3,
+                "MAIL4": "",
+                "MAIL5": "",
+                "PARCEL_USE": use_code,
+                "FCV": rng.randint(60, 900) * 1000,
+                "CURZONE_OL": rng.choice(["R-1", "R-2", "R-3", "C-1", "C-2", "SR", "CR-1"]),
+                "GISAREA": rng.randint(3000, 20000),
+                "RECORDDATE": int(f"{record_year}{rng.randint(1, 12):02d}{rng.randint(1, 28):02d}"),
+                "SEQ_NUM_D": str(rng.randint(10 ** 10, 10 ** 11)),
+                "SEQ_NUM_S": "",
+                "DOCKET": str(rng.randint(1000, 14000)),
+                "PAGE": str(rng.randint(1, 3000)),
+                "Sale_Price": rng.randint(80, 700) * 1000 if rng.random() < 0.5 else None,
+                "Sale_Date": f"{record_year}-{rng.randint(1, 12):02d}-01" if rng.random() < 0.5 else None,
+            }
+            feature = {"attributes": attrs, "geometry": {"rings": _square(cx, cy, step * 0.45)}}
+            parcel_features.append(feature)
+            zip_parcels.append((street, cx, cy))
+            if pi % 10 == 0:
+                address_features.append({
+                    "attributes": {"ADDRESS": street, "ZIPCODE": zip_code, "ZIPCITY": city},
+                    "geometry": {"x": cx, "y": cy},
+                })
+
+        # Violations only exist inside Tucson
+        if city == "TUCSON" and zip_parcels:
+            for vi in range(violations_per_zip):
+                street, cx, cy = rng.choice(zip_parcels)
+                violation_features.append({
+                    "attributes": {
+                        "ACT_NUM": f"T{zip_code}{vi:05d}",
+                        "ADDRESSFULL": f"{street}, TUCSON AZ {zip_code}",
+                        "DESCRIPTION": rng.choice(VIOLATION_TYPES),
+                        "STATUS_1": _weighted(rng, VIOLATION_STATUSES),
+                    },
+                    "geometry": {"x": cx, "y": cy},
+                })
+
+    return {
+        "pima/GISOpenData/LandRecords/12": Layer("parcels", parcel_features, "esriGeometryPolygon", 2000),
+        "pima/GISOpenData/Addresses/6": Layer("zipcodes", zip_features, "esriGeometryPolygon", 1000),
+        "pima/GISOpenData/Addresses/3": Layer("addresses", address_features, "esriGeometryPoint", 2000),
+        "tucson/PDSD/pdsdMain_General5/94": Layer("violations", violation_features, "esriGeometryPoint", 1000),
+    }
+
+
+def load_fixture_layers(fixtures_dir: Path) -> Dict[str, Layer]:
+    """
+    Load layers from ArcGIS JSON dumps (outSR=4326). File names map to layer keys:
+        parcels.json -> pima/GISOpenData/LandRecords/12
+        zipcodes.json -> pima/GISOpenData/Addresses/6
+        addresses.json -> pima/GISOpenData/Addresses/3
+        violations.json -> tucson/PDSD/pdsdMain_General5/94
+    """
+    mapping = {
+        "parcels.json": ("pima/GISOpenData/LandRecords/12", "esriGeometryPolygon", 2000),
+        "zipcodes.json": ("pima/GISOpenData/Addresses/6", "esriGeometryPolygon", 1000),
+        "addresses.json": ("pima/GISOpenData/Addresses/3", "esriGeometryPoint", 2000),
+        "violations.json": ("tucson/PDSD/pdsdMain_General5/94", "esriGeometryPoint", 1000),
+    }
+    layers = {}
+    for filename, (key, gtype, max_count) in mapping.items():
+        path = fixtures_dir / filename
+        if not path.exists():
+            continue
+        with open(path, "r") as f:
+            data = json.load(f)
+        layers[key] = Layer(filename.split(".")[0], data.get("features", []), gtype, max_count)
+        print(f"[StandIn] Loaded {len(layers[key].features)} features from {path}")
+    return layers
+
+
+# ======================================================================
+# Query execution
+# ======================================================================
+def _parse_geometry(raw: str, geometry_type: str, in_sr: Optional[int]) -> Tuple[str, Any]:
+    """Return ("envelope", (xmin,ymin,xmax,ymax)) / ("points", [...]) / ("polygon", ring) in WGS84."""
+    raw = (raw or "").strip()
+    if not raw:
+        return "none", None
+
+    try:
+        geom = json.loads(raw)
+    except ValueError:
+        nums = [float(v) for v in raw.split(",")]
+        geom = {"xmin": nums[0], "ymin": nums[1], "xmax": nums[2], "ymax": nums[3]} if len(nums) == 4 else {"x": nums[0], "y": nums[1]}
+
+    sr = (geom.get("spatialReference") or {}).get("wkid") or in_sr or 4326
+    project = _to_wgs84(sr)
+
+    if "xmin" in geom:
+        corners = [project(geom["xmin"], geom["ymin"]), project(geom["xmax"], geom["ymax"]),
+                   project(geom["xmin"], geom["ymax"]), project(geom["xmax"], geom["ymin"])]
+        xs = [c[0] for c in corners]
+        ys = [c[1] for c in corners]
+        return "envelope", (min(xs), min(ys), max(xs), max(ys))
+    if "points" in geom:
+        return "points", [project(p[0], p[1]) for p in geom["points"]]
+    if "x" in geom:
+        return "points", [project(geom["x"], geom["y"])]
+    if "rings" in geom:
+        return "polygon", [list(project(p[0], p[1])) for p in geom["rings"][0]]
+    raise ValueError(f"Unsupported geometry ({geometry_type})")
+
+
+def _project_geometry(geom: Dict, out_sr: Optional[int]) -> Dict:
+    if not geom or out_sr in (None, 4326):
+        return geom
+    fwd = _from_wgs84(out_sr)
+    if "x" in geom:
+        x, y = fwd(geom["x"], geom["y"])
+        return {"x": x, "y": y}
+    if "rings" in geom:
+        return {"rings": [[list(fwd(p[0], p[1])) for p in ring] for ring in geom["rings"]]}
+    if "points" in geom:
+        return {"points": [list(fwd(p[0], p[1])) for p in geom["points"]]}
+    return geom
+
+
+def _flag(params: Dict[str, str], name: str) -> bool:
+    return str(params.get(name, "false")).lower() == "true"
+
+
+def _int(params: Dict[str, str], name: str, default: Optional[int] = None) -> Optional[int]:
+    try:
+        return int(params.get(name)) if params.get(name) not in (None, "") else default
+    except ValueError:
+        return default
+
+
+def run_query(layer: Layer, params: Dict[str, str], record_cap: Optional[int] = None) -> Dict:
+    """Execute an ArcGIS query against an in-memory layer."""
+    in_sr = _int(params, "inSR")
+    kind, geom = _parse_geometry(params.get("geometry", ""), params.get("geometryType", ""), in_sr)
+
+    if kind == "envelope":
+        idx = layer.envelope_hits(*geom)
+    elif kind == "points":
+        idx = layer.point_hits(geom)
+    elif kind == "polygon":
+        idx = layer.polygon_hits(geom)
+    else:
+        idx = np.arange(len(layer.features))
+
+    predicate = compile_where(params.get("where", "1=1"))
+    matched = [layer.features[int(i)] for i in idx if predicate(layer.features[int(i)]["attributes"])]
+
+    if _flag(params, "returnCountOnly"):
+        return {"count": len(matched)}
+
+    order = (params.get("orderByFields") or "").strip()
+    if order:
+        field, *direction = order.split()
+        reverse = bool(direction) and direction[0].upper() == "DESC"
+        matched.sort(key=lambda f: (f["attributes"].get(field) is None, f["attributes"].get(field)), reverse=reverse)
+
+    if _flag(params, "returnIdsOnly"):
+        return {"objectIdFieldName": "OBJECTID", "objectIds": [f["attributes"]["OBJECTID"] for f in matched]}
+
+    out_fields = [f.strip() for f in (params.get("outFields") or "*").split(",") if f.strip()]
+    select_all = "*" in out_fields
+
+    def pick(attrs: Dict) -> Dict:
+        return dict(attrs) if select_all else {k: attrs.get(k) for k in out_fields}
+
+    if _flag(params, "returnDistinctValues"):
+        seen, distinct = set(), []
+        for f in matched:
+            row = pick(f["attributes"])
+            key = tuple(sorted(row.items()))
+            if key not in seen:
+                seen.add(key)
+                distinct.append({"attributes": row})
+        return {"features": distinct}
+
+    offset = _int(params, "resultOffset", 0) or 0
+    cap = layer.max_record_count if record_cap is None else min(layer.max_record_count, record_cap)
+    requested = _int(params, "resultRecordCount", cap) or cap
+    page_size = min(requested, cap)
+    page = matched[offset:offset + page_size]
+
+    return_geometry = str(params.get("returnGeometry", "true")).lower() != "false"
+    out_sr = _int(params, "outSR", 2868)  # layers are natively 2868 - mirror ArcGIS default
+
+    features = []
+    for f in page:
+        item = {"attributes": pick(f["attributes"])}
+        if return_geometry and f.get("geometry"):
+            item["geometry"] = _project_geometry(f["geometry"], out_sr)
+        features.append(item)
+
+    result = {
+        "objectIdFieldName": "OBJECTID",
+        "geometryType": layer.geometry_type,
+        "spatialReference": {"wkid": out_sr or 2868},
+        "features": features,
+    }
+    if offset + page_size < len(matched):
+        result["exceededTransferLimit"] = True
+    return result
+
+
+# ======================================================================
+# App
+# ======================================================================
+class StandInState:
+    def __init__(self, layers: Dict[str, Layer], latency_ms: float = 0, jitter_ms: float = 0,
+                 error_rate: float = 0.0, error_mode: str = "http", record_cap: Optional[int] = None, seed: int = 42):
+        self.layers = layers
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.error_mode = error_mode  # http | arcgis | timeout
+        self.record_cap = record_cap
+        self.rng = random.Random(seed)
+        self.stats: Dict[str, Dict[str, int]] = {}
+        self.started = time.time()
+
+    def config(self) -> Dict:
+        return {
+            "latency_ms": self.latency_ms,
+            "jitter_ms": self.jitter_ms,
+            "error_rate": self.error_rate,
+            "error_mode": self.error_mode,
+            "record_cap": self.record_cap,
+            "layers": {k: len(v.features) for k, v in self.layers.items()},
+        }
+
+    def count(self, key: str, outcome: str):
+        entry = self.stats.setdefault(key, {"requests": 0, "errors": 0})
+        entry["requests"] += 1
+        if outcome != "ok":
+            entry["errors"] += 1
+
+
+def create_app(state: StandInState) -> FastAPI:
+    app = FastAPI(title="ARELA ArcGIS Stand-in")
+    app.state.standin = state
+
+    async def _params(request: Request) -> Dict[str, str]:
+        params = dict(request.query_params)
+        if request.method == "POST":
+            body = (await request.body()).decode("utf-8", errors="replace")
+            if body:
+                # Parse urlencoded forms by hand - avoids a python-multipart dependency
+                params.update({k: v[-1] for k, v in parse_qs(body, keep_blank_values=True).items()})
+        return params
+
+    async def _chaos(key: str) -> Optional[JSONResponse]:
+        """Apply configured latency / failures. Returns an error response or None."""
+        delay = state.latency_ms + (state.rng.uniform(-state.jitter_ms, state.jitter_ms) if state.jitter_ms else 0)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000.0)
+        if state.error_rate and state.rng.random() < state.error_rate:
+            state.count(key, "error")
+            if state.error_mode == "timeout":
+                await asyncio.sleep(60)
+                return JSONResponse({"error": {"code": 504, "message": "Gateway Timeout"}}, status_code=504)
+            if state.error_mode == "arcgis":
+                # ArcGIS reports most failures as HTTP 200 with an error body
+                return JSONResponse({"error": {"code": 400, "message": "Unable to complete operation.", "details": []}})
+            return JSONResponse({"error": {"code": 500, "message": "Internal Server Error"}}, status_code=500)
+        return None
+
+    @app.api_route("/{root}/rest/services/{service_path:path}/MapServer/{layer_id}/query", methods=["GET", "POST"])
+    async def query(root: str, service_path: str, layer_id: int, request: Request):
+        key = f"{root}/{service_path}/{layer_id}"
+        failure = await _chaos(key)
+        if failure is not None:
+            return failure
+
+        layer = state.layers.get(key)
+        if layer is None:
+            state.count(key, "ok")
+            return {"features": []}
+
+        params = await _params(request)
+        try:
+            result = run_query(layer, params, state.record_cap)
+        except (WhereSyntaxError, ValueError) as e:
+            state.count(key, "error")
+            return {"error": {"code": 400, "message": f"Invalid query: {e}", "details": []}}
+        state.count(key, "ok")
+        return result
+
+    @app.post("/assessor/parceldetails/")
+    async def assessor(request: Request):
+        failure = await _chaos("assessor")
+        if failure is not None:
+            return failure
+        try:
+            payload = json.loads((await request.body()) or b"{}")
+        except ValueError:
+            payload = {}
+        parcel = str(payload.get("parcel", ""))
+        rng = random.Random(parcel)
+        state.count("assessor", "ok")
+        return {
+            "SalesInfo": [{"SaleValue": rng.randint(80, 700) * 1000, "SaleMonth": rng.randint(1, 12), "SaleYear": rng.randint(1990, 2025)}],
+            "Mailing": {"ParcelOwner": f"OWNER {parcel[-4:]}"},
+        }
+
+    @app.get("/_standin/stats")
+    async def stats():
+        return {"uptime_s": round(time.time() - state.started, 1), "config": state.config(), "layers": state.stats}
+
+    @app.post("/_standin/config")
+    async def update_config(request: Request):
+        changes = json.loads((await request.body()) or b"{}")
+        for name in ("latency_ms", "jitter_ms", "error_rate", "error_mode", "record_cap"):
+            if name in changes:
+                setattr(state, name, changes[name])
+        return state.config()
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local ArcGIS REST stand-in for Scout load/chaos testing")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--fixtures", help="Directory with parcels/zipcodes/addresses/violations.json (ArcGIS JSON, 4326)")
+    parser.add_argument("--parcels-per-zip", type=int, default=1500)
+    parser.add_argument("--violations-per-zip", type=int, default=120)
+    parser.add_argument("--latency-ms", type=float, default=0)
+    parser.add_argument("--jitter-ms", type=float, default=0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-mode", choices=["http", "arcgis", "timeout"], default="http")
+    parser.add_argument("--record-cap", type=int, help="Cap records per response below each layer's maxRecordCount")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    t0 = time.time()
+    layers = build_synthetic_layers(args.parcels_per_zip, args.violations_per_zip, args.seed)
+    if args.fixtures:
+        layers.update(load_fixture_layers(Path(args.fixtures)))
+    print(f"[StandIn] Layers ready in {time.time() - t0:.1f}s: " + ", ".join(f"{k}={len(v.features)}" for k, v in layers.items()))
+
+    state = StandInState(layers, args.latency_ms, args.jitter_ms, args.error_rate, args.error_mode, args.record_cap, args.seed)
+
+    import uvicorn
+    uvicorn.run(create_app(state), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
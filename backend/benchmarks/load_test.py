@@ -0,0 +1,335 @@
+"""
+Concurrent Load-Test Harness for the FastAPI search endpoints
+Drives /scout/search, /scout/autocomplete and /api/v1/leads at a target
+request rate (open-loop, Poisson arrivals) with a realistic filter mix and
+reports latency percentiles, error rate and event-loop lag.
+
+Event-loop lag is measured from the outside: a dedicated probe hits the
+trivial /health endpoint every --probe-interval-ms. /health does no I/O, so
+its latency above the idle floor is time spent waiting for the server's
+event loop (i.e. blocking work inside request handlers).
+
+Usage (from backend/, with the API running - ideally against gis_standin):
+    python -m benchmarks.load_test --rps 5 --duration 60
+    python -m benchmarks.load_test --mix search=1 --search-mix city_wide --rps 1 --duration 120
+
+    # Find how many city-wide searches/sec one instance sustains (p95 SLO 10s)
+    python -m benchmarks.load_test --mix search=1 --search-mix city_wide --ramp 0.5:0.5:5 --slo-p95-ms 10000
+"""
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import aiohttp
+
+BACKEND_DIR = Path(__file__).parent.parent.resolve()
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from benchmarks.scenarios import search_filters, CENTRAL_TUCSON_BOUNDS
+
+TUCSON_ZIPS = ["85705", "85711", "85712", "85713", "85716", "85719", "85745", "85710", "85730", "85706"]
+
+# Weighted /scout/search payloads - roughly what the UI sends.
+# HomeHarvest is skipped so a load run never fans out to realtor.com.
+SEARCH_MIX: Dict[str, List[Tuple[str, int]]] = {
+    "default": [
+        ("zip_violations", 30),
+        ("zip_property_type", 25),
+        ("bounds_subtype", 20),
+        ("zip_absentee", 15),
+        ("city_wide", 10),
+    ],
+    "city_wide": [("city_wide", 1)],
+    "zip_only": [("zip_violations", 1), ("zip_property_type", 1), ("zip_absentee", 1)],
+}
+
+AUTOCOMPLETE_QUERIES = ["12", "123 N", "4908 S", "ORACLE", "SPEEDWAY", "1314 N BROAD", "GRANT RD", "77 W", "ROGER"]
+
+
+def build_search_payload(kind: str, rng: random.Random) -> Dict:
+    zip_code = rng.choice(TUCSON_ZIPS)
+    if kind == "zip_violations":
+        return search_filters(zip_code=zip_code, distress_type=["Code Violations"], limit=50, skip_homeharvest=True)
+    if kind == "zip_property_type":
+        return search_filters(zip_code=zip_code, property_types=[rng.choice(["Single Family", "Multi-Family", "Mobile Homes"])],
+                              limit=50, skip_homeharvest=True)
+    if kind == "zip_absentee":
+        return search_filters(zip_code=zip_code, distress_type=["Absentee Owner"], property_types=["Single Family"],
+                              limit=50, skip_homeharvest=True)
+    if kind == "bounds_subtype":
+        dx = rng.uniform(-0.02, 0.02)
+        dy = rng.uniform(-0.02, 0.02)
+        bounds = {k: v + (dx if k.startswith("x") else dy) for k, v in CENTRAL_TUCSON_BOUNDS.items()}
+        return search_filters(bounds=bounds, property_types=["Single Family"], property_subtypes=["Urban Subdivided"],
+                              limit=100, skip_homeharvest=True)
+    if kind == "city_wide":
+        return search_filters(city="Tucson", distress_type=[rng.choice(["Absentee Owner", "Code Violations"])],
+                              limit=100, skip_homeharvest=True)
+    raise ValueError(f"Unknown search kind: {kind}")
+
+
+def _weighted_choice(rng: random.Random, items: List[Tuple[str, int]]) -> str:
+    names, weights = zip(*items)
+    return rng.choices(names, weights=weights, k=1)[0]
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * pct / 100.0
+    lo = int(k)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+
+class Stats:
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = {}
+        self.errors: Dict[str, int] = {}
+        self.error_samples: Dict[str, List[str]] = {}
+        self.dropped = 0
+
+    def record(self, endpoint: str, latency_ms: float, error: Optional[str] = None):
+        self.latencies.setdefault(endpoint, []).append(latency_ms)
+        if error:
+            self.errors[endpoint] = self.errors.get(endpoint, 0) + 1
+            samples = self.error_samples.setdefault(endpoint, [])
+            if len(samples) < 5:
+                samples.append(error)
+
+    def summary(self, elapsed_s: float) -> Dict:
+        out = {}
+        for endpoint, lats in sorted(self.latencies.items()):
+            errs = self.errors.get(endpoint, 0)
+            out[endpoint] = {
+                "requests": len(lats),
+                "achieved_rps": round(len(lats) / elapsed_s, 2) if elapsed_s else 0,
+                "error_rate": round(errs / len(lats), 4) if lats else 0,
+                "p50_ms": _round(percentile(lats, 50)),
+                "p95_ms": _round(percentile(lats, 95)),
+                "p99_ms": _round(percentile(lats, 99)),
+                "max_ms": _round(max(lats) if lats else None),
+                "error_samples": self.error_samples.get(endpoint, []),
+            }
+        return out
+
+
+def _round(v: Optional[float]) -> Optional[float]:
+    return round(v, 1) if v is not None else None
+
+
+class LoadRunner:
+    def __init__(self, base_url: str, mix: Dict[str, float], search_mix: str, api_key: str,
+                 max_in_flight: int, timeout_s: float, seed: int):
+        self.base_url = base_url.rstrip("/")
+        self.mix = [(k, v) for k, v in mix.items() if v > 0]
+        self.search_mix = SEARCH_MIX[search_mix]
+        self.headers = {"X-API-Key": api_key}
+        self.sem = asyncio.Semaphore(max_in_flight)
+        self.timeout = aiohttp.ClientTimeout(total=timeout_s)
+        self.rng = random.Random(seed)
+
+    async def _request(self, session: aiohttp.ClientSession, stats: Stats):
+        endpoint = _weighted_choice(self.rng, self.mix)
+        if endpoint == "search":
+            kind = _weighted_choice(self.rng, self.search_mix)
+            label = f"search:{kind}"
+            method, url, kwargs = "POST", "/scout/search", {"json": build_search_payload(kind, self.rng)}
+        elif endpoint == "autocomplete":
+            label = "autocomplete"
+            method, url, kwargs = "GET", "/scout/autocomplete", {"params": {"query": self.rng.choice(AUTOCOMPLETE_QUERIES)}}
+        else:
+            label = "leads"
+            method, url, kwargs = "GET", "/api/v1/leads", {"params": {"skip": self.rng.choice([0, 0, 0, 100, 500]), "limit": 100}}
+
+        if self.sem.locked():
+            # Open-loop: never queue client-side beyond max_in_flight - count as dropped
+            stats.dropped += 1
+            return
+
+        async with self.sem:
+            t0 = time.perf_counter()
+            error = None
+            try:
+                async with session.request(method, self.base_url + url, headers=self.headers, **kwargs) as resp:
+                    await resp.read()
+                    if resp.status >= 400:
+                        error = f"HTTP {resp.status}"
+            except asyncio.TimeoutError:
+                error = "timeout"
+            except aiohttp.ClientError as e:
+                error = f"{type(e).__name__}: {e}"
+            stats.record(label, (time.perf_counter() - t0) * 1000, error)
+
+    async def _probe_loop_lag(self, session: aiohttp.ClientSession, interval_ms: float, stop: asyncio.Event, samples: List[float]):
+        while not stop.is_set():
+            t0 = time.perf_counter()
+            try:
+                async with session.get(self.base_url + "/health") as resp:
+                    await resp.read()
+                samples.append((time.perf_counter() - t0) * 1000)
+            except Exception:
+                pass
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=interval_ms / 1000.0)
+            except asyncio.TimeoutError:
+                pass
+
+    async def run(self, rps: float, duration_s: float, probe_interval_ms: float) -> Dict:
+        stats = Stats()
+        lag_samples: List[float] = []
+        stop = asyncio.Event()
+
+        connector = aiohttp.TCPConnector(limit=0)
+        async with aiohttp.ClientSession(timeout=self.timeout, connector=connector) as session, \
+                aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as probe_session:
+
+            # Idle floor for the lag probe before load starts
+            idle: List[float] = []
+            for _ in range(10):
+                t0 = time.perf_counter()
+                try:
+                    async with probe_session.get(self.base_url + "/health") as resp:
+                        await resp.read()
+                    idle.append((time.perf_counter() - t0) * 1000)
+                except Exception as e:
+                    raise RuntimeError(f"API not reachable at {self.base_url}: {e}")
+            idle_floor = percentile(idle, 50) or 0.0
+
+            probe = asyncio.create_task(self._probe_loop_lag(probe_session, probe_interval_ms, stop, lag_samples))
+            tasks = []
+            start = time.perf_counter()
+            next_at = start
+            while True:
+                next_at += self.rng.expovariate(rps)
+                if next_at - start > duration_s:
+                    break
+                delay = next_at - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                tasks.append(asyncio.create_task(self._request(session, stats)))
+
+            await asyncio.gather(*tasks)
+            elapsed = time.perf_counter() - start
+            stop.set()
+            await probe
+
+        lag = [max(0.0, s - idle_floor) for s in lag_samples]
+        all_lats = [v for lats in stats.latencies.values() for v in lats]
+        total_errors = sum(stats.errors.values())
+        return {
+            "target_rps": rps,
+            "duration_s": round(elapsed, 1),
+            "requests": len(all_lats),
+            "dropped": stats.dropped,
+            "error_rate": round(total_errors / len(all_lats), 4) if all_lats else 0,
+            "p50_ms": _round(percentile(all_lats, 50)),
+            "p95_ms": _round(percentile(all_lats, 95)),
+            "p99_ms": _round(percentile(all_lats, 99)),
+            "loop_lag": {
+                "idle_floor_ms": _round(idle_floor),
+                "samples": len(lag),
+                "p50_ms": _round(percentile(lag, 50)),
+                "p95_ms": _round(percentile(lag, 95)),
+                "p99_ms": _round(percentile(lag, 99)),
+                "max_ms": _round(max(lag) if lag else None),
+            },
+            "endpoints": stats.summary(elapsed),
+        }
+
+
+def print_report(result: Dict):
+    print()
+    print("=" * 96)
+    print(f"target {result['target_rps']} rps for {result['duration_s']}s  |  {result['requests']} requests, "
+          f"{result['dropped']} dropped, error rate {result['error_rate'] * 100:.1f}%")
+    print("-" * 96)
+    print(f"{'endpoint':<28}{'reqs':>7}{'rps':>8}{'err%':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for name, e in result["endpoints"].items():
+        print(f"{name:<28}{e['requests']:>7}{e['achieved_rps']:>8}{e['error_rate'] * 100:>8.1f}"
+              f"{e['p50_ms'] or 0:>10.1f}{e['p95_ms'] or 0:>10.1f}{e['p99_ms'] or 0:>10.1f}{e['max_ms'] or 0:>10.1f}")
+    lag = result["loop_lag"]
+    print("-" * 96)
+    print(f"{'event-loop lag (/health)':<28}{lag['samples']:>7}{'':>16}"
+          f"{lag['p50_ms'] or 0:>10.1f}{lag['p95_ms'] or 0:>10.1f}{lag['p99_ms'] or 0:>10.1f}{lag['max_ms'] or 0:>10.1f}"
+          f"   (idle floor {lag['idle_floor_ms']} ms)")
+    for name, e in result["endpoints"].items():
+        for sample in e["error_samples"]:
+            print(f"  ! {name}: {sample}")
+    print("=" * 96)
+
+
+def _parse_mix(raw: str) -> Dict[str, float]:
+    mix = {"search": 0.0, "autocomplete": 0.0, "leads": 0.0}
+    for part in raw.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in mix:
+            raise argparse.ArgumentTypeError(f"Unknown endpoint '{name}' (use search, autocomplete, leads)")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+async def _main(args):
+    runner = LoadRunner(args.base_url, args.mix, args.search_mix, args.api_key,
+                        args.max_in_flight, args.timeout, args.seed)
+
+    if not args.ramp:
+        result = await runner.run(args.rps, args.duration, args.probe_interval_ms)
+        print_report(result)
+        results = [result]
+    else:
+        start, step, stop = (float(v) for v in args.ramp.split(":"))
+        results = []
+        sustained = None
+        rps = start
+        while rps <= stop + 1e-9:
+            print(f"[Load] Ramp step: {rps} rps for {args.duration}s...", flush=True)
+            result = await runner.run(rps, args.duration, args.probe_interval_ms)
+            print_report(result)
+            results.append(result)
+            ok = (result["p95_ms"] or 0) <= args.slo_p95_ms and result["error_rate"] <= args.max_error_rate and not result["dropped"]
+            if not ok:
+                print(f"[Load] SLO broken at {rps} rps (p95 {result['p95_ms']} ms, errors {result['error_rate'] * 100:.1f}%)")
+                break
+            sustained = rps
+            rps = round(rps + step, 4)
+        print(f"[Load] Max sustained rate: {sustained if sustained is not None else '< ' + str(start)} rps "
+              f"(p95 <= {args.slo_p95_ms} ms, errors <= {args.max_error_rate * 100:.1f}%)")
+
+    if args.json_out:
+        with open(args.json_out, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"[Load] Results written to {args.json_out}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test /scout/search, /scout/autocomplete and /api/v1/leads")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--rps", type=float, default=2.0, help="Target arrival rate (requests/sec)")
+    parser.add_argument("--duration", type=float, default=60.0, help="Seconds per run / ramp step")
+    parser.add_argument("--mix", type=_parse_mix, default=_parse_mix("search=3,autocomplete=4,leads=3"),
+                        help="Endpoint weights, e.g. search=3,autocomplete=4,leads=3")
+    parser.add_argument("--search-mix", choices=sorted(SEARCH_MIX), default="default")
+    parser.add_argument("--max-in-flight", type=int, default=200, help="Client-side concurrency cap")
+    parser.add_argument("--timeout", type=float, default=120.0, help="Per-request timeout (s)")
+    parser.add_argument("--probe-interval-ms", type=float, default=100.0)
+    parser.add_argument("--ramp", help="START:STEP:MAX rps - step up until the SLO breaks")
+    parser.add_argument("--slo-p95-ms", type=float, default=10000.0)
+    parser.add_argument("--max-error-rate", type=float, default=0.01)
+    parser.add_argument("--api-key", default="arela-dev-key")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--json", dest="json_out")
+    args = parser.parse_args()
+    asyncio.run(_main(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark Scenarios for ScoutService.fetch_leads
+Each scenario is a filters dict exactly as /scout/search would pass it
+(SearchFilters.dict()), plus how many times to run it in one process.
+
+repeat > 1 runs the same filters back-to-back on the SAME ScoutService
+instance, so runs 2..N measure the warm in-memory caches
+(_violations_cache, _lead_cache, _homeharvest_cache, _property_type_cache).
+"""
+from typing import Dict, List
+
+
+def search_filters(**overrides) -> Dict:
+    """Default SearchFilters payload (mirrors app.main.SearchFilters defaults)."""
+    base = {
+        "zip_code": None,
+        "city": None,
+        "county": "Pima",
+        "address": None,
+        "bounds": None,
+        "neighborhood": None,
+        "distress_type": None,
+        "property_types": None,
+        "property_subtypes": None,
+        "hot_list": None,
+        "listing_statuses": None,
+        "limit": 100,
+        "skip_homeharvest": False,
+        "min_beds": None, "max_beds": None,
+        "min_baths": None, "max_baths": None,
+        "min_sqft": None, "max_sqft": None,
+        "min_year_built": None, "max_year_built": None,
+        "has_pool": None, "has_garage": None, "has_guest_house": None,
+    }
+    base.update(overrides)
+    return base
+
+
+# Central Tucson viewport (roughly Speedway/Grant between Oracle and Campbell)
+CENTRAL_TUCSON_BOUNDS = {"xmin": -110.985, "ymin": 32.230, "xmax": -110.940, "ymax": 32.265}
+
+
+SCENARIOS: List[Dict] = [
+    {
+        "name": "zip_code_violations",
+        "description": "Single zip (85705) + Code Violations",
+        "filters": search_filters(zip_code="85705", distress_type=["Code Violations"], limit=50),
+        "repeat": 1,
+    },
+    {
+        "name": "city_absentee",
+        "description": "City-wide (Tucson) Absentee Owner",
+        "filters": search_filters(city="Tucson", distress_type=["Absentee Owner"], limit=100, skip_homeharvest=True),
+        "repeat": 1,
+    },
+    {
+        "name": "bounds_subtype",
+        "description": "Map bounds + Single Family / Urban Subdivided",
+        "filters": search_filters(
+            bounds=CENTRAL_TUCSON_BOUNDS,
+            property_types=["Single Family"],
+            property_subtypes=["Urban Subdivided"],
+            limit=100,
+        ),
+        "repeat": 1,
+    },
+    {
+        "name": "hot_list",
+        "description": "Hot list (Price Reduced + High Days on Market) in 85716",
+        "filters": search_filters(zip_code="85716", hot_list=["Price Reduced", "High Days on Market"], limit=50),
+        "repeat": 1,
+    },
+    {
+        "name": "cache_warm_violations",
+        "description": "Zip 85705 Code Violations + Single Family, repeated 3x (warm caches)",
+        "filters": search_filters(
+            zip_code="85705",
+            distress_type=["Code Violations"],
+            property_types=["Single Family"],
+            limit=50,
+        ),
+        "repeat": 3,
+    },
+]
+
+
+def get_scenario(name: str) -> Dict:
+    for scenario in SCENARIOS:
+        if scenario["name"] == name:
+            return scenario
+    raise KeyError(f"Unknown scenario: {name}. Available: {[s['name'] for s in SCENARIOS]}")
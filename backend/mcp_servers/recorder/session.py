@@ -8,17 +8,24 @@ Configuration:
     - GOOGLE_CLOUD_PROJECT: GCP project ID (default: arela-project)
     - GOOGLE_APPLICATION_CREDENTIALS: Path to GCP service account JSON
     - VERTEX_AI_LOCATION: Vertex AI region (default: us-central1)
+    - RECORDER_MIN_SEARCH_INTERVAL_S: minimum gap between searches across all tabs (default: 2.0)
+    - RECORDER_CAPTURE_MODE: "dom" (parse rendered rows) or "network" (map search-result XHR JSON)
+    - RECORDER_SEARCH_RESPONSE_PATTERN: regex for search-result response URLs (default: /web/search)
   
   File locations:
     - .env file: backend/.env (auto-loaded)
     - credentials.json: backend/credentials.json (auto-detected if env not set)
 """
 import asyncio
+import functools
+import inspect
 import os
+import re
 import base64
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Optional, List, Dict
-from playwright.async_api import async_playwright
+from typing import AsyncIterator, Optional, List, Dict
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
 from playwright_stealth import Stealth
 import httpx
 from dotenv import load_dotenv
@@ -70,6 +77,368 @@ RECORDER_URL = "https://pimacountyaz-web.tylerhost.net/web/search/DOCSEARCH55S10
 # Cookie file location for persistent sessions
 COOKIES_FILE = BACKEND_DIR / "cache" / "recorder_cookies.json"
 import json
+import time
+from collections import deque
+
+# Politeness: minimum gap between search submissions across every tab of the session
+MIN_SEARCH_INTERVAL_S = float(os.environ.get("RECORDER_MIN_SEARCH_INTERVAL_S", "2.0"))
+
+# Result capture: "dom" parses the rendered rows; "network" maps the portal's
+# search-result JSON (XHR responses matching RECORDER_SEARCH_RESPONSE_PATTERN)
+# straight into document records and only falls back to the DOM when no such
+# response arrives
+CAPTURE_MODE = os.environ.get("RECORDER_CAPTURE_MODE", "dom").lower()
+SEARCH_RESPONSE_PATTERN = re.compile(os.environ.get("RECORDER_SEARCH_RESPONSE_PATTERN", r"/web/search"), re.I)
+NETWORK_CAPTURE_TIMEOUT_S = 15
+
+# Candidate JSON keys for each document field (first present wins)
+RECORD_JSON_KEYS = {
+    "doc_id": ("documentId", "DocumentId", "documentID", "docId", "id"),
+    "doc_number": ("documentNumber", "DocumentNumber", "docNumber", "instrumentNumber", "feeNumber"),
+    "doc_type": ("documentType", "DocumentType", "docType", "documentTypeDescription", "docTypeDescription"),
+    "record_date": ("recordingDate", "RecordingDate", "recordDate", "recordedDate", "dateRecorded"),
+    "grantor": ("grantor", "Grantor", "grantors", "grantorNames"),
+    "grantee": ("grantee", "Grantee", "grantees", "granteeNames"),
+    "book_page": ("bookPage", "BookPage"),
+}
+_RESULT_LIST_KEYS = ("searchResults", "results", "documents", "rows", "items", "data")
+_ISO_DATE_RE = re.compile(r"^(\d{4})-(\d{2})-(\d{2})")
+
+
+def _json_value(obj: Dict, field: str):
+    for key in RECORD_JSON_KEYS[field]:
+        if obj.get(key) not in (None, ""):
+            return obj[key]
+    return None
+
+
+def _looks_like_document(obj) -> bool:
+    # A bare "id" is too generic to identify a document on its own
+    return isinstance(obj, dict) and any(k in obj for k in RECORD_JSON_KEYS["doc_id"][:-1]) and (
+        _json_value(obj, "doc_number") is not None or _json_value(obj, "doc_type") is not None)
+
+
+def _find_result_list(node, depth: int = 0) -> Optional[list]:
+    """The list of result objects inside a search response (None if it isn't one)."""
+    if depth > 4:
+        return None
+    if isinstance(node, list):
+        if node and any(_looks_like_document(x) for x in node):
+            return node
+        children = node
+    elif isinstance(node, dict):
+        for key in _RESULT_LIST_KEYS:
+            value = node.get(key)
+            if isinstance(value, list) and (not value or any(_looks_like_document(x) for x in value)):
+                return value
+        children = node.values()
+    else:
+        return None
+    for child in children:
+        found = _find_result_list(child, depth + 1)
+        if found is not None:
+            return found
+    return None
+
+
+def _record_date(value) -> str:
+    """Same MM/DD/YYYY format the rendered rows show."""
+    if value is None:
+        return ""
+    if isinstance(value, (int, float)):  # epoch milliseconds
+        from datetime import datetime, timezone
+        return datetime.fromtimestamp(value / 1000, tz=timezone.utc).strftime("%m/%d/%Y")
+    match = _ISO_DATE_RE.match(str(value))
+    if match:
+        return f"{match.group(2)}/{match.group(3)}/{match.group(1)}"
+    return str(value).strip()
+
+
+def records_from_json(payload) -> Optional[List[Dict]]:
+    """
+    Maps a search-result JSON payload to document dicts shaped like the DOM
+    parser's. Returns None when the payload holds no result list, [] when it
+    is an empty result page.
+    """
+    items = _find_result_list(payload)
+    if items is None:
+        return None
+    records = []
+    for obj in items:
+        if not isinstance(obj, dict):
+            continue
+        doc_id = _json_value(obj, "doc_id")
+        if doc_id is None:
+            continue
+        def party(field):
+            value = _json_value(obj, field)
+            return "; ".join(map(str, value)) if isinstance(value, list) else str(value or "").strip()
+        records.append({
+            "doc_id": str(doc_id),
+            "doc_number": str(_json_value(obj, "doc_number") or "").strip(),
+            "doc_type": str(_json_value(obj, "doc_type") or "").strip(),
+            "record_date": _record_date(_json_value(obj, "record_date")),
+            "grantor": party("grantor"),
+            "grantee": party("grantee"),
+            "book_page": str(_json_value(obj, "book_page") or ""),
+            "related_docs": [],
+        })
+    return records
+
+# Results pager "next" controls, most specific first
+NEXT_PAGE_SELECTORS = [
+    "a[aria-label*='Next' i]",
+    "button[aria-label*='Next' i]",
+    ".pagination li.next a",
+    "a.next",
+    "a:has-text('Next')",
+]
+MAX_RESULT_PAGES = 200  # Safety stop for iter_documents
+
+# Condition-wait budgets (WaitStrategy) - upper bounds, not fixed delays
+WAIT_TIMEOUT_MS = 15000          # Form ready / search results settled
+CLEAR_RELOAD_TIMEOUT_MS = 5000   # Clear Search reloading the page
+AUTOCOMPLETE_TIMEOUT_MS = 5000   # Doc type autocomplete list populated
+SELECTION_TIMEOUT_MS = 3000      # Selected doc type pill added
+VIEWER_TIMEOUT_MS = 20000        # Document viewer's download button present
+RESULTS_QUIET_MS = 1500          # A freshly loaded results page with no rows after this long has none
+
+SELECTION_PILLS_JS = "document.querySelectorAll('#field_selfservice_documentTypes-holder li.cblist-input-list.transition-background').length"
+
+# True once the search has produced fresh rows (not the ones marked stale
+# before Search was clicked), a "no results" message, or a newly loaded
+# document that stayed empty for RESULTS_QUIET_MS
+RESULTS_SETTLED_JS = r"""(quietMs) => {
+    const rows = document.querySelectorAll('li.ss-search-row');
+    if (rows.length && !rows[0].dataset.arelaStale) return true;
+    const body = document.body ? document.body.textContent : '';
+    if (/no (matching )?(results|records|documents)( were)? found/i.test(body)) return true;
+    return !window.__arelaStale && !rows.length && document.readyState === 'complete' && performance.now() > quietMs;
+}"""
+
+# Document types kept by search_by_name(deed_types_only=True)
+RELEVANT_DOC_KEYWORDS = [
+    # Deeds
+    "DEED", "WARRANTY", "QUITCLAIM", "QCD", "GRANT", "TRANSFER", "CONVEY",
+    # Trust & Mortgage docs
+    "TRUST", "DEED OF TRUST", "MORTGAGE", "RECONVEYANCE", "SUBSTITUTION",
+    # Liens & Encumbrances
+    "LIEN", "MECHANICS LIEN", "FEDERAL", "TAX LIEN", "RELEASE", "SATISFACTION",
+    # Notices & Court
+    "NOTICE", "LIS PENDENS", "NOTICE OF DEFAULT", "NOTICE SALE",
+    "JUDGMENT", "ABSTRACT JUDGMENT",
+    # Other relevant
+    "SALE", "AGREEMENT", "EASEMENT", "AFFIDAVIT", "ASSIGNMENT", "ASSUMPTION"
+]
+
+# Parses every li.ss-search-row on the page in one evaluate call (instead of
+# several awaited locator round trips per row). Labels are matched on
+# textContent, which needs no layout; innerText is only read for the Related
+# Documents block, whose line breaks are what separate the documents.
+RESULT_ROWS_JS = r"""(limit) => {
+    const rows = Array.from(document.querySelectorAll('li.ss-search-row'));
+    const out = [];
+    for (const row of rows.slice(0, limit || rows.length)) {
+        try {
+            const doc_id = row.getAttribute('data-documentid') || '';
+            if (!doc_id) continue;
+
+            // Header: "DOC NUMBER • DOC TYPE" (older rows use a dash or a.doc-link)
+            const header = row.querySelector('h1') || row.querySelector('a.doc-link');
+            const h1Text = header ? header.textContent.trim() : '';
+            let doc_number = '';
+            let doc_type = '';
+            if (h1Text) {
+                const parts = h1Text.split(h1Text.includes('•') ? '•' : '-').map(p => p.trim());
+                doc_number = parts[0] || '';
+                doc_type = parts.length > 1 ? parts[parts.length - 1] : '';
+            }
+
+            let record_date = '';
+            let grantor = '';
+            let grantee = '';
+            for (const col of row.querySelectorAll('.searchResultThreeColumn, .col-md-4')) {
+                const colText = col.textContent || '';
+                const boldEl = col.querySelector('b, strong, span.value');
+                const value = boldEl ? boldEl.textContent.trim() : '';
+                if (colText.includes('Recording Date')) record_date = value;
+                else if (colText.includes('Grantor')) grantor = value;
+                else if (colText.includes('Grantee')) grantee = value;
+            }
+
+            const rowText = row.textContent || '';
+            const bpMatch = rowText.match(/B:\s*(\d+)\s*P:\s*(\d+)/);
+            const book_page = bpMatch ? `B: ${bpMatch[1]} P: ${bpMatch[2]}` : '';
+
+            const related_docs = [];
+            if (rowText.includes('Related Documents')) {
+                const section = Array.from(row.querySelectorAll('div, ul, table'))
+                    .find(el => (el.textContent || '').includes('Related Documents'));
+                for (const line of (section ? section.innerText : '').split('\n')) {
+                    if (line.includes('Related Documents')) continue;
+                    const docNumMatch = line.match(/(\d{8,})/);  // Document numbers are 8+ digits
+                    if (docNumMatch) related_docs.push({ doc_number: docNumMatch[0], full_text: line.trim() });
+                }
+            }
+
+            out.push({ doc_id, doc_number, doc_type, record_date, grantor, grantee, book_page, related_docs });
+        } catch (e) {
+            // Skip a malformed row, keep the rest
+        }
+    }
+    return out;
+}"""
+
+
+class ResultsTruncated(Exception):
+    """A paginated search stopped at its page cap with results left over."""
+
+
+class ResultsIncomplete(Exception):
+    """A search's results could not be read in full (rows never settled, parsing failed, form not filled)."""
+
+
+def _page_argument(method):
+    """Reads the `page` argument of a call to `method` (None when not given)."""
+    signature = inspect.signature(method)
+    
+    def page_of(self, args, kwargs):
+        return signature.bind(self, *args, **kwargs).arguments.get("page")
+    return page_of
+
+
+def leased(method):
+    """Runs a search coroutine holding the lease on its tab (its `page` argument, default the main page)."""
+    page_of = _page_argument(method)
+    
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        async with self.lease_page(page_of(self, args, kwargs)):
+            return await method(self, *args, **kwargs)
+    return wrapper
+
+
+def leased_iter(method):
+    """leased() for async-generator searches: the tab stays leased until iteration ends or is closed."""
+    page_of = _page_argument(method)
+    
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        async with self.lease_page(page_of(self, args, kwargs)):
+            documents = method(self, *args, **kwargs)
+            try:
+                async for item in documents:
+                    yield item
+            finally:
+                await documents.aclose()
+    return wrapper
+
+
+class StepTimer:
+    """Wall time per step of one recorder operation, logged when it finishes."""
+    
+    def __init__(self, operation: str):
+        self.operation = operation
+        self.steps: Dict[str, float] = {}
+        self._started = self._mark = time.perf_counter()
+    
+    def step(self, name: str):
+        """Charges the time since the previous step to `name`."""
+        now = time.perf_counter()
+        self.steps[name] = round(self.steps.get(name, 0.0) + now - self._mark, 3)
+        self._mark = now
+    
+    def finish(self) -> Dict:
+        total = round(time.perf_counter() - self._started, 3)
+        steps = ", ".join(f"{name} {secs:.2f}s" for name, secs in self.steps.items())
+        print(f"    Timing ({self.operation}): {steps} - total {total:.2f}s", flush=True)
+        return {"operation": self.operation, "total_s": total, "steps": dict(self.steps), "at": time.time()}
+
+
+class WaitStrategy:
+    """
+    Condition-based waits for the Tyler Tech search form and document viewer.
+    Each wait returns as soon as the page is in the state the next step needs
+    (form rendered, autocomplete listed, pill added, results replaced,
+    viewer loaded) and gives up after its budget instead of sleeping a
+    fixed time.
+    """
+    
+    def __init__(self, page):
+        self.page = page
+    
+    async def until(self, expression: str, arg=None, timeout_ms: int = WAIT_TIMEOUT_MS) -> bool:
+        """Waits for a JS predicate, re-arming it when a navigation replaces the document."""
+        deadline = time.monotonic() + timeout_ms / 1000
+        while True:
+            remaining = int((deadline - time.monotonic()) * 1000)
+            if remaining <= 0:
+                return False
+            try:
+                await self.page.wait_for_function(expression, arg=arg, timeout=remaining, polling=100)
+                return True
+            except PlaywrightTimeoutError:
+                return False
+            except Exception:
+                # Execution context destroyed by a navigation - poll the new document
+                await asyncio.sleep(0.05)
+    
+    async def form_ready(self, timeout_ms: int = WAIT_TIMEOUT_MS) -> bool:
+        try:
+            await self.page.locator("#field_selfservice_documentTypes").wait_for(timeout=timeout_ms)
+            return True
+        except Exception:
+            return False
+    
+    async def clear_form(self) -> bool:
+        """Clicks Clear Search (it resets the form with location.reload()) and waits for the fresh form."""
+        clear_btn = self.page.locator("#clearSearchButton")
+        if not await clear_btn.count() or not await clear_btn.is_visible():
+            return False
+        await self.page.evaluate("window.__arelaStale = true")
+        await clear_btn.click()
+        await self.until("() => !window.__arelaStale", timeout_ms=CLEAR_RELOAD_TIMEOUT_MS)
+        return await self.form_ready()
+    
+    async def autocomplete_item(self, text: str):
+        """The visible autocomplete entry for `text`, or None if the list never shows it."""
+        item = self.page.locator(f"ul.ui-autocomplete li:has-text('{text}'), .cb-dropdown-list li:has-text('{text}')").first
+        try:
+            await item.wait_for(state="visible", timeout=AUTOCOMPLETE_TIMEOUT_MS)
+            return item
+        except Exception:
+            return None
+    
+    async def selection_count(self) -> int:
+        return await self.page.evaluate(f"() => {SELECTION_PILLS_JS}")
+    
+    async def selection_added(self, before: int) -> int:
+        """Waits for the doc type pill count to grow past `before`; returns the count."""
+        await self.until(f"(n) => ({SELECTION_PILLS_JS}) > n", arg=before, timeout_ms=SELECTION_TIMEOUT_MS)
+        return await self.selection_count()
+    
+    async def mark_results_stale(self):
+        """Tags the current rows/document so results() can tell new results from old."""
+        await self.page.evaluate("""() => {
+            document.querySelectorAll('li.ss-search-row').forEach(r => r.dataset.arelaStale = '1');
+            window.__arelaStale = true;
+        }""")
+    
+    async def results(self) -> bool:
+        return await self.until(RESULTS_SETTLED_JS, arg=RESULTS_QUIET_MS)
+    
+    async def viewer_frame(self, timeout_ms: int = VIEWER_TIMEOUT_MS):
+        """First frame (the PDF viewer is often an iframe) showing #download, or None."""
+        deadline = time.monotonic() + timeout_ms / 1000
+        while time.monotonic() < deadline:
+            for frame in self.page.frames:
+                try:
+                    if await frame.locator("#download").count() > 0:
+                        return frame
+                except Exception:
+                    continue
+            await asyncio.sleep(0.2)
+        return None
 
 
 class RecorderSession:
@@ -80,13 +449,20 @@ class RecorderSession:
     - Saves cookies after successful authentication
     """
     
-    def __init__(self):
+    def __init__(self, capture_mode: Optional[str] = None):
+        self.capture_mode = (capture_mode or CAPTURE_MODE).lower()  # "dom" or "network"
         self.playwright = None
         self.browser = None
         self.page = None
         self.context = None
         self.initialized = False
         self._headless_mode = False  # Track if we're in headless mode
+        self.search_pages = []  # Extra tabs in the authenticated context (see open_search_pages)
+        self.dedicated_pages: Dict[str, object] = {}  # Tabs reserved for one background user (see dedicated_page)
+        self._page_locks: Dict[object, asyncio.Lock] = {}  # One search at a time per tab (see lease_page)
+        self._throttle_lock = asyncio.Lock()
+        self._last_search_at = 0.0
+        self.timings = deque(maxlen=100)  # StepTimer results, newest last (GET /recorder/timings)
     
     def _load_cookies(self) -> list:
         """Load cookies from file if they exist."""
@@ -184,13 +560,18 @@ class RecorderSession:
         )
         
         self.page = await self.context.new_page()
+        await self._harden_page(self.page)
         
+        self._headless_mode = headless
+    
+    async def _harden_page(self, page):
+        """Stealth patches for a tab (main page and every pooled search tab)."""
         # Apply playwright-stealth to hide automation markers (v2.0.0 API)
         stealth = Stealth()
-        await stealth.apply_stealth_async(self.page)
+        await stealth.apply_stealth_async(page)
         
         # Additional JavaScript evasion patches
-        await self.page.add_init_script("""
+        await page.add_init_script("""
             // Override webdriver property
             Object.defineProperty(navigator, 'webdriver', {
                 get: () => undefined
@@ -211,13 +592,11 @@ class RecorderSession:
                 runtime: {}
             };
         """)
-        
-        self._headless_mode = headless
     
-    async def _verify_search_page(self, timeout: int = 5000) -> bool:
+    async def _verify_search_page(self, timeout: int = 5000, page=None) -> bool:
         """Check if we're on the search page (past CAPTCHA)."""
         try:
-            doc_input = self.page.locator("#field_selfservice_documentTypes")
+            doc_input = (page or self.page).locator("#field_selfservice_documentTypes")
             await doc_input.wait_for(timeout=timeout)
             return True
         except:
@@ -254,10 +633,8 @@ class RecorderSession:
             print(f"Navigating to {RECORDER_URL}...", flush=True)
             await self.page.goto(RECORDER_URL)
             
-            # Give it a moment, then check if we're on search page
-            await self.page.wait_for_timeout(2000)
-            
-            if await self._verify_search_page(timeout=5000):
+            # Check if we landed on the search page (waits for the form, not a fixed delay)
+            if await self._verify_search_page(timeout=7000):
                 self.initialized = True
                 print("✓ Cookies valid! Session ready (headless mode).", flush=True)
                 return True
@@ -297,212 +674,339 @@ class RecorderSession:
             print("✗ Could not verify search page. CAPTCHA may not have been solved.", flush=True)
             return False
     
+    async def open_search_pages(self, count: int) -> list:
+        """
+        Returns `count` tabs parked on the search form: the main page plus
+        extra tabs opened in the same (already authenticated) context, so they
+        share its cookies and never see the CAPTCHA. Tabs are kept open and
+        reused by later calls. A tab that fails to reach the search form is
+        closed and left out, so fewer than `count` may come back.
+        """
+        if not self.initialized or not await self.validate_session():
+            return []
+        self.search_pages = [p for p in self.search_pages if not p.is_closed()]
+        while len(self.search_pages) < count - 1:
+            page = await self._open_search_tab()
+            if page is None:
+                print("    Extra search tab did not reach the search form, continuing with fewer tabs", flush=True)
+                break
+            self.search_pages.append(page)
+        return [self.page] + self.search_pages[:count - 1]
+    
+    async def _open_search_tab(self):
+        """A new tab in the authenticated context, parked on the search form (None if it never got there)."""
+        page = await self.context.new_page()
+        await self._harden_page(page)
+        await page.goto(RECORDER_URL)
+        if not await self._verify_search_page(timeout=10000, page=page):
+            await page.close()
+            return None
+        return page
+    
+    async def dedicated_page(self, name: str):
+        """
+        A tab only `name` uses (e.g. the background harvester), opened on first
+        use and reopened if closed, so it never competes with user searches
+        for the main page or the bulk-lookup tabs. None if it cannot be opened.
+        """
+        if not self.initialized or not await self.validate_session():
+            return None
+        page = self.dedicated_pages.get(name)
+        if page is None or page.is_closed():
+            page = await self._open_search_tab()
+            if page is None:
+                print(f"    Could not open the {name} tab on the search form", flush=True)
+                return None
+            self.dedicated_pages[name] = page
+        return page
+    
+    @asynccontextmanager
+    async def lease_page(self, page=None):
+        """
+        Exclusive use of a tab (default the main page) for one search or
+        document view. Every search method takes it, so a form being cleared,
+        filled and paged is never touched by another search meanwhile.
+        """
+        page = page or self.page
+        lock = self._page_locks.setdefault(page, asyncio.Lock())
+        async with lock:
+            yield page
+    
+    async def _run_search(self, page=None, limit: Optional[int] = None, timer: Optional[StepTimer] = None,
+                          submit=None, strict: bool = False) -> List[Dict]:
+        """
+        Submits the filled search form (or runs `submit`, e.g. a pager click)
+        and returns the result records, from the intercepted result JSON in
+        "network" mode or the rendered rows. With strict, results that did
+        not settle or could not be parsed raise ResultsIncomplete instead of
+        returning what is rendered.
+        """
+        page = page or self.page
+        if submit is None:
+            # Click Search button using JavaScript (more reliable for SPA pages)
+            submit = lambda: page.evaluate("document.querySelector('#searchButton').click()")
+        timer = timer or StepTimer("search")
+        waits = WaitStrategy(page)
+        await self._throttle()
+        timer.step("throttle")
+        print("    Clicking Search...", flush=True)
+        await waits.mark_results_stale()
+        if self.capture_mode == "network":
+            records = await self._search_via_network(page, submit)
+            timer.step("search")
+            if records is not None:
+                print(f"    Captured {len(records)} records from the search response", flush=True)
+                return records[:limit] if limit else records
+            print("    No search-result JSON captured, reading the rendered rows", flush=True)
+        else:
+            await submit()
+        
+        # Wait until the old rows are replaced (or the search settles empty)
+        if not await waits.results():
+            if strict:
+                raise ResultsIncomplete("Results did not settle in time")
+            print("    Results did not settle in time, reading what is rendered", flush=True)
+        timer.step("search")
+        
+        results = await self._parse_result_rows(page, limit=limit, strict=strict)
+        timer.step("parse")
+        return results
+    
+    def _record_timing(self, timer: StepTimer):
+        self.timings.append(timer.finish())
+    
+    async def _search_via_network(self, page, submit) -> Optional[List[Dict]]:
+        """
+        Runs `submit` (the Search click) and resolves with the first JSON response that carries a
+        result list (records_from_json), without waiting for the page to
+        render it. None if none arrives within NETWORK_CAPTURE_TIMEOUT_S.
+        """
+        found = asyncio.get_running_loop().create_future()
+        
+        async def inspect(response):
+            try:
+                if not SEARCH_RESPONSE_PATTERN.search(response.url):
+                    return
+                if "json" not in (response.headers.get("content-type") or ""):
+                    return
+                records = records_from_json(await response.json())
+                if records is not None and not found.done():
+                    found.set_result(records)
+            except Exception as e:
+                print(f"    Could not read search response {response.url}: {e}", flush=True)
+        
+        def on_response(response):
+            asyncio.ensure_future(inspect(response))
+        
+        page.on("response", on_response)
+        try:
+            await submit()
+            return await asyncio.wait_for(found, timeout=NETWORK_CAPTURE_TIMEOUT_S)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            page.remove_listener("response", on_response)
+    
+    async def _parse_result_rows(self, page=None, limit: Optional[int] = None, strict: bool = False) -> List[Dict]:
+        """All result rows on the page (first `limit`) as document dicts, in one round trip."""
+        try:
+            return await (page or self.page).evaluate(RESULT_ROWS_JS, limit or 0)
+        except Exception as e:
+            if strict:
+                raise ResultsIncomplete(f"Could not parse result rows: {e}") from e
+            print(f"    Error parsing result rows: {e}", flush=True)
+            return []
+    
+    async def _throttle(self):
+        """Spaces search submissions MIN_SEARCH_INTERVAL_S apart across all tabs."""
+        async with self._throttle_lock:
+            wait = self._last_search_at + MIN_SEARCH_INTERVAL_S - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._last_search_at = time.monotonic()
+    
     async def refresh_cookies(self):
         """Force a manual CAPTCHA flow to get fresh cookies."""
         print("Forcing cookie refresh...", flush=True)
         await self.close()
         return await self.initialize(force_manual=True)
     
-    async def search_by_doc_type(self, doc_type: str, days_back: int = 30, limit: int = 50) -> List[Dict]:
-        """Search for documents by document type with date range."""
-        if not self.initialized or not await self.validate_session():
-            return [{"error": "Session not initialized or browser closed. Please re-initialize."}]
+    async def _select_doc_type(self, page, waits: "WaitStrategy", doc_type: str) -> bool:
+        """Adds one document type to the search's selection (autocomplete pick)."""
+        selected_before = await waits.selection_count()
+        try:
+            doc_input = page.locator("#field_selfservice_documentTypes")
+            await doc_input.click()
+            # Clear any existing text first
+            await doc_input.fill("")
+            # Type the document type slowly (like a human)
+            await doc_input.type(doc_type, delay=50)
+            print(f"    Typed doc type: {doc_type}", flush=True)
+        except Exception as e:
+            print(f"    ERROR typing doc type: {e}", flush=True)
+            return False
         
-        results = []
+        # Select autocomplete item - click the dropdown option as soon as it is listed
+        try:
+            # Tyler Tech uses ul.ui-autocomplete or div with autocomplete items
+            autocomplete_item = await waits.autocomplete_item(doc_type)
+            
+            if autocomplete_item is not None:
+                # Click the matching autocomplete item
+                await autocomplete_item.click()
+                print(f"    Clicked autocomplete item: {doc_type}", flush=True)
+            else:
+                # Fallback: try keyboard navigation
+                print(f"    No autocomplete dropdown found, trying keyboard...", flush=True)
+                await doc_input.press("ArrowDown")
+                await doc_input.press("Enter")
+                print(f"    Selected via keyboard: {doc_type}", flush=True)
+        except Exception as e:
+            print(f"    Could not select autocomplete item: {e}", flush=True)
         
-        # Calculate date range (past N days)
-        from datetime import datetime, timedelta
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days_back)
-        start_str = start_date.strftime("%m/%d/%Y")
-        end_str = end_date.strftime("%m/%d/%Y")
+        # Verify selection was added (wait for a new tag/pill in the holder)
+        selection_count = await waits.selection_added(selected_before)
+        if selection_count <= selected_before:
+            print(f"    Warning: Doc type '{doc_type}' may not have been selected properly", flush=True)
+            return False
+        print(f"    Selection confirmed ({selection_count} doc type(s) selected)", flush=True)
+        return True
+    
+    async def _next_results_page(self, page, timer: StepTimer) -> Optional[List[Dict]]:
+        """Clicks the results pager's Next control; None when there is no further page."""
+        for selector in NEXT_PAGE_SELECTORS:
+            link = page.locator(selector).first
+            try:
+                if not await link.count() or not await link.is_visible():
+                    continue
+                disabled = await link.evaluate(
+                    "el => el.disabled || el.getAttribute('aria-disabled') === 'true' || "
+                    "!!el.closest('.disabled')"
+                )
+            except Exception:
+                continue
+            if disabled:
+                return None
+            return await self._run_search(page, timer=timer, submit=link.click, strict=True)
+        return None
+    
+    @leased_iter
+    async def iter_documents(
+        self,
+        doc_types: List[str],
+        days_back: int = 30,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        page=None,
+        max_pages: int = MAX_RESULT_PAGES,
+        selected_types: Optional[List[str]] = None,
+    ) -> AsyncIterator[Dict]:
+        """
+        One search over several document types and a recording-date window
+        (MM/DD/YYYY, default the past `days_back` days), yielding every result
+        across all result pages. Pages are fetched lazily - stop iterating and
+        no further pages are requested. Each record carries the doc type it
+        was recorded as; records repeated across pages are yielded once.
         
-        import sys  # Import sys for flush
+        Types whose autocomplete pick fails are left out of the search; pass a
+        list as selected_types to learn which ones were actually searched.
+        """
+        page = page or self.page
+        if not self.initialized or not await self.validate_session():
+            raise RuntimeError("Session not initialized or browser closed. Please re-initialize.")
+        
+        from datetime import datetime, timedelta
+        if not end_date:
+            end_date = datetime.now().strftime("%m/%d/%Y")
+        if not start_date:
+            start_date = (datetime.strptime(end_date, "%m/%d/%Y") - timedelta(days=days_back)).strftime("%m/%d/%Y")
         
+        timer = StepTimer(f"doc types {', '.join(doc_types)} {start_date}-{end_date}")
+        waits = WaitStrategy(page)
         try:
             # Check if there are existing document type selections that need clearing
             # Tyler Tech stores selections as li.cblist-input-list.transition-background
-            has_existing_selection = await self.page.evaluate("""(() => {
-                const holder = document.querySelector('#field_selfservice_documentTypes-holder');
-                if (holder) {
-                    return holder.querySelectorAll('li.cblist-input-list.transition-background').length > 0;
-                }
-                return false;
-            })()""")
-            
-            if has_existing_selection:
+            if await waits.selection_count() > 0:
                 # Use the native Clear Selections button which properly resets form state
                 # This triggers an AJAX call and page reload
                 print("    Previous selection found, clearing via native button...", flush=True)
-                clear_btn = self.page.locator("#clearSearchButton")
-                if await clear_btn.is_visible(timeout=2000):
-                    await clear_btn.click()
-                    # Wait for the page to reload (the button triggers location.reload())
-                    await self.page.wait_for_load_state("networkidle")
-                    await self.page.wait_for_timeout(1000)
+                if await waits.clear_form():
                     print("    Form cleared via native button", flush=True)
-            
-            # Fill Recording Date Start using the specific ID
-            try:
-                start_input = self.page.locator("#field_RecordingDateID_DOT_StartDate")
-                await start_input.fill(start_str)
-                print(f"    Filled start date: {start_str}", flush=True)
-            except Exception as e:
-                print(f"    ERROR filling start date: {e}", flush=True)
-            
-            # Fill Recording Date End
-            try:
-                end_input = self.page.locator("#field_RecordingDateID_DOT_EndDate")
-                await end_input.fill(end_str)
-                print(f"    Filled end date: {end_str}", flush=True)
-            except Exception as e:
-                print(f"    ERROR filling end date: {e}", flush=True)
-            
-            await self.page.wait_for_timeout(500)
-            
-            # Type document type into autocomplete
-            try:
-                doc_input = self.page.locator("#field_selfservice_documentTypes")
-                await doc_input.click()
-                # Clear any existing text first
-                await doc_input.fill("")
-                await self.page.wait_for_timeout(300)
-                # Type the document type slowly (like a human)
-                await doc_input.type(doc_type, delay=50)
-                print(f"    Typed doc type: {doc_type}", flush=True)
-                await self.page.wait_for_timeout(2000)  # Wait for autocomplete to populate
-            except Exception as e:
-                print(f"    ERROR typing doc type: {e}", flush=True)
-            
-            # Select autocomplete item - try clicking on visible dropdown option
-            try:
-                # Look for the autocomplete dropdown list
-                # Tyler Tech uses ul.ui-autocomplete or div with autocomplete items
-                autocomplete_item = self.page.locator(f"ul.ui-autocomplete li:has-text('{doc_type}'), .cb-dropdown-list li:has-text('{doc_type}')")
-                
-                if await autocomplete_item.count() > 0:
-                    # Click the matching autocomplete item
-                    await autocomplete_item.first.click()
-                    print(f"    Clicked autocomplete item: {doc_type}", flush=True)
-                else:
-                    # Fallback: try keyboard navigation
-                    print(f"    No autocomplete dropdown found, trying keyboard...", flush=True)
-                    await doc_input.press("ArrowDown")
-                    await self.page.wait_for_timeout(200)
-                    await doc_input.press("Enter")
-                    print(f"    Selected via keyboard: {doc_type}", flush=True)
-            except Exception as e:
-                print(f"    Could not select autocomplete item: {e}", flush=True)
-            
-            await self.page.wait_for_timeout(1000)
-            
-            # Verify selection was added (look for tag/pill in the holder)
-            selection_count = await self.page.evaluate("""() => {
-                const holder = document.querySelector('#field_selfservice_documentTypes-holder');
-                if (holder) {
-                    return holder.querySelectorAll('li.cblist-input-list.transition-background').length;
-                }
-                return 0;
-            }""")
-            
-            if selection_count == 0:
-                print(f"    Warning: Doc type '{doc_type}' may not have been selected properly", flush=True)
-            else:
-                print(f"    Selection confirmed ({selection_count} doc type(s) selected)", flush=True)
-            
-            await self.page.wait_for_timeout(500)
-            
-            # Click Search button using JavaScript (more reliable for SPA pages)
-            print("    Clicking Search...", flush=True)
-            await self.page.evaluate("document.querySelector('#searchButton').click()")
-            
-            # Wait for navigation or results to load (with timeout fallback)
-            try:
-                await self.page.wait_for_load_state("networkidle", timeout=15000)
-            except Exception:
-                # networkidle can fail if page has ongoing activity
-                pass
-            
-            # Wait for results to appear - use the actual result row selector
-            try:
-                await self.page.wait_for_selector("li.ss-search-row", timeout=10000)
-            except:
-                # No results yet, wait a bit more for async content
-                await self.page.wait_for_timeout(2000)
-            
-            # Tyler Tech uses li.ss-search-row for result rows
-            rows = await self.page.locator("li.ss-search-row").all()
-            
-            if rows:
-                print(f"    Found {len(rows)} result rows", flush=True)
-            else:
-                print(f"    No results found for '{doc_type}'", flush=True)
-                return []
-            
-            # Parse Tyler Tech result rows using JavaScript for speed
-            # This avoids the slow Playwright locator calls with 30s default timeout
-            for row in rows[:limit]:
-                try:
-                    # Extract data from row using fast JavaScript evaluation
-                    # Extract data using Python Playwright API
-                    doc_id = await row.get_attribute('data-documentid') or ''
-                    
-                    # Get h1 text
-                    h1 = row.locator('h1').first
-                    h1_text = await h1.text_content() if await h1.count() > 0 else ''
-                    
-                    doc_number = ''
-                    doc_type = ''
-                    if h1_text:
-                        parts = []
-                        if '•' in h1_text:
-                            parts = h1_text.split('•')
-                        elif '-' in h1_text:
-                            parts = h1_text.split('-')
-                        else:
-                            parts = [h1_text]
-                            
-                        doc_number = parts[0].strip()
-                        doc_type = parts[1].strip() if len(parts) > 1 else ''
-                    
-                    # Get columns
-                    record_date = ''
-                    grantor = ''
-                    grantee = ''
-                    
-                    columns = await row.locator('.searchResultThreeColumn').all()
-                    for col in columns:
-                        col_text = await col.text_content()
-                        bold = col.locator('b').first
-                        value = (await bold.text_content()).strip() if await bold.count() > 0 else ''
-                        
-                        if 'Recording Date' in col_text:
-                            record_date = value
-                        elif 'Grantor' in col_text:
-                            grantor = value
-                        elif 'Grantee' in col_text:
-                            grantee = value
-                            
-                    row_data = {
-                        "doc_id": doc_id,
-                        "doc_number": doc_number,
-                        "doc_type": doc_type,
-                        "record_date": record_date,
-                        "grantor": grantor,
-                        "grantee": grantee
-                    }
-                    
-                    if row_data and row_data.get("doc_id"):
-                        results.append(row_data)
-                except Exception as e:
-                    print(f"    Error parsing row: {e}", flush=True)
-                    continue
-                    
+            timer.step("clear")
+            
+            # Fill Recording Date Start / End using the specific IDs
+            await self._fill_dates(page, start_date, end_date)
+            timer.step("fill dates")
+            
+            # Every type goes into the same search
+            selected = [t for t in doc_types if await self._select_doc_type(page, waits, t)]
+            timer.step("select doc types")
+            if selected_types is not None:
+                selected_types.extend(selected)
+            if len(selected) < len(doc_types):
+                print(f"    Not selected: {', '.join(t for t in doc_types if t not in selected)}", flush=True)
+            if not selected:
+                print(f"    No document type could be selected, skipping search", flush=True)
+                return
+            
+            async for record in self._iter_result_pages(page, timer, max_pages):
+                yield record
+        finally:
+            self._record_timing(timer)
+    
+    async def _iter_result_pages(self, page, timer: StepTimer, max_pages: int = MAX_RESULT_PAGES) -> AsyncIterator[Dict]:
+        """
+        Submits the filled form and yields every result, following the pager
+        one page at a time. Records repeated across pages are yielded once.
+        Raises ResultsTruncated when max_pages is reached with pages left, and
+        ResultsIncomplete when a page could not be read in full - callers
+        must not treat a search that raised as complete.
+        """
+        seen = set()
+        records = await self._run_search(page, timer=timer, strict=True)
+        pages = 1
+        while records:
+            fresh = [r for r in records if r.get("doc_id") not in seen]
+            if not fresh:
+                # Next was enabled but the pager showed a page we already had
+                raise ResultsIncomplete(f"Result page {pages + 1} repeated an earlier page")
+            print(f"    Result page {pages}: {len(fresh)} documents", flush=True)
+            for record in fresh:
+                seen.add(record["doc_id"])
+                yield record
+            records = await self._next_results_page(page, timer)
+            if records and pages >= max_pages:
+                print(f"    Stopping at {max_pages} result pages", flush=True)
+                raise ResultsTruncated(f"More than {max_pages} result pages")
+            pages += 1
+    
+    async def search_by_doc_type(self, doc_type: str, days_back: int = 30, limit: int = 50) -> List[Dict]:
+        """Search for documents by document type with date range (first `limit` results)."""
+        if not self.initialized or not await self.validate_session():
+            return [{"error": "Session not initialized or browser closed. Please re-initialize."}]
+        return await self.search_by_doc_types([doc_type], days_back=days_back, limit=limit)
+    
+    async def search_by_doc_types(self, doc_types: List[str], days_back: int = 30, limit: int = 50) -> List[Dict]:
+        """First `limit` results of one search over several document types."""
+        results = []
+        documents = self.iter_documents(doc_types, days_back=days_back)
+        try:
+            async for record in documents:
+                results.append(record)
+                if len(results) >= limit:
+                    break
         except Exception as e:
             print(f"Search error: {e}")
+        finally:
+            await documents.aclose()
         
+        if results:
+            print(f"    Found {len(results)} documents", flush=True)
+        else:
+            print(f"    No results found for {', '.join(doc_types)}", flush=True)
         return results
     
+    @leased
     async def search_by_sequence(self, seq_num: str) -> List[Dict]:
         """Search for a document by its sequence number."""
         if not self.initialized or not await self.validate_session():
@@ -510,24 +1014,15 @@ class RecorderSession:
         
         print(f"Searching by sequence number: {seq_num}...", flush=True)
         results = []
+        timer = StepTimer(f"sequence {seq_num}")
+        waits = WaitStrategy(self.page)
         
         try:
             # Clear previous selections
-            has_existing_selection = await self.page.evaluate("""(() => {
-                const holder = document.querySelector('#field_selfservice_documentTypes-holder');
-                if (holder) {
-                    return holder.querySelectorAll('li.cblist-input-list.transition-background').length > 0;
-                }
-                return false;
-            })()""")
-            
-            if has_existing_selection:
+            if await waits.selection_count() > 0:
                 print("    Clearing previous doc type selections...", flush=True)
-                clear_btn = self.page.locator("#clearSearchButton")
-                if await clear_btn.is_visible(timeout=2000):
-                    await clear_btn.click()
-                    await self.page.wait_for_load_state("networkidle")
-                    await self.page.wait_for_timeout(1000)
+                await waits.clear_form()
+            timer.step("clear")
             
             # Find Sequence Number input - Try multiple common selectors for Tyler Tech
             seq_input = None
@@ -568,91 +1063,155 @@ class RecorderSession:
                 print("    Cleared date range filters", flush=True)
             except:
                 pass
-                
-            await self.page.wait_for_timeout(500)
+            timer.step("fill")
             
-            # Click Search
-            print("    Clicking Search...", flush=True)
-            await self.page.evaluate("document.querySelector('#searchButton').click()")
+            # Click Search and read the result rows
+            results = await self._run_search(self.page, timer=timer)
             
-            try:
-                await self.page.wait_for_load_state("networkidle", timeout=15000)
-            except:
-                pass
-            
-            # Wait for results
-            try:
-                await self.page.wait_for_selector("li.ss-search-row", timeout=10000)
-            except:
-                await self.page.wait_for_timeout(2000)
-            
-            rows = await self.page.locator("li.ss-search-row").all()
-            
-            if rows:
-                print(f"    Found {len(rows)} result rows", flush=True)
-                
-                # Parse results (same logic as search_by_doc_type)
-                for row in rows:
-                    try:
-                        # Extract data using Python Playwright API to avoid JS syntax errors
-                        doc_id = await row.get_attribute('data-documentid') or ''
-                        
-                        # Get h1 text
-                        h1 = row.locator('h1').first
-                        h1_text = await h1.text_content() if await h1.count() > 0 else ''
-                        
-                        doc_number = ''
-                        doc_type = ''
-                        if h1_text:
-                            # Split by bullet (•) or dash
-                            # Python handles unicode natively, so this is safe
-                            parts = []
-                            if '•' in h1_text:
-                                parts = h1_text.split('•')
-                            elif '-' in h1_text:
-                                parts = h1_text.split('-')
-                            else:
-                                parts = [h1_text]
-                                
-                            doc_number = parts[0].strip()
-                            doc_type = parts[1].strip() if len(parts) > 1 else ''
-                        
-                        # Get columns
-                        record_date = ''
-                        try:
-                            columns = await row.locator('.searchResultThreeColumn').all()
-                            for col in columns:
-                                # Use text_content() instead of inner_text() to avoid potential JS errors
-                                col_text = await col.text_content()
-                                if 'Recording Date' in col_text:
-                                    # Extract value from bold tag if present
-                                    bold = col.locator('b').first
-                                    if await bold.count() > 0:
-                                        record_date = (await bold.text_content()).strip()
-                        except Exception as e:
-                            print(f"    Warning: Error parsing columns: {e}", flush=True)
-                        
-                        row_data = {
-                            "doc_id": doc_id,
-                            "doc_number": doc_number,
-                            "doc_type": doc_type,
-                            "record_date": record_date
-                        }
-                        
-                        if row_data and row_data.get("doc_id"):
-                            results.append(row_data)
-                    except Exception as e:
-                        print(f"    Error parsing row: {e}", flush=True)
+            if results:
+                print(f"    Found {len(results)} result rows", flush=True)
             else:
                 print(f"    No results found for sequence {seq_num}", flush=True)
 
         except Exception as e:
             print(f"Sequence search error: {e}")
             return [{"error": str(e)}]
-            
+        
+        self._record_timing(timer)
         return results
     
-    async def search_by_name(self, name: str, search_type: str = "grantor", deed_types_only: bool = True, limit: int = 20) -> List[Dict]:
+    async def _find_input(self, page, label_text: str, possible_ids: List[str]):
+        """A form input by known selectors, falling back to its label."""
+        # 1. Try specific IDs
+        for selector in possible_ids:
+            if await page.locator(selector).count() > 0:
+                print(f"    Found {label_text} input via: {selector}", flush=True)
+                return page.locator(selector).first
+        
+        # 2. Try by Label Text
+        try:
+            # Find label with exact text or containing text
+            label = page.locator(f"label:has-text('{label_text}')").first
+            if await label.count() > 0:
+                # Check 'for' attribute
+                for_id = await label.get_attribute("for")
+                if for_id:
+                    print(f"    Found {label_text} input via label 'for' attribute: #{for_id}", flush=True)
+                    return page.locator(f"#{for_id}")
+                
+                # Check if input is nested
+                if await label.locator("input").count() > 0:
+                    print(f"    Found {label_text} input nested in label", flush=True)
+                    return label.locator("input").first
+                    
+                # Check parent's input (common in form groups)
+                # label -> parent -> input
+                parent_input = label.locator("..").locator("input").first
+                if await parent_input.count() > 0:
+                    print(f"    Found {label_text} input via parent traversal", flush=True)
+                    return parent_input
+        except Exception as e:
+            print(f"    Error finding input by label '{label_text}': {e}", flush=True)
+            
+        return None
+    
+    async def _fill_party_names(self, page, name: str, search_type: str):
+        """
+        Puts `name` in the Grantor and/or Grantee field ("grantor", "grantee"
+        or "both"). Raises ResultsIncomplete when a field is missing - the
+        search would otherwise run without the name.
+        """
+        # Clear the name fields first (the form may keep them across searches)
+        for field_id in ["#field_GrantorName", "#field_GranteeName", "input[name='GrantorName']", "input[name='GranteeName']"]:
+            try:
+                field = page.locator(field_id).first
+                if await field.count() > 0:
+                    await field.fill("")
+            except:
+                pass
+        
+        # Fill Grantor field
+        if search_type in ["grantor", "both"]:
+            grantor_input = await self._find_input(page, "Grantor", [
+                "#field_GrantorName", 
+                "#field_Grantor",
+                "input[name='GrantorName']",
+                "input[aria-label*='Grantor']", 
+                "input[placeholder*='Grantor']"
+            ])
+            
+            if grantor_input:
+                await grantor_input.fill("")
+                await grantor_input.type(name, delay=30)
+                print(f"    Filled Grantor: {name}", flush=True)
+            else:
+                print("    ERROR: Could not find Grantor input field", flush=True)
+                raise ResultsIncomplete("Could not find Grantor input field")
+        
+        # Fill Grantee field - use GranteeID (that's the actual field name on the site)
+        if search_type in ["grantee", "both"]:
+            grantee_input = await self._find_input(page, "Grantee", [
+                "#field_GranteeID",   # This is the actual field name on the site
+                "#field_GranteeName", 
+                "input[name='GranteeID']",
+                "input[name='GranteeName']",
+                "input[aria-label*='Grantee']",
+                "input[placeholder*='Grantee']"
+            ])
+            
+            if grantee_input:
+                await grantee_input.fill("")
+                await grantee_input.type(name, delay=30)
+                print(f"    Filled Grantee: {name}", flush=True)
+            else:
+                print("    ERROR: Could not find Grantee input field", flush=True)
+                raise ResultsIncomplete("Could not find Grantee input field")
+    
+    async def _fill_dates(self, page, start_date: str, end_date: str):
+        """Recording date range (MM/DD/YYYY); empty strings leave that end open."""
+        try:
+            await page.locator("#field_RecordingDateID_DOT_StartDate").fill(start_date)
+            await page.locator("#field_RecordingDateID_DOT_EndDate").fill(end_date)
+            if start_date or end_date:
+                print(f"    Filled recording dates: {start_date or '...'} - {end_date or '...'}", flush=True)
+        except Exception as e:
+            print(f"    ERROR filling dates: {e}", flush=True)
+    
+    @leased_iter
+    async def iter_name_documents(
+        self,
+        name: str,
+        search_type: str = "grantee",
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        page=None,
+        max_pages: int = MAX_RESULT_PAGES,
+    ) -> AsyncIterator[Dict]:
+        """
+        Every document for a party name (optionally within a recording date
+        range), across all result pages - the complete answer the local
+        catalog needs, where search_by_name keeps only the first rows.
+        """
+        page = page or self.page
+        if not self.initialized or not await self.validate_session():
+            raise RuntimeError("Session not initialized or browser closed. Please re-initialize.")
+        
+        timer = StepTimer(f"{search_type} {name} {start_date or '...'}-{end_date or '...'}")
+        waits = WaitStrategy(page)
+        try:
+            await waits.clear_form()
+            timer.step("clear")
+            await self._fill_party_names(page, name, search_type)
+            await self._fill_dates(page, start_date or "", end_date or "")
+            timer.step("fill")
+            async for record in self._iter_result_pages(page, timer, max_pages):
+                yield record
+        finally:
+            self._record_timing(timer)
+    
+    @leased
+    async def search_by_name(self, name: str, search_type: str = "grantor", deed_types_only: bool = True, limit: int = 20, page=None,
+                             start_date: Optional[str] = None, end_date: Optional[str] = None) -> List[Dict]:
         """
         Search for documents by Grantor or Grantee name.
         
@@ -661,6 +1220,8 @@ class RecorderSession:
             search_type: "grantor", "grantee", or "both" 
             deed_types_only: If True, filter for deed-related document types
             limit: Maximum number of results to return
+            page: Tab to run the search on (one of open_search_pages(); defaults to the main page)
+            start_date / end_date: Optional recording date range (MM/DD/YYYY); all time if omitted
             
         Returns:
             List of documents found, sorted by recording date (newest first)
@@ -668,281 +1229,39 @@ class RecorderSession:
         if not self.initialized or not await self.validate_session():
             return [{"error": "Session not initialized or browser closed. Please re-initialize."}]
         
+        page = page or self.page
         print(f"Searching by {search_type}: {name}...", flush=True)
         results = []
+        timer = StepTimer(f"{search_type} {name}")
+        waits = WaitStrategy(page)
         
         try:
             # ALWAYS click Clear button at start of every search to reset form
             print("    Clicking Clear Search to reset form...", flush=True)
-            clear_btn = self.page.locator("#clearSearchButton")
-            if await clear_btn.is_visible(timeout=3000):
-                await clear_btn.click()
-                await self.page.wait_for_load_state("networkidle")
-                await self.page.wait_for_timeout(1000)
+            if await waits.clear_form():
                 print("    Form cleared successfully", flush=True)
             else:
                 print("    Clear button not found, continuing...", flush=True)
+            timer.step("clear")
             
-            # Also manually clear the name fields as backup
-            for field_id in ["#field_GrantorName", "#field_GranteeName", "input[name='GrantorName']", "input[name='GranteeName']"]:
-                try:
-                    field = self.page.locator(field_id).first
-                    if await field.count() > 0:
-                        await field.fill("")
-                except:
-                    pass
+            await self._fill_party_names(page, name, search_type)
+            # Empty dates search all time
+            await self._fill_dates(page, start_date or "", end_date or "")
+            timer.step("fill")
             
-            # Helper to find input
-            async def find_input(label_text, possible_ids):
-                # 1. Try specific IDs
-                for selector in possible_ids:
-                    if await self.page.locator(selector).count() > 0:
-                        print(f"    Found {label_text} input via: {selector}", flush=True)
-                        return self.page.locator(selector).first
-                
-                # 2. Try by Label Text
-                try:
-                    # Find label with exact text or containing text
-                    label = self.page.locator(f"label:has-text('{label_text}')").first
-                    if await label.count() > 0:
-                        # Check 'for' attribute
-                        for_id = await label.get_attribute("for")
-                        if for_id:
-                            print(f"    Found {label_text} input via label 'for' attribute: #{for_id}", flush=True)
-                            return self.page.locator(f"#{for_id}")
-                        
-                        # Check if input is nested
-                        if await label.locator("input").count() > 0:
-                            print(f"    Found {label_text} input nested in label", flush=True)
-                            return label.locator("input").first
-                            
-                        # Check parent's input (common in form groups)
-                        # label -> parent -> input
-                        parent_input = label.locator("..").locator("input").first
-                        if await parent_input.count() > 0:
-                            print(f"    Found {label_text} input via parent traversal", flush=True)
-                            return parent_input
-                except Exception as e:
-                    print(f"    Error finding input by label '{label_text}': {e}", flush=True)
-                    
-                return None
-
-            # Fill Grantor field
-            if search_type in ["grantor", "both"]:
-                grantor_input = await find_input("Grantor", [
-                    "#field_GrantorName", 
-                    "#field_Grantor",
-                    "input[name='GrantorName']",
-                    "input[aria-label*='Grantor']", 
-                    "input[placeholder*='Grantor']"
-                ])
-                
-                if grantor_input:
-                    await grantor_input.fill("")
-                    await grantor_input.type(name, delay=30)
-                    print(f"    Filled Grantor: {name}", flush=True)
-                else:
-                    print("    ERROR: Could not find Grantor input field", flush=True)
-            
-            # Fill Grantee field - use GranteeID (that's the actual field name on the site)
-            if search_type in ["grantee", "both"]:
-                grantee_input = await find_input("Grantee", [
-                    "#field_GranteeID",   # This is the actual field name on the site
-                    "#field_GranteeName", 
-                    "input[name='GranteeID']",
-                    "input[name='GranteeName']",
-                ])
-                
-                if grantee_input:
-                    await grantee_input.fill("")
-                    await grantee_input.type(name, delay=30)
-                    print(f"    Filled Grantee: {name}", flush=True)
-                else:
-                    print("    ERROR: Could not find Grantee input field", flush=True)
-            
-            # Clear date fields to search all time
-            try:
-                await self.page.locator("#field_RecordingDateID_DOT_StartDate").fill("")
-                await self.page.locator("#field_RecordingDateID_DOT_EndDate").fill("")
-            except:
-                pass
-            
-            await self.page.wait_for_timeout(500)
-            
-            # Click Search
-            print("    Clicking Search...", flush=True)
-            await self.page.evaluate("document.querySelector('#searchButton').click()")
-            
-            try:
-                await self.page.wait_for_load_state("networkidle", timeout=15000)
-            except:
-                pass
-            
-            # Wait for results
-            try:
-                await self.page.wait_for_selector("li.ss-search-row", timeout=10000)
-            except:
-                await self.page.wait_for_timeout(2000)
-            
-            rows = await self.page.locator("li.ss-search-row").all()
+            # Click Search (parse extra rows so the deed filter can still fill the limit)
+            rows = await self._run_search(page, limit=limit * 2, timer=timer)
             
             if rows:
                 print(f"    Found {len(rows)} result rows", flush=True)
                 
-                # Deed-related document types to filter for
-                deed_keywords = ["DEED", "WARRANTY", "QUITCLAIM", "QCD", "GRANT", "TRANSFER", "CONVEY", "SALE"]
-                
-                for row in rows[:limit * 2]:  # Get extra to filter
-                    try:
-                        # DEBUG: Print first row HTML to understand structure
-                        if results == []:
-                            html = await row.inner_html()
-                            print(f"    DEBUG: First row HTML (truncated): {html[:500]}...", flush=True)
-
-                        row_data = await row.evaluate("""(row) => {
-                            try {
-                                const doc_id = row.getAttribute('data-documentid') || '';
-                                
-                                // Try finding the header text (Doc Number + Type)
-                                // It might be in an h1, or just a div with specific class
-                                let h1Text = '';
-                                const h1 = row.querySelector('h1');
-                                if (h1) {
-                                    h1Text = h1.innerText;
-                                } else {
-                                    // Fallback: try finding text that looks like a doc number
-                                    const headerLink = row.querySelector('a.doc-link');
-                                    if (headerLink) h1Text = headerLink.innerText;
-                                }
-                                
-                                let doc_number = '';
-                                let doc_type = '';
-                                if (h1Text) {
-                                    const parts = h1Text.split('•').map(s => s.trim());
-                                    doc_number = parts[0] || '';
-                                    doc_type = parts[parts.length - 1] || ''; // Type is usually last
-                                }
-                                
-                                let record_date = '';
-                                let grantor = '';
-                                let grantee = '';
-                                
-                                // Try finding columns
-                                const columns = row.querySelectorAll('.searchResultThreeColumn, .col-md-4');
-                                for (const col of columns) {
-                                    const colText = col.innerText || '';
-                                    const boldEl = col.querySelector('b, strong, span.value');
-                                    const value = boldEl ? boldEl.innerText.trim() : '';
-                                    
-                                    if (colText.includes('Recording Date')) record_date = value;
-                                    if (colText.includes('Grantor')) grantor = value;
-                                    if (colText.includes('Grantee')) grantee = value;
-                                }
-                                
-                                // Parse Book/Page
-                                let book_page = '';
-                                const headerText = row.innerText;
-                                const bpMatch = headerText.match(/B:\s*(\d+)\s*P:\s*(\d+)/);
-                                if (bpMatch) {
-                                    book_page = `B: ${bpMatch[1]} P: ${bpMatch[2]}`;
-                                }
-
-                                // Parse Related Documents
-                                let related_docs = [];
-                                // Look for the Related Documents section
-                                // It's usually in a div or ul with specific classes or text
-                                // Based on screenshot, it looks like rows inside the main row
-                                const relatedRows = row.querySelectorAll('li.ss-search-row-related, .related-document-row, tr.related-doc'); 
-                                // If specific class not found, try searching by text content in nested divs
-                                if (relatedRows.length === 0) {
-                                    const allDivs = row.querySelectorAll('div');
-                                    for (const div of allDivs) {
-                                        if (div.innerText && div.innerText.includes('Related Documents')) {
-                                            // Found the header, now look for siblings or children that look like docs
-                                            // This is tricky without seeing HTML. Let's try a generic approach:
-                                            // Look for text patterns like "Document Number" followed by values
-                                        }
-                                    }
-                                }
-
-                                // Robust approach for Related Docs based on typical Tyler structure:
-                                // They are often in a separate UL or Table nested in the row
-                                const relatedSection = Array.from(row.querySelectorAll('div, ul, table')).find(el => el.innerText && el.innerText.includes('Related Documents'));
-                                if (relatedSection) {
-                                    // Try to find lines that look like docs
-                                    // Pattern: DocNumber Type Date Book/Page
-                                    const lines = relatedSection.innerText.split('\n');
-                                    for (const line of lines) {
-                                        // Skip the header line
-                                        if (line.includes('Related Documents')) continue;
-                                        
-                                        // Simple heuristic: if line has a date and some text, it might be a doc
-                                        // Better: look for the document number pattern (usually starts with year like 2012...)
-                                        const docNumMatch = line.match(/(\d{8,})/); // 8+ digits
-                                        if (docNumMatch) {
-                                            related_docs.push({
-                                                doc_number: docNumMatch[0],
-                                                full_text: line.trim()
-                                            });
-                                        }
-                                    }
-                                }
-
-                                return { doc_id, doc_number, doc_type, record_date, grantor, grantee, h1Text, book_page, related_docs };
-                            } catch (e) {
-                                return { error: e.toString() };
-                            }
-                        }""")
-                        
-                        if row_data.get("error"):
-                            print(f"    JS Parsing Error: {row_data['error']}", flush=True)
+                for row_data in rows:
+                    # Filter for deeds if requested
+                    if deed_types_only:
+                        doc_type_upper = row_data.get("doc_type", "").upper()
+                        if not any(k in doc_type_upper for k in RELEVANT_DOC_KEYWORDS):
                             continue
-                            
-                        # print(f"    DEBUG: Parsed row data: {row_data}", flush=True)
-                        
-                        if row_data and row_data.get("doc_id"):
-                            # Filter for deeds if requested
-                            is_deed = False
-                            if deed_types_only:
-                                doc_type_upper = row_data.get("doc_type", "").upper()
-                                # Expanded list of relevant document types
-                                relevant_keywords = [
-                                    # Deeds
-                                    "DEED", "WARRANTY", "QUITCLAIM", "QCD", "GRANT", "TRANSFER", "CONVEY",
-                                    # Trust & Mortgage docs
-                                    "TRUST", "DEED OF TRUST", "MORTGAGE", "RECONVEYANCE", "SUBSTITUTION",
-                                    # Liens & Encumbrances
-                                    "LIEN", "MECHANICS LIEN", "FEDERAL", "TAX LIEN", "RELEASE", "SATISFACTION",
-                                    # Notices & Court
-                                    "NOTICE", "LIS PENDENS", "NOTICE OF DEFAULT", "NOTICE SALE",
-                                    "JUDGMENT", "ABSTRACT JUDGMENT",
-                                    # Other relevant
-                                    "SALE", "AGREEMENT", "EASEMENT", "AFFIDAVIT", "ASSIGNMENT", "ASSUMPTION"
-                                ]
-                                if any(k in doc_type_upper for k in relevant_keywords):
-                                    is_deed = True
-                            else:
-                                is_deed = True
-                                
-                            if is_deed:
-                                results.append(row_data)
-                    except Exception as e:
-                        print(f"    Error parsing row: {e}", flush=True)
-                        continue
-                        
-                        if row_data and row_data.get("doc_id"):
-                            # Filter for deed types if requested
-                            if deed_types_only:
-                                doc_type_upper = row_data.get("doc_type", "").upper()
-                                if any(kw in doc_type_upper for kw in deed_keywords):
-                                    results.append(row_data)
-                            else:
-                                results.append(row_data)
-                                
-                            if len(results) >= limit:
-                                break
-                    except Exception as e:
-                        print(f"    Error parsing row: {e}", flush=True)
+                    results.append(row_data)
                 
                 # Sort by recording date (newest first)
                 from datetime import datetime
@@ -952,6 +1271,7 @@ class RecorderSession:
                     except:
                         return datetime.min
                 results.sort(key=parse_date, reverse=True)
+                results = results[:limit]
                 
             else:
                 print(f"    No results found for name: {name}", flush=True)
@@ -960,8 +1280,10 @@ class RecorderSession:
             print(f"Name search error: {e}")
             return [{"error": str(e)}]
         
+        self._record_timing(timer)
         return results
     
+    @leased
     async def search_by_name_and_date(self, name: str, record_date: str, search_type: str = "both", limit: int = 20) -> List[Dict]:
         """
         Search for documents by name AND recording date.
@@ -982,163 +1304,24 @@ class RecorderSession:
         print(f"Searching by {search_type}: {name} on date: {record_date}...", flush=True)
         results = []
         
+        timer = StepTimer(f"{search_type} {name} on {record_date}")
+        
         try:
             # Clear form first
             print("    Clearing search form...", flush=True)
-            clear_btn = self.page.locator("#clearSearchButton")
-            if await clear_btn.is_visible(timeout=3000):
-                await clear_btn.click()
-                await self.page.wait_for_load_state("networkidle")
-                await self.page.wait_for_timeout(1000)
+            await WaitStrategy(self.page).clear_form()
+            timer.step("clear")
             
             # Fill date range (same date for start and end)
-            try:
-                start_date_input = self.page.locator("#field_RecordingDateID_DOT_StartDate")
-                end_date_input = self.page.locator("#field_RecordingDateID_DOT_EndDate")
-                
-                if await start_date_input.count() > 0:
-                    await start_date_input.fill("")
-                    await start_date_input.type(record_date, delay=30)
-                    print(f"    Filled start date: {record_date}", flush=True)
-                    
-                if await end_date_input.count() > 0:
-                    await end_date_input.fill("")
-                    await end_date_input.type(record_date, delay=30)
-                    print(f"    Filled end date: {record_date}", flush=True)
-            except Exception as e:
-                print(f"    Error setting date: {e}", flush=True)
-            
-            # Helper to find input (robust version with label fallback)
-            async def find_input(label_text, possible_ids):
-                # 1. Try specific IDs
-                for selector in possible_ids:
-                    if await self.page.locator(selector).count() > 0:
-                        print(f"    Found {label_text} input via: {selector}", flush=True)
-                        return self.page.locator(selector).first
-                
-                # 2. Try by Label Text
-                try:
-                    label = self.page.locator(f"label:has-text('{label_text}')").first
-                    if await label.count() > 0:
-                        for_id = await label.get_attribute("for")
-                        if for_id:
-                            print(f"    Found {label_text} input via label 'for' attribute: #{for_id}", flush=True)
-                            return self.page.locator(f"#{for_id}")
-                        
-                        if await label.locator("input").count() > 0:
-                            print(f"    Found {label_text} input nested in label", flush=True)
-                            return label.locator("input").first
-                            
-                        parent_input = label.locator("..").locator("input").first
-                        if await parent_input.count() > 0:
-                            print(f"    Found {label_text} input via parent traversal", flush=True)
-                            return parent_input
-                except Exception as e:
-                    print(f"    Error finding input by label '{label_text}': {e}", flush=True)
-                    
-                return None
-            
-            if search_type in ["grantor", "both"]:
-                grantor_input = await find_input("Grantor", [
-                    "#field_GrantorName", 
-                    "#field_Grantor",
-                    "input[name='GrantorName']",
-                    "input[aria-label*='Grantor']", 
-                    "input[placeholder*='Grantor']"
-                ])
-                
-                if grantor_input:
-                    await grantor_input.fill("")
-                    await grantor_input.type(name, delay=30)
-                    print(f"    Filled Grantor: {name}", flush=True)
-                else:
-                    print("    ERROR: Could not find Grantor input field", flush=True)
-            
-            if search_type in ["grantee", "both"]:
-                grantee_input = await find_input("Grantee", [
-                    "#field_GranteeID",
-                    "#field_GranteeName", 
-                    "input[name='GranteeID']",
-                    "input[aria-label*='Grantee']",
-                    "input[placeholder*='Grantee']"
-                ])
-                
-                if grantee_input:
-                    await grantee_input.fill("")
-                    await grantee_input.type(name, delay=30)
-                    print(f"    Filled Grantee: {name}", flush=True)
-                else:
-                    print("    ERROR: Could not find Grantee input field", flush=True)
-            
-            await self.page.wait_for_timeout(500)
-            
-            # Click Search
-            print("    Clicking Search...", flush=True)
-            await self.page.evaluate("document.querySelector('#searchButton').click()")
-            
-            try:
-                await self.page.wait_for_load_state("networkidle", timeout=15000)
-            except:
-                pass
-            
-            # Wait for results
-            try:
-                await self.page.wait_for_selector("li.ss-search-row", timeout=10000)
-            except:
-                await self.page.wait_for_timeout(2000)
+            await self._fill_dates(self.page, record_date, record_date)
+            await self._fill_party_names(self.page, name, search_type)
+            timer.step("fill")
             
-            rows = await self.page.locator("li.ss-search-row").all()
+            # Click Search and read the result rows
+            results = await self._run_search(self.page, limit=limit, timer=timer)
             
-            if rows:
-                print(f"    Found {len(rows)} results for {name} on {record_date}", flush=True)
-                
-                for row in rows[:limit]:
-                    try:
-                        row_data = await row.evaluate("""(row) => {
-                            try {
-                                const doc_id = row.getAttribute('data-documentid') || '';
-                                const h1 = row.querySelector('h1');
-                                let doc_number = '';
-                                let doc_type = '';
-                                if (h1) {
-                                    const parts = h1.innerText.split('•').map(s => s.trim());
-                                    doc_number = parts[0] || '';
-                                    doc_type = parts[parts.length - 1] || '';
-                                }
-                                
-                                let record_date = '';
-                                let grantor = '';
-                                let grantee = '';
-                                let book_page = '';
-                                
-                                const columns = row.querySelectorAll('.searchResultThreeColumn, .col-md-4');
-                                for (const col of columns) {
-                                    const colText = col.innerText || '';
-                                    const boldEl = col.querySelector('b, strong, span.value');
-                                    const value = boldEl ? boldEl.innerText.trim() : '';
-                                    
-                                    if (colText.includes('Recording Date')) record_date = value;
-                                    if (colText.includes('Grantor')) grantor = value;
-                                    if (colText.includes('Grantee')) grantee = value;
-                                }
-                                
-                                // Parse Book/Page
-                                const headerText = row.innerText;
-                                const bpMatch = headerText.match(/B:\\s*(\\d+)\\s*P:\\s*(\\d+)/);
-                                if (bpMatch) {
-                                    book_page = `B: ${bpMatch[1]} P: ${bpMatch[2]}`;
-                                }
-                                
-                                return { doc_id, doc_number, doc_type, record_date, grantor, grantee, book_page };
-                            } catch (e) {
-                                return { error: e.toString() };
-                            }
-                        }""")
-                        
-                        if row_data and row_data.get("doc_id"):
-                            results.append(row_data)
-                    except Exception as e:
-                        print(f"    Error parsing row: {e}", flush=True)
+            if results:
+                print(f"    Found {len(results)} results for {name} on {record_date}", flush=True)
             else:
                 print(f"    No results found for {name} on {record_date}", flush=True)
         
@@ -1146,9 +1329,11 @@ class RecorderSession:
             print(f"Name+Date search error: {e}")
             return [{"error": str(e)}]
         
+        self._record_timing(timer)
         return results
     
-        """Search for documents using active session."""
+    async def search(self, doc_type: str = None, distress_filter: str = None, days_back: int = 30, limit: int = 50) -> List[Dict]:
+        """Search for documents using active session (all of a distress filter's types in one search)."""
         if not self.initialized:
             return [{"error": "Session not initialized. Call initialize() first."}]
         
@@ -1160,16 +1345,8 @@ class RecorderSession:
         else:
             return [{"error": "Must specify doc_type or distress_filter"}]
         
-        all_results = []
-        for doc_type_search in search_types:
-            print(f"  Searching: {doc_type_search}...")
-            results = await self.search_by_doc_type(doc_type_search, limit=limit)
-            all_results.extend(results)
-            
-            if len(all_results) >= limit:
-                break
-        
-        return all_results[:limit]
+        print(f"  Searching: {', '.join(search_types)}...")
+        return await self.search_by_doc_types(search_types, days_back=days_back, limit=limit)
     
     async def close(self):
         """Close the recorder session."""
@@ -1177,6 +1354,9 @@ class RecorderSession:
             await self.browser.close()
         if self.playwright:
             await self.playwright.stop()
+        self.search_pages = []
+        self.dedicated_pages = {}
+        self._page_locks = {}
         self.initialized = False
         print("Recorder session closed.")
     
@@ -1195,22 +1375,11 @@ class RecorderSession:
             doc_url = f"https://pimacountyaz-web.tylerhost.net/web/document/{doc_id}?search=DOCSEARCH55S10"
             
             print(f"  Opening document: {doc_id}", flush=True)
-            await self.page.goto(doc_url)
-            
-            # Wait for page to load
-            try:
-                await self.page.wait_for_load_state("networkidle", timeout=15000)
-            except:
-                await self.page.wait_for_load_state("domcontentloaded", timeout=5000)
+            # The viewer itself is awaited by the caller (WaitStrategy.viewer_frame)
+            await self.page.goto(doc_url, wait_until="domcontentloaded")
             
             # Check for CAPTCHA challenge
-            await self.page.wait_for_timeout(2000)
-            if await self._check_and_handle_captcha():
-                # User solved CAPTCHA, wait for actual content to load
-                await self.page.wait_for_timeout(3000)
-            
-            # Wait for viewer to fully load
-            await self.page.wait_for_timeout(1000)
+            await self._check_and_handle_captcha()
             
             return True
             
@@ -1256,6 +1425,7 @@ class RecorderSession:
             print(f"  CAPTCHA check error: {e}", flush=True)
             return False
     
+    @leased
     async def download_document(self, doc_id: str, download_dir: str = None) -> Optional[str]:
         """
         Download PDF for a document, return file path.
@@ -1280,34 +1450,31 @@ class RecorderSession:
         download_dir.mkdir(parents=True, exist_ok=True)
         
         max_retries = 3
+        timer = StepTimer(f"download {doc_id}")
+        waits = WaitStrategy(self.page)
         
         for attempt in range(1, max_retries + 1):
             try:
                 # First view the document - this opens the viewer
-                if not await self.view_document(doc_id):
+                opened = await self.view_document(doc_id)
+                timer.step("open")
+                if not opened:
                     print(f"  Attempt {attempt}/{max_retries}: Failed to open document viewer", flush=True)
                     if attempt < max_retries:
                         await self.page.wait_for_timeout(2000)
                         continue
                     else:
+                        self._record_timing(timer)
                         return None
                 
                 print("  Looking for PDF viewer and download button...", flush=True)
-                await self.page.wait_for_timeout(2000)
                 
-                # The PDF viewer might be in an iframe - search all frames
-                pdf_frame = None
-                for frame in self.page.frames:
-                    try:
-                        download_btn = frame.locator("#download")
-                        if await download_btn.count() > 0:
-                            pdf_frame = frame
-                            print(f"  Found PDF viewer in frame", flush=True)
-                            break
-                    except:
-                        continue
-                
-                if not pdf_frame:
+                # The PDF viewer might be in an iframe - wait until some frame shows #download
+                pdf_frame = await waits.viewer_frame()
+                timer.step("viewer")
+                if pdf_frame:
+                    print(f"  Found PDF viewer in frame", flush=True)
+                else:
                     # Try main page
                     pdf_frame = self.page
                 
@@ -1327,12 +1494,15 @@ class RecorderSession:
                             raise Exception("No download button found")
                 
                 download = await download_info.value
+                timer.step("download event")
                 
                 # Save to downloads folder
                 pdf_path = download_dir / f"{doc_id}.pdf"
                 await download.save_as(str(pdf_path))
+                timer.step("save")
                 print(f"  PDF downloaded: {pdf_path}", flush=True)
                 
+                self._record_timing(timer)
                 return str(pdf_path)
                 
             except Exception as e:
@@ -1342,6 +1512,7 @@ class RecorderSession:
                     await self.page.wait_for_timeout(2000)
                 else:
                     print(f"  All {max_retries} attempts failed", flush=True)
+                    self._record_timing(timer)
                     return None
     
     async def _capture_viewer_pages(self, doc_id: str, download_dir: Path) -> Optional[str]:
@@ -1519,6 +1690,7 @@ async def interactive_session():
     print("=" * 50)
     print()
     print("Commands:")
+    print("  pre      - Search Pre-Foreclosure (all types in one search)")
     print("  lis      - Search LIS PENDENS")
     print("  nots     - Search NOTICE SALE")
     print("  sub      - Search SUBSTITUTION TRUSTEE")
@@ -1539,7 +1711,7 @@ async def interactive_session():
     print()
     
     # Search commands that require browser initialization
-    search_commands = {"lis", "nots", "sub", "federal", "city", "lien", "mechanic", "notice", "judgment", "absjudge", "divorce", "probate"}
+    search_commands = {"pre", "lis", "nots", "sub", "federal", "city", "lien", "mechanic", "notice", "judgment", "absjudge", "divorce", "probate"}
     
     while True:
         cmd = input(">>> ").strip()
@@ -1557,6 +1729,7 @@ async def interactive_session():
             print("=" * 50)
             print()
             print("SEARCH COMMANDS (opens browser on first use):")
+            print("  pre      - Search Pre-Foreclosure (LIS PENDENS, NOTICE SALE, SUBSTITUTION TRUSTEE)")
             print("  lis      - Search LIS PENDENS (pre-foreclosure notices)")
             print("  nots     - Search NOTICE SALE (foreclosure sales)")
             print("  sub      - Search SUBSTITUTION TRUSTEE")
@@ -1680,7 +1853,10 @@ async def interactive_session():
                     continue
             
             # Run the search
-            if action == "lis":
+            if action == "pre":
+                print("Searching Pre-Foreclosure...")
+                last_results = await session.search(distress_filter="Pre-Foreclosure", limit=100)
+            elif action == "lis":
                 print("Searching LIS PENDENS...")
                 last_results = await session.search_by_doc_type("LIS PENDENS", limit=100)
             elif action == "nots":